@@ -0,0 +1,132 @@
+"""Benchmark rendering of large results.
+
+Compares the time and peak memory of the output paths for a synthetic
+`show_hosts` result, writing to /dev/null.
+
+$ python scripts/bench_output.py --hosts 20000
+$ python scripts/bench_output.py --hosts 5000 --memory
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import TextIO
+
+import typer
+from rich.console import Console
+from rich.table import Table
+from zabbix_cli.models import AggregateResult
+from zabbix_cli.pyzabbix.types import Host
+from zabbix_cli.pyzabbix.types import HostGroup
+from zabbix_cli.pyzabbix.types import Template
+
+console = Console()
+
+
+def make_result(n: int) -> AggregateResult[Host]:
+    groups = [HostGroup(groupid=str(i), name=f"Group {i}") for i in range(3)]
+    templates = [Template(templateid=str(i), host=f"Template {i}") for i in range(2)]
+    return AggregateResult(
+        result=[
+            Host(
+                hostid=str(i),
+                host=f"host{i}.example.com",
+                groups=groups,
+                templates=templates,
+                status="0",
+            )
+            for i in range(n)
+        ]
+    )
+
+
+def measure(func: Callable[[], object], *, memory: bool) -> tuple[float, float]:
+    """Run a function. Returns the elapsed seconds and peak memory in MiB.
+
+    Tracing memory allocations slows the function down considerably, so
+    memory is only measured when requested."""
+    gc.collect()
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    if not memory:
+        return elapsed, 0.0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main(
+    hosts: int = typer.Option(10000, "--hosts", help="Number of hosts."),
+    memory: bool = typer.Option(False, "--memory", help="Measure peak memory (slow)."),
+) -> None:
+    """Benchmark the output paths for a result with many hosts."""
+    result = make_result(hosts)
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        run_benchmarks(result, devnull, memory=memory)
+
+
+def run_benchmarks(
+    result: AggregateResult[Host], devnull: TextIO, *, memory: bool
+) -> None:
+    from zabbix_cli.output.plain import CsvWriter
+    from zabbix_cli.output.plain import format_plain_table
+    from zabbix_cli.output.render import write_json
+
+    null_console = Console(file=devnull, width=200)
+
+    def rich_json() -> None:
+        null_console.print_json(
+            result.model_dump_json(indent=2, by_alias=True), indent=2, sort_keys=False
+        )
+
+    def direct_json() -> None:
+        write_json(
+            result.__pydantic_serializer__.to_json(result, indent=2, by_alias=True),
+            devnull,
+        )
+
+    def direct_json_compact() -> None:
+        write_json(
+            result.__pydantic_serializer__.to_json(result, by_alias=True), devnull
+        )
+
+    def rich_table() -> None:
+        null_console.print(result.as_table())
+
+    def plain_table() -> None:
+        devnull.writelines(
+            line + "\n" for line in format_plain_table([result], max_width=50)
+        )
+
+    def csv() -> None:
+        CsvWriter(devnull).write([result])
+
+    benchmarks: dict[str, Callable[[], object]] = {
+        "table (rich)": rich_table,
+        "table (plain)": plain_table,
+        "csv": csv,
+        "json (rich)": rich_json,
+        "json (direct)": direct_json,
+        "json (direct, compact)": direct_json_compact,
+    }
+
+    table = Table(title=f"Rendering {len(result.result)} hosts")
+    table.add_column("Output")
+    table.add_column("Time (s)", justify="right")
+    if memory:
+        table.add_column("Peak memory (MiB)", justify="right")
+    for name, func in benchmarks.items():
+        elapsed, peak = measure(func, memory=memory)
+        table.add_row(name, f"{elapsed:.2f}", *([f"{peak:.1f}"] if memory else []))
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -18,8 +18,11 @@ def test_get_enum_attr_docs():
     )
     assert get_enum_attr_docs(OutputFormat) == snapshot(
         {
+            OutputFormat.CSV: "Comma-separated values with nested values joined on a single line.",
             OutputFormat.JSON: "JSON-serialized output.",
             OutputFormat.TABLE: "Rich terminal table output.",
+            OutputFormat.NDJSON: "Newline-delimited JSON output with one object per line.",
+            OutputFormat.PLAIN: "Plain fixed-width table output. Faster than table output for large results.",
         }
     )
 
@@ -6,6 +6,8 @@ import typer
 from inline_snapshot import snapshot
 from zabbix_cli.app.app import StatefulApp
 from zabbix_cli.commands.common.args import CommandParam
+from zabbix_cli.commands.common.pages import get_output_properties
+from zabbix_cli.state import State
 
 
 def test_command_param(ctx: typer.Context) -> None:
@@ -67,3 +69,24 @@ def test_command_param_in_command(
         # Also, terminal styling is broken when testing outside of a terminal.
         # Thus, this minimal test.
         assert "other-command help-command [OPTIONS]" in captured.out
+
+
+@pytest.mark.parametrize(
+    "fields, expect",
+    [
+        (None, None),
+        (["host"], ["hostid", "host"]),
+        (["host", "groups", "hostid"], ["hostid", "host"]),
+        (["host", "interfaces"], None),
+    ],
+)
+def test_get_output_properties(
+    state: State, fields: list[str] | None, expect: list[str] | None
+) -> None:
+    state.fields = fields
+    assert (
+        get_output_properties(
+            ("hostid", "host", "status"), id_field="hostid", selected=("groups",)
+        )
+        == expect
+    )
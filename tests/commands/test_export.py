@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from zabbix_cli.commands.export import EXPORT_JOURNAL_FILENAME
+from zabbix_cli.commands.export import ExportJournal
+from zabbix_cli.commands.export import ExportType
+from zabbix_cli.commands.export import ImportLedger
+from zabbix_cli.commands.export import ZabbixExporter
+from zabbix_cli.commands.export import ZabbixImporter
+from zabbix_cli.commands.export import get_import_type
+from zabbix_cli.config.model import Config
+from zabbix_cli.exceptions import ZabbixCLIError
+from zabbix_cli.pyzabbix.client import ZabbixAPI
+from zabbix_cli.pyzabbix.enums import ExportFormat
+from zabbix_cli.pyzabbix.types import Host
+
+
+def test_export_journal(tmp_path: Path) -> None:
+    journal = ExportJournal(tmp_path)
+    journal.record_success(ExportType.HOSTS, "1", tmp_path / "hosts" / "a_1.json")
+    journal.record_failure(ExportType.HOSTS, "2", "Connection reset")
+    journal.record_failure(ExportType.TEMPLATES, "3", "Timeout")
+    # Later entries take precedence
+    journal.record_success(ExportType.TEMPLATES, "3", tmp_path / "templates" / "c.json")
+
+    # Simulate a partially written line from an interrupted export
+    with open(journal.path, "a") as f:
+        f.write('{"type": "hosts", "id": "4"')
+
+    loaded = ExportJournal(tmp_path)
+    loaded.load()
+    assert loaded.is_completed(ExportType.HOSTS, "1")
+    assert loaded.is_failed(ExportType.HOSTS, "2")
+    assert loaded.is_completed(ExportType.TEMPLATES, "3")
+    assert not loaded.is_failed(ExportType.TEMPLATES, "3")
+    assert not loaded.is_completed(ExportType.HOSTS, "4")
+    assert loaded.failed_types() == {ExportType.HOSTS}
+
+    loaded.reset()
+    assert not loaded.path.exists()
+    assert not loaded.completed
+    assert not loaded.failed
+
+
+def _make_exporter(
+    client: ZabbixAPI, config: Config, directory: Path, **kwargs: Any
+) -> ZabbixExporter:
+    return ZabbixExporter(
+        client=client,
+        config=config,
+        types=[ExportType.HOSTS],
+        names=[],
+        directory=directory,
+        format=ExportFormat.JSON,
+        timestamps=False,
+        legacy_filenames=False,
+        pretty=False,
+        ignore_errors=False,
+        **kwargs,
+    )
+
+
+def test_exporter_resume_and_retry_failed(
+    tmp_path: Path,
+    config: Config,
+    zabbix_client_mock_version: ZabbixAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = zabbix_client_mock_version
+    hosts = [Host(hostid=str(i), host=f"host{i}") for i in range(1, 6)]
+    monkeypatch.setattr(client, "get_hosts", lambda *args, **kwargs: hosts)
+
+    exported_ids: list[str] = []
+    fail_on = {"4"}
+
+    def export_configuration(**kwargs: Any) -> str:
+        hostid = kwargs["hosts"][0].hostid
+        if hostid in fail_on:
+            raise ZabbixCLIError("API went away")
+        exported_ids.append(hostid)
+        return "{}"
+
+    monkeypatch.setattr(client, "export_configuration", export_configuration)
+
+    # First run fails on host 4
+    exporter = _make_exporter(client, config, tmp_path)
+    with pytest.raises(ZabbixCLIError):
+        exporter.run()
+    assert exported_ids == ["1", "2", "3"]
+    assert (tmp_path / EXPORT_JOURNAL_FILENAME).exists()
+
+    # Resuming retries the failed host and continues with the rest
+    fail_on.clear()
+    exported_ids.clear()
+    exporter = _make_exporter(client, config, tmp_path, resume=True)
+    files = exporter.run()
+    assert exported_ids == ["4", "5"]
+    assert len(files) == 2
+    assert exporter.skipped == 3
+
+    # Retrying failed objects with ignore_errors only exports the failures
+    fail_on.add("2")
+    exported_ids.clear()
+    exporter = _make_exporter(client, config, tmp_path)
+    exporter.ignore_errors = True
+    exporter.run()
+    assert exported_ids == ["1", "3", "4", "5"]
+
+    fail_on.clear()
+    exported_ids.clear()
+    exporter = _make_exporter(client, config, tmp_path, retry_failed=True)
+    exporter.run()
+    assert exported_ids == ["2"]
+    assert not exporter.journal.failed
+
+
+@pytest.mark.parametrize(
+    "filename, contents, expect",
+    [
+        pytest.param("hosts/foo_1.json", "", ExportType.HOSTS, id="directory"),
+        pytest.param("groups/foo_1.json", "", ExportType.HOST_GROUPS, id="legacy dir"),
+        pytest.param(
+            "foo.json",
+            '{"zabbix_export": {"version": "7.0", "template_groups": [], "templates": []}}',
+            ExportType.TEMPLATES,
+            id="json",
+        ),
+        pytest.param(
+            "foo.yaml",
+            "zabbix_export:\n  version: '7.0'\n  host_groups:\n    - name: foo\n  hosts:\n    - host: foo\n      groups:\n        - name: foo\n",
+            ExportType.HOSTS,
+            id="yaml",
+        ),
+        pytest.param(
+            "foo.xml",
+            "<?xml version='1.0'?>\n<zabbix_export>\n    <version>5.0</version>\n    <groups>\n        <group>\n            <name>foo</name>\n        </group>\n    </groups>\n</zabbix_export>\n",
+            ExportType.HOST_GROUPS,
+            id="xml",
+        ),
+        pytest.param("foo.json", "not json", None, id="invalid"),
+        pytest.param(
+            "foo.json", '{"zabbix_export": {"version": "7.0"}}', None, id="unknown"
+        ),
+    ],
+)
+def test_get_import_type(
+    tmp_path: Path, filename: str, contents: str, expect: ExportType | None
+) -> None:
+    file = tmp_path / filename
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file.write_text(contents)
+    assert get_import_type(file) == expect
+
+
+def test_importer_tiers(
+    tmp_path: Path,
+    config: Config,
+    zabbix_client: ZabbixAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    files: list[Path] = []
+    for name in ["maps/m.json", "hosts/h.json", "templates/t.json", "unknown.json"]:
+        file = tmp_path / name
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text("{}")
+        files.append(file)
+    files.append(tmp_path / "host_groups" / "g.json")
+    files[-1].parent.mkdir()
+    files[-1].write_text("{}")
+
+    importer = ZabbixImporter(
+        client=zabbix_client,
+        config=config,
+        files=files,
+        create_missing=True,
+        update_existing=True,
+        delete_missing=False,
+        ignore_errors=True,
+        jobs=4,
+    )
+    tiers = importer.get_import_tiers()
+    assert [[f.parent.name for f in tier] for tier in tiers] == [
+        ["host_groups"],
+        ["templates"],
+        ["hosts"],
+        ["maps"],
+        [tmp_path.name],
+    ]
+
+    # Templates fail the first time (e.g. linked template not yet imported)
+    attempts: list[str] = []
+
+    def import_configuration(file: Path, **kwargs: Any) -> None:
+        attempts.append(file.parent.name)
+        if file.parent.name == "templates" and attempts.count("templates") == 1:
+            raise ZabbixCLIError("Linked template not found")
+
+    monkeypatch.setattr(zabbix_client, "import_configuration", import_configuration)
+    importer.run()
+    assert attempts == [
+        "host_groups",
+        "templates",
+        "templates",
+        "hosts",
+        "maps",
+        tmp_path.name,
+    ]
+    assert len(importer.imported) == 5
+    assert not importer.failed
+
+
+def test_importer_changed_only(
+    tmp_path: Path,
+    config: Config,
+    zabbix_client: ZabbixAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    files: list[Path] = []
+    for name in ["a", "b", "c"]:
+        file = tmp_path / "hosts" / f"{name}.json"
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(f'{{"name": "{name}"}}')
+        files.append(file)
+
+    imported: list[str] = []
+
+    def import_configuration(file: Path, **kwargs: Any) -> None:
+        imported.append(file.stem)
+
+    monkeypatch.setattr(zabbix_client, "import_configuration", import_configuration)
+
+    ledger_file = tmp_path / "ledger.json"
+
+    def run_importer() -> ZabbixImporter:
+        importer = ZabbixImporter(
+            client=zabbix_client,
+            config=config,
+            files=list(files),
+            create_missing=True,
+            update_existing=True,
+            delete_missing=False,
+            ignore_errors=False,
+            changed_only=True,
+            ledger=ImportLedger.load(ledger_file),
+        )
+        importer.run()
+        return importer
+
+    # First import records all files in the ledger
+    run_importer()
+    assert sorted(imported) == ["a", "b", "c"]
+    assert ledger_file.exists()
+
+    # No changes
+    imported.clear()
+    importer = run_importer()
+    assert imported == []
+    assert len(importer.skipped) == 3
+
+    # Only the modified file is imported
+    files[1].write_text('{"name": "b", "changed": true}')
+    imported.clear()
+    importer = run_importer()
+    assert imported == ["b"]
+    assert len(importer.skipped) == 2
+
+    # Ledger is keyed by server URL
+    zabbix_client.set_url("https://zabbix-staging.example.com")
+    imported.clear()
+    run_importer()
+    assert sorted(imported) == ["a", "b", "c"]
+
+
+def test_importer_compare(
+    tmp_path: Path,
+    config: Config,
+    zabbix_client_mock_version: ZabbixAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = zabbix_client_mock_version
+    files: list[Path] = []
+    for name in ["template_groups/g.json", "templates/t.json", "hosts/h.json"]:
+        file = tmp_path / name
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text("{}")
+        files.append(file)
+
+    compared: list[str] = []
+    imported: list[str] = []
+
+    def compare_configuration(file: Path, **kwargs: Any) -> bool:
+        compared.append(file.parent.name)
+        return False
+
+    def import_configuration(file: Path, **kwargs: Any) -> None:
+        imported.append(file.parent.name)
+
+    monkeypatch.setattr(client, "compare_configuration", compare_configuration)
+    monkeypatch.setattr(client, "import_configuration", import_configuration)
+    importer = ZabbixImporter(
+        client=client,
+        config=config,
+        files=files,
+        create_missing=True,
+        update_existing=True,
+        delete_missing=False,
+        ignore_errors=False,
+        compare=True,
+    )
+    importer.run()
+    # Only templates and template groups can be compared
+    assert compared == ["template_groups", "templates"]
+    assert imported == ["hosts"]
+    assert len(importer.skipped) == 2
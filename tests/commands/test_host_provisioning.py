@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from zabbix_cli.commands.host_provisioning import HostCreator
+from zabbix_cli.commands.host_provisioning import HostFileFormat
+from zabbix_cli.commands.host_provisioning import HostRow
+from zabbix_cli.commands.host_provisioning import HostSyncer
+from zabbix_cli.commands.host_provisioning import read_host_file
+from zabbix_cli.exceptions import ZabbixAPICallError
+from zabbix_cli.exceptions import ZabbixAPIRequestError
+from zabbix_cli.pyzabbix.client import ZabbixAPI
+from zabbix_cli.pyzabbix.enums import MonitoringStatus
+from zabbix_cli.pyzabbix.types import Host
+from zabbix_cli.pyzabbix.types import HostGroup
+from zabbix_cli.pyzabbix.types import Macro
+from zabbix_cli.pyzabbix.types import Proxy
+from zabbix_cli.pyzabbix.types import Template
+from zabbix_cli.pyzabbix.types import ZabbixAPIError
+from zabbix_cli.pyzabbix.types import ZabbixAPIResponse
+
+
+def test_read_host_file_csv(tmp_path: Path) -> None:
+    file = tmp_path / "hosts.csv"
+    file.write_text(
+        "hostname,groups,proxy,interfaces,templates,macros,status\n"
+        'foo.example.com,"Group1,Group2",proxy-.+,"agent,snmp",Template1,"{""{$A}"": ""1""}",off\n'
+        "bar.example.com,,,,,,\n"
+        "baz.example.com,,,,,,invalid\n"
+    )
+    rows = list(read_host_file(file, HostFileFormat.from_path(file)))
+    assert [lineno for lineno, _ in rows] == [2, 3, 4]
+
+    foo = rows[0][1]
+    assert isinstance(foo, HostRow)
+    assert foo.groups == ["Group1", "Group2"]
+    assert foo.proxy == "proxy-.+"
+    assert foo.templates == ["Template1"]
+    assert foo.macros == {"{$A}": "1"}
+    assert foo.status == MonitoringStatus.OFF
+    interfaces = foo.get_interfaces(create_interface=True)
+    assert [(i["type"], i["dns"], i["port"]) for i in interfaces] == [
+        (1, "foo.example.com", "10050"),
+        (2, "foo.example.com", "161"),
+    ]
+    assert "details" in interfaces[1]
+
+    bar = rows[1][1]
+    assert isinstance(bar, HostRow)
+    assert bar.proxy is None
+    assert bar.interfaces is None
+    assert len(bar.get_interfaces(create_interface=True)) == 1
+    assert not bar.get_interfaces(create_interface=False)
+
+    assert isinstance(rows[2][1], Exception)
+
+
+def test_read_host_file_jsonl(tmp_path: Path) -> None:
+    file = tmp_path / "hosts.jsonl"
+    file.write_text(
+        '{"hostname": "10.0.0.1", "interfaces": [{"type": "agent", "port": 10051}], "inventory": {"site": "A"}}\n'
+        "\n"
+        "not json\n"
+        '{"hostname": "foo", "unknown": 1}\n'
+    )
+    rows = list(read_host_file(file, HostFileFormat.from_path(file)))
+    assert [lineno for lineno, _ in rows] == [1, 3, 4]
+
+    row = rows[0][1]
+    assert isinstance(row, HostRow)
+    assert row.inventory == {"site": "A"}
+    [interface] = row.get_interfaces(create_interface=False)
+    assert interface["ip"] == "10.0.0.1"
+    assert interface["useip"] == 1
+    assert interface["port"] == "10051"
+
+    assert isinstance(rows[1][1], Exception)
+    assert isinstance(rows[2][1], Exception)
+
+
+def test_host_creator(
+    zabbix_client_mock_version: ZabbixAPI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = zabbix_client_mock_version
+    groups = [
+        HostGroup(groupid="1", name="Group1"),
+        HostGroup(groupid="2", name="Default"),
+    ]
+    calls: list[list[str]] = []
+
+    def get_hosts_by_name(*names: str) -> list[Host]:
+        return [Host(hostid="100", host="existing")] if "existing" in names else []
+
+    def get_hostgroups(*names: str, **kwargs: Any) -> list[HostGroup]:
+        return [g for g in groups if g.name in names or g.groupid in names]
+
+    def get_templates(*names: str, **kwargs: Any) -> list[Template]:
+        return [Template(templateid="10", host="Template1")]
+
+    def get_proxies(**kwargs: Any) -> list[Proxy]:
+        return [Proxy(proxyid="20", name="proxy-1", address="127.0.0.1")]
+
+    def create_hosts(hosts: list[dict[str, Any]]) -> list[str]:
+        names = [h["host"] for h in hosts]
+        calls.append(names)
+        if "invalid" in names:
+            raise ZabbixAPICallError(
+                f"Failed to create {len(hosts)} hosts"
+            ) from ZabbixAPIRequestError(
+                "Error: Invalid params.",
+                api_response=ZabbixAPIResponse(
+                    jsonrpc="2.0",
+                    id=1,
+                    error=ZabbixAPIError(code=-32602, message="Invalid params."),
+                ),
+            )
+        return [str(i) for i, _ in enumerate(names)]
+
+    monkeypatch.setattr(client, "get_hosts_by_name", get_hosts_by_name)
+    monkeypatch.setattr(client, "get_hostgroups", get_hostgroups)
+    monkeypatch.setattr(client, "get_templates", get_templates)
+    monkeypatch.setattr(client, "get_proxies", get_proxies)
+    monkeypatch.setattr(client, "create_hosts", create_hosts)
+
+    rows: list[tuple[int, HostRow | Exception]] = [
+        (1, HostRow(hostname="host1", groups=["Group1"], templates=["Template1"])),
+        (2, HostRow(hostname="host2", proxy="proxy-.+")),
+        (3, HostRow(hostname="invalid")),
+        (4, HostRow(hostname="host4", groups=["Missing"])),
+        (5, HostRow(hostname="existing")),
+        (6, HostRow(hostname="HOST1")),
+        (7, ValueError("Invalid row")),
+        (8, HostRow(hostname="host8", proxy="other-.+")),
+        (9, HostRow(hostname="host9")),
+    ]
+    creator = HostCreator(
+        client, default_hostgroups=["Default"], create_interface=True, chunk_size=4
+    )
+    results = creator.run(rows)
+
+    assert [(r.row, r.status) for r in results] == [
+        (1, "created"),
+        (2, "created"),
+        (3, "failed"),
+        (4, "failed"),
+        (5, "failed"),
+        (6, "failed"),
+        (7, "failed"),
+        (8, "failed"),
+        (9, "created"),
+    ]
+    # The failing chunk is split until the invalid host is found
+    assert calls == [
+        ["host1", "host2", "invalid", "host9"],
+        ["host1", "host2"],
+        ["invalid", "host9"],
+        ["invalid"],
+        ["host9"],
+    ]
+    assert results[3].error == "Host group 'Missing' not found"
+    assert results[4].error == "Host 'existing' already exists"
+    assert results[5].error == "Duplicate of row 1"
+    assert results[7].error == "No proxies matching pattern 'other-.+'"
+
+
+def test_host_creator_request_error(
+    zabbix_client_mock_version: ZabbixAPI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = zabbix_client_mock_version
+    calls: list[list[str]] = []
+
+    def create_hosts(hosts: list[dict[str, Any]]) -> list[str]:
+        calls.append([h["host"] for h in hosts])
+        # Not an error returned by the API, so not caused by any host
+        raise ZabbixAPICallError(
+            f"Failed to create {len(hosts)} hosts"
+        ) from ZabbixAPIRequestError("Failed to send request")
+
+    monkeypatch.setattr(client, "get_hosts_by_name", lambda *names: [])
+    monkeypatch.setattr(
+        client,
+        "get_hostgroups",
+        lambda *names, **kwargs: [HostGroup(groupid="1", name="Default")],
+    )
+    monkeypatch.setattr(client, "create_hosts", create_hosts)
+
+    rows: list[tuple[int, HostRow | Exception]] = [
+        (i, HostRow(hostname=f"host{i}")) for i in range(1, 6)
+    ]
+    creator = HostCreator(
+        client, default_hostgroups=["Default"], create_interface=True, chunk_size=4
+    )
+    results = creator.run(rows)
+
+    assert all(r.status == "failed" for r in results)
+    # Failing chunks are not split
+    assert calls == [["host1", "host2", "host3", "host4"], ["host5"]]
+
+
+def test_host_syncer(
+    zabbix_client_mock_version: ZabbixAPI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = zabbix_client_mock_version
+    group1 = HostGroup(groupid="1", name="Group1")
+    group2 = HostGroup(groupid="2", name="Group2")
+    template1 = Template(templateid="10", host="Template1")
+    proxy1 = Proxy(proxyid="20", name="proxy-1", address="127.0.0.1")
+    macro = Macro(
+        hostid="100", hostmacroid="30", macro="{$A}", value="1", type=0, description=""
+    )
+    hosts = [
+        Host(
+            hostid="100",
+            host="host1",
+            groups=[group1],
+            templates=[template1],
+            macros=[macro],
+            proxyid="20",
+            status="0",
+        ),
+        Host(hostid="101", host="host2", groups=[group1], status="0"),
+        Host(hostid="102", host="host3", groups=[group1, group2], status="0"),
+    ]
+    calls: list[tuple[str, Any]] = []
+
+    def get_hosts_by_name(*names: str, **kwargs: Any) -> list[Host]:
+        calls.append(("get_hosts_by_name", names))
+        return [h for h in hosts if h.host in names]
+
+    def get_hostgroups(*names: str, **kwargs: Any) -> list[HostGroup]:
+        calls.append(("get_hostgroups", names))
+        return [g for g in (group1, group2) if g.name in names]
+
+    def get_templates(*names: str, **kwargs: Any) -> list[Template]:
+        calls.append(("get_templates", names))
+        return [template1] if "Template1" in names else []
+
+    def get_proxies(**kwargs: Any) -> list[Proxy]:
+        calls.append(("get_proxies", ()))
+        return [proxy1]
+
+    def record(name: str) -> Any:
+        def method(*args: Any, **kwargs: Any) -> None:
+            calls.append((name, args))
+
+        return method
+
+    monkeypatch.setattr(client, "get_hosts_by_name", get_hosts_by_name)
+    monkeypatch.setattr(client, "get_hostgroups", get_hostgroups)
+    monkeypatch.setattr(client, "get_templates", get_templates)
+    monkeypatch.setattr(client, "get_proxies", get_proxies)
+    for name in (
+        "add_hosts_to_hostgroups",
+        "remove_hosts_from_hostgroups",
+        "link_templates_to_hosts",
+        "update_hosts_status",
+        "create_host_macros",
+        "update_macros",
+    ):
+        monkeypatch.setattr(client, name, record(name))
+
+    # A file that is in sync only costs the reads
+    in_sync: list[tuple[int, HostRow | Exception]] = [
+        (
+            1,
+            HostRow(
+                hostname="host1",
+                groups=["Group1"],
+                templates=["Template1"],
+                proxy="proxy-.+",
+                macros={"{$A}": "1"},
+                status=MonitoringStatus.ON,
+            ),
+        ),
+        (2, HostRow(hostname="host2", groups=["1"])),
+    ]
+    syncer = HostSyncer(client, default_hostgroups=[], create_interface=True)
+    syncer.plan(in_sync)
+    assert not syncer.changes
+    assert not syncer.operations
+    assert [name for name, _ in calls] == ["get_hosts_by_name", "get_proxies"]
+
+    # Identical changes to multiple hosts are applied with a single operation
+    calls.clear()
+    rows: list[tuple[int, HostRow | Exception]] = [
+        (1, HostRow(hostname="host1", groups=["Group2"], macros={"{$A}": "2"})),
+        (2, HostRow(hostname="host2", groups=["Group2"], status=MonitoringStatus.OFF)),
+        (
+            3,
+            HostRow(
+                hostname="host3", status=MonitoringStatus.OFF, macros={"{$B}": "1"}
+            ),
+        ),
+        (4, HostRow(hostname="host4")),
+        (5, HostRow(hostname="host2", templates=["Missing"])),
+        # Numeric host names are not host IDs (host2 has ID 101)
+        (6, HostRow(hostname="101")),
+    ]
+    syncer = HostSyncer(
+        client, default_hostgroups=[], create_interface=True, create_missing=False
+    )
+    syncer.plan(rows)
+    # Group2 is found among the groups of host3 and is not fetched
+    assert [name for name, _ in calls] == ["get_hosts_by_name"]
+    assert [(c.row, c.change, c.status) for c in syncer.changes] == [
+        (5, "error", "failed"),
+        (4, "error", "failed"),
+        (6, "error", "failed"),
+        (1, "host groups", "planned"),
+        (1, "macro {$A}", "planned"),
+        (2, "host groups", "planned"),
+        (2, "status", "planned"),
+        (3, "status", "planned"),
+        (3, "macro {$B}", "planned"),
+    ]
+    assert syncer.changes[0].error == "Duplicate of row 2"
+    assert syncer.changes[1].error == "Host 'host4' not found"
+    assert syncer.changes[2].error == "Host '101' not found"
+
+    calls.clear()
+    syncer.apply()
+    assert all(c.status == "applied" for c in syncer.changes[3:])
+    assert sorted((name, len(args[0])) for name, args in calls) == [
+        ("add_hosts_to_hostgroups", 2),
+        ("create_host_macros", 1),
+        ("remove_hosts_from_hostgroups", 2),
+        ("update_hosts_status", 2),
+        ("update_macros", 1),
+    ]
+
+
+def test_host_syncer_removes_last(
+    zabbix_client_mock_version: ZabbixAPI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Hosts are added to their new groups before they are removed from the old."""
+    client = zabbix_client_mock_version
+    a, c, d = (HostGroup(groupid=str(i), name=n) for i, n in enumerate("ACD"))
+    hosts = [
+        Host(hostid="100", host="h1", groups=[c]),
+        Host(hostid="101", host="h2", groups=[c]),
+    ]
+    calls: list[tuple[str, list[str], list[str]]] = []
+
+    def record(name: str) -> Any:
+        def method(hosts: list[Host], groups: list[HostGroup]) -> None:
+            calls.append((name, [h.host for h in hosts], [g.name for g in groups]))
+
+        return method
+
+    monkeypatch.setattr(
+        client,
+        "get_hosts_by_name",
+        lambda *names, **kw: [h for h in hosts if h.host in names],
+    )
+    monkeypatch.setattr(
+        client,
+        "get_hostgroups",
+        lambda *names, **kw: [g for g in (a, d) if g.name in names],
+    )
+    monkeypatch.setattr(client, "add_hosts_to_hostgroups", record("add"))
+    monkeypatch.setattr(client, "remove_hosts_from_hostgroups", record("remove"))
+
+    syncer = HostSyncer(client, default_hostgroups=[], create_interface=True)
+    syncer.plan(
+        [
+            (1, HostRow(hostname="h1", groups=["A"])),
+            (2, HostRow(hostname="h2", groups=["D"])),
+        ]
+    )
+    syncer.apply()
+    assert calls == [
+        ("add", ["h1"], ["A"]),
+        ("add", ["h2"], ["D"]),
+        ("remove", ["h1", "h2"], ["C"]),
+    ]
@@ -19,6 +19,24 @@ from zabbix_cli.state import get_state
 runner = CliRunner()
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--benchmark", action="store_true", help="Run tests marked as benchmarks."
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    # Timing comparisons are unreliable on shared CI runners
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="Benchmarks only run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(name="app")
 def _app() -> Iterator[StatefulApp]:
     yield app
@@ -12,6 +12,9 @@ from zabbix_cli.exceptions import ZabbixAPILogoutError
 from zabbix_cli.pyzabbix.client import ZabbixAPI
 from zabbix_cli.pyzabbix.client import add_param
 from zabbix_cli.pyzabbix.client import append_param
+from zabbix_cli.pyzabbix.lookup import LookupTable
+from zabbix_cli.pyzabbix.types import HostGroup
+from zabbix_cli.pyzabbix.types import ZabbixAPIResponse
 
 from tests.utils import add_zabbix_endpoint
 from tests.utils import add_zabbix_version_endpoint
@@ -254,3 +257,125 @@ def test_client_logout(httpserver: HTTPServer, auth_type: AuthType, auth: str) -
 
     httpserver.check_assertions()
     httpserver.check_handler_errors()
+
+
+def test_client_lookup(zabbix_client_mock_version: ZabbixAPI) -> None:
+    client = zabbix_client_mock_version
+    table = LookupTable()
+    table.add("hostgroup", [HostGroup(groupid="1", name="Group1")])
+    client.lookup = table
+
+    # Served from the table by name and ID
+    assert [hg.groupid for hg in client.get_hostgroups("1", "1")] == ["1"]
+    assert client.get_hostgroup("Group1").name == "Group1"
+    assert table.hits == 2
+    # Names that are searched for can match other objects in the API
+    assert client._lookup("hostgroup", ("Group1",), search=True) is None
+    assert client._lookup("hostgroup", ("Group1", "1"), search=False) is None
+    assert client._lookup("hostgroup", ("1",), search=True) is not None
+    # Unless the table holds the results of searching for them
+    table.add(
+        "hostgroup",
+        [HostGroup(groupid="2", name="Group10"), HostGroup(groupid="3", name="Other")],
+        searched=["group1"],
+    )
+    assert [hg.name for hg in client.get_hostgroups("GROUP1", search=True)] == [
+        "Group1",
+        "Group10",
+    ]
+    assert client._lookup("hostgroup", ("Group1", "Other"), search=True) is None
+    assert table.hits == 4
+    # Not all objects are in the table
+    assert table.get("hostgroup", ["Group1", "Group2"]) is None
+    # Returned objects are copies
+    client.get_hostgroup("Group1").name = "Modified"
+    assert client.get_hostgroup("1").name == "Group1"
+
+    # Modifying objects of a type clears the table for that type
+    table.invalidate("hostgroup.get")
+    table.invalidate("hostgroup.massadd")  # names and IDs are unchanged
+    table.invalidate("template.update")
+    assert table.get("hostgroup", ["Group1"]) is not None
+    table.invalidate("hostgroup.delete")
+    assert table.get("hostgroup", ["Group1"]) is None
+
+
+def test_client_get_hosts_by_name(
+    zabbix_client_mock_version: ZabbixAPI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = zabbix_client_mock_version
+    requests: list[dict[str, Any]] = []
+
+    def do_request(method: str, params: dict[str, Any]) -> ZabbixAPIResponse:
+        requests.append(params)
+        result = [{"hostid": "1", "host": "host1"}]
+        return ZabbixAPIResponse(jsonrpc="2.0", id=1, result=result)
+
+    monkeypatch.setattr(client, "do_request", do_request)
+
+    assert client.get_hosts_by_name() == []
+    hosts = client.get_hosts_by_name("host1", "host2")
+    assert [h.host for h in hosts] == ["host1"]
+    # Multiple names are filtered, not searched for
+    assert requests == [{"output": "extend", "filter": {"host": ["host1", "host2"]}}]
+
+
+def test_client_get_item_counts(
+    zabbix_client_mock_version: ZabbixAPI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = zabbix_client_mock_version
+    requests: list[dict[str, Any]] = []
+
+    def do_request(method: str, params: dict[str, Any]) -> ZabbixAPIResponse:
+        assert method == "item.get"
+        requests.append(params)
+        result = [{"hostid": "1", "rowscount": "3"}, {"hostid": "2", "rowscount": "1"}]
+        return ZabbixAPIResponse(jsonrpc="2.0", id=1, result=result)
+
+    monkeypatch.setattr(client, "do_request", do_request)
+    assert client.get_item_counts(["1", "2", "3"]) == {"1": 3, "2": 1}
+    # Counted by the API instead of fetching the items
+    assert requests[0]["countOutput"] is True
+    assert requests[0]["groupCount"] is True
+
+
+def test_client_iter_hosts(
+    zabbix_client_mock_version: ZabbixAPI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = zabbix_client_mock_version
+    requests: list[dict[str, Any]] = []
+    hosts = [{"hostid": str(i), "host": f"host{i}"} for i in range(1, 6)]
+
+    def do_request(method: str, params: dict[str, Any]) -> ZabbixAPIResponse:
+        assert method == "host.get"
+        requests.append(params)
+        if "hostids" in params:
+            result = [h for h in hosts if h["hostid"] in params["hostids"]]
+        else:
+            result = [{"hostid": h["hostid"]} for h in hosts][: params.get("limit")]
+        return ZabbixAPIResponse(jsonrpc="2.0", id=1, result=result)
+
+    monkeypatch.setattr(client, "do_request", do_request)
+
+    # Fetched in a single request by default
+    pages = list(client.iter_hosts(select_groups=True))
+    assert len(pages) == 1
+    assert len(requests) == 1
+
+    # IDs are fetched first, without related objects
+    requests.clear()
+    pages = list(client.iter_hosts(select_groups=True, limit=4, page_size=3))
+    assert [[h.host for h in page] for page in pages] == [
+        ["host1", "host2", "host3"],
+        ["host4"],
+    ]
+    assert requests[0]["output"] == ["hostid"]
+    assert requests[0]["limit"] == 4
+    assert not any(key.startswith("select") for key in requests[0])
+    assert [r["hostids"] for r in requests[1:]] == [["1", "2", "3"], ["4"]]
+    assert all("limit" not in r and "selectHostGroups" in r for r in requests[1:])
+
+    # Only the given properties are requested
+    requests.clear()
+    list(client.iter_hosts(output=["hostid", "host"]))
+    assert requests[0]["output"] == ["hostid", "host"]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from zabbix_cli.exceptions import ZabbixAPICallError
+from zabbix_cli.exceptions import ZabbixAPIMassOperationError
+from zabbix_cli.exceptions import ZabbixAPITokenExpiredError
+from zabbix_cli.pyzabbix.mass import ChunkSizer
+from zabbix_cli.pyzabbix.mass import MassOperation
+
+
+def test_chunk_sizer() -> None:
+    sizer = ChunkSizer(100, max_size=300, target_latency=4.0)
+    # Fast full chunks grow the size up to the max
+    sizer.record(100, 0.5)
+    assert sizer.size == 200
+    sizer.record(200, 0.5)
+    assert sizer.size == 300
+    # A fast remainder does not
+    sizer.record(10, 0.1)
+    assert sizer.size == 300
+    # Slow requests and failures shrink it
+    sizer.record(300, 5.0)
+    assert sizer.size == 150
+    sizer.record(150, 2.0)
+    assert sizer.size == 150
+    sizer.shrink(20)
+    assert sizer.size == 10
+    # Never grows back to the size that failed
+    sizer.record(10, 0.1)
+    sizer.record(19, 0.1)
+    assert sizer.size == 19
+    for _ in range(10):
+        sizer.shrink(1)
+    assert sizer.size == 1
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_mass_operation(jobs: int) -> None:
+    calls: list[list[int]] = []
+    lock = threading.Lock()
+    progress: list[int] = []
+
+    def func(chunk: list[int]) -> None:
+        with lock:
+            calls.append(chunk)
+        if 13 in chunk or 42 in chunk:
+            raise ZabbixAPICallError("Invalid host")
+
+    operation = MassOperation(
+        func, chunk_size=8, target_latency=60.0, jobs=jobs, on_progress=progress.append
+    )
+    result = operation.run(list(range(50)))
+
+    assert sorted(result.succeeded) == [i for i in range(50) if i not in (13, 42)]
+    assert [item for item, _ in sorted(result.failed)] == [13, 42]
+    assert sum(progress) == 50
+    assert result.requests == len(calls)
+    # Every item is sent exactly once in a chunk that succeeded or failed on its own
+    assert sorted(
+        i for c in calls if len(c) == 1 or not {13, 42} & set(c) for i in c
+    ) == list(range(50))
+
+    with pytest.raises(ZabbixAPIMassOperationError) as exc_info:
+        result.raise_for_failures("Failed to update hosts")
+    msg = str(exc_info.value)
+    assert msg.startswith("Failed to update hosts: failed for 2 of 50: ")
+    assert "13 (Invalid host)" in msg
+    assert "42 (Invalid host)" in msg
+    assert exc_info.value.succeeded == result.succeeded
+
+
+def test_mass_operation_adapts_chunk_size() -> None:
+    calls: list[int] = []
+
+    def func(chunk: list[int]) -> None:
+        calls.append(len(chunk))
+        if len(chunk) > 5:
+            raise ZabbixAPICallError("Request too large")
+
+    result = MassOperation(func, chunk_size=8, target_latency=60.0).run(list(range(60)))
+    assert len(result.succeeded) == 60
+    # Failed sizes are never tried again, so the size settles below the limit
+    assert calls == [8, 4, 4, 7, 3, 4, 6, 3, 3, 5, 5, 5, 5, 5, 5, 5, 4]
+
+
+def test_mass_operation_fatal_error() -> None:
+    calls: list[list[int]] = []
+
+    def func(chunk: list[int]) -> None:
+        calls.append(chunk)
+        try:
+            raise ZabbixAPITokenExpiredError("Token expired")
+        except ZabbixAPITokenExpiredError as e:
+            raise ZabbixAPICallError("Failed to update hosts") from e
+
+    with pytest.raises(ZabbixAPICallError):
+        MassOperation(func, chunk_size=4).run(list(range(10)))
+    # Not retried
+    assert calls == [[0, 1, 2, 3]]
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_mass_operation_error_not_per_object(jobs: int) -> None:
+    """Errors that make every chunk fail abort the operation instead of splitting."""
+    calls: list[list[int]] = []
+
+    def func(chunk: list[int]) -> None:
+        calls.append(chunk)
+        raise ZabbixAPICallError("No permissions to referred object")
+
+    operation = MassOperation(func, chunk_size=1000, jobs=jobs)
+    with pytest.raises(ZabbixAPIMassOperationError, match="No permissions"):
+        operation.run(list(range(5000)))
+    # The chunk and its two halves
+    assert len(calls) <= 3 + jobs
+
+
+def test_mass_operation_max_retries() -> None:
+    calls: list[list[int]] = []
+
+    def func(chunk: list[int]) -> None:
+        calls.append(chunk)
+        raise ZabbixAPICallError(f"Invalid host {chunk[0]}")
+
+    result = MassOperation(func, chunk_size=1000, max_retries=10).run(list(range(1000)))
+    assert len(calls) == 11
+    assert len(result.failed) == 1000
+    assert not result.succeeded
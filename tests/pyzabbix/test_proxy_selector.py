@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+from zabbix_cli.exceptions import ZabbixAPICallError
+from zabbix_cli.exceptions import ZabbixNotFoundError
+from zabbix_cli.pyzabbix.client import ZabbixAPI
+from zabbix_cli.pyzabbix.enums import ProxyStrategy
+from zabbix_cli.pyzabbix.proxy_selector import ProxySelector
+from zabbix_cli.pyzabbix.types import Proxy
+
+PROXIES = [
+    Proxy(proxyid="1", name="proxy-a", address="127.0.0.1"),
+    Proxy(proxyid="2", name="proxy-b", address="127.0.0.1"),
+    Proxy(proxyid="3", name="proxy-c", address="127.0.0.1"),
+    Proxy(proxyid="4", name="other", address="127.0.0.1"),
+]
+
+
+@pytest.fixture
+def calls(zabbix_client: ZabbixAPI, monkeypatch: pytest.MonkeyPatch) -> Counter[str]:
+    """Patch the client to return the test proxies and counts the requests."""
+    counter: Counter[str] = Counter()
+    host_counts = {"1": 10, "2": 4, "3": 4}
+    item_counts = {"1": 100, "2": 400, "3": 40}
+
+    def get_proxies() -> list[Proxy]:
+        counter["get_proxies"] += 1
+        return PROXIES
+
+    def get_proxy_host_counts() -> dict[str, int]:
+        counter["get_proxy_host_counts"] += 1
+        return dict(host_counts)
+
+    def get_proxy_item_count(proxy: Proxy) -> int:
+        counter["get_proxy_item_count"] += 1
+        return item_counts.get(proxy.proxyid, 0)
+
+    monkeypatch.setattr(zabbix_client, "get_proxies", get_proxies)
+    monkeypatch.setattr(zabbix_client, "get_proxy_host_counts", get_proxy_host_counts)
+    monkeypatch.setattr(zabbix_client, "get_proxy_item_count", get_proxy_item_count)
+    return counter
+
+
+def test_match(zabbix_client: ZabbixAPI, calls: Counter[str]) -> None:
+    selector = ProxySelector(zabbix_client)
+    assert [p.name for p in selector.match("proxy-.+")] == [
+        "proxy-a",
+        "proxy-b",
+        "proxy-c",
+    ]
+    assert len(selector.match()) == 4
+    with pytest.raises(ZabbixNotFoundError):
+        selector.match("nope")
+    with pytest.raises(ZabbixAPICallError):
+        selector.match("[")
+    # Proxies are only fetched once
+    assert calls["get_proxies"] == 1
+
+
+def test_select_least_hosts(zabbix_client: ZabbixAPI, calls: Counter[str]) -> None:
+    selector = ProxySelector(zabbix_client, strategy=ProxyStrategy.LEAST_HOSTS)
+    selected = [selector.select("proxy-.+").name for _ in range(13)]
+    # Fills up the least loaded proxies first, ties broken by name
+    assert selected[:2] == ["proxy-b", "proxy-c"]
+    assert selected[-1] == "proxy-a"
+    assert Counter(selected) == {"proxy-a": 1, "proxy-b": 6, "proxy-c": 6}
+    assert [selector.host_count(p) for p in PROXIES[:3]] == [11, 10, 10]
+    # Counts are fetched once and updated locally
+    assert calls["get_proxy_host_counts"] == 1
+    assert calls["get_proxies"] == 1
+
+
+def test_select_least_items(zabbix_client: ZabbixAPI, calls: Counter[str]) -> None:
+    selector = ProxySelector(zabbix_client, strategy=ProxyStrategy.LEAST_ITEMS)
+    # New hosts are counted with the average items per host of their proxy
+    selected = [selector.select("proxy-.+").name for _ in range(10)]
+    assert "proxy-b" not in selected
+    assert selector.item_count(PROXIES[0]) == pytest.approx(
+        100 + 10 * selected.count("proxy-a")
+    )
+    assert selector.item_count(PROXIES[2]) == pytest.approx(
+        40 + 10 * selected.count("proxy-c")
+    )
+    # Item counts are fetched once per candidate
+    assert calls["get_proxy_item_count"] == 3
+
+
+def test_select_round_robin(zabbix_client: ZabbixAPI, calls: Counter[str]) -> None:
+    selector = ProxySelector(zabbix_client, strategy=ProxyStrategy.ROUND_ROBIN)
+    selected = [selector.select("proxy-.+").name for _ in range(4)]
+    assert selected == ["proxy-a", "proxy-b", "proxy-c", "proxy-a"]
+    # Counts are not needed
+    assert not calls["get_proxy_host_counts"]
+
+
+def test_select_moves_host(zabbix_client: ZabbixAPI, calls: Counter[str]) -> None:
+    selector = ProxySelector(zabbix_client, strategy=ProxyStrategy.LEAST_HOSTS)
+    proxy = selector.select("proxy-.+", current=PROXIES[0])
+    assert proxy.name == "proxy-b"
+    assert selector.host_count(PROXIES[0]) == 9
+    assert selector.host_count(PROXIES[1]) == 5
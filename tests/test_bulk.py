@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 import pytest
 import typer
@@ -13,10 +16,21 @@ from zabbix_cli.bulk import CommandExecution
 from zabbix_cli.bulk import CommandResult
 from zabbix_cli.bulk import CommentLine
 from zabbix_cli.bulk import EmptyLine
+from zabbix_cli.bulk_checkpoint import BulkCheckpoint
+from zabbix_cli.bulk_timing import RELATIVE_ACCURACY
+from zabbix_cli.bulk_timing import BulkTimings
+from zabbix_cli.bulk_timing import LatencyHistogram
 from zabbix_cli.exceptions import CommandFileError
+from zabbix_cli.exceptions import ZabbixAPICallError
 from zabbix_cli.output.console import exit_err
 from zabbix_cli.output.console import exit_ok
 from zabbix_cli.output.console import info
+from zabbix_cli.pyzabbix.client import ZabbixAPI
+from zabbix_cli.pyzabbix.types import Host
+from zabbix_cli.pyzabbix.types import HostGroup
+from zabbix_cli.pyzabbix.types import Proxy
+from zabbix_cli.pyzabbix.types import ZabbixAPIResponse
+from zabbix_cli.state import State
 
 
 @pytest.mark.parametrize(
@@ -655,3 +669,666 @@ only_options -O "str" -S "Optional[str]" -I 42 -N 42
             ),
         ]
     )
+
+
+@pytest.mark.parametrize(
+    "line, other, expect",
+    [
+        pytest.param(
+            "add_host_to_hostgroup host1 GroupX",
+            "add_host_to_hostgroup host2 GroupX",
+            False,
+            id="different hosts, same group",
+        ),
+        pytest.param(
+            "create_host host1 --hostgroup GroupX",
+            "add_host_to_hostgroup host1 GroupY",
+            True,
+            id="same host",
+        ),
+        pytest.param(
+            "create_hostgroup GroupX",
+            "add_host_to_hostgroup host1,host2 GroupX",
+            True,
+            id="group created",
+        ),
+        pytest.param(
+            "add_host_to_hostgroup host1,host2 GroupX",
+            "remove_host host2",
+            True,
+            id="comma-separated",
+        ),
+        pytest.param(
+            "show_host *.example.com",
+            "create_host host1",
+            True,
+            id="wildcard",
+        ),
+        pytest.param(
+            "-o json show_host host1",
+            "create_host host2",
+            True,
+            id="global option",
+        ),
+    ],
+)
+def test_bulk_command_conflicts_with(line: str, other: str, expect: bool) -> None:
+    cmd = BulkCommand.from_line(line)
+    other_cmd = BulkCommand.from_line(other)
+    assert cmd.conflicts_with(other_cmd) == expect
+    assert other_cmd.conflicts_with(cmd) == expect
+
+
+@pytest.mark.parametrize(
+    "mode", [BulkRunnerMode.STRICT, BulkRunnerMode.CONTINUE, BulkRunnerMode.SKIP]
+)
+def test_bulk_runner_concurrent(
+    tmp_path: Path, app: StatefulApp, ctx: typer.Context, mode: BulkRunnerMode
+) -> None:
+    """Test running commands concurrently with barriers and conflicting lines."""
+    import threading
+    import time
+
+    file = tmp_path / "commands.txt"
+    file.write_text(
+        """\
+record_name a
+record_name b
+record_name c
+record_name a
+# barrier
+record_name d
+record_name e
+"""
+    )
+    events: list[str] = []
+    lock = threading.Lock()
+
+    @app.command(name="record_name")
+    def record_name(name: str = typer.Argument()) -> None:
+        with lock:
+            events.append(f"start {name}")
+        time.sleep(0.05)
+        with lock:
+            events.append(f"end {name}")
+        info(f"Recorded {name}")
+
+    cmd = typer.main.get_command(app)
+    ctx.command = cmd
+
+    b = BulkRunner(ctx, file, mode, jobs=4)
+    b.run_bulk()
+
+    assert len(b.executions) == 6
+    assert all(e.result == CommandResult.SUCCESS for e in b.executions)
+    assert [e.line_number for e in b.executions] == [1, 2, 3, 4, 6, 7]
+    assert all(e.output and "Recorded" in e.output for e in b.executions)
+
+    # Second "a" waits for the first "a" to finish
+    assert events.index("start a", events.index("end a")) > events.index("end a")
+    # Lines after the barrier wait for all previous lines
+    start_d = events.index("start d")
+    assert all(events.index(f"end {n}") < start_d for n in "abc")
+    # Independent lines run concurrently
+    assert events.index("start b") < events.index("end a")
+
+
+def test_bulk_runner_concurrent_strict_failure(
+    tmp_path: Path, app: StatefulApp, ctx: typer.Context
+) -> None:
+    file = tmp_path / "commands.txt"
+    file.write_text(
+        """\
+maybe_fail ok1
+maybe_fail fail
+# barrier
+maybe_fail ok2
+"""
+    )
+
+    @app.command(name="maybe_fail")
+    def maybe_fail(name: str = typer.Argument()) -> None:
+        if name == "fail":
+            exit_err("This command fails")
+
+    cmd = typer.main.get_command(app)
+    ctx.command = cmd
+
+    b = BulkRunner(ctx, file, BulkRunnerMode.STRICT, jobs=2)
+    with pytest.raises(CommandFileError):
+        b.run_bulk()
+    # Line after the barrier is never run
+    assert [e.line_number for e in b.executions] == [1, 2]
+    assert b.executions[1].result == CommandResult.FAILURE
+
+
+def test_bulk_runner_concurrent_strict_failure_in_flight(
+    tmp_path: Path, app: StatefulApp, ctx: typer.Context
+) -> None:
+    """Commands running when a command fails are recorded before stopping."""
+    import time
+
+    file = tmp_path / "commands.txt"
+    file.write_text(
+        """\
+maybe_fail fail
+maybe_fail slow
+maybe_fail fail
+"""
+    )
+    results_file = tmp_path / "results.jsonl"
+
+    @app.command(name="maybe_fail")
+    def maybe_fail(name: str = typer.Argument()) -> None:
+        if name == "fail":
+            exit_err("This command fails")
+        time.sleep(0.2)
+
+    cmd = typer.main.get_command(app)
+    ctx.command = cmd
+
+    b = BulkRunner(
+        ctx,
+        file,
+        BulkRunnerMode.STRICT,
+        jobs=2,
+        results_file=results_file,
+        checkpoint=True,
+        checkpoint_dir=tmp_path,
+    )
+    # Line 3 waits for line 1, which fails while line 2 is still running
+    with pytest.raises(CommandFileError):
+        b.run_bulk()
+    assert [e.line_number for e in b.executions] == [1, 2]
+    assert b.counts[CommandResult.SUCCESS] == 1
+    assert b.counts[CommandResult.FAILURE] == 1
+    assert len(results_file.read_text().splitlines()) == 2
+    assert b.checkpoint is not None
+    assert b.checkpoint.last_line == 2
+    assert b.checkpoint.failed == {1}
+
+
+def _mock_host_api(
+    state: State,
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    fail_mass_call: bool = False,
+    host_ids: Iterable[int] = range(1, 6),
+) -> list[list[str]]:
+    """Mock the API methods used by `add_host_to_hostgroup`.
+
+    Returns a list of host names for each call to `add_hosts_to_hostgroups`."""
+    hosts = {f"host{i}": Host(hostid=str(i), host=f"host{i}") for i in host_ids}
+    calls: list[list[str]] = []
+
+    def get_hosts(*names: str, **kwargs: Any) -> list[Host]:
+        # Names are searched for, matching hosts whose names contain them
+        return [h for h in hosts.values() if any(n in h.host for n in names)]
+
+    def get_hostgroups(*names: str, **kwargs: Any) -> list[HostGroup]:
+        return [HostGroup(groupid=str(i), name=n) for i, n in enumerate(names)]
+
+    def add_hosts_to_hostgroups(hosts: list[Host], hgs: list[HostGroup]) -> None:
+        if fail_mass_call and len(hosts) > 1:
+            raise ZabbixAPICallError("Mass call failed")
+        calls.append([h.host for h in hosts])
+
+    monkeypatch.setattr(state.client, "get_hosts", get_hosts)
+    monkeypatch.setattr(state.client, "get_hostgroups", get_hostgroups)
+    monkeypatch.setattr(
+        state.client, "add_hosts_to_hostgroups", add_hosts_to_hostgroups
+    )
+    return calls
+
+
+COALESCE_COMMANDS = """\
+add_host_to_hostgroup host1 Group1
+add_host_to_hostgroup host2,host3 Group1
+add_host_to_hostgroup missing Group1
+add_host_to_hostgroup host4 Group1
+add_host_to_hostgroup host5 Group2
+add_host_to_hostgroup host1 Group2
+"""
+
+
+@pytest.mark.parametrize("coalesce", [True, False])
+def test_bulk_runner_coalesce(
+    tmp_path: Path,
+    app: StatefulApp,
+    ctx: typer.Context,
+    state: State,
+    monkeypatch: pytest.MonkeyPatch,
+    coalesce: bool,
+) -> None:
+    file = tmp_path / "commands.txt"
+    file.write_text(COALESCE_COMMANDS)
+    calls = _mock_host_api(state, monkeypatch)
+    ctx.command = typer.main.get_command(app)
+
+    b = BulkRunner(ctx, file, BulkRunnerMode.CONTINUE, coalesce=coalesce)
+    with pytest.raises(CommandFileError, match="Line 3"):
+        b.run_bulk()
+
+    # One result per line, regardless of coalescing
+    assert [e.line_number for e in b.executions] == [1, 2, 3, 4, 5, 6]
+    assert [e.line_number for e in b.executions if e.error] == [3]
+    if coalesce:
+        assert calls == [["host1", "host2", "host3", "host4"], ["host5", "host1"]]
+    else:
+        assert calls == [["host1"], ["host2", "host3"], ["host4"], ["host5"], ["host1"]]
+
+
+@pytest.mark.parametrize("coalesce", [True, False])
+def test_bulk_runner_coalesce_search(
+    tmp_path: Path,
+    app: StatefulApp,
+    ctx: typer.Context,
+    state: State,
+    monkeypatch: pytest.MonkeyPatch,
+    coalesce: bool,
+) -> None:
+    """Host names match the same hosts with and without coalescing."""
+    file = tmp_path / "commands.txt"
+    file.write_text(
+        """\
+add_host_to_hostgroup host1 Group1
+add_host_to_hostgroup host2 Group1
+"""
+    )
+    calls = _mock_host_api(state, monkeypatch, host_ids=[1, 2, 10])
+    ctx.command = typer.main.get_command(app)
+
+    b = BulkRunner(ctx, file, BulkRunnerMode.STRICT, coalesce=coalesce)
+    b.run_bulk()
+    if coalesce:
+        assert calls == [["host1", "host10", "host2"]]
+    else:
+        assert calls == [["host1", "host10"], ["host2"]]
+
+
+@pytest.mark.parametrize("coalesce", [True, False])
+def test_bulk_runner_coalesce_proxy_strategy(
+    tmp_path: Path,
+    app: StatefulApp,
+    ctx: typer.Context,
+    state: State,
+    monkeypatch: pytest.MonkeyPatch,
+    coalesce: bool,
+) -> None:
+    """Hosts are distributed among the matching proxies with and without coalescing."""
+    file = tmp_path / "commands.txt"
+    file.write_text(
+        """\
+update_host_proxy host1 proxy-.+ --strategy round-robin
+update_host_proxy host2 proxy-.+ --strategy round-robin
+"""
+    )
+    proxies = [
+        Proxy(proxyid="1", name="proxy-a", address="127.0.0.1"),
+        Proxy(proxyid="2", name="proxy-b", address="127.0.0.1"),
+    ]
+    hosts = {f"host{i}": Host(hostid=str(i), host=f"host{i}") for i in (1, 2)}
+    moved: dict[str, str] = {}
+
+    def get_hosts(*names: str, **kwargs: Any) -> list[Host]:
+        return [h for h in hosts.values() if any(n in h.host for n in names)]
+
+    def get_proxies(*names: str, **kwargs: Any) -> list[Proxy]:
+        return list(proxies)
+
+    def update_hosts_proxy(hosts: list[Host], proxy: Proxy) -> list[str]:
+        moved.update((h.host, proxy.name) for h in hosts)
+        return [h.hostid for h in hosts]
+
+    monkeypatch.setattr(state.client, "get_hosts", get_hosts)
+    monkeypatch.setattr(state.client, "get_proxies", get_proxies)
+    monkeypatch.setattr(state.client, "update_hosts_proxy", update_hosts_proxy)
+    ctx.command = typer.main.get_command(app)
+
+    b = BulkRunner(ctx, file, BulkRunnerMode.STRICT, coalesce=coalesce)
+    b.run_bulk()
+    assert moved == {"host1": "proxy-a", "host2": "proxy-b"}
+
+
+def test_bulk_runner_coalesce_strict(
+    tmp_path: Path,
+    app: StatefulApp,
+    ctx: typer.Context,
+    state: State,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    file = tmp_path / "commands.txt"
+    file.write_text(COALESCE_COMMANDS)
+    calls = _mock_host_api(state, monkeypatch)
+    ctx.command = typer.main.get_command(app)
+
+    b = BulkRunner(ctx, file, BulkRunnerMode.STRICT)
+    with pytest.raises(CommandFileError):
+        b.run_bulk()
+    # Lines after the failing line are not applied
+    assert calls == [["host1", "host2", "host3"]]
+    assert [e.line_number for e in b.executions] == [1, 2, 3]
+
+
+def test_bulk_runner_coalesce_fallback(
+    tmp_path: Path,
+    app: StatefulApp,
+    ctx: typer.Context,
+    state: State,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Lines are run individually if the mass API call fails."""
+    file = tmp_path / "commands.txt"
+    file.write_text(
+        """\
+add_host_to_hostgroup host1 Group1
+add_host_to_hostgroup host2 Group1
+add_host_to_hostgroup host3 Group1
+"""
+    )
+    calls = _mock_host_api(state, monkeypatch, fail_mass_call=True)
+    ctx.command = typer.main.get_command(app)
+
+    b = BulkRunner(ctx, file, BulkRunnerMode.STRICT)
+    b.run_bulk()
+    assert calls == [["host1"], ["host2"], ["host3"]]
+    assert all(e.result == CommandResult.SUCCESS for e in b.executions)
+
+
+def test_bulk_runner_stdin_results_file(
+    tmp_path: Path,
+    app: StatefulApp,
+    ctx: typer.Context,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test streaming commands from stdin without keeping executions in memory."""
+    import io
+    import json
+
+    @app.command(name="maybe_fail")
+    def maybe_fail(name: str = typer.Argument()) -> None:
+        if name == "fail":
+            exit_err("This command fails")
+
+    ctx.command = typer.main.get_command(app)
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO("maybe_fail ok1\n# comment\nmaybe_fail fail\nmaybe_fail ok2\n"),
+    )
+    results_file = tmp_path / "results.jsonl"
+
+    b = BulkRunner(
+        ctx,
+        Path("-"),
+        BulkRunnerMode.CONTINUE,
+        results_file=results_file,
+        keep_executions=False,
+    )
+    with pytest.raises(CommandFileError, match="Line 3"):
+        b.run_bulk()
+    assert b.counts[CommandResult.SUCCESS] == 2
+    assert b.counts[CommandResult.FAILURE] == 1
+    assert not b.executions
+    assert not b.skipped
+    assert [e.line_number for e in b.failures] == [3]
+
+    results = [json.loads(line) for line in results_file.read_text().splitlines()]
+    assert results == snapshot(
+        [
+            {
+                "line_number": 1,
+                "command": "maybe_fail ok1",
+                "result": "success",
+                "error": None,
+            },
+            {
+                "line_number": 3,
+                "command": "maybe_fail fail",
+                "result": "failure",
+                "error": "1",
+            },
+            {
+                "line_number": 4,
+                "command": "maybe_fail ok2",
+                "result": "success",
+                "error": None,
+            },
+        ]
+    )
+
+
+def test_bulk_checkpoint_complete_out_of_order(tmp_path: Path) -> None:
+    file = tmp_path / "commands.txt"
+    file.write_text("foo\n")
+    checkpoint = BulkCheckpoint.new(file, tmp_path)
+    checkpoint.complete(2)
+    checkpoint.complete(3, failed=True)
+    assert checkpoint.last_line == 0
+    checkpoint.complete(1, failed=False)
+    assert checkpoint.last_line == 3
+    assert checkpoint.failed == {3}
+    # Retried line succeeds
+    checkpoint.complete(3, failed=False)
+    assert checkpoint.last_line == 3
+    assert not checkpoint.failed
+
+
+def test_bulk_runner_resume(
+    tmp_path: Path, app: StatefulApp, ctx: typer.Context
+) -> None:
+    file = tmp_path / "commands.txt"
+    file.write_text(
+        """\
+record_run a
+record_run b
+# comment
+record_run c
+record_run d
+"""
+    )
+    ran: list[str] = []
+    failing: set[str] = {"b", "d"}
+
+    @app.command(name="record_run")
+    def record_run(name: str = typer.Argument()) -> None:
+        ran.append(name)
+        if name in failing:
+            exit_err(f"{name} failed")
+
+    ctx.command = typer.main.get_command(app)
+
+    def run(mode: BulkRunnerMode, **kwargs: Any) -> BulkRunner:
+        b = BulkRunner(
+            ctx, file, mode, checkpoint=True, checkpoint_dir=tmp_path, **kwargs
+        )
+        b.run_bulk()
+        return b
+
+    # Strict mode stops at the first failure
+    with pytest.raises(CommandFileError):
+        run(BulkRunnerMode.STRICT)
+    assert ran == ["a", "b"]
+
+    # Retrying failed lines keeps the checkpoint for lines that never ran
+    ran.clear()
+    failing.remove("b")
+    b = run(BulkRunnerMode.STRICT, retry_failed=True)
+    assert ran == ["b"]
+    assert b.not_run == 2
+    assert b.checkpoint is not None
+    assert b.checkpoint.last_line == 3
+    assert BulkCheckpoint.get_path(file, tmp_path).exists()
+
+    # Resuming continues with the lines that never ran
+    ran.clear()
+    with pytest.raises(CommandFileError):
+        run(BulkRunnerMode.CONTINUE, resume=True)
+    assert ran == ["c", "d"]
+
+    # Only the failed line is retried
+    ran.clear()
+    failing.clear()
+    b = run(BulkRunnerMode.STRICT, retry_failed=True)
+    assert ran == ["d"]
+    assert b.completed == 3
+
+    # Checkpoint is deleted when there is nothing left to run
+    assert not BulkCheckpoint.get_path(file, tmp_path).exists()
+    with pytest.raises(CommandFileError, match="No checkpoint found"):
+        run(BulkRunnerMode.STRICT, resume=True)
+
+    # File cannot be resumed after it has changed
+    failing.add("a")
+    with pytest.raises(CommandFileError):
+        run(BulkRunnerMode.STRICT)
+    file.write_text("record_run e\n")
+    with pytest.raises(CommandFileError, match="has changed"):
+        run(BulkRunnerMode.STRICT, resume=True)
+
+
+def test_bulk_runner_prefetch(
+    tmp_path: Path,
+    app: StatefulApp,
+    ctx: typer.Context,
+    state: State,
+    zabbix_client_mock_version: ZabbixAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Host groups referenced by the command file are fetched once up front."""
+    file = tmp_path / "commands.txt"
+    file.write_text(
+        """\
+show_groups Group1
+show_groups Group1,Group2
+show_groups 2
+show_groups Group*
+"""
+    )
+    groups = [
+        HostGroup(groupid="1", name="Group1"),
+        HostGroup(groupid="2", name="Group2"),
+        HostGroup(groupid="3", name="Group10"),
+    ]
+    requests: list[str] = []
+
+    def do_request(method: str, params: Any = None) -> ZabbixAPIResponse:
+        requests.append(method)
+        names = params.get("search", {}).get("name", [])
+        ids = params.get("groupids", [])
+        # Searching matches substrings
+        result = [
+            g.model_dump(mode="json")
+            for g in groups
+            if "Group*" in names
+            or any(n.casefold() in g.name.casefold() for n in names)
+            or g.groupid in ids
+        ]
+        return ZabbixAPIResponse(jsonrpc="2.0", id=0, result=result)
+
+    monkeypatch.setattr(state.client, "do_request", do_request)
+    found: list[list[str]] = []
+
+    @app.command(name="show_groups")
+    def show_groups(hostgroups: str = typer.Argument()) -> None:
+        hgs = state.client.get_hostgroups(*hostgroups.split(","), search=True)
+        found.append(sorted(hg.name for hg in hgs))
+
+    ctx.command = typer.main.get_command(app)
+
+    b = BulkRunner(ctx, file, BulkRunnerMode.STRICT, coalesce=False, prefetch=True)
+    b.run_bulk()
+    # One request each for prefetching names and IDs, one for the wildcard.
+    # Searches for prefetched names match the same groups as the API.
+    assert requests == ["hostgroup.get"] * 3
+    assert found == [
+        ["Group1", "Group10"],
+        ["Group1", "Group10", "Group2"],
+        ["Group2"],
+        ["Group1", "Group10", "Group2"],
+    ]
+    assert state.client.lookup is None
+
+
+def test_bulk_timings() -> None:
+    timings = BulkTimings()
+    for i in range(1, 101):
+        name = "slow" if i % 10 == 0 else "fast"
+        timings.add(
+            CommandExecution(
+                BulkCommand(args=[name], line=name),
+                CommandResult.SUCCESS,
+                line_number=i,
+                duration=i / 1000,
+                api_calls=1,
+                bytes=100,
+            )
+        )
+    timings.finish()
+    report = timings.to_dict()
+    assert report["commands"] == 100
+    assert report["api_calls"] == 100
+    assert report["bytes"] == 10_000
+    assert report["by_command"]["slow"]["count"] == 10
+    assert report["by_command"]["slow"]["total"] == pytest.approx(0.55)
+    # Percentiles are approximated by the histogram buckets
+    approx = partial(pytest.approx, rel=RELATIVE_ACCURACY)
+    assert report["by_command"]["slow"]["p50"] == approx(0.05)
+    assert report["by_command"]["slow"]["p99"] == approx(0.1)
+    assert report["by_command"]["fast"]["count"] == 90
+    assert report["by_command"]["fast"]["p95"] == approx(0.095)
+    assert [line["line_number"] for line in report["slowest"]] == list(
+        range(100, 90, -1)
+    )
+
+
+def test_latency_histogram_bounded() -> None:
+    histogram = LatencyHistogram()
+    for i in range(100_000):
+        histogram.add(0.001 + i / 100_000)
+    histogram.add(0.0)
+    assert histogram.count == 100_001
+    # Buckets only depend on the range of durations, not their number
+    assert len(histogram.buckets) < 400
+    assert histogram.percentile(0) == 0.0
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=RELATIVE_ACCURACY)
+    assert histogram.percentile(100) == histogram.max
+
+
+def test_bulk_runner_timings_not_requested(
+    tmp_path: Path, app: StatefulApp, ctx: typer.Context
+) -> None:
+    @app.command(name="noop")
+    def noop(name: str = typer.Argument()) -> None:
+        pass
+
+    ctx.command = typer.main.get_command(app)
+    file = tmp_path / "commands.txt"
+    file.write_text("noop a\nnoop b\n")
+
+    b = BulkRunner(ctx, file, BulkRunnerMode.STRICT)
+    b.run_bulk()
+    assert b.timings is None
+
+
+def test_bulk_runner_timings_file(
+    tmp_path: Path, app: StatefulApp, ctx: typer.Context
+) -> None:
+    import json
+
+    @app.command(name="noop")
+    def noop(name: str = typer.Argument()) -> None:
+        pass
+
+    ctx.command = typer.main.get_command(app)
+    file = tmp_path / "commands.txt"
+    file.write_text("noop a\n# comment\nnoop b\n")
+    timings_file = tmp_path / "timings.json"
+
+    b = BulkRunner(ctx, file, BulkRunnerMode.STRICT, timings_file=timings_file)
+    b.run_bulk()
+    assert all(e.duration > 0 for e in b.executions)
+
+    report = json.loads(timings_file.read_text())
+    assert report["commands"] == 2
+    assert report["by_command"]["noop"]["count"] == 2
+    assert sorted(line["line_number"] for line in report["slowest"]) == [1, 3]
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
 import logging
+import timeit
+from enum import Enum
+from typing import Any
+from typing import Literal
+from typing import Optional
 
 import pytest
 from inline_snapshot import snapshot
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import computed_field
 from pytest import LogCaptureFixture
+from zabbix_cli.exceptions import ZabbixCLIError
+from zabbix_cli.models import AggregateResult
+from zabbix_cli.models import FieldKind
 from zabbix_cli.models import MetaKey
+from zabbix_cli.models import SortKey
 from zabbix_cli.models import TableRenderable
+from zabbix_cli.models import fmt_field_name
+from zabbix_cli.models import get_columns
+from zabbix_cli.models import get_field_kind
+from zabbix_cli.models import select_fields
 
 
 @pytest.mark.parametrize(
@@ -111,3 +125,161 @@ def test_rows_with_unknown_base_model(caplog: LogCaptureFixture) -> None:
     assert record.funcName == "__rows__"
     assert record.stack_info is not None
     assert "test_rows_with_unknown_base_model" in record.stack_info
+
+
+class Status(Enum):
+    ON = 0
+
+
+@pytest.mark.parametrize(
+    "annotation, expect",
+    [
+        (str, FieldKind.TEXT),
+        (int, FieldKind.TEXT),
+        (Optional[str], FieldKind.TEXT),  # noqa: UP045
+        (str | int | None, FieldKind.TEXT),
+        (Literal["a", "b"], FieldKind.TEXT),
+        (Status, FieldKind.TEXT),
+        (list[str], FieldKind.ANY),
+        (Optional[list[str]], FieldKind.ANY),  # noqa: UP045
+        (TableRenderable, FieldKind.ANY),
+        (Any, FieldKind.ANY),
+    ],
+)
+def test_get_field_kind(annotation: Any, expect: FieldKind) -> None:
+    assert get_field_kind(annotation) == expect
+
+
+class BenchRow(TableRenderable):
+    name: str
+    count: int
+    description: str | None = None
+    tags: list[str] = Field(
+        default_factory=list, json_schema_extra={MetaKey.JOIN_CHAR: ", "}
+    )
+    hidden: str = Field(default="", exclude=True)
+
+
+def _uncached_cols_rows(obj: TableRenderable) -> tuple[list[str], list[list[str]]]:
+    """Column and row extraction looking up the field metadata for every object."""
+    cols: list[str] = []
+    row: list[str] = []
+    for name, field in obj.__all_fields__().items():
+        extra = (
+            field.json_schema_extra if isinstance(field.json_schema_extra, dict) else {}
+        )
+        cols.append(str(extra.get(MetaKey.HEADER) or fmt_field_name(name)))
+        value = getattr(obj, name, "")
+        if isinstance(value, list):
+            join_char = obj._get_extra(name, MetaKey.JOIN_CHAR, "\n")  # pyright: ignore[reportPrivateUsage]
+            row.append(join_char.join(str(v) for v in value))  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+        else:
+            row.append(str(value))
+    return cols, [row]
+
+
+def test_cols_rows_cached() -> None:
+    """Field metadata used for column and row extraction is cached per class."""
+    objs = [BenchRow(name=f"host{i}", count=i, tags=["a", "b"]) for i in range(100)]
+    assert objs[0].__cols_rows__() == _uncached_cols_rows(objs[0])
+    assert objs[0].__cols_rows__() == (
+        ["Name", "Count", "Description", "Tags"],
+        [["host0", "0", "None", "a, b"]],
+    )
+
+    misses = get_columns.cache_info().misses
+    for obj in objs:
+        assert obj.__cols_rows__() == _uncached_cols_rows(obj)
+    # Metadata is computed once per class, not per object
+    assert get_columns.cache_info().misses == misses
+
+
+@pytest.mark.benchmark
+def test_cols_rows_benchmark() -> None:
+    """Micro-benchmark of column and row extraction with cached field metadata."""
+    objs = [BenchRow(name=f"host{i}", count=i, tags=["a", "b"]) for i in range(5000)]
+
+    def cached() -> None:
+        for obj in objs:
+            obj.__cols_rows__()
+
+    def uncached() -> None:
+        for obj in objs:
+            _uncached_cols_rows(obj)
+
+    cached_time = min(timeit.repeat(cached, number=1, repeat=3))
+    uncached_time = min(timeit.repeat(uncached, number=1, repeat=3))
+    assert cached_time < uncached_time
+
+
+@pytest.mark.parametrize(
+    "value, expect",
+    [
+        ("host", SortKey("host")),
+        ("host:desc", SortKey("host", descending=True)),
+        ("host:ASC", SortKey("host")),
+    ],
+)
+def test_sort_key_parse(value: str, expect: SortKey) -> None:
+    assert SortKey.parse(value) == expect
+
+
+@pytest.mark.parametrize("value", ["", ":desc", "host:up"])
+def test_sort_key_parse_invalid(value: str) -> None:
+    with pytest.raises(ZabbixCLIError):
+        SortKey.parse(value)
+
+
+def test_aggregate_result_sort_by() -> None:
+    result = AggregateResult(
+        result=[
+            BenchRow(name="b", count=10),
+            BenchRow(name="a", count=9, description="x"),
+            BenchRow(name="C", count=100),
+        ]
+    )
+    result.sort_by(SortKey("count"))
+    # Numeric values are sorted numerically
+    assert [r.count for r in result.result] == [9, 10, 100]
+    result.sort_by(SortKey("Name", descending=True))
+    assert [r.name for r in result.result] == ["C", "b", "a"]
+    # Missing values are last
+    result.sort_by(SortKey("description"))
+    assert result.result[0].name == "a"
+    with pytest.raises(ZabbixCLIError, match="Unknown field 'foo'"):
+        result.sort_by(SortKey("foo"))
+
+
+def test_select_fields() -> None:
+    class Custom(TableRenderable):
+        name: str
+        count: int = 0
+        tags: list[str] = Field(
+            default_factory=list, json_schema_extra={MetaKey.HEADER: "Labels"}
+        )
+
+        @computed_field
+        @property
+        def upper(self) -> str:
+            return self.name.upper()
+
+        def __cols_rows__(self) -> tuple[list[str], list[list[str]]]:  # pyright: ignore[reportIncompatibleMethodOverride]
+            return ["Custom"], [[self.name]]
+
+    obj = Custom(name="a", count=2, tags=["x", "y"])
+    selected = select_fields(obj, ["upper", "labels", "name"])
+    # Selected fields use the default columns and rows, in the given order
+    assert selected.__cols_rows__() == (
+        ["Upper", "Labels", "Name"],
+        [["A", "x\ny", "a"]],
+    )
+    assert selected.model_dump(mode="json") == {
+        "upper": "A",
+        "tags": ["x", "y"],
+        "name": "a",
+    }
+    # Models are created once per class and fields
+    assert type(select_fields(obj, ["upper", "tags", "name"])) is type(selected)
+
+    aggregate = AggregateResult(result=[obj, obj]).select(["count"])
+    assert aggregate.__cols_rows__() == (["Count"], [["2"], ["2"]])
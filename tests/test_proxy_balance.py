@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import pytest
+from zabbix_cli.proxy_balance import LoadMetric
+from zabbix_cli.proxy_balance import ProxyBalance
+from zabbix_cli.proxy_balance import get_host_loads
+from zabbix_cli.proxy_balance import get_targets
+from zabbix_cli.proxy_balance import parse_delay
+from zabbix_cli.proxy_balance import plan_rebalance
+from zabbix_cli.pyzabbix.client import ZabbixAPI
+from zabbix_cli.pyzabbix.types import Host
+from zabbix_cli.pyzabbix.types import Proxy
+
+
+@pytest.mark.parametrize(
+    "total, weights, expected",
+    [
+        (10, [1, 1], [5, 5]),
+        (10, [1, 1, 1], [4, 3, 3]),
+        (9, [2, 1], [6, 3]),
+        (5, [1, 0, 1], [3, 0, 2]),
+        (0, [1, 1], [0, 0]),
+    ],
+)
+def test_get_targets(total: int, weights: list[int], expected: list[int]) -> None:
+    assert get_targets(total, weights) == expected
+
+
+def make_balances(counts: list[int], weights: list[int]) -> list[ProxyBalance]:
+    balances: list[ProxyBalance] = []
+    hostid = 0
+    for i, (count, weight) in enumerate(zip(counts, weights, strict=True)):
+        hosts: list[Host] = []
+        for _ in range(count):
+            hostid += 1
+            hosts.append(Host(hostid=str(hostid), host=f"host{hostid}"))
+        proxy = Proxy(proxyid=str(i + 1), name=f"proxy{i + 1}", address="127.0.0.1")
+        balances.append(ProxyBalance(proxy=proxy, weight=weight, hosts=hosts))
+    return balances
+
+
+@pytest.mark.parametrize("consistent", [False, True])
+def test_plan_rebalance(consistent: bool) -> None:
+    # Balanced proxies are left alone
+    balances = make_balances([50, 50], [1, 1])
+    assert not plan_rebalance(balances, consistent=consistent)
+
+    # Only the surplus is moved
+    balances = make_balances([90, 10, 0], [1, 1, 1])
+    moves = plan_rebalance(balances, consistent=consistent)
+    assert len(moves) == 56
+    assert [b.target for b in balances] == [34, 33, 33]
+    assert [b.count for b in balances] == [34, 33, 33]
+    assert all(m.source is balances[0] for m in moves)
+    assert len(balances[1].incoming) == 23
+    assert len(balances[2].incoming) == 33
+
+
+def test_plan_rebalance_consistent() -> None:
+    # Adding a proxy only moves hosts to the new proxy, and the same hosts
+    # are chosen on every run
+    balances = make_balances([60, 60, 0], [1, 1, 1])
+    moves = plan_rebalance(balances, consistent=True)
+    assert all(m.destination is balances[2] for m in moves)
+    assert len(moves) == 40
+    again = plan_rebalance(balances, consistent=True)
+    assert [m.host.hostid for m in again] == [m.host.hostid for m in moves]
+
+
+@pytest.mark.parametrize(
+    "delay, expected",
+    [
+        ("30", 30),
+        ("30s", 30),
+        ("5m", 300),
+        ("1h;10s/1-5,09:00-18:00", 3600),
+        ("0", 0),
+        (None, 0),
+        ("{$INTERVAL}", 60),
+    ],
+)
+def test_parse_delay(delay: str | None, expected: float) -> None:
+    assert parse_delay(delay) == expected
+
+
+def test_get_host_loads(
+    zabbix_client: ZabbixAPI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    counted: list[list[str]] = []
+    requested: list[list[str]] = []
+    items = {
+        "1": ["10s", "1m", "0"],
+        "2": ["1m"],
+        "4": ["1h", "1h"],
+    }
+
+    def get_item_counts(hostids: list[str]) -> dict[str, int]:
+        counted.append(hostids)
+        return {h: len(items[h]) for h in hostids if h in items}
+
+    def get_item_delays(hostids: list[str]) -> list[tuple[str, str]]:
+        requested.append(hostids)
+        return [(h, d) for h in hostids for d in items.get(h, [])]
+
+    monkeypatch.setattr(zabbix_client, "get_item_counts", get_item_counts)
+    monkeypatch.setattr(zabbix_client, "get_item_delays", get_item_delays)
+    hosts = [Host(hostid=str(i), host=f"host{i}") for i in (1, 2, 3, 4)]
+    loads = get_host_loads(zabbix_client, hosts, chunk_size=2, item_chunk_size=3)
+
+    assert counted == [["1", "2"], ["3", "4"]]
+    # Chunked by number of items, skipping hosts without items
+    assert requested == [["1"], ["2", "4"]]
+    assert loads["1"].items == 3
+    assert loads["1"].nvps == pytest.approx(0.1 + 1 / 60)
+    assert loads["2"].get(LoadMetric.ITEMS) == 1
+    assert loads["3"].get(LoadMetric.NVPS) == 0
+    assert loads["3"].get(LoadMetric.HOSTS) == 1
+    assert loads["4"].nvps == pytest.approx(2 / 3600)
+
+    # Items are only counted if values per second are not needed
+    requested.clear()
+    loads = get_host_loads(zabbix_client, hosts, nvps=False)
+    assert not requested
+    assert loads["4"].items == 2
+    assert loads["4"].nvps == 0
+
+
+def test_plan_rebalance_loads() -> None:
+    # Moving a heavy host would only make the imbalance worse
+    balances = make_balances([1, 9], [1, 1])
+    loads = {"1": 5000.0, **{str(i): 100.0 for i in range(2, 11)}}
+    moves = plan_rebalance(balances, loads=loads)
+    assert [b.target for b in balances] == [2950.0, 2950.0]
+    assert not moves
+
+    # Heavy hosts are moved first
+    balances = make_balances([2, 1, 1], [1, 1, 1])
+    loads = {"1": 200.0, "2": 100.0, "3": 100.0, "4": 0.0}
+    moves = plan_rebalance(balances, loads=loads)
+    assert [(m.host.hostid, m.destination.proxy.name) for m in moves] == [
+        ("1", "proxy3")
+    ]
+    assert [b.load_after for b in balances] == [100.0, 100.0, 200.0]
+
+    # Hosts are only moved while they bring proxies closer to their targets
+    balances = make_balances([0, 0, 10], [1, 1, 1])
+    loads = {str(i): 100.0 for i in range(1, 11)}
+    moves = plan_rebalance(balances, loads=loads)
+    assert len(moves) == 6
+    assert [b.load_after for b in balances] == [300.0, 300.0, 400.0]
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import shlex
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pydantic import Field
+from zabbix_cli.config.constants import OutputFormat
+from zabbix_cli.models import AggregateResult
+from zabbix_cli.models import MetaKey
+from zabbix_cli.models import Result
+from zabbix_cli.models import SortKey
+from zabbix_cli.models import TableRenderable
+from zabbix_cli.output.console import console
+from zabbix_cli.output.pager import is_paging
+from zabbix_cli.output.pager import pager
+from zabbix_cli.output.pager import should_page
+from zabbix_cli.output.plain import CsvWriter
+from zabbix_cli.output.plain import Joiners
+from zabbix_cli.output.plain import format_plain_table
+from zabbix_cli.output.plain import plain_cell
+from zabbix_cli.output.render import is_streaming
+from zabbix_cli.output.render import iter_json_chunks
+from zabbix_cli.output.render import render_json
+from zabbix_cli.output.render import render_json_legacy
+from zabbix_cli.output.render import render_pages
+from zabbix_cli.output.render import render_result
+from zabbix_cli.output.render import write_json
+from zabbix_cli.pyzabbix.types import Host
+from zabbix_cli.pyzabbix.types import HostGroup
+from zabbix_cli.state import State
+
+
+def make_result() -> AggregateResult[Host]:
+    return AggregateResult(
+        result=[Host(hostid=str(i), host=f"høst-{i}") for i in range(3)]
+    )
+
+
+@pytest.mark.parametrize("legacy", [False, True])
+def test_render_json_direct(
+    state: State,
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+    legacy: bool,
+) -> None:
+    """JSON written directly is identical to JSON printed by Rich."""
+    render = render_json_legacy if legacy else render_json
+
+    render(make_result())
+    direct = capsys.readouterr().out
+
+    monkeypatch.setattr("zabbix_cli.output.render.should_write_json", lambda: False)
+    render(make_result())
+    assert direct == capsys.readouterr().out
+    assert "høst-0" in direct
+
+
+def test_render_json_compact(state: State, capsys: pytest.CaptureFixture[str]) -> None:
+    state.config.app.output.compact_json = True
+    render_json(make_result())
+    out = capsys.readouterr().out
+    assert out.count("\n") == 1
+    assert json.loads(out)["result"][2]["host"] == "høst-2"
+
+
+def test_write_json_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("zabbix_cli.output.render.JSON_WRITE_CHUNK_SIZE", 4)
+    file = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    file.write("before ")
+    write_json(b'{"a": [1, 2, 3]}', file)
+    assert file.buffer.getvalue() == b'before {"a": [1, 2, 3]}\n'  # type: ignore
+
+    text = io.StringIO()
+    write_json(b"[]", text)
+    assert text.getvalue() == "[]\n"
+
+
+def test_render_ndjson(state: State, capsys: pytest.CaptureFixture[str]) -> None:
+    state.config.app.output.format = OutputFormat.NDJSON
+    render_result(make_result())
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["host"] for line in lines] == [
+        "høst-0",
+        "høst-1",
+        "høst-2",
+    ]
+
+    render_result(Result(message="Created host"))
+    captured = capsys.readouterr()
+    assert json.loads(captured.out)["message"] == "Created host"
+    assert "Created host" in captured.err
+
+
+def test_render_pages_streams(state: State, capsys: pytest.CaptureFixture[str]) -> None:
+    state.config.app.output.format = OutputFormat.NDJSON
+    rendered: list[int] = []
+
+    def pages() -> Iterator[list[Host]]:
+        for i in range(3):
+            # Previous pages are written before the next page is fetched
+            rendered.append(capsys.readouterr().out.count("\n"))
+            yield [Host(hostid=str(i), host=f"host{i}")]
+
+    render_pages(pages())
+    assert rendered == [0, 1, 1]
+    assert json.loads(capsys.readouterr().out)["host"] == "host2"
+
+
+def test_render_csv(state: State, capsys: pytest.CaptureFixture[str]) -> None:
+    state.config.app.output.format = OutputFormat.CSV
+    groups = [HostGroup(groupid="1", name="A"), HostGroup(groupid="2", name="B")]
+    render_result(
+        AggregateResult(
+            result=[
+                Host(hostid="1", host="host1", groups=groups),
+                Host(hostid="2", host='host "2", with comma'),
+            ]
+        )
+    )
+    rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+    assert rows[0][:3] == ["HostID", "Name", "Host groups"]
+    assert rows[1][:3] == ["1", "host1", "A; B"]
+    assert rows[2][:3] == ["2", 'host "2", with comma', ""]
+
+    render_result(Result(message="Created host"))
+    captured = capsys.readouterr()
+    assert not captured.out
+    assert "Created host" in captured.err
+
+
+class Nested(TableRenderable):
+    name: str
+    tags: list[str] = Field(default_factory=list)
+    groups: list[HostGroup] = Field(default_factory=list)
+    styled: str = Field(default="", json_schema_extra={MetaKey.HEADER: "Styled"})
+
+
+def test_csv_writer_flattens() -> None:
+    file = io.StringIO()
+    writer = CsvWriter(file, Joiners(items=" | ", cells="/"))
+    obj = Nested(
+        name="a",
+        tags=["x", "y"],
+        groups=[HostGroup(groupid="1", name="G1"), HostGroup(groupid="2", name="G2")],
+        styled="item[key]",
+    )
+    # Header is only written once across pages
+    writer.write([obj])
+    writer.write([obj])
+    rows = list(csv.reader(io.StringIO(file.getvalue())))
+    assert rows[0] == ["Name", "Tags", "Groups", "Styled"]
+    assert rows[1] == [
+        "a",
+        "x | y",
+        "1/G1/Plain/Unknown | 2/G2/Plain/Unknown",
+        "item[key]",
+    ]
+    assert rows[1] == rows[2]
+    assert len(rows) == 3
+
+
+def test_plain_cell() -> None:
+    assert plain_cell("[green]On[/]") == "On"
+    assert plain_cell("system.cpu.load[percpu,avg]") == "system.cpu.load[percpu,avg]"
+    assert plain_cell("a\nb", Joiners(items=",")) == "a,b"
+
+
+def test_render_pages_streams_csv(
+    state: State, capsys: pytest.CaptureFixture[str]
+) -> None:
+    state.config.app.output.format = OutputFormat.CSV
+    render_pages([[Host(hostid=str(i), host=f"host{i}")] for i in range(3)])
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 4
+    assert lines[0].startswith("HostID,")
+    assert lines[3].startswith("2,host2,")
+
+
+def test_format_plain_table() -> None:
+    obj = Nested(name="a" * 20, tags=["x", "y"], styled="ø")
+    lines = list(format_plain_table([AggregateResult(result=[obj, obj])], max_width=8))
+    assert lines == [
+        "Name      Tags  Groups  Styled",
+        "--------  ----  ------  ------",
+        "aaaaaaa…  x; y          ø",
+        "aaaaaaa…  x; y          ø",
+    ]
+    assert not list(format_plain_table([AggregateResult(result=[])], max_width=8))
+
+
+@pytest.mark.parametrize("threshold, plain", [(0, False), (2, True), (3, False)])
+def test_render_table_plain_threshold(
+    state: State, capsys: pytest.CaptureFixture[str], threshold: int, plain: bool
+) -> None:
+    state.config.app.output.plain_threshold = threshold
+    render_result(make_result())
+    out = capsys.readouterr().out
+    assert out.startswith("HostID  Name") is plain
+    assert "høst-2" in out
+
+
+@pytest.mark.parametrize("indent", [2, None])
+@pytest.mark.parametrize("n", [0, 1, 3])
+def test_iter_json_chunks(indent: int | None, n: int) -> None:
+    hosts = [
+        Host(hostid=str(i), host=f"høst-{i}", groups=[HostGroup(groupid="1", name="A")])
+        for i in range(n)
+    ]
+    result = AggregateResult(result=hosts)
+    expect = result.__pydantic_serializer__.to_json(
+        result, indent=indent, by_alias=True
+    ).decode()
+    chunks = iter_json_chunks(AggregateResult(), iter(hosts), indent)
+    assert "".join(chunks) == expect
+
+
+def test_format_plain_table_sample() -> None:
+    objs = [Nested(name="a"), Nested(name="bbbbbb")]
+    converted: list[str] = []
+
+    def iter_objs() -> Iterator[Nested]:
+        for obj in objs:
+            converted.append(obj.name)
+            yield obj
+
+    lines = format_plain_table(iter_objs(), max_width=10, sample=1)
+    assert next(lines) == "Name  Tags  Groups  Styled"
+    assert converted == ["a"]
+    # Rows after the sample are truncated to the widths of the sample
+    assert list(lines)[-1] == "bbb…"
+    assert converted == ["a", "bbbbbb"]
+
+
+@pytest.fixture
+def paging(state: State, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Enable paging as if stdout was a terminal."""
+    state.config.app.output.paging = True
+    monkeypatch.setattr(console, "_force_terminal", True)
+
+
+def test_pager(paging: None, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    out = tmp_path / "out.txt"
+    script = f"import sys; open({str(out)!r}, 'w').write(sys.stdin.read())"
+    monkeypatch.setenv("PAGER", shlex.join([sys.executable, "-c", script]))
+    assert should_page()
+    with pager():
+        assert is_paging()
+        assert not should_page()
+        console.print("paged")
+    assert not is_paging()
+    assert out.read_text() == "paged\n"
+
+
+@pytest.mark.parametrize("fmt", [OutputFormat.TABLE, OutputFormat.JSON])
+def test_render_pages_lazily(
+    state: State, paging: None, monkeypatch: pytest.MonkeyPatch, fmt: OutputFormat
+) -> None:
+    """Pages are only fetched until the pager is closed."""
+    # Pager that exits after reading the first line
+    script = "import sys; sys.stdin.readline()"
+    monkeypatch.setenv("PAGER", shlex.join([sys.executable, "-c", script]))
+    state.config.app.output.format = fmt
+    state.config.app.output.plain_threshold = 10
+    assert is_streaming()
+    fetched = 0
+
+    def pages() -> Iterator[list[Host]]:
+        nonlocal fetched
+        while True:
+            fetched += 1
+            yield [Host(hostid=str(i), host=f"host{i}") for i in range(100)]
+
+    render_pages(pages())
+    assert not is_paging()
+    assert 0 < fetched < 10000
+
+
+def test_render_fields_sort(state: State, capsys: pytest.CaptureFixture[str]) -> None:
+    state.config.app.output.format = OutputFormat.CSV
+    state.fields = ["host", "hostid"]
+    state.sort = SortKey("hostid", descending=True)
+    hosts = [Host(hostid=str(i), host=f"host{i}") for i in (2, 10, 1)]
+    render_result(AggregateResult(result=hosts))
+    rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+    assert rows == [
+        ["Host", "Hostid"],
+        ["host10", "10"],
+        ["host2", "2"],
+        ["host1", "1"],
+    ]
+
+    # Pages are collected before they are sorted
+    render_pages([[host] for host in hosts])
+    assert capsys.readouterr().out.splitlines()[1:] == [
+        "host10,10",
+        "host2,2",
+        "host1,1",
+    ]
+
+    # Fields can be selected while results are streamed
+    state.sort = None
+    render_pages([[host] for host in hosts])
+    assert capsys.readouterr().out.splitlines()[1] == "host2,2"
@@ -1,7 +1,32 @@
 from __future__ import annotations
 
+import csv
+import io
+import threading
+from pathlib import Path
+
+import click
+import pytest
 from inline_snapshot import snapshot
+from prompt_toolkit.document import Document
+from zabbix_cli.config.constants import OutputFormat
+from zabbix_cli.exceptions import ZabbixCLIError
+from zabbix_cli.models import AggregateResult
+from zabbix_cli.models import Result
+from zabbix_cli.output.render import render_pages
+from zabbix_cli.output.render import render_result
+from zabbix_cli.pyzabbix.client import ZabbixAPI
+from zabbix_cli.pyzabbix.types import Host
+from zabbix_cli.repl.completer import ClickCompleter
+from zabbix_cli.repl.names import NameKind
+from zabbix_cli.repl.names import ObjectNames
+from zabbix_cli.repl.names import PrefixIndex
 from zabbix_cli.repl.repl import _help_internal  # pyright: ignore[reportPrivateUsage]
+from zabbix_cli.repl.repl import handle_internal_commands
+from zabbix_cli.repl.results import ResultBuffer
+from zabbix_cli.repl.results import estimate_size
+from zabbix_cli.repl.results import parse_redirect
+from zabbix_cli.state import State
 
 
 def test_help_internal() -> None:
@@ -16,5 +41,176 @@ REPL help:
     prefix internal commands with ":"
     :exit, :q, :quit  exits the repl
     :?, :h, :help     displays general help information
+    :last             re-renders a previous result (see :last --help)
+    :results          lists the results that can be re-rendered
 """
     )
+
+
+def make_hosts(n: int) -> list[Host]:
+    return [
+        Host(hostid=str(i), host=f"host{i}", description="x" * 100) for i in range(n)
+    ]
+
+
+def test_result_buffer_eviction() -> None:
+    size = estimate_size(make_hosts(10))
+    buffer = ResultBuffer(max_results=3, max_size=size * 2)
+    for i in range(4):
+        buffer.add(f"cmd{i}", AggregateResult(result=make_hosts(5)))
+    # Evicted by number of results
+    assert [r.command for r in buffer.results] == ["cmd1", "cmd2", "cmd3"]
+    assert buffer.get(1).command == "cmd3"
+
+    # Evicted by size
+    buffer.add("big", AggregateResult(result=make_hosts(15)))
+    assert [r.command for r in buffer.results] == ["big"]
+    assert buffer.size == buffer.get().size
+
+    # Results larger than the buffer are not added
+    buffer.add("huge", AggregateResult(result=make_hosts(30)))
+    assert buffer.get().command == "big"
+    with pytest.raises(ZabbixCLIError):
+        buffer.get(2)
+
+
+def test_result_buffer_records(state: State) -> None:
+    state.repl = True
+    buffer = state.result_buffer
+    render_result(Result(message="Created host"))
+    render_pages([make_hosts(2), make_hosts(1)])
+    buffer.commit("show_hosts")
+    assert len(buffer.results) == 1
+    assert buffer.get().n_items == 3
+
+    # Pages are not recorded if they are not all rendered
+    pages = buffer.record_pages([make_hosts(2), make_hosts(1)])
+    next(iter(pages))
+    buffer.commit("show_hosts")
+    assert len(buffer.results) == 1
+
+
+@pytest.mark.parametrize(
+    "args, expect",
+    [
+        (["--sort", "host"], ["--sort", "host"]),
+        (
+            ["--grep", "web", ">", "out.csv"],
+            ["--grep", "web", "--output-file", "out.csv"],
+        ),
+        ([">out.csv"], ["--output-file", "out.csv"]),
+    ],
+)
+def test_parse_redirect(args: list[str], expect: list[str]) -> None:
+    assert parse_redirect(args) == expect
+
+
+def test_last(state: State, capsys: pytest.CaptureFixture[str], tmp_path: Path) -> None:
+    state.repl = True
+    hosts = [
+        Host(hostid="1", host="web2", status="0"),
+        Host(hostid="2", host="db1"),
+        Host(hostid="3", host="WEB1", status="1"),
+    ]
+    state.result_buffer.add("show_hosts", AggregateResult(result=hosts))
+
+    path = tmp_path / "hosts.csv"
+    handle_internal_commands(
+        f":last --sort host --grep web --fields host,status -o csv > {path}"
+    )
+    with path.open(encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows == [["Host", "Status"], ["WEB1", "1"], ["web2", "0"]]
+
+    # Options only apply to the re-rendered result
+    assert state.config.app.output.format == OutputFormat.TABLE
+    assert state.fields is None
+    assert state.sort is None
+    assert state.output_file is None
+    # The buffered result is unchanged and the re-rendered result is not buffered
+    assert state.result_buffer.get().result.result == hosts  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+    assert len(state.result_buffer.results) == 1
+
+    capsys.readouterr()
+    handle_internal_commands(":last -o csv")
+    rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+    assert [row[1] for row in rows[1:]] == ["web2", "db1", "WEB1"]
+
+    with pytest.raises(ZabbixCLIError):
+        handle_internal_commands(":last 2")
+
+
+def test_revert_output_options(state: State) -> None:
+    state.repl = True
+    state._config_loaded = True  # pyright: ignore[reportPrivateUsage]
+    state.revert_config_overrides()  # REPL started
+    state.fields = ["host"]
+    state.output_file = Path("hosts.csv")
+    state.revert_config_overrides()  # next command
+    assert state.fields is None
+    assert state.output_file is None
+
+
+def test_prefix_index() -> None:
+    index = PrefixIndex(["web2", "Web1", "db1", "web2", "", "webserver"])
+    assert len(index) == 4
+    assert index.search("web") == ["Web1", "web2", "webserver"]
+    assert index.search("WEB", limit=2) == ["Web1", "web2"]
+    assert index.search("x") == []
+    assert index.search("") == ["db1", "Web1", "web2", "webserver"]
+
+
+def test_object_names(zabbix_client: ZabbixAPI) -> None:
+    names = ObjectNames(zabbix_client, ttl=60)
+    fetched: list[list[str]] = [["Linux servers"], ["Linux servers", "Lab"]]
+    names.fetchers[NameKind.HOSTGROUP] = lambda: fetched.pop(0)
+
+    # Names are fetched in the background
+    assert names.search(NameKind.HOSTGROUP, "l") == []
+    wait_for_refresh(names)
+    assert names.search(NameKind.HOSTGROUP, "l") == ["Linux servers"]
+
+    # Modified names are refreshed in the background
+    names.invalidate("hostgroup.get")
+    assert names.refresh([]) is None
+    names.invalidate("hostgroup.create")
+    assert names.search(NameKind.HOSTGROUP, "l") == ["Linux servers"]
+    wait_for_refresh(names)
+    assert names.search(NameKind.HOSTGROUP, "l") == ["Lab", "Linux servers"]
+
+    # Failed refreshes keep the previous names
+    names.invalidate("hostgroup.delete")
+    names.search(NameKind.HOSTGROUP, "l")
+    wait_for_refresh(names)
+    assert names.search(NameKind.HOSTGROUP, "l") == ["Lab", "Linux servers"]
+
+
+def wait_for_refresh(names: ObjectNames) -> None:
+    for thread in threading.enumerate():
+        if thread.name == "repl-names":
+            thread.join()
+
+
+def test_completer_names(zabbix_client: ZabbixAPI) -> None:
+    @click.group()
+    def cli() -> None: ...
+
+    @cli.command("add_host")
+    @click.argument("hostgroups")
+    @click.option("--proxy")
+    def add_host(hostgroups: str, proxy: str | None) -> None: ...
+
+    names = ObjectNames(zabbix_client)
+    names.fetchers[NameKind.HOSTGROUP] = lambda: ["Linux servers", "Lab"]
+    names.fetchers[NameKind.PROXY] = lambda: ["proxy1"]
+    names.refresh([NameKind.HOSTGROUP, NameKind.PROXY])
+    wait_for_refresh(names)
+    completer = ClickCompleter(cli, click.Context(cli), names=names)
+
+    def complete(text: str) -> list[str]:
+        return [c.text for c in completer.get_completions(Document(text))]
+
+    assert complete("add_host La") == ["Lab"]
+    assert complete("add_host Lab,li") == ["'Lab,Linux servers'"]
+    assert complete('add_host "Li') == ['"Linux servers"']
+    assert complete("add_host Lab --proxy p") == ["proxy1"]
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import csv
+import json
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from zabbix_cli.config.constants import OutputFormat
+from zabbix_cli.exceptions import ZabbixCLIFileError
+from zabbix_cli.models import AggregateResult
+from zabbix_cli.output.render import is_streaming
+from zabbix_cli.output.render import render_pages
+from zabbix_cli.output.render import render_result
+from zabbix_cli.output.sinks import SinkFormat
+from zabbix_cli.output.sinks import get_sink_format
+from zabbix_cli.output.sinks import write_file
+from zabbix_cli.pyzabbix.types import Host
+from zabbix_cli.pyzabbix.types import HostGroup
+from zabbix_cli.state import State
+
+
+def make_pages() -> list[list[Host]]:
+    groups = [HostGroup(groupid="1", name="A"), HostGroup(groupid="2", name="B")]
+    return [
+        [Host(hostid=str(i), host=f"høst-{i}", groups=groups) for i in range(j, j + 2)]
+        for j in (0, 2)
+    ]
+
+
+@pytest.mark.parametrize(
+    "name, fmt, expect",
+    [
+        ("hosts.json", OutputFormat.TABLE, SinkFormat.JSON),
+        ("hosts.JSONL", OutputFormat.TABLE, SinkFormat.NDJSON),
+        ("hosts.csv", OutputFormat.JSON, SinkFormat.CSV),
+        ("hosts.sqlite3", OutputFormat.TABLE, SinkFormat.SQLITE),
+        ("hosts.txt", OutputFormat.CSV, SinkFormat.CSV),
+        ("hosts", OutputFormat.TABLE, SinkFormat.JSON),
+    ],
+)
+def test_get_sink_format(
+    state: State, name: str, fmt: OutputFormat, expect: SinkFormat
+) -> None:
+    state.config.app.output.format = fmt
+    assert get_sink_format(Path(name)) == expect
+
+
+def test_write_file_json(state: State, tmp_path: Path) -> None:
+    path = tmp_path / "hosts.json"
+    assert write_file(path, make_pages()) == 4
+    result = AggregateResult(result=[h for page in make_pages() for h in page])
+    assert (
+        path.read_text(encoding="utf-8")
+        == result.model_dump_json(indent=2, by_alias=True) + "\n"
+    )
+
+
+def test_write_file_text(state: State, tmp_path: Path) -> None:
+    path = tmp_path / "hosts.ndjson"
+    write_file(path, make_pages())
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["host"] for line in lines] == [
+        "høst-0",
+        "høst-1",
+        "høst-2",
+        "høst-3",
+    ]
+
+    path = tmp_path / "hosts.csv"
+    write_file(path, make_pages())
+    with path.open(encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert len(rows) == 5
+    assert rows[4][:3] == ["3", "høst-3", "A; B"]
+
+
+def test_write_file_sqlite(
+    state: State, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("zabbix_cli.output.sinks.SQLITE_BATCH_SIZE", 3)
+    path = tmp_path / "hosts.db"
+    write_file(path, [[HostGroup(groupid="9", name="old")]])
+    # Tables are replaced
+    assert write_file(path, make_pages()) == 4
+
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute(
+            'SELECT hostid, host, groups FROM "results" ORDER BY hostid'
+        ).fetchall()
+        types = {row[1]: row[2] for row in conn.execute('PRAGMA table_info("results")')}
+    finally:
+        conn.close()
+    assert [r[1] for r in rows] == ["høst-0", "høst-1", "høst-2", "høst-3"]
+    assert [g["name"] for g in json.loads(rows[0][2])] == ["A", "B"]
+    assert types["hostid"] == "TEXT"
+    assert types["groups"] == "TEXT"
+    assert "name" not in types
+
+
+def test_write_file_sqlite_replace(state: State, tmp_path: Path) -> None:
+    path = tmp_path / "hosts.db"
+    write_file(path, make_pages())
+
+    def failing_pages() -> Iterator[list[Host]]:
+        yield make_pages()[0]
+        raise OSError("Connection lost")
+
+    def count() -> int | None:
+        conn = sqlite3.connect(path)
+        try:
+            return conn.execute('SELECT COUNT(*) FROM "results"').fetchone()[0]
+        except sqlite3.OperationalError:
+            return None  # no such table
+        finally:
+            conn.close()
+
+    # Table is kept if writing fails
+    with pytest.raises(ZabbixCLIFileError):
+        write_file(path, failing_pages())
+    assert count() == 4
+
+    # Empty results leave no stale rows behind
+    assert write_file(path, [[]]) == 0
+    assert count() is None
+
+
+def test_render_pages_output_file(
+    state: State, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = tmp_path / "hosts.ndjson"
+    state.output_file = path
+    # Results are fetched page by page
+    assert is_streaming()
+    fetched: list[int] = []
+
+    def pages() -> Iterator[list[Host]]:
+        for i, page in enumerate(make_pages()):
+            fetched.append(i)
+            yield page
+
+    render_pages(pages())
+    assert fetched == [0, 1]
+    captured = capsys.readouterr()
+    assert not captured.out
+    assert "Wrote 4 results" in captured.err
+
+    # Results that are not fetched page by page are written the same way
+    render_result(AggregateResult(result=make_pages()[0]))
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import inspect
 import logging
+import threading
 from collections.abc import Callable
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
@@ -16,6 +17,7 @@ from typing import NamedTuple
 from typing import Protocol
 
 import typer
+from rich.status import Status
 from typer.core import TyperCommand
 from typer.core import TyperGroup
 from typer.main import Typer
@@ -31,7 +33,6 @@ from zabbix_cli.state import get_state
 
 if TYPE_CHECKING:
     from rich.console import RenderableType
-    from rich.status import Status
     from rich.style import StyleType
 
     from zabbix_cli.config.model import Config
@@ -96,6 +97,23 @@ class StatusCallable(Protocol):
     ) -> Status: ...
 
 
+class NullStatus(Status):
+    """Status that is never displayed.
+
+    Only one live display can be active at a time, so commands running
+    in worker threads cannot show a status spinner.
+    """
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
 class StatefulApp(typer.Typer):
     """A Typer app that provides access to the global state."""
 
@@ -206,8 +224,13 @@ class StatefulApp(typer.Typer):
 
     @property
     def status(self) -> StatusCallable:
+        if threading.current_thread() is not threading.main_thread():
+            return self._null_status
         return self.state.err_console.status
 
+    def _null_status(self, status: RenderableType, **kwargs: Any) -> Status:
+        return NullStatus(status, console=self.state.err_console, **kwargs)
+
     def get_plugin_config(self, name: str) -> PluginConfig:
         """Get a plugin's configuration by name.
 
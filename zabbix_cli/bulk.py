@@ -2,28 +2,68 @@
 
 Uses a very rudimentary parser to parse commands from a file, then
 passes them to typer.Context.invoke() to run them.
+
+Commands can be run concurrently on a pool of worker threads. Ordering between
+commands is preserved through barriers: explicit `# barrier` directives in
+the file, and lines that touch the same objects as a previous line.
+
+Runs of consecutive commands performing the same operation are coalesced
+into mass API calls before they are run. See `zabbix_cli.bulk_coalesce`.
+
+Objects referenced by the commands in a command file (host groups,
+templates, proxies, user groups) are fetched up front in as few requests
+as possible. See `zabbix_cli.bulk_prefetch`.
+
+Commands are read lazily from the file (or stdin), and results are
+tallied as they come in, so memory usage does not grow with the number of
+lines. Results for each line can be streamed to a JSONL file.
+
+Progress can be recorded in a checkpoint, so that interrupted or failed
+runs can be resumed. See `zabbix_cli.bulk_checkpoint`.
+
+The wall time and API usage of each line are recorded for a timing report
+of the run. See `zabbix_cli.bulk_timing`.
 """
 
 from __future__ import annotations
 
+import contextlib
+import json
 import logging
 import shlex
+import sys
+import time
 from collections import Counter
-from contextlib import contextmanager
+from collections.abc import Iterable
+from collections.abc import Iterator
 from dataclasses import dataclass
+from dataclasses import field
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import TextIO
 
 import typer
 from pydantic import BaseModel
 from pydantic import Field
 from typing_extensions import Self
 
+from zabbix_cli.bulk_timing import BulkTimings
 from zabbix_cli.config.constants import BulkRunnerMode
 from zabbix_cli.exceptions import CommandFileError
+from zabbix_cli.output.console import info
 from zabbix_cli.output.console import warning
 from zabbix_cli.state import get_state
-from zabbix_cli.utils.fs import read_file
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import click
+
+    from zabbix_cli.bulk_checkpoint import BulkCheckpoint
+    from zabbix_cli.bulk_coalesce import CoalescedCommand
+    from zabbix_cli.pyzabbix.lookup import LookupTable
 
 logger = logging.getLogger(__name__)
 
@@ -45,12 +85,33 @@ class CommentLine(SkippableLine):
     """Line is a comment."""
 
 
+class BarrierLine(CommentLine):
+    """Line is a barrier directive."""
+
+
+BARRIER_DIRECTIVE = "barrier"
+"""Comment directive that waits for all previous commands to finish
+before running the next command."""
+
+WILDCARD_CHARS = ("*", "?")
+"""Characters in arguments that signify a command touching an unknown
+number of objects."""
+
+STDIN_PATH = Path("-")
+"""Command file path that reads commands from stdin."""
+
+MAX_REPORTED_FAILURES = 100
+"""Maximum number of failed commands kept for the final error message."""
+
+
 class BulkCommand(BaseModel):
     """A command to be run in bulk."""
 
     args: list[str] = Field(default_factory=list)
     line: str = ""  # original line from file
     line_number: int = 0
+    barrier: bool = False
+    """Wait for all previous commands to finish before running this command."""
 
     def __str__(self) -> str:
         if self.line:
@@ -65,6 +126,8 @@ class BulkCommand(BaseModel):
         if not line:
             raise EmptyLine("Cannot parse empty line")
         if line.startswith("#"):
+            if line.lstrip("#").strip().lower() == BARRIER_DIRECTIVE:
+                raise BarrierLine("Cannot parse barrier directive")
             raise CommentLine("Cannot parse comment line")
 
         # Split the line into tokens, handling quotes and comments
@@ -76,6 +139,82 @@ class BulkCommand(BaseModel):
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self}>"
 
+    @property
+    def exclusive(self) -> bool:
+        """Command must run on its own, without other commands running concurrently.
+
+        Applies to commands following a barrier, commands with global options
+        (which modify the shared configuration) and commands with wildcard
+        arguments (which can touch any object).
+        """
+        return self.barrier or self.global_options or self.wildcards
+
+    @property
+    def global_options(self) -> bool:
+        """Command sets global options instead of running a command."""
+        return not self.args or self.args[0].startswith("-")
+
+    @property
+    def wildcards(self) -> bool:
+        """Command has wildcard arguments."""
+        return any(c in arg for arg in self.args[1:] for c in WILDCARD_CHARS)
+
+    @property
+    def writes(self) -> set[str]:
+        """Names of objects the command modifies.
+
+        Heuristic: the first positional argument is the object the command
+        operates on, i.e. `create_host <hostname>` or `add_host_to_hostgroup <hosts>`.
+        """
+        if len(self.args) < 2 or self.args[1].startswith("-"):
+            return set()
+        return _split_arg(self.args[1])
+
+    @property
+    def reads(self) -> set[str]:
+        """Names of objects the command references. Includes all arguments
+        and option values except the modified object."""
+        names: set[str] = set()
+        for arg in self.args[2:]:
+            if not arg.startswith("-"):
+                names.update(_split_arg(arg))
+        return names
+
+    def conflicts_with(self, other: BulkCommand | CoalescedCommand) -> bool:
+        """Command touches an object modified by another command or vice versa."""
+        if self.exclusive or other.exclusive:
+            return True
+        writes = self.writes
+        other_writes = other.writes
+        return bool(
+            writes & other_writes or writes & other.reads or other_writes & self.reads
+        )
+
+
+def _split_arg(arg: str) -> set[str]:
+    """Split a comma-separated argument into a set of names."""
+    return {a.strip() for a in arg.split(",") if a.strip()}
+
+
+def get_command_params(
+    ctx: typer.Context, group: click.Command, command: BulkCommand
+) -> dict[str, Any] | None:
+    """Parse the parameters of a command without invoking it.
+
+    Returns None if the command cannot be parsed."""
+    import click
+
+    if not isinstance(group, click.Group):
+        return None
+    try:
+        cmd = group.get_command(ctx, command.args[0])
+        if not cmd:
+            return None
+        with cmd.make_context(command.args[0], command.args[1:], parent=ctx) as sub:
+            return dict(sub.params)
+    except (Exception, SystemExit):
+        return None
+
 
 class CommandResult(Enum):
     """Result of a command execution."""
@@ -93,6 +232,24 @@ class CommandExecution:
     result: CommandResult
     error: BaseException | None = None
     line_number: int | None = None
+    output: str | None = None
+    """Captured output of the command. Only captured when running concurrently."""
+    # Measurements of the run, not part of the result itself
+    duration: float = field(default=0.0, compare=False)
+    """Wall time of the command in seconds."""
+    api_calls: int = field(default=0, compare=False)
+    """Number of API requests made by the command."""
+    bytes: int = field(default=0, compare=False)
+    """Bytes sent to and received from the API by the command."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get a JSON-serializable representation of the execution."""
+        return {
+            "line_number": self.line_number,
+            "command": str(self.command),
+            "result": self.result.value,
+            "error": str(self.error) if self.error is not None else None,
+        }
 
 
 class BulkRunner:
@@ -101,55 +258,207 @@ class BulkRunner:
         ctx: typer.Context,
         file: Path,
         mode: BulkRunnerMode = BulkRunnerMode.STRICT,
+        *,
+        jobs: int = 1,
+        coalesce: bool = True,
+        results_file: Path | None = None,
+        keep_executions: bool = True,
+        checkpoint: bool = False,
+        resume: bool = False,
+        retry_failed: bool = False,
+        checkpoint_dir: Path | None = None,
+        prefetch: bool = False,
+        timings: bool = False,
+        timings_file: Path | None = None,
     ) -> None:
         self.ctx = ctx
         self.file = file
+        """Command file. Commands are read from stdin if the path is `-`."""
         self.mode = mode
+        self.jobs = max(jobs, 1)
+        """Number of commands to run concurrently."""
+        self.coalesce = coalesce
+        """Merge runs of compatible commands into mass API calls."""
+        self.results_file = results_file
+        """File to append the result of each line to (JSONL)."""
+        self.keep_executions = keep_executions
+        """Keep all executions and skipped lines in memory.
+        Disable for large files where only the counts are needed."""
+        self.counts: Counter[CommandResult] = Counter()
+        """Number of lines by result."""
+        self.failures: list[CommandExecution] = []
+        """The first failed commands (up to `MAX_REPORTED_FAILURES`)."""
         self.executions: list[CommandExecution] = []
-        """Commands that were executed."""
+        """Commands that were executed. Only populated if `keep_executions` is True."""
         self.skipped: list[CommandExecution] = []
-        """Lines that were skipped during parsing."""
-
-    @contextmanager
-    def _command_context(self, command: BulkCommand):
-        """Context manager for command execution with proper error handling."""
+        """Lines that were skipped during parsing. Only populated if `keep_executions` is True."""
+        self._results_fp: TextIO | None = None
+
+        self.use_checkpoint = checkpoint or resume or retry_failed
+        """Record progress in a checkpoint file."""
+        self.resume = resume
+        """Skip lines that were successfully run according to the checkpoint."""
+        self.retry_failed = retry_failed
+        """Only run lines that failed according to the checkpoint."""
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint: BulkCheckpoint | None = None
+        self.completed = 0
+        """Number of lines skipped because they were completed in a previous run."""
+        self.not_run = 0
+        """Number of lines skipped because only failed lines were retried,
+        but which have never been run."""
+        self.prefetch = prefetch
+        """Fetch objects referenced by the commands before running them.
+        Requires reading the command file twice, so it cannot be used with stdin."""
+        self.lookup: LookupTable | None = None
+        self.timings: BulkTimings | None = None
+        """Timings of executed commands. Only recorded if a report is requested."""
+        self.show_timings = timings
+        """Print the timing report to stderr when the run is done."""
+        self.timings_file = timings_file
+        """File to write the timing report to (JSON)."""
+
+    def run_command(
+        self, group: click.Command, command: BulkCommand, *, capture: bool = False
+    ) -> CommandExecution:
+        """Run a single command. Never raises, errors are stored in the result.
+
+        If `capture` is True, output from the command is captured instead
+        of printed.
+        """
+        return self.run_unit(group, command, capture=capture)[0]
 
-        def add_success() -> None:
-            self.executions.append(
-                CommandExecution(
-                    command, CommandResult.SUCCESS, line_number=command.line_number
-                )
+    def run_unit(
+        self,
+        group: click.Command,
+        unit: BulkCommand | CoalescedCommand,
+        *,
+        capture: bool = False,
+    ) -> list[CommandExecution]:
+        """Run a command or a batch of coalesced commands.
+        Never raises, errors are stored in the results.
+
+        If `capture` is True, output from the commands is captured instead
+        of printed, and stored in the first result.
+        """
+        if not capture:
+            return self._run_unit(group, unit)
+
+        from zabbix_cli.output.console import console
+        from zabbix_cli.output.console import err_console
+
+        # Rich consoles buffer output per thread, so capturing only
+        # captures the output from the current thread.
+        with console.capture() as out, err_console.capture() as err:
+            executions = self._run_unit(group, unit)
+        executions[0].output = out.get() + err.get()
+        return executions
+
+    def _run_unit(
+        self, group: click.Command, unit: BulkCommand | CoalescedCommand
+    ) -> list[CommandExecution]:
+        state = get_state()
+        stats = state.client.stats if state.is_client_loaded else None
+        calls, nbytes = (stats.calls, stats.bytes) if stats else (0, 0)
+        start = time.perf_counter()
+
+        if isinstance(unit, BulkCommand):
+            executions = [self._invoke_command(group, unit)]
+        else:
+            executions = self._run_coalesced(group, unit)
+
+        # The lines of a coalesced batch share its wall time, while its
+        # API calls are attributed to the first line so totals add up
+        duration = (time.perf_counter() - start) / len(executions)
+        for execution in executions:
+            execution.duration = duration
+        if stats:
+            executions[0].api_calls = stats.calls - calls
+            executions[0].bytes = stats.bytes - nbytes
+        return executions
+
+    def _run_coalesced(
+        self, group: click.Command, batch: CoalescedCommand
+    ) -> list[CommandExecution]:
+        """Run a batch of coalesced commands as a single mass API call.
+
+        Falls back to running the commands individually if the batch fails."""
+        strict = self.mode == BulkRunnerMode.STRICT
+        try:
+            lines = batch.run(get_state().client, stop_on_error=strict)
+        except Exception as e:
+            logger.warning(
+                "Unable to coalesce %s, running lines individually: %s", batch, e
             )
-            logger.info("Command succeeded: %s", command)
-
-        def add_failure(e: BaseException) -> None:
-            self.executions.append(
-                CommandExecution(
-                    command,
-                    CommandResult.FAILURE,
-                    error=e,
-                    line_number=command.line_number,
-                )
+            executions: list[CommandExecution] = []
+            for command in batch.commands:
+                execution = self._invoke_command(group, command)
+                executions.append(execution)
+                if strict and execution.result == CommandResult.FAILURE:
+                    break
+            return executions
+        return [
+            CommandExecution(
+                line.command,
+                CommandResult.FAILURE if line.error else CommandResult.SUCCESS,
+                error=line.error,
+                line_number=line.command.line_number,
+            )
+            for line in lines
+        ]
+
+    def _invoke_command(
+        self, group: click.Command, command: BulkCommand
+    ) -> CommandExecution:
+        def result(e: BaseException | None = None) -> CommandExecution:
+            return CommandExecution(
+                command,
+                CommandResult.FAILURE if e else CommandResult.SUCCESS,
+                error=e,
+                line_number=command.line_number,
             )
-            if self.mode == BulkRunnerMode.STRICT:
-                raise CommandFileError(
-                    f"Command failed: [command]{command}[/]: {e}"
-                ) from e
-            else:
-                logger.error("Command failed: %s - %s", command, e)
 
         try:
-            yield
-            add_success()
+            with group.make_context(None, command.args, parent=self.ctx) as ctx:
+                group.invoke(ctx)
         except (SystemExit, typer.Exit) as e:
             # If we get return code 0 on an exit, we consider it a success
             code = e.code if isinstance(e, SystemExit) else e.exit_code
-            if code == 0:
-                add_success()
-            else:
-                add_failure(e)
+            return result(e if code != 0 else None)
         except Exception as e:
-            add_failure(e)
+            return result(e)
+        return result()
+
+    def add_execution(self, execution: CommandExecution) -> None:
+        """Record the execution of a command.
+
+        Raises:
+            CommandFileError: If the command failed in STRICT mode.
+        """
+        if execution.output:
+            from rich.text import Text
+
+            from zabbix_cli.output.console import console
+
+            console.print(Text.from_ansi(execution.output), end="", soft_wrap=True)
+
+        self.record_result(execution)
+        if self.timings is not None:
+            self.timings.add(execution)
+        if self.keep_executions:
+            self.executions.append(execution)
+        command = execution.command
+        if execution.result == CommandResult.SUCCESS:
+            logger.info("Command succeeded: %s", command)
+            return
+
+        if len(self.failures) < MAX_REPORTED_FAILURES:
+            self.failures.append(execution)
+        e = execution.error
+        if self.mode == BulkRunnerMode.STRICT:
+            raise CommandFileError(f"Command failed: [command]{command}[/]: {e}") from e
+        else:
+            logger.error("Command failed: %s - %s", command, e)
 
     def run_bulk(self) -> Counter[CommandResult]:
         """Run commands in bulk from a file where each line is a CLI command.
@@ -175,16 +484,36 @@ class BulkRunner:
         # Contains all commands defined via @app.command()
         group = self.ctx.command
 
-        commands = self.load_command_file()
-        for command in commands:
-            with group.make_context(None, command.args, parent=self.ctx) as ctx:
-                with self._command_context(command):
-                    group.invoke(ctx)
+        self.load_checkpoint()
+        lines: Iterable[BulkCommand] = self.iter_commands()
+        if self.resume or self.retry_failed:
+            lines = self._skip_completed(lines)
+        commands: Iterable[BulkCommand | CoalescedCommand] = lines
+        if self.coalesce:
+            from zabbix_cli.bulk_coalesce import coalesce_commands
 
-        # Generate summary
-        results: Counter[CommandResult] = Counter()
-        for execution in self.executions:
-            results[execution.result] += 1
+            commands = coalesce_commands(self.ctx, group, commands)
+
+        finished = False
+        if self.show_timings or self.timings_file:
+            self.timings = BulkTimings()
+        try:
+            self.prefetch_objects(group)
+            self._open_results_file()
+            if self.jobs > 1:
+                self._run_concurrent(group, commands)
+            else:
+                for unit in commands:
+                    for execution in self.run_unit(group, unit):
+                        self.add_execution(execution)
+            finished = True
+        finally:
+            self._close_results_file()
+            self.save_checkpoint(finished=finished)
+            self.clear_prefetched()
+            self.report_timings()
+
+        results = self.counts
 
         # Log summary
         total = sum(results.values())
@@ -200,9 +529,12 @@ class BulkRunner:
         if self.mode == BulkRunnerMode.CONTINUE and results[CommandResult.FAILURE] > 0:
             failed_commands = [
                 f"Line {e.line_number}: [command]{e.command}[/] [i]({e.error})[/]"
-                for e in self.executions
-                if e.result == CommandResult.FAILURE
+                for e in self.failures
             ]
+            if results[CommandResult.FAILURE] > len(self.failures):
+                failed_commands.append(
+                    f"... and {results[CommandResult.FAILURE] - len(self.failures)} more"
+                )
             raise CommandFileError(
                 f"{results[CommandResult.FAILURE]} commands failed:\n"
                 + "\n".join(failed_commands)
@@ -210,31 +542,276 @@ class BulkRunner:
 
         return results
 
+    def _run_concurrent(
+        self,
+        group: click.Command,
+        commands: Iterable[BulkCommand | CoalescedCommand],
+    ) -> None:
+        """Run commands on a pool of worker threads.
+
+        Commands are dispatched in order. Before a command is dispatched,
+        the runner waits for any running commands it conflicts with.
+        Results are recorded in line order for each batch of finished commands.
+
+        If a command fails in STRICT mode, no more commands are dispatched.
+        Commands that are already running are waited for, and their results
+        recorded, before the error is raised.
+        """
+        from concurrent.futures import FIRST_COMPLETED
+        from concurrent.futures import ThreadPoolExecutor
+        from concurrent.futures import wait
+
+        running: dict[
+            Future[list[CommandExecution]], BulkCommand | CoalescedCommand
+        ] = {}
+
+        def collect(futures: Iterable[Future[list[CommandExecution]]]) -> None:
+            """Record the results of commands once they finish.
+
+            All results are recorded before the first error is raised."""
+            done, _ = wait(list(futures))
+            error: CommandFileError | None = None
+            for future in sorted(done, key=lambda f: running[f].line_number):
+                running.pop(future)
+                for execution in future.result():
+                    try:
+                        self.add_execution(execution)
+                    except CommandFileError as e:
+                        error = error or e
+            if error:
+                raise error
+
+        executor = ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="bulk")
+        try:
+            for command in commands:
+                conflicts = [f for f, c in running.items() if c.conflicts_with(command)]
+                if conflicts:
+                    logger.debug(
+                        "Line %d waiting for %d conflicting commands",
+                        command.line_number,
+                        len(conflicts),
+                    )
+                    collect(conflicts)
+                # Limit number of commands queued in the executor
+                if len(running) >= self.jobs * 2:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    collect(done)
+                future = executor.submit(self.run_unit, group, command, capture=True)
+                running[future] = command
+            collect(running)
+        except CommandFileError:
+            # Commands that have started cannot be stopped. Record their
+            # results, so the counts, results file and checkpoint match
+            # what was actually run
+            for future in list(running):
+                if future.cancel():
+                    running.pop(future)
+            with contextlib.suppress(CommandFileError):
+                collect(running)
+            raise
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def record_result(self, execution: CommandExecution) -> None:
+        """Count the result of a line and write it to the results file."""
+        self.counts[execution.result] += 1
+        if self._results_fp:
+            self._results_fp.write(json.dumps(execution.to_dict()) + "\n")
+        if self.checkpoint and execution.line_number:
+            self.checkpoint.complete(
+                execution.line_number,
+                failed=execution.result == CommandResult.FAILURE,
+            )
+
+    def load_checkpoint(self) -> None:
+        """Load the checkpoint when resuming, or create a new one.
+
+        Raises:
+            CommandFileError: If the checkpoint cannot be used for the command file.
+        """
+        if not self.use_checkpoint:
+            return
+        from zabbix_cli.bulk_checkpoint import BulkCheckpoint
+        from zabbix_cli.config.constants import BULK_CHECKPOINT_DIR
+
+        directory = self.checkpoint_dir or BULK_CHECKPOINT_DIR
+        if self.file == STDIN_PATH:
+            if self.resume or self.retry_failed:
+                raise CommandFileError("Cannot resume commands read from stdin.")
+            return
+        if self.resume or self.retry_failed:
+            self.checkpoint = BulkCheckpoint.load(self.file, directory)
+            logger.info(
+                "Resuming from checkpoint. Last line: %d, failed lines: %d",
+                self.checkpoint.last_line,
+                len(self.checkpoint.failed),
+            )
+        else:
+            self.checkpoint = BulkCheckpoint.new(self.file, directory)
+
+    def save_checkpoint(self, *, finished: bool) -> None:
+        """Save the checkpoint, or delete it if there is nothing left to run."""
+        if not self.checkpoint:
+            return
+        if finished and not self.checkpoint.failed and not self.not_run:
+            self.checkpoint.delete()
+            return
+        self.checkpoint.save()
+        if self.checkpoint.failed:
+            msg = f"{len(self.checkpoint.failed)} failed lines"
+        elif finished:
+            msg = f"{self.not_run} lines have not been run"
+        else:
+            msg = f"Stopped after line {self.checkpoint.last_line}"
+        info(
+            f"{msg}. Run again with [option]--resume[/] to continue, "
+            "or [option]--retry-failed[/] to only run failed lines."
+        )
+
+    def _skip_completed(self, commands: Iterable[BulkCommand]) -> Iterator[BulkCommand]:
+        """Skip commands that do not need to run according to the checkpoint."""
+        if not self.checkpoint:
+            yield from commands
+            return
+        barrier = False
+        for command in commands:
+            if self.checkpoint.should_run(
+                command.line_number, retry_failed=self.retry_failed
+            ):
+                # Keep barriers preceding skipped commands
+                command.barrier = command.barrier or barrier
+                barrier = False
+                yield command
+            else:
+                barrier = barrier or command.barrier
+                # Lines after the last line were never run, and must
+                # not be marked as completed when only retrying failed lines
+                if command.line_number <= self.checkpoint.last_line:
+                    self.checkpoint.complete(command.line_number)
+                    self.completed += 1
+                else:
+                    self.not_run += 1
+
+    def report_timings(self) -> None:
+        """Print and/or save the timing report of the run."""
+        if self.timings is None:
+            return
+        self.timings.finish()
+        logger.info(
+            "Ran %d commands in %.2fs (%d API calls)",
+            self.timings.count,
+            self.timings.elapsed,
+            self.timings.api_calls,
+        )
+        if self.show_timings:
+            self.timings.print()
+        if self.timings_file:
+            try:
+                self.timings.save(self.timings_file)
+            except CommandFileError as e:
+                # Not being able to save the report should not fail the run
+                warning(str(e))
+
+    def _open_results_file(self) -> None:
+        if not self.results_file:
+            return
+        try:
+            self.results_file.parent.mkdir(parents=True, exist_ok=True)
+            # Line buffered, so results are written even if the run is interrupted
+            self._results_fp = open(self.results_file, "a", buffering=1)
+        except OSError as e:
+            raise CommandFileError(
+                f"Unable to open results file {self.results_file}: {e}"
+            ) from e
+
+    def _close_results_file(self) -> None:
+        if self._results_fp:
+            self._results_fp.close()
+            self._results_fp = None
+
+    def prefetch_objects(self, group: click.Command) -> None:
+        """Fetch the objects referenced by the commands in the command file,
+        and serve lookups of them from a lookup table for the rest of the run."""
+        if not self.prefetch or self.file == STDIN_PATH:
+            return
+        from zabbix_cli.bulk_prefetch import collect_references
+        from zabbix_cli.bulk_prefetch import prefetch
+
+        state = get_state()
+        references = collect_references(
+            self.ctx, group, self._iter_parseable(), state.config
+        )
+        if not references:
+            return
+        try:
+            self.lookup = prefetch(state.client, references)
+        except Exception as e:
+            # Commands look up the objects themselves instead
+            logger.warning("Unable to prefetch objects: %s", e)
+            return
+        state.client.lookup = self.lookup
+
+    def clear_prefetched(self) -> None:
+        """Stop serving lookups from the prefetched objects."""
+        if not self.lookup:
+            return
+        logger.info("Served %d lookups from prefetched objects", self.lookup.hits)
+        get_state().client.lookup = None
+        self.lookup = None
+
+    def _iter_parseable(self) -> Iterator[BulkCommand]:
+        """Parse the commands from the command file, ignoring invalid lines."""
+        for lineno, line in enumerate(self._read_lines(), start=1):
+            try:
+                yield BulkCommand.from_line(line.rstrip("\r\n"), line_number=lineno)
+            except Exception:
+                continue
+
     def load_command_file(self) -> list[BulkCommand]:
         """Parse the contents of a command file."""
+        return list(self.iter_commands())
+
+    def _read_lines(self) -> Iterator[str]:
+        """Read lines from the command file or stdin one at a time."""
+        if self.file == STDIN_PATH:
+            yield from sys.stdin
+            return
         try:
-            contents = read_file(self.file)
-        except Exception as e:
+            f = open(self.file)
+        except OSError as e:
             raise CommandFileError(f"Could not read command file: {e}") from e
+        with f:
+            yield from f
 
-        commands: list[BulkCommand] = []
+    def iter_commands(self) -> Iterator[BulkCommand]:
+        """Parse commands from the command file as they are read."""
 
         def add_skipped(
             line: str, line_number: int, error: BaseException | None = None
         ) -> None:
-            self.skipped.append(
-                CommandExecution(
-                    BulkCommand(line=line, line_number=line_number),
-                    CommandResult.SKIPPED,
-                    error=error,
-                    line_number=line_number,
-                )
+            execution = CommandExecution(
+                BulkCommand(line=line, line_number=line_number),
+                CommandResult.SKIPPED,
+                error=error,
+                line_number=line_number,
             )
-
-        for lineno, line in enumerate(contents.splitlines(), start=1):
+            if self.keep_executions:
+                self.skipped.append(execution)
+            # Only invalid lines count as skipped commands
+            if error is not None:
+                self.record_result(execution)
+            elif self.checkpoint:
+                self.checkpoint.complete(line_number)
+
+        barrier = False
+        for lineno, line in enumerate(self._read_lines(), start=1):
+            line = line.rstrip("\r\n")
             try:
                 command = BulkCommand.from_line(line, line_number=lineno)
-                commands.append(command)
+            except BarrierLine:
+                logger.debug("Barrier on line %d", lineno)
+                add_skipped(line, lineno)
+                barrier = True
             except SkippableLine:
                 logger.debug("Skipping line %d: %s", lineno, line)
                 add_skipped(line, lineno)
@@ -248,13 +825,43 @@ class BulkRunner:
                     raise CommandFileError(
                         f"Unable to parse line {lineno} '{line}': {e}"
                     ) from e
-
-        return commands
-
-
-def run_bulk(ctx: typer.Context, file: Path, mode: BulkRunnerMode) -> None:
+            else:
+                command.barrier = barrier
+                barrier = False
+                yield command
+
+
+def run_bulk(
+    ctx: typer.Context,
+    file: Path,
+    mode: BulkRunnerMode,
+    *,
+    jobs: int = 1,
+    coalesce: bool = True,
+    results_file: Path | None = None,
+    resume: bool = False,
+    retry_failed: bool = False,
+    prefetch: bool = True,
+    timings: bool = False,
+    timings_file: Path | None = None,
+) -> None:
     state = get_state()
-    runner = BulkRunner(ctx, file, mode)
+    runner = BulkRunner(
+        ctx,
+        file,
+        mode,
+        jobs=jobs,
+        coalesce=coalesce,
+        results_file=results_file,
+        keep_executions=False,
+        # Command files are always checkpointed so they can be resumed
+        checkpoint=file != STDIN_PATH,
+        resume=resume,
+        retry_failed=retry_failed,
+        prefetch=prefetch,
+        timings=timings,
+        timings_file=timings_file,
+    )
     try:
         state.bulk = True
         runner.run_bulk()
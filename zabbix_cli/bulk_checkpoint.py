@@ -0,0 +1,138 @@
+"""Checkpoints for resuming bulk runs.
+
+While a command file is running, the progress of the run is recorded
+in a checkpoint file in the data directory. The checkpoint stores
+the last line up to which all lines have been run, as well as the lines
+that failed. It is tied to the contents of the command file through
+its hash, so a run can only be resumed if the file is unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from pathlib import Path
+
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import PrivateAttr
+from typing_extensions import Self
+
+from zabbix_cli.config.constants import BULK_CHECKPOINT_DIR
+from zabbix_cli.exceptions import CommandFileError
+from zabbix_cli.utils.fs import get_file_hash
+from zabbix_cli.utils.fs import mkdir_if_not_exists
+
+logger = logging.getLogger(__name__)
+
+SAVE_INTERVAL = 1.0
+"""Minimum number of seconds between automatic saves of a checkpoint."""
+
+
+class BulkCheckpoint(BaseModel):
+    """Progress of a bulk run for a command file."""
+
+    file: str
+    """Absolute path of the command file."""
+    file_hash: str
+    """SHA-256 hash of the command file's contents."""
+    last_line: int = 0
+    """All lines up to and including this line have been run."""
+    failed: set[int] = Field(default_factory=set)
+    """Lines that failed."""
+
+    _path: Path | None = PrivateAttr(default=None)
+    _pending: set[int] = PrivateAttr(default_factory=set)
+    """Completed lines after `last_line`. Lines can complete out of order
+    when commands run concurrently."""
+    _last_save: float = PrivateAttr(default=0.0)
+
+    @staticmethod
+    def get_path(file: Path, directory: Path = BULK_CHECKPOINT_DIR) -> Path:
+        """Get the path of the checkpoint for a command file."""
+        key = hashlib.sha256(str(file.resolve()).encode()).hexdigest()[:16]
+        return directory / f"{key}.json"
+
+    @classmethod
+    def new(cls, file: Path, directory: Path = BULK_CHECKPOINT_DIR) -> Self:
+        """Create an empty checkpoint for a command file."""
+        checkpoint = cls(file=str(file.resolve()), file_hash=get_file_hash(file))
+        checkpoint._path = cls.get_path(file, directory)
+        return checkpoint
+
+    @classmethod
+    def load(cls, file: Path, directory: Path = BULK_CHECKPOINT_DIR) -> Self:
+        """Load the checkpoint for a command file.
+
+        Raises:
+            CommandFileError: If no checkpoint exists, or the file has changed
+                since the checkpoint was written.
+        """
+        path = cls.get_path(file, directory)
+        if not path.exists():
+            raise CommandFileError(f"No checkpoint found for command file {file}.")
+        try:
+            checkpoint = cls.model_validate_json(path.read_text())
+        except Exception as e:
+            raise CommandFileError(f"Unable to load checkpoint {path}: {e}") from e
+        if checkpoint.file_hash != get_file_hash(file):
+            raise CommandFileError(
+                f"Command file {file} has changed since the checkpoint was written. "
+                "Run it again without resuming to start over."
+            )
+        checkpoint._path = path
+        return checkpoint
+
+    def save(self) -> None:
+        if not self._path:
+            raise CommandFileError("Cannot save checkpoint without a path.")
+        try:
+            mkdir_if_not_exists(self._path.parent)
+            # Write to a temporary file first, so an interrupted write
+            # never leaves behind a corrupted checkpoint
+            tmp = self._path.with_suffix(".tmp")
+            tmp.write_text(self.model_dump_json(indent=2))
+            tmp.replace(self._path)
+        except Exception as e:
+            # Not being able to save the checkpoint should not fail the run
+            logger.error("Unable to save checkpoint %s: %s", self._path, e)
+        else:
+            logger.debug("Saved checkpoint %s", self._path)
+        self._last_save = time.monotonic()
+
+    def delete(self) -> None:
+        if self._path and self._path.exists():
+            self._path.unlink()
+            logger.debug("Deleted checkpoint %s", self._path)
+
+    def should_run(self, line_number: int, *, retry_failed: bool = False) -> bool:
+        """Check if a line should be run when resuming.
+
+        Failed lines are always run. Lines that have not been run yet are
+        run unless only failed lines are retried."""
+        if line_number in self.failed:
+            return True
+        return not retry_failed and line_number > self.last_line
+
+    def complete(self, line_number: int, *, failed: bool | None = None) -> None:
+        """Mark a line as completed.
+
+        Args:
+            line_number: The line that completed.
+            failed: Whether the line failed. If None, the status of the line
+                is not changed, i.e. for lines that are not run.
+        """
+        if failed:
+            self.failed.add(line_number)
+        elif failed is not None:
+            self.failed.discard(line_number)
+
+        if line_number > self.last_line:
+            self._pending.add(line_number)
+            while self.last_line + 1 in self._pending:
+                self.last_line += 1
+                self._pending.remove(self.last_line)
+
+        if time.monotonic() - self._last_save >= SAVE_INTERVAL:
+            self.save()
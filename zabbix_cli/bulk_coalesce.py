@@ -0,0 +1,492 @@
+"""Coalescing of bulk commands into mass API calls.
+
+Command files often contain long runs of lines that perform the same
+operation on different hosts, e.g. adding thousands of hosts to the same
+host group one line at a time. Running each line as a separate command
+results in multiple API requests per line.
+
+Before commands are run, consecutive lines that perform the same operation
+are merged into a single batch. The hosts referenced by all lines in the batch
+are fetched with a single request, and the operation is applied to all
+of them with a single mass API call. Each line still gets its own result,
+so failures are reported for the line that caused them.
+
+If a batch cannot be applied, its lines are run individually instead.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Hashable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+
+from zabbix_cli.bulk import BulkCommand
+from zabbix_cli.bulk import get_command_params
+from zabbix_cli.exceptions import ZabbixCLIError
+from zabbix_cli.exceptions import ZabbixNotFoundError
+from zabbix_cli.output.console import error
+from zabbix_cli.output.console import success
+from zabbix_cli.output.formatting.grammar import pluralize as p
+from zabbix_cli.utils.args import parse_list_arg
+
+if TYPE_CHECKING:
+    import click
+    import typer
+
+    from zabbix_cli.pyzabbix.client import ZabbixAPI
+    from zabbix_cli.pyzabbix.enums import MonitoringStatus
+    from zabbix_cli.pyzabbix.enums import ProxyStrategy
+    from zabbix_cli.pyzabbix.types import Host
+    from zabbix_cli.pyzabbix.types import HostGroup
+    from zabbix_cli.pyzabbix.types import Proxy
+    from zabbix_cli.pyzabbix.types import Template
+
+logger = logging.getLogger(__name__)
+
+COALESCE_CHUNK_SIZE = 500
+"""Maximum number of lines merged into a single mass API call."""
+
+
+@dataclass
+class CoalescedLine:
+    """A line in a coalesced batch."""
+
+    command: BulkCommand
+    params: dict[str, Any]
+    """Parsed parameters of the command."""
+    hosts: list[Host] = field(default_factory=list)
+    """Hosts the line operates on."""
+    error: Exception | None = None
+    """Error preventing the line from being applied."""
+
+
+class Coalescer:
+    """Merges lines running the same command into mass API calls.
+
+    Lines can be merged if they have the same key, i.e. they perform the
+    same operation on different hosts. A new coalescer is created for each batch.
+    """
+
+    commands: ClassVar[tuple[str, ...]] = ()
+    """Names of the commands handled by the coalescer."""
+    hosts_param: ClassVar[str] = "hostname"
+    """Name of the parameter containing the hosts of a line."""
+    exact: ClassVar[bool] = False
+    """Parameter is a single host that must exist (like `get_host()`),
+    instead of comma-separated names."""
+    require_hosts: ClassVar[bool] = True
+    """Lines matching no hosts fail."""
+
+    @classmethod
+    def key(cls, params: dict[str, Any]) -> Hashable | None:
+        """Get the key for a line. Returns None if the line cannot be coalesced."""
+        if params.get("dryrun"):
+            return None
+        return tuple(
+            (name, str(value))
+            for name, value in sorted(params.items())
+            if name != cls.hosts_param
+        )
+
+    def get_host_args(self, line: CoalescedLine) -> list[str]:
+        arg = str(line.params[self.hosts_param])
+        if self.exact:
+            return [arg.strip()]
+        return [a.strip() for a in parse_list_arg(arg)]
+
+    def check_line(self, line: CoalescedLine) -> None:
+        """Validate the parameters of a line. Raises an exception if invalid."""
+        if not self.exact and line.params.get("strict"):
+            expected = len(self.get_host_args(line))
+            if len(line.hosts) != expected:
+                raise ZabbixCLIError(
+                    f"Found {len(line.hosts)} hosts, expected {expected}"
+                )
+
+    def prepare(self, client: ZabbixAPI, params: dict[str, Any]) -> None:
+        """Fetch the objects shared by all lines in the batch."""
+
+    def apply(self, client: ZabbixAPI, hosts: list[Host]) -> None:
+        """Apply the operation to the hosts of all lines in the batch."""
+        raise NotImplementedError
+
+    def message(self, hosts: list[Host]) -> str:
+        """Message printed after the batch is applied."""
+        raise NotImplementedError
+
+
+class AddHostsToHostGroupCoalescer(Coalescer):
+    commands = ("add_host_to_hostgroup",)
+    hosts_param = "hostnames_or_ids"
+
+    def __init__(self) -> None:
+        self.hostgroups: list[HostGroup] = []
+
+    def prepare(self, client: ZabbixAPI, params: dict[str, Any]) -> None:
+        self.hostgroups = client.get_hostgroups(
+            *parse_list_arg(params["hostgroups"]), search=True
+        )
+        if not self.hostgroups:
+            raise ZabbixNotFoundError(
+                f"No host groups found matching {params['hostgroups']}"
+            )
+
+    def apply(self, client: ZabbixAPI, hosts: list[Host]) -> None:
+        client.add_hosts_to_hostgroups(hosts, self.hostgroups)
+
+    def message(self, hosts: list[Host]) -> str:
+        return (
+            f"Added {p('host', len(hosts))} to {p('host group', len(self.hostgroups))}"
+        )
+
+
+class RemoveHostsFromHostGroupCoalescer(AddHostsToHostGroupCoalescer):
+    commands = ("remove_host_from_hostgroup",)
+
+    def apply(self, client: ZabbixAPI, hosts: list[Host]) -> None:
+        client.remove_hosts_from_hostgroups(hosts, self.hostgroups)
+
+    def message(self, hosts: list[Host]) -> str:
+        return f"Removed {p('host', len(hosts))} from {p('host group', len(self.hostgroups))}"
+
+
+class LinkTemplatesToHostsCoalescer(Coalescer):
+    commands = ("link_template_to_host",)
+    hosts_param = "hostnames_or_ids"
+
+    def __init__(self) -> None:
+        self.templates: list[Template] = []
+
+    def prepare(self, client: ZabbixAPI, params: dict[str, Any]) -> None:
+        template_args = parse_list_arg(params["template_names_or_ids"])
+        self.templates = client.get_templates(*template_args)
+        if not self.templates:
+            raise ZabbixNotFoundError(
+                f"No templates found matching {params['template_names_or_ids']}"
+            )
+        if params.get("strict") and len(self.templates) != len(template_args):
+            raise ZabbixNotFoundError(
+                f"Found {len(self.templates)} templates, expected {len(template_args)}"
+            )
+
+    def apply(self, client: ZabbixAPI, hosts: list[Host]) -> None:
+        client.link_templates_to_hosts(self.templates, hosts)
+
+    def message(self, hosts: list[Host]) -> str:
+        return f"Linked {p('template', len(self.templates))} to {p('host', len(hosts))}"
+
+
+class UpdateHostProxyCoalescer(Coalescer):
+    commands = ("update_host_proxy",)
+    require_hosts = False
+
+    def __init__(self) -> None:
+        self.proxies: list[Proxy] = []
+        """Destination proxies. The first match is used unless a strategy is given."""
+        self.strategy: ProxyStrategy | None = None
+
+    def prepare(self, client: ZabbixAPI, params: dict[str, Any]) -> None:
+        # All lines in the batch have the same proxy and strategy (part of the key)
+        self.strategy = params.get("strategy")
+        if self.strategy is None:
+            self.proxies = [client.get_proxy(params["proxy"])]
+            return
+        self.proxies = client.get_proxies(params["proxy"])
+        if not self.proxies:
+            raise ZabbixNotFoundError(f"No proxies matching {params['proxy']!r}")
+
+    def apply(self, client: ZabbixAPI, hosts: list[Host]) -> None:
+        # Hosts to move to each destination proxy, by proxy ID
+        destinations: dict[str, tuple[Proxy, list[Host]]] = {}
+        if self.strategy is None:
+            proxy = self.proxies[0]
+            destinations[proxy.proxyid] = (
+                proxy,
+                [host for host in hosts if host.proxyid != proxy.proxyid],
+            )
+        else:
+            selector = client.proxy_selector
+            current = {proxy.proxyid: proxy for proxy in selector.proxies}
+            for host in hosts:
+                proxy = selector.choose(
+                    self.proxies,
+                    strategy=self.strategy,
+                    current=current.get(str(host.proxyid)),
+                )
+                if host.proxyid != proxy.proxyid:
+                    _, to_move = destinations.setdefault(proxy.proxyid, (proxy, []))
+                    to_move.append(host)
+        for proxy, to_move in destinations.values():
+            if to_move:
+                client.update_hosts_proxy(to_move, proxy)
+
+    def message(self, hosts: list[Host]) -> str:
+        return f"Updated proxy for {p('host', len(hosts))}"
+
+
+class MonitorHostCoalescer(Coalescer):
+    commands = ("monitor_host",)
+    exact = True
+
+    def __init__(self) -> None:
+        self.status: MonitoringStatus | None = None
+
+    def prepare(self, client: ZabbixAPI, params: dict[str, Any]) -> None:
+        # All lines in the batch have the same status (part of the key)
+        self.status = params["new_status"]
+
+    def apply(self, client: ZabbixAPI, hosts: list[Host]) -> None:
+        if self.status is None:
+            raise ZabbixCLIError("Monitoring status not prepared")
+        client.update_hosts_status(hosts, self.status)
+
+    def message(self, hosts: list[Host]) -> str:
+        return f"Updated monitoring status for {p('host', len(hosts))}. New monitoring status: {self.status}"
+
+
+class DefineHostMacroCoalescer(Coalescer):
+    commands = ("define_host_macro", "define_host_usermacro")
+    exact = True
+
+    def __init__(self) -> None:
+        self.macros: dict[tuple[str, str], tuple[Host, str]] = {}
+        """Macro value for each (host ID, macro name). Later lines take precedence."""
+
+    @classmethod
+    def key(cls, params: dict[str, Any]) -> Hashable | None:
+        # Each line defines its own macro and value
+        return ()
+
+    def check_line(self, line: CoalescedLine) -> None:
+        from zabbix_cli.commands.macro import fmt_macro_name
+
+        name = fmt_macro_name(line.params["macro_name"])
+        for host in line.hosts:
+            self.macros[(host.hostid, name)] = (host, line.params["macro_value"])
+
+    def apply(self, client: ZabbixAPI, hosts: list[Host]) -> None:
+        existing = {
+            (macro.hostid, macro.macro): macro.hostmacroid
+            for macro in client.get_macros(hosts=hosts, sort_field=None)
+        }
+        to_create: list[tuple[Host, str, str]] = []
+        to_update: list[tuple[str, str]] = []
+        for (hostid, name), (host, value) in self.macros.items():
+            macroid = existing.get((hostid, name))
+            if macroid:
+                to_update.append((macroid, value))
+            else:
+                to_create.append((host, name, value))
+        if to_create:
+            client.create_host_macros(to_create)
+        if to_update:
+            client.update_macros(to_update)
+
+    def message(self, hosts: list[Host]) -> str:
+        return f"Defined {p('macro', len(self.macros))} for {p('host', len(hosts))}"
+
+
+COALESCERS: dict[str, type[Coalescer]] = {
+    name: coalescer
+    for coalescer in [
+        AddHostsToHostGroupCoalescer,
+        RemoveHostsFromHostGroupCoalescer,
+        LinkTemplatesToHostsCoalescer,
+        UpdateHostProxyCoalescer,
+        MonitorHostCoalescer,
+        DefineHostMacroCoalescer,
+    ]
+    for name in coalescer.commands
+}
+"""Coalescers for each command that can be coalesced."""
+
+
+@dataclass
+class CoalescedCommand:
+    """A batch of consecutive lines that are run as a single mass API call."""
+
+    coalescer: Coalescer
+    key: Hashable
+    lines: list[CoalescedLine] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        if len(self.lines) == 1:
+            return str(self.lines[0].command)
+        return f"{self.name} (lines {self.line_number}-{self.lines[-1].command.line_number})"
+
+    @property
+    def name(self) -> str:
+        return self.lines[0].command.args[0]
+
+    @property
+    def commands(self) -> list[BulkCommand]:
+        return [line.command for line in self.lines]
+
+    @property
+    def line_number(self) -> int:
+        return self.lines[0].command.line_number
+
+    @property
+    def barrier(self) -> bool:
+        return self.lines[0].command.barrier
+
+    @property
+    def exclusive(self) -> bool:
+        return self.barrier
+
+    @property
+    def writes(self) -> set[str]:
+        return set().union(*(line.command.writes for line in self.lines))
+
+    @property
+    def reads(self) -> set[str]:
+        return set().union(*(line.command.reads for line in self.lines))
+
+    def conflicts_with(self, other: BulkCommand | CoalescedCommand) -> bool:
+        return any(command.conflicts_with(other) for command in self.commands)
+
+    def accepts(self, command: BulkCommand, key: Hashable) -> bool:
+        """Command can be added to the batch."""
+        return (
+            not command.barrier
+            and command.args[0] == self.name
+            and key == self.key
+            and len(self.lines) < COALESCE_CHUNK_SIZE
+        )
+
+    def run(
+        self, client: ZabbixAPI, *, stop_on_error: bool = False
+    ) -> list[CoalescedLine]:
+        """Resolve the hosts of each line and apply the batch.
+
+        Lines that fail to resolve are not applied and have their error set.
+        If `stop_on_error` is True, no lines after the first failing line are applied
+        and only the lines up to and including the failing line are returned.
+
+        Raises:
+            Exception: If the batch cannot be applied.
+        """
+        self.coalescer.prepare(client, self.lines[0].params)
+        self.resolve_hosts(client)
+
+        lines: list[CoalescedLine] = []
+        for line in self.lines:
+            if not line.error:
+                try:
+                    self.coalescer.check_line(line)
+                except Exception as e:
+                    line.error = e
+            lines.append(line)
+            if line.error and stop_on_error:
+                break
+
+        hosts: dict[str, Host] = {}
+        for line in lines:
+            if not line.error:
+                hosts.update((host.hostid, host) for host in line.hosts)
+        host_list = list(hosts.values())
+        if host_list:
+            self.coalescer.apply(client, host_list)
+
+        for line in lines:
+            if line.error:
+                error(f"Line {line.command.line_number}: {line.error}")
+        if host_list:
+            success(f"{self.coalescer.message(host_list)} [i]({self})[/].")
+        return lines
+
+    def resolve_hosts(self, client: ZabbixAPI) -> None:
+        """Fetch the hosts for all lines with as few requests as possible.
+
+        Hosts are matched the same way as when the lines are run on their own:
+        names of exact coalescers must match a host name (like `get_host()`),
+        while other names match any host whose name contains them
+        (like `parse_hosts_arg()`)."""
+        args = {id(line): self.coalescer.get_host_args(line) for line in self.lines}
+        all_args = {arg for line_args in args.values() for arg in line_args}
+        # Names and IDs cannot be mixed in a single request
+        ids = sorted(a for a in all_args if a.isnumeric())
+        names = sorted(a for a in all_args if not a.isnumeric())
+        by_id: dict[str, Host] = {}
+        hosts: list[Host] = []
+        if ids:
+            by_id = {h.hostid: h for h in client.get_hosts(*ids, search=True)}
+        if names and self.coalescer.exact:
+            hosts = client.get_hosts_by_name(*names)
+        elif names:
+            hosts = client.get_hosts(*names, search=True)
+        by_name = {h.host.casefold(): h for h in hosts}
+        host_names = [(h.host.casefold(), h) for h in hosts]
+
+        for line in self.lines:
+            line_args = args[id(line)]
+            missing: list[str] = []
+            found: dict[str, Host] = {}
+            for arg in line_args:
+                key = arg.casefold()
+                if arg.isnumeric():
+                    matches = [by_id[arg]] if arg in by_id else []
+                elif self.coalescer.exact:
+                    matches = [by_name[key]] if key in by_name else []
+                else:
+                    matches = [h for name, h in host_names if key in name]
+                found.update((h.hostid, h) for h in matches)
+                if not matches:
+                    missing.append(arg)
+            line.hosts.extend(found.values())
+            if self.coalescer.exact and missing:
+                line.error = ZabbixNotFoundError(
+                    f"Host {missing[0]!r} not found. Check your search pattern and filters."
+                )
+            elif self.coalescer.require_hosts and not line.hosts:
+                line.error = ZabbixNotFoundError(
+                    f"No hosts found matching {line.params[self.coalescer.hosts_param]}"
+                )
+
+
+def coalesce_commands(
+    ctx: typer.Context, group: click.Command, commands: Iterable[BulkCommand]
+) -> Iterator[BulkCommand | CoalescedCommand]:
+    """Merge runs of consecutive commands that can be coalesced into batches.
+
+    Commands that cannot be coalesced, and batches with a single command,
+    are yielded as-is.
+    """
+    batch: CoalescedCommand | None = None
+
+    def flush() -> Iterator[BulkCommand | CoalescedCommand]:
+        if batch is None:
+            return
+        if len(batch.lines) == 1:
+            yield batch.lines[0].command
+        else:
+            yield batch
+
+    for command in commands:
+        coalescer = COALESCERS.get(command.args[0])
+        key: Hashable | None = None
+        params: dict[str, Any] | None = None
+        # Global options and wildcards are never coalesced
+        if coalescer and not command.global_options and not command.wildcards:
+            params = get_command_params(ctx, group, command)
+            if params is not None:
+                key = coalescer.key(params)
+
+        if params is not None and key is not None and coalescer:
+            line = CoalescedLine(command=command, params=params)
+            if batch and batch.accepts(command, key):
+                batch.lines.append(line)
+                continue
+            yield from flush()
+            batch = CoalescedCommand(coalescer=coalescer(), key=key, lines=[line])
+        else:
+            yield from flush()
+            batch = None
+            yield command
+    yield from flush()
@@ -0,0 +1,151 @@
+"""Prefetching of objects referenced by bulk commands.
+
+Commands resolve the host groups, templates, proxies and user groups they
+reference with separate API requests, even though most lines in a command
+file reference the same few objects. Before a command file is run, all
+lines are parsed and the names of referenced objects are collected from
+the command parameters. Each object type is then fetched with as few
+requests as possible, and stored in a lookup table that the API client
+consults for the rest of the run. See `zabbix_cli.pyzabbix.lookup`.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+from typing import Any
+
+from zabbix_cli.bulk import BulkCommand
+from zabbix_cli.bulk import get_command_params
+from zabbix_cli.pyzabbix.lookup import LookupTable
+
+if TYPE_CHECKING:
+    import click
+    import typer
+
+    from zabbix_cli.config.model import Config
+    from zabbix_cli.pyzabbix.client import ZabbixAPI
+    from zabbix_cli.pyzabbix.types import ZabbixAPIBaseModel
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_CHUNK_SIZE = 500
+"""Maximum number of names fetched in a single request."""
+
+PREFETCH_PARAMS: dict[str, str] = {
+    "hostgroup": "hostgroup",
+    "hostgroups": "hostgroup",
+    "template_names_or_ids": "template",
+    "template_name_or_id": "template",
+    "template_name": "template",
+    "proxy": "proxy",
+    "proxies": "proxy",
+    "proxy_src": "proxy",
+    "proxy_dst": "proxy",
+    "usergroup": "usergroup",
+    "usergroups": "usergroup",
+}
+"""Command parameters referencing objects, and the type of object they reference."""
+
+DEFAULT_GROUPS: dict[str, tuple[str, str, Callable[[Config], list[str]]]] = {
+    "create_host": (
+        "use_default_hostgroups",
+        "hostgroup",
+        lambda config: config.app.commands.create_host.hostgroups,
+    ),
+    "create_user": (
+        "use_default_usergroups",
+        "usergroup",
+        lambda config: config.app.commands.create_user.usergroups,
+    ),
+    "create_notification_user": (
+        "use_default_usergroups",
+        "usergroup",
+        lambda config: config.app.commands.create_notification_user.usergroups,
+    ),
+}
+"""Commands that add default groups from the config, with the parameter
+enabling the default groups, and the type of group."""
+
+
+def get_references(
+    command: BulkCommand, params: dict[str, Any], config: Config
+) -> dict[str, set[str]]:
+    """Get the names of the objects referenced by a command, by object type."""
+    references: dict[str, set[str]] = {}
+    for param, value in params.items():
+        object_type = PREFETCH_PARAMS.get(param)
+        if not object_type or not isinstance(value, str):
+            continue
+        names = {n.strip() for n in value.split(",")}
+        references.setdefault(object_type, set()).update(
+            n for n in names if n and "*" not in n
+        )
+
+    if default := DEFAULT_GROUPS.get(command.args[0]):
+        flag, object_type, get_groups = default
+        if params.get(flag):
+            references.setdefault(object_type, set()).update(get_groups(config))
+    return references
+
+
+def collect_references(
+    ctx: typer.Context,
+    group: click.Command,
+    commands: Iterable[BulkCommand],
+    config: Config,
+) -> dict[str, set[str]]:
+    """Collect the names of the objects referenced by all commands, by object type."""
+    references: dict[str, set[str]] = {}
+    for command in commands:
+        params = get_command_params(ctx, group, command)
+        if params is None:
+            continue
+        for object_type, names in get_references(command, params, config).items():
+            references.setdefault(object_type, set()).update(names)
+    return references
+
+
+def _fetch_hostgroups(client: ZabbixAPI, names: list[str]) -> list[Any]:
+    return client.get_hostgroups(*names, search=True)
+
+
+def _fetch_templates(client: ZabbixAPI, names: list[str]) -> list[Any]:
+    return client.get_templates(*names)
+
+
+def _fetch_usergroups(client: ZabbixAPI, names: list[str]) -> list[Any]:
+    return client.get_usergroups(*names, select_users=False, select_rights=False)
+
+
+FETCHERS: dict[str, Callable[[ZabbixAPI, list[str]], list[ZabbixAPIBaseModel]]] = {
+    "hostgroup": _fetch_hostgroups,
+    "template": _fetch_templates,
+    "usergroup": _fetch_usergroups,
+}
+"""Functions fetching objects of a type by ID, or by searching for names."""
+
+
+def prefetch(client: ZabbixAPI, references: dict[str, set[str]]) -> LookupTable:
+    """Fetch the referenced objects into a lookup table."""
+    table = LookupTable()
+    for object_type, names in references.items():
+        if object_type == "proxy":
+            # Proxies are referenced by patterns, and there are few of them,
+            # so we fetch all of them.
+            table.set_all("proxy", client.get_proxies())
+            continue
+        fetch = FETCHERS[object_type]
+        # Names and IDs cannot be mixed in a single request
+        ids = sorted(n for n in names if n.isnumeric())
+        other = sorted(n for n in names if not n.isnumeric())
+        for i in range(0, len(ids), PREFETCH_CHUNK_SIZE):
+            table.add(object_type, fetch(client, ids[i : i + PREFETCH_CHUNK_SIZE]))
+        # Names are searched for, so the results can serve later searches
+        for i in range(0, len(other), PREFETCH_CHUNK_SIZE):
+            chunk = other[i : i + PREFETCH_CHUNK_SIZE]
+            table.add(object_type, fetch(client, chunk), searched=chunk)
+        logger.debug("Prefetched %d %s names", len(names), object_type)
+    return table
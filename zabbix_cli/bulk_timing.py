@@ -0,0 +1,232 @@
+"""Timing reports for bulk runs.
+
+Each executed line records its wall time, along with the number of API
+requests it made and the bytes it sent and received. The report summarizes
+the run with the throughput, latency percentiles per command and the
+slowest lines, so that the operations worth optimizing stand out.
+
+Durations are counted in log-spaced histogram buckets rather than kept
+per line, so the memory used by the report does not grow with the number
+of lines in the command file.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import math
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING
+from typing import Any
+
+from zabbix_cli.exceptions import CommandFileError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from rich.console import RenderableType
+
+    from zabbix_cli.bulk import CommandExecution
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (50, 95, 99)
+"""Latency percentiles reported per command."""
+
+SLOWEST_LINES = 10
+"""Number of slowest lines reported."""
+
+
+RELATIVE_ACCURACY = 0.01
+"""Maximum relative error of the reported percentiles."""
+
+
+class LatencyHistogram:
+    """Histogram of durations with logarithmically sized buckets.
+
+    Each bucket covers durations within `RELATIVE_ACCURACY` of its
+    midpoint, so percentiles are approximated within that relative error.
+    The number of buckets only depends on the ratio between the shortest
+    and longest duration (about 1300 buckets from 1 microsecond to 1 day)."""
+
+    def __init__(self) -> None:
+        self.gamma = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: defaultdict[int, int] = defaultdict(int)
+        """Number of durations in each bucket by bucket index."""
+        self.zero = 0
+        """Number of durations too short to be measured."""
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value <= 0:
+            self.zero += 1
+        else:
+            self.buckets[math.ceil(math.log(value) / self._log_gamma)] += 1
+
+    def percentile(self, pct: float) -> float:
+        """Get a percentile of the durations using the nearest-rank method."""
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(pct / 100 * self.count), 1)
+        seen = self.zero
+        if seen >= rank:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                value = 2 * self.gamma**index / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class BulkTimings:
+    """Timings of the commands executed in a bulk run."""
+
+    def __init__(self) -> None:
+        self.durations: defaultdict[str, LatencyHistogram] = defaultdict(
+            LatencyHistogram
+        )
+        """Wall times of the lines by command name."""
+        self.slowest: list[tuple[float, int, str, int, int]] = []
+        """Heap of (duration, line number, command, API calls, bytes)
+        for the slowest lines."""
+        self.api_calls = 0
+        self.bytes = 0
+        self._start = time.perf_counter()
+        self._end: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """Wall time of the run so far."""
+        end = self._end if self._end is not None else time.perf_counter()
+        return end - self._start
+
+    @property
+    def count(self) -> int:
+        return sum(d.count for d in self.durations.values())
+
+    def add(self, execution: CommandExecution) -> None:
+        """Record the timing of an executed line."""
+        command = execution.command
+        name = command.args[0] if command.args else ""
+        self.durations[name].add(execution.duration)
+        self.api_calls += execution.api_calls
+        self.bytes += execution.bytes
+        entry = (
+            execution.duration,
+            execution.line_number or 0,
+            str(command),
+            execution.api_calls,
+            execution.bytes,
+        )
+        if len(self.slowest) < SLOWEST_LINES:
+            heapq.heappush(self.slowest, entry)
+        else:
+            heapq.heappushpop(self.slowest, entry)
+
+    def finish(self) -> None:
+        """Stop the clock for the run."""
+        self._end = time.perf_counter()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get a JSON-serializable representation of the report."""
+        elapsed = self.elapsed
+        commands: dict[str, dict[str, Any]] = {}
+        for name, durations in sorted(self.durations.items()):
+            commands[name] = {
+                "count": durations.count,
+                "total": durations.total,
+                **{f"p{pct}": durations.percentile(pct) for pct in PERCENTILES},
+            }
+        return {
+            "elapsed": elapsed,
+            "commands": self.count,
+            "commands_per_second": self.count / elapsed if elapsed else 0.0,
+            "api_calls": self.api_calls,
+            "bytes": self.bytes,
+            "by_command": commands,
+            "slowest": [
+                {
+                    "line_number": line_number,
+                    "command": command,
+                    "duration": duration,
+                    "api_calls": api_calls,
+                    "bytes": nbytes,
+                }
+                for duration, line_number, command, api_calls, nbytes in sorted(
+                    self.slowest, reverse=True
+                )
+            ],
+        }
+
+    def get_renderables(self) -> list[RenderableType]:
+        """Get the report as tables."""
+        from zabbix_cli.table import get_table
+
+        report = self.to_dict()
+
+        def ms(seconds: float) -> str:
+            return f"{seconds * 1000:.1f}"
+
+        by_command = get_table(
+            ["Command", "Count", "Total (s)"] + [f"p{pct} (ms)" for pct in PERCENTILES],
+            [
+                [
+                    name,
+                    str(c["count"]),
+                    f"{c['total']:.2f}",
+                    *(ms(c[f"p{pct}"]) for pct in PERCENTILES),
+                ]
+                for name, c in report["by_command"].items()
+            ],
+            title="Latency by command",
+            show_lines=False,
+        )
+        slowest = get_table(
+            ["Line", "Command", "Time (ms)", "API calls", "Bytes"],
+            [
+                [
+                    str(line["line_number"]),
+                    line["command"],
+                    ms(line["duration"]),
+                    str(line["api_calls"]),
+                    str(line["bytes"]),
+                ]
+                for line in report["slowest"]
+            ],
+            title="Slowest lines",
+            show_lines=False,
+        )
+        summary = (
+            f"Ran {report['commands']} commands in {report['elapsed']:.2f}s "
+            f"({report['commands_per_second']:.1f} commands/s), "
+            f"{report['api_calls']} API calls, {report['bytes']} bytes"
+        )
+        return [by_command, slowest, summary]
+
+    def print(self) -> None:
+        """Print the report to stderr."""
+        from zabbix_cli.output.console import err_console
+
+        for renderable in self.get_renderables():
+            err_console.print(renderable)
+
+    def save(self, path: Path) -> None:
+        """Write the report to a JSON file."""
+        try:
+            path.write_text(json.dumps(self.to_dict(), indent=2))
+        except OSError as e:
+            raise CommandFileError(
+                f"Unable to write timing report to {path}: {e}"
+            ) from e
+        logger.info("Wrote timing report to %s", path)
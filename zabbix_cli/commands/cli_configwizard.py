@@ -356,7 +356,12 @@ _CONFIG_OPTIONS: dict[str, list[ConfigOption[Any]]] = {
             attr="app.output.color",
             type=bool,
         ),
-        # paging NYI
+        ConfigOption(
+            name="Output paging",
+            message="Show long output in a pager?",
+            attr="app.output.paging",
+            type=bool,
+        ),
     ],
 }
 
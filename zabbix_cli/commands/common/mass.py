@@ -0,0 +1,41 @@
+"""Mass operations with progress reporting for commands."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+from zabbix_cli.app import app
+
+if TYPE_CHECKING:
+    from zabbix_cli.pyzabbix.mass import MassOperationResult
+
+T = TypeVar("T")
+
+
+def run_mass_operation(
+    description: str,
+    func: Callable[[list[T]], object],
+    items: Sequence[T],
+    *,
+    unit: str = "hosts",
+) -> MassOperationResult[T]:
+    """Apply a mass operation to objects in chunks, showing a progress bar.
+
+    Only one live display can be active at a time, so no progress bar is
+    shown for commands running in worker threads."""
+    from zabbix_cli.output.progress import get_progress
+
+    client = app.state.client
+    if threading.current_thread() is not threading.main_thread():
+        return client.run_chunked(func, items)
+
+    progress = get_progress(unit)
+    with progress:
+        task = progress.add_task(description, total=len(items))
+        return client.run_chunked(
+            func, items, on_progress=lambda n: progress.update(task, advance=n)
+        )
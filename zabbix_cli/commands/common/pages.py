@@ -0,0 +1,54 @@
+"""Fetching of results page by page for commands that can stream them,
+and of only the properties needed for the fields selected with `--fields`."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Collection
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import TypeVar
+
+from zabbix_cli.app import app
+from zabbix_cli.output.render import is_streaming
+
+T = TypeVar("T")
+
+
+def fetch_pages(
+    fetch: Callable[[int | None], Iterator[list[T]]], status: str
+) -> Iterable[list[T]]:
+    """Fetch the results of a command.
+
+    `fetch` is called with the page size and returns an iterator of pages.
+    When results are streamed, pages are fetched lazily as they are
+    rendered. Otherwise, all results are fetched in a single request.
+    """
+    if is_streaming():
+        return fetch(app.state.client.page_size)
+    with app.status(status):
+        return list(fetch(None))
+
+
+def get_output_properties(
+    properties: Collection[str], *, id_field: str, selected: Collection[str] = ()
+) -> list[str] | None:
+    """Get the object properties to request from the API for the fields
+    selected with `--fields`.
+
+    `properties` are the fields that correspond directly to object properties,
+    and `selected` are the fields that are fetched with `select*` parameters
+    regardless. Returns None (all properties) if no fields are selected, or
+    if any of the selected fields is derived from other properties."""
+    fields = app.state.fields
+    if not fields:
+        return None
+    output = [id_field]
+    for field in fields:
+        if field in selected:
+            continue
+        if field not in properties:
+            return None
+        if field not in output:
+            output.append(field)
+    return output
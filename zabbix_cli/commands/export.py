@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
 from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
@@ -10,11 +11,16 @@ from typing import NamedTuple
 from typing import Protocol
 
 import typer
+from pydantic import BaseModel
+from pydantic import PrivateAttr
+from pydantic import RootModel
+from pydantic import ValidationError
 from strenum import StrEnum
 
 from zabbix_cli._v2_compat import deprecated_positional_arguments
 from zabbix_cli.app import Example
 from zabbix_cli.app import app
+from zabbix_cli.config.constants import IMPORT_LEDGER_FILE
 from zabbix_cli.config.constants import OutputFormat
 from zabbix_cli.exceptions import ZabbixCLIError
 from zabbix_cli.logs import logger
@@ -31,7 +37,10 @@ from zabbix_cli.pyzabbix.enums import ExportFormat
 from zabbix_cli.utils.args import parse_bool_arg
 from zabbix_cli.utils.args import parse_list_arg
 from zabbix_cli.utils.args import parse_path_arg
+from zabbix_cli.utils.fs import get_file_hash
+from zabbix_cli.utils.fs import mkdir_if_not_exists
 from zabbix_cli.utils.fs import open_directory
+from zabbix_cli.utils.fs import read_file
 from zabbix_cli.utils.fs import sanitize_filename
 from zabbix_cli.utils.utils import convert_seconds_to_duration
 
@@ -83,6 +92,113 @@ class ExportType(StrEnum):
         return self.value.replace("_", " ").lower()
 
 
+EXPORT_JOURNAL_FILENAME = ".zabbix-cli-export-journal.jsonl"
+"""Name of the checkpoint journal file written to the export directory."""
+
+
+class ExportJournalEntry(BaseModel):
+    """A single line in the export journal."""
+
+    type: ExportType
+    id: str
+    path: Path | None = None
+    """Path to the exported file. Only set for successful exports."""
+    error: str | None = None
+    """Error message. Only set for failed exports."""
+
+
+class ExportJournal:
+    """Checkpoint journal of completed and failed exports.
+
+    The journal is stored in the export directory as a JSON Lines file,
+    and every export is appended to it as soon as it finishes. This way
+    the journal is always up to date, even if the export is interrupted.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.path = directory / EXPORT_JOURNAL_FILENAME
+        self.completed: dict[tuple[ExportType, str], Path] = {}
+        """Mapping of (type, ID) to the path of successfully exported objects."""
+        self.failed: dict[tuple[ExportType, str], str] = {}
+        """Mapping of (type, ID) to the error message of failed exports."""
+
+    def load(self) -> None:
+        """Load entries from an existing journal file."""
+        self.completed.clear()
+        self.failed.clear()
+        if not self.path.exists():
+            logger.debug("No export journal found at %s", self.path)
+            return
+        try:
+            contents = read_file(self.path)
+        except Exception as e:
+            raise ZabbixCLIError(f"Unable to read export journal: {e}") from e
+
+        for lineno, line in enumerate(contents.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                entry = ExportJournalEntry.model_validate_json(line)
+            except ValidationError:
+                # Most likely a partially written line from an interrupted export
+                logger.warning(
+                    "Ignoring invalid line %d in export journal %s", lineno, self.path
+                )
+                continue
+            self._apply(entry)
+        logger.info(
+            "Loaded export journal %s (%d completed, %d failed)",
+            self.path,
+            len(self.completed),
+            len(self.failed),
+        )
+
+    def reset(self) -> None:
+        """Clear the journal and remove the journal file."""
+        self.completed.clear()
+        self.failed.clear()
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as e:
+            raise ZabbixCLIError(f"Unable to remove export journal: {e}") from e
+
+    def is_completed(self, export_type: ExportType, id: str) -> bool:
+        return (export_type, id) in self.completed
+
+    def is_failed(self, export_type: ExportType, id: str) -> bool:
+        return (export_type, id) in self.failed
+
+    def failed_types(self) -> set[ExportType]:
+        """Export types with at least one failed export."""
+        return {export_type for export_type, _ in self.failed}
+
+    def record_success(self, export_type: ExportType, id: str, path: Path) -> None:
+        self._append(ExportJournalEntry(type=export_type, id=id, path=path))
+
+    def record_failure(self, export_type: ExportType, id: str, error: str) -> None:
+        self._append(ExportJournalEntry(type=export_type, id=id, error=error))
+
+    def _apply(self, entry: ExportJournalEntry) -> None:
+        """Apply an entry to the in-memory state. Later entries take precedence."""
+        key = (entry.type, entry.id)
+        if entry.error is None and entry.path is not None:
+            self.completed[key] = entry.path
+            self.failed.pop(key, None)
+        else:
+            self.failed[key] = entry.error or ""
+            self.completed.pop(key, None)
+
+    def _append(self, entry: ExportJournalEntry) -> None:
+        self._apply(entry)
+        try:
+            mkdir_if_not_exists(self.path.parent)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(entry.model_dump_json() + "\n")
+        except OSError as e:
+            # Failing to write the journal should not abort the export itself
+            logger.error("Failed to write to export journal %s: %s", self.path, e)
+
+
 class ExporterFunc(Protocol):
     def __call__(self) -> Iterator[Path | None]: ...
 
@@ -107,6 +223,9 @@ class ZabbixExporter:
         legacy_filenames: bool,
         pretty: bool,
         ignore_errors: bool,
+        *,
+        resume: bool = False,
+        retry_failed: bool = False,
     ) -> None:
         self.client = client
         self.config = config
@@ -118,6 +237,12 @@ class ZabbixExporter:
         self.legacy_filenames = legacy_filenames
         self.pretty = pretty
         self.ignore_errors = ignore_errors
+        self.resume = resume
+        self.retry_failed = retry_failed
+
+        self.journal = ExportJournal(directory)
+        self.skipped = 0
+        """Number of objects skipped because of the journal."""
 
         # Ideally, we fetch and write at the same time, so we keep memory usage low,
         # while utilizing I/O and CPU as much as possible.
@@ -138,6 +263,11 @@ class ZabbixExporter:
 
     def run(self) -> list[Path]:
         """Run exporters."""
+        if self.resume or self.retry_failed:
+            self.journal.load()
+        else:
+            self.journal.reset()
+
         files: list[Path] = []
         with err_console.status("") as status:
             for exporter in self.get_exporters():
@@ -170,6 +300,9 @@ class ZabbixExporter:
         """Get a list of exporters to run."""
         exporters: list[Exporter] = []
         for export_type in self.export_types:
+            if self.retry_failed and export_type not in self.journal.failed_types():
+                logger.debug("No failed %s to retry", export_type.human_readable())
+                continue
             exporter = self.exporter_map.get(export_type, None)
             if not exporter:  # should never happen - tests should catch this
                 raise ZabbixCLIError(
@@ -213,7 +346,9 @@ class ZabbixExporter:
         hostgroups = self.client.get_hostgroups(*self.names, search=True)
         for hg in hostgroups:
             filename = self.get_filename(hg.name, hg.groupid, ExportType.HOST_GROUPS)
-            yield self.do_run_export(filename, host_groups=[hg])
+            yield self.do_run_export(
+                ExportType.HOST_GROUPS, hg.groupid, filename, host_groups=[hg]
+            )
 
     def export_template_groups(self) -> Iterator[Path | None]:
         template_groups = self.client.get_templategroups(*self.names, search=True)
@@ -221,25 +356,31 @@ class ZabbixExporter:
             filename = self.get_filename(
                 tg.name, tg.groupid, ExportType.TEMPLATE_GROUPS
             )
-            yield self.do_run_export(filename, template_groups=[tg])
+            yield self.do_run_export(
+                ExportType.TEMPLATE_GROUPS, tg.groupid, filename, template_groups=[tg]
+            )
 
     def export_hosts(self) -> Iterator[Path | None]:
         hosts = self.client.get_hosts(*self.names)
         for host in hosts:
             filename = self.get_filename(host.host, host.hostid, ExportType.HOSTS)
-            yield self.do_run_export(filename, hosts=[host])
+            yield self.do_run_export(
+                ExportType.HOSTS, host.hostid, filename, hosts=[host]
+            )
 
     def export_images(self) -> Iterator[Path | None]:
         images = self.client.get_images(*self.names, select_image=False)
         for image in images:
             filename = self.get_filename(image.name, image.imageid, ExportType.IMAGES)
-            yield self.do_run_export(filename, images=[image])
+            yield self.do_run_export(
+                ExportType.IMAGES, image.imageid, filename, images=[image]
+            )
 
     def export_maps(self) -> Iterator[Path | None]:
         maps = self.client.get_maps(*self.names)
         for m in maps:
             filename = self.get_filename(m.name, m.sysmapid, ExportType.MAPS)
-            yield self.do_run_export(filename, maps=[m])
+            yield self.do_run_export(ExportType.MAPS, m.sysmapid, filename, maps=[m])
 
     def export_media_types(self) -> Iterator[Path | None]:
         media_types = self.client.get_media_types(*self.names)
@@ -247,7 +388,9 @@ class ZabbixExporter:
             filename = self.get_filename(
                 mt.name, mt.mediatypeid, ExportType.MEDIA_TYPES
             )
-            yield self.do_run_export(filename, media_types=[mt])
+            yield self.do_run_export(
+                ExportType.MEDIA_TYPES, mt.mediatypeid, filename, media_types=[mt]
+            )
 
     def export_templates(self) -> Iterator[Path | None]:
         templates = self.client.get_templates(*self.names)
@@ -255,19 +398,43 @@ class ZabbixExporter:
             filename = self.get_filename(
                 template.host, template.templateid, ExportType.TEMPLATES
             )
-            yield self.do_run_export(filename, templates=[template])
+            yield self.do_run_export(
+                ExportType.TEMPLATES,
+                template.templateid,
+                filename,
+                templates=[template],
+            )
+
+    def should_export(self, export_type: ExportType, id: str) -> bool:
+        """Check the journal to determine if an object should be exported."""
+        if (self.resume or self.retry_failed) and self.journal.is_completed(
+            export_type, id
+        ):
+            return False
+        if self.retry_failed and not self.journal.is_failed(export_type, id):
+            return False
+        return True
 
     def do_run_export(
-        self, filename: Path, **kwargs: Unpack[ExportKwargs]
+        self,
+        export_type: ExportType,
+        id: str,
+        filename: Path,
+        **kwargs: Unpack[ExportKwargs],
     ) -> Path | None:
         """Runs the export process."""
+        if not self.should_export(export_type, id):
+            logger.debug("Skipping export of %s (ID %s)", export_type, id)
+            self.skipped += 1
+            return None
+
         try:
             exported = self.client.export_configuration(
                 pretty=self.pretty,
                 format=self.format,
                 **kwargs,
             )
-            return self.write_exported(exported, filename)
+            path = self.write_exported(exported, filename)
         except Exception as e:
             # HACKY: since we do some ugly metaprogramming to generalize the export process,
             # we don't have the actual object on hand to print a useful representation of it.
@@ -275,11 +442,15 @@ class ZabbixExporter:
             # then get the firsty entry of that list and call __pretty__ on it. But as it stands,
             # it's prettier to just print the expected filename than to leak the entire object repr
             msg = f"Failed to export {filename}: {e}"
+            self.journal.record_failure(export_type, id, str(e))
             if self.ignore_errors:
                 error(msg, exc_info=True)
                 return None
             else:
                 raise ZabbixCLIError(msg) from e
+        else:
+            self.journal.record_success(export_type, id, path)
+            return path
 
     def write_exported(self, exported: str, filename: Path) -> Path:
         """Writes an exported object to a file. Returns path to file."""
@@ -404,7 +575,16 @@ def export_configuration(
         "--ignore-errors",
         help="Enable best-effort exporting. Print errors but continue exporting.",
     ),
-    # TODO: add --ignore-errors option
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Resume a previous export to the same directory. Skips objects that were already exported.",
+    ),
+    retry_failed: bool = typer.Option(
+        False,
+        "--retry-failed",
+        help="Only export objects that failed in the previous export to the same directory.",
+    ),
     # Legacy positional args
     args: list[str] | None = deprecated_positional_arguments(3),
 ) -> None:
@@ -425,6 +605,10 @@ def export_configuration(
     Timestamps are disabled by default, but can be enabled with [option]--timestamps[/] or the [configopt]app.commands.export.timestamps[/]
     configuration option.
 
+    Progress is recorded in a journal file in the export directory.
+    An interrupted export can be continued with [option]--resume[/],
+    and objects that failed to export can be retried with [option]--retry-failed[/].
+
     Shows detailed information about exported files in JSON output mode.
     """
     from zabbix_cli.commands.results.export import ExportResult
@@ -464,12 +648,22 @@ def export_configuration(
         legacy_filenames=legacy_filenames,
         pretty=pretty,
         ignore_errors=ignore_errors,
+        resume=resume,
+        retry_failed=retry_failed,
     )
     exported = exporter.run()
+    msg = f"Exported {len(exported)} files to {exportdir}"
+    if exporter.skipped:
+        msg += f" (skipped {exporter.skipped} objects based on export journal)"
+    if exporter.journal.failed:
+        warning(
+            f"Failed to export {len(exporter.journal.failed)} objects. "
+            "Use [option]--retry-failed[/] to retry them."
+        )
     # NOTE: record duration similar to import_configuration?
     render_result(
         Result(
-            message=f"Exported {len(exported)} files to {exportdir}",
+            message=msg,
             result=ExportResult(
                 exported=exported, types=types, names=obj_names, format=format
             ),
@@ -481,6 +675,148 @@ def export_configuration(
         open_directory(exportdir)
 
 
+# Order in which export types are imported. Types in the same tier do not
+# depend on each other and can be imported concurrently.
+IMPORT_TIERS: tuple[tuple[ExportType, ...], ...] = (
+    (
+        ExportType.HOST_GROUPS,
+        ExportType.TEMPLATE_GROUPS,
+        ExportType.IMAGES,
+        ExportType.MEDIA_TYPES,
+    ),
+    (ExportType.TEMPLATES,),
+    (ExportType.HOSTS,),
+    (ExportType.MAPS,),
+)
+
+# Mapping of keys in the root of an export document to export types.
+# Global triggers and graphs reference host items, so they are imported with hosts.
+DOCUMENT_KEY_TYPES: dict[str, ExportType] = {
+    "groups": ExportType.HOST_GROUPS,  # < 6.2
+    "host_groups": ExportType.HOST_GROUPS,
+    "template_groups": ExportType.TEMPLATE_GROUPS,
+    "images": ExportType.IMAGES,
+    "media_types": ExportType.MEDIA_TYPES,
+    "templates": ExportType.TEMPLATES,
+    "hosts": ExportType.HOSTS,
+    "triggers": ExportType.HOSTS,
+    "graphs": ExportType.HOSTS,
+    "maps": ExportType.MAPS,
+}
+
+# Export types that `configuration.importcompare` can compare. The API only
+# reports changes to templates and their elements, so other types are always
+# imported when comparing.
+COMPARABLE_TYPES = (ExportType.TEMPLATE_GROUPS, ExportType.TEMPLATES)
+
+
+def get_import_tier(export_type: ExportType | None) -> int:
+    """Get the import tier of an export type. Unknown types are imported last."""
+    for tier, types in enumerate(IMPORT_TIERS):
+        if export_type in types:
+            return tier
+    return len(IMPORT_TIERS)
+
+
+def get_document_keys(file: Path) -> list[str]:
+    """Get the keys in the root of an export document."""
+    import json
+    import re
+
+    contents = read_file(file)
+    fmt = file.suffix.strip(".").casefold()
+    if fmt == ExportFormat.JSON:
+        doc = json.loads(contents)
+        if not isinstance(doc, dict) or not isinstance(
+            root := doc.get("zabbix_export"),  # pyright: ignore[reportUnknownMemberType]
+            dict,
+        ):
+            return []
+        return [str(k) for k in root]  # pyright: ignore[reportUnknownVariableType]
+
+    # No YAML or XML parser available, so we find the indentation of the
+    # first child of the root element and look for siblings with the same indentation.
+    if fmt == ExportFormat.XML:
+        version_pattern, key_pattern = r"^(\s+)<version>", r"^{indent}<(\w+)>"
+    else:
+        version_pattern, key_pattern = r"^(\s+)version:", r"^{indent}(\w+):"
+    version = re.search(version_pattern, contents, re.MULTILINE)
+    if not version:
+        return []
+    pattern = key_pattern.format(indent=re.escape(version.group(1)))
+    return re.findall(pattern, contents, re.MULTILINE)
+
+
+def get_import_type(file: Path) -> ExportType | None:
+    """Determine the export type of a file to import.
+
+    Uses the name of the parent directory if the file is in an export directory
+    created by `export_configuration`. Otherwise, the export type is determined
+    from the keys in the root of the document. Documents containing multiple
+    types are classified as the type that should be imported last.
+    """
+    try:
+        return ExportType(file.parent.name)
+    except ValueError:
+        pass
+
+    try:
+        keys = get_document_keys(file)
+    except Exception as e:
+        logger.warning("Unable to determine export type of %s: %s", file, e)
+        return None
+
+    types = [DOCUMENT_KEY_TYPES[k] for k in keys if k in DOCUMENT_KEY_TYPES]
+    if not types:
+        return None
+    return max(types, key=get_import_tier)
+
+
+class ImportLedger(RootModel[dict[str, dict[str, str]]]):
+    """Hashes of successfully imported files.
+
+    Root model that wraps a dict of Zabbix API URLs to a dict of
+    absolute file paths to SHA-256 hashes of their contents.
+    """
+
+    root: dict[str, dict[str, str]] = {}
+    _path: Path | None = PrivateAttr(default=None)
+
+    @classmethod
+    def load(cls, file: Path) -> ImportLedger:
+        """Load the contents of a ledger file. Returns an empty ledger if
+        the file does not exist or cannot be loaded."""
+        ledger = cls()
+        if file.exists():
+            try:
+                ledger = cls.model_validate_json(read_file(file))
+            except Exception as e:
+                logger.warning("Unable to load import ledger %s: %s", file, e)
+        ledger._path = file
+        return ledger
+
+    def save(self, path: Path | None = None) -> None:
+        path = path or self._path
+        if not path:
+            raise ZabbixCLIError("Cannot save import ledger without a path.")
+        try:
+            mkdir_if_not_exists(path.parent)
+            path.write_text(self.model_dump_json(indent=2))
+        except Exception as e:
+            # Not being able to save the ledger should not fail the import
+            logger.error("Unable to save import ledger %s: %s", path, e)
+        else:
+            logger.debug("Saved import ledger %s", path)
+
+    def is_unchanged(self, url: str, file: Path, digest: str) -> bool:
+        """Check if a file was previously imported with identical contents."""
+        return self.root.get(url, {}).get(str(file.resolve())) == digest
+
+    def record(self, url: str, file: Path, digest: str) -> None:
+        """Record a successful import of a file."""
+        self.root.setdefault(url, {})[str(file.resolve())] = digest
+
+
 class ZabbixImporter:
     def __init__(
         self,
@@ -491,6 +827,11 @@ class ZabbixImporter:
         update_existing: bool,
         delete_missing: bool,
         ignore_errors: bool,
+        *,
+        jobs: int = 1,
+        changed_only: bool = False,
+        compare: bool = False,
+        ledger: ImportLedger | None = None,
     ) -> None:
         self.client = client
         self.config = config
@@ -499,39 +840,141 @@ class ZabbixImporter:
         self.create_missing = create_missing
         self.update_existing = update_existing
         self.delete_missing = delete_missing
+        self.jobs = max(jobs, 1)
+        self.changed_only = changed_only
+        self.compare = compare
+        self.ledger = ledger
+
+        if self.compare and self.client.version.release < (6, 0, 0):
+            warning(
+                "Comparing configuration before importing requires Zabbix >= 6.0. "
+                f"Connected to Zabbix {self.client.version}."
+            )
+            self.compare = False
 
         self.imported: list[Path] = []
         self.failed: list[Path] = []
+        self.skipped: list[Path] = []
+        """Files that were skipped because they are unchanged."""
+
+        self.hashes: dict[Path, str] = {}
+        """SHA-256 hashes of files to import."""
+        self.types: dict[Path, ExportType | None] = {}
+        """Export types of files to import."""
+
+    def filter_unchanged(self, files: list[Path]) -> list[Path]:
+        """Remove files that are unchanged since they were last imported."""
+        if not self.ledger:
+            return files
+        changed: list[Path] = []
+        for file in files:
+            if self.ledger.is_unchanged(self.client.url, file, self.hashes[file]):
+                logger.debug("Skipping unchanged file %s", file)
+                self.skipped.append(file)
+            else:
+                changed.append(file)
+        return changed
+
+    def add_imported(self, file: Path) -> None:
+        self.imported.append(file)
+        if self.ledger:
+            self.ledger.record(self.client.url, file, self.hashes[file])
+        logger.info(f"Imported file {file}")
+
+    def add_skipped(self, file: Path) -> None:
+        self.skipped.append(file)
+        if self.ledger:
+            self.ledger.record(self.client.url, file, self.hashes[file])
+        logger.info(f"Skipped file {file} (no changes)")
+
+    def get_import_tiers(self) -> list[list[Path]]:
+        """Group files into tiers that must be imported in order."""
+        tiers: list[list[Path]] = [[] for _ in range(len(IMPORT_TIERS) + 1)]
+        for file in self.files:
+            export_type = self.types[file] = get_import_type(file)
+            tier = get_import_tier(export_type)
+            logger.debug("Import tier %d (%s): %s", tier, export_type, file)
+            tiers[tier].append(file)
+        return [tier for tier in tiers if tier]
 
     def run(self) -> None:
         """Runs the importer."""
-        from rich.progress import BarColumn
-        from rich.progress import Progress
-        from rich.progress import SpinnerColumn
-        from rich.progress import TaskProgressColumn
-        from rich.progress import TextColumn
-        from rich.progress import TimeElapsedColumn
-
-        progress = Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TimeElapsedColumn(),
-            transient=True,
-            console=err_console,
-        )
-        with progress:
-            task = progress.add_task("Importing files...", total=len(self.files))
-            for file in self.files:
-                self.import_file(file)
-                progress.update(task, advance=1)
+        from zabbix_cli.output.progress import get_progress
+
+        if self.ledger:
+            self.hashes = {file: get_file_hash(file) for file in self.files}
+        if self.changed_only:
+            self.files = self.filter_unchanged(self.files)
+
+        progress = get_progress("files")
+        try:
+            with progress:
+                task = progress.add_task("Importing files...", total=len(self.files))
+
+                def advance() -> None:
+                    progress.update(task, advance=1)
+
+                for tier in self.get_import_tiers():
+                    self.run_tier(tier, advance)
+        finally:
+            if self.ledger:
+                self.ledger.save()
+
+    def run_tier(self, files: list[Path], advance: Callable[[], None]) -> None:
+        """Import a tier of independent files concurrently.
+
+        Files that fail are retried serially once the rest of the tier is
+        imported, since they can depend on other files in the same tier
+        (e.g. templates linking other templates).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from concurrent.futures import as_completed
+
+        deferred: list[Path] = []
+        executor = ThreadPoolExecutor(max_workers=self.jobs)
+        try:
+            futures = {executor.submit(self._import_file, f): f for f in files}
+            for future in as_completed(futures):
+                file = futures[future]
+                try:
+                    imported = future.result()
+                except Exception as e:
+                    logger.info("Deferring import of %s: %s", file, e)
+                    deferred.append(file)
+                else:
+                    if imported:
+                        self.add_imported(file)
+                    else:
+                        self.add_skipped(file)
+                    advance()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        for file in sorted(deferred):
+            self.import_file(file)
+            advance()
+
+    def _import_file(self, file: Path) -> bool:
+        """Import a file. Returns False if the file has no changes to import."""
+        kwargs = {
+            "create_missing": self.create_missing,
+            "update_existing": self.update_existing,
+            "delete_missing": self.delete_missing,
+        }
+        if (
+            self.compare
+            and self.types.get(file) in COMPARABLE_TYPES
+            and not self.client.compare_configuration(file, **kwargs)
+        ):
+            return False
+        self.client.import_configuration(file, **kwargs)
+        return True
 
     def import_file(self, file: Path) -> None:
         # API method will return true if successful, but does failure return false
         # or does it raise an exception?
         try:
-            self.client.import_configuration(file)
+            imported = self._import_file(file)
         except Exception as e:
             self.failed.append(file)
             msg = f"Failed to import {file}: {e}"
@@ -540,8 +983,10 @@ class ZabbixImporter:
             else:
                 raise ZabbixCLIError(msg) from e
         else:
-            self.imported.append(file)
-            logger.info(f"Imported file {file}")
+            if imported:
+                self.add_imported(file)
+            else:
+                self.add_skipped(file)
 
 
 def filter_valid_imports(files: list[Path]) -> list[Path]:
@@ -581,6 +1026,23 @@ def import_configuration(
         "--ignore-errors",
         help="Enable best-effort importing. Print errors from failed imports but continue importing.",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of files to import concurrently.",
+        min=1,
+    ),
+    changed_only: bool = typer.Option(
+        False,
+        "--changed-only",
+        help="Skip files that are unchanged since they were last imported to the same server.",
+    ),
+    compare: bool = typer.Option(
+        False,
+        "--compare",
+        help="Compare template and template group files with the server configuration before importing and skip files without changes. Other files are always imported. Requires Zabbix >= 6.0.",
+    ),
     # Legacy positional args
     args: list[str] | None = deprecated_positional_arguments(2),
 ) -> None:
@@ -590,6 +1052,14 @@ def import_configuration(
     Uses default export directory if no argument is specified.
 
     Determines format to import based on file extensions.
+
+    Files are imported in dependency order: groups, images and media types first,
+    then templates, hosts and finally maps. The type of each file is determined
+    by its directory in the export directory or by the contents of the file.
+    Files of the same type can be imported concurrently with [option]--jobs[/].
+
+    Hashes of imported files are recorded per server, and files that are unchanged
+    since they were last imported can be skipped with [option]--changed-only[/].
     """
     import glob
 
@@ -650,6 +1120,10 @@ def import_configuration(
         update_existing=update_existing,
         ignore_errors=ignore_errors,
         delete_missing=delete_missing,
+        jobs=jobs,
+        changed_only=changed_only,
+        compare=compare,
+        ledger=ImportLedger.load(IMPORT_LEDGER_FILE),
     )
 
     try:
@@ -664,20 +1138,25 @@ def import_configuration(
                 dryrun=False,
                 imported=importer.imported,
                 failed=importer.failed,
+                skipped=importer.skipped,
             ),
             table=False,  # only render this in JSON mode
         )
     else:
         duration = time.monotonic() - start_time
         msg = f"Imported {len(importer.imported)} files in {convert_seconds_to_duration(int(duration))}"
+        if importer.skipped:
+            msg += f", skipped {len(importer.skipped)} unchanged files"
         if importer.failed:
-            msg += f", failed to import {len(importer.failed)} files"
+            msg += f", failed to import {len(importer.failed)} files:\n"
+            msg += "\n".join(f"  {path_link(f)}" for f in importer.failed)
         res = Result(
             message=msg,
             result=ImportResult(
                 success=len(importer.failed) == 0,
                 imported=importer.imported,
                 failed=importer.failed,
+                skipped=importer.skipped,
                 duration=duration,
             ),
             table=False,  # only render this in JSON mode
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ipaddress
+from typing import TYPE_CHECKING
 
 import typer
 
@@ -17,9 +18,13 @@ from zabbix_cli.pyzabbix.enums import ActiveInterface
 from zabbix_cli.pyzabbix.enums import InterfaceType
 from zabbix_cli.pyzabbix.enums import InventoryMode
 from zabbix_cli.pyzabbix.enums import MonitoringStatus
+from zabbix_cli.pyzabbix.enums import ProxyStrategy
 from zabbix_cli.utils.args import check_at_least_one_option_set
 from zabbix_cli.utils.args import parse_list_arg
 
+if TYPE_CHECKING:
+    from zabbix_cli.pyzabbix.types import Host
+
 HELP_PANEL = "Host"
 
 
@@ -40,6 +45,15 @@ def create_host(
         "--proxy",
         help="Proxy server used to monitor the host. Supports regular expressions.",
     ),
+    proxy_strategy: ProxyStrategy | None = typer.Option(
+        None,
+        "--proxy-strategy",
+        help=(
+            "Strategy for selecting among the proxies matching [option]--proxy[/]. "
+            "Uses [configopt]app.commands.create_host.proxy_strategy[/] if omitted."
+        ),
+        case_sensitive=False,
+    ),
     status: MonitoringStatus = typer.Option(
         MonitoringStatus.ON.value,
         "--status",
@@ -74,7 +88,8 @@ def create_host(
     Always adds the host to the default host groups specified in the config
     under [configopt]app.commands.create_host.hostgroups[/] unless [option]--no-default-hostgroup[/] is specified.
 
-    Selects a random proxy by default unless [option]--proxy[/] [value]"-"[/] is specified.
+    Selects a proxy matching [option]--proxy[/] using the configured proxy strategy
+    (random by default) unless [option]--proxy[/] [value]"-"[/] is specified.
 
     Creates an interface for the host by default unless [option]--no-interface[/] is specified.
     """
@@ -84,7 +99,6 @@ def create_host(
     from zabbix_cli.models import Result
     from zabbix_cli.output.formatting.grammar import pluralize_no_count as pnc
     from zabbix_cli.pyzabbix.types import HostInterface
-    from zabbix_cli.pyzabbix.utils import get_random_proxy
 
     if args:
         hostgroups = args[0]
@@ -142,7 +156,11 @@ def create_host(
 
     # Find a proxy (No match = monitored by zabbix server)
     try:
-        prox = get_random_proxy(app.state.client, pattern=proxy)
+        prox = app.state.client.proxy_selector.select(
+            proxy,
+            strategy=proxy_strategy
+            or app.state.config.app.commands.create_host.proxy_strategy,
+        )
     except ZabbixNotFoundError:
         prox = None
 
@@ -298,8 +316,10 @@ def show_hosts(
     Hosts can be filtered by agent, monitoring and maintenance status.
     Hosts are sorted by name.
     """
+    from zabbix_cli.commands.common.pages import fetch_pages
+    from zabbix_cli.commands.common.pages import get_output_properties
     from zabbix_cli.commands.results.host import HostFilterArgs
-    from zabbix_cli.models import AggregateResult
+    from zabbix_cli.output.render import render_pages
     from zabbix_cli.pyzabbix.utils import get_proxy_map
 
     # Unified parsing of legacy and V3-style filter arguments
@@ -311,8 +331,15 @@ def show_hosts(
     hgs = parse_list_arg(hostgroup)
     hostgroups = [app.state.client.get_hostgroup(hg) for hg in hgs]
 
-    with app.status("Fetching hosts..."):
-        hosts = app.state.client.get_hosts(
+    # Only fetch the properties needed for the fields selected with --fields
+    output = get_output_properties(
+        ("host", "description", "status", "maintenance_status"),
+        id_field="hostid",
+        selected=("groups", "templates"),
+    )
+
+    pages = fetch_pages(
+        lambda page_size: app.state.client.iter_hosts(
             *hostnames_or_ids,
             select_groups=True,
             select_templates=True,
@@ -324,17 +351,24 @@ def show_hosts(
             active_interface=args.active,
             limit=limit,
             hostgroups=hostgroups,
-        )
+            page_size=page_size,
+            output=output,
+        ),
+        "Fetching hosts...",
+    )
 
     # HACK: inject proxy map for each host
     # By default, each host only has a proxy ID.
     # We need to determine inside each host object which
     # Proxy object to select
     proxy_map = get_proxy_map(app.state.client)
-    for host in hosts:
-        host.set_proxy(proxy_map)
 
-    render_result(AggregateResult(result=hosts))
+    def set_proxies(hosts: list[Host]) -> list[Host]:
+        for host in hosts:
+            host.set_proxy(proxy_map)
+        return hosts
+
+    render_pages(set_proxies(page) for page in pages)
 
 
 @app.command(name="update_host", rich_help_panel=HELP_PANEL)
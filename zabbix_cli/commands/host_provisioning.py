@@ -0,0 +1,1139 @@
+"""Commands for provisioning hosts from CSV and JSONL files.
+
+Each row of a host file describes a host. All objects referenced by the
+rows (host groups, templates, proxies) are resolved up front with as few
+requests as possible, and the hosts are created with chunked, array-form
+`host.create` calls instead of a handful of requests per host.
+
+Syncing hosts with a file fetches the current state of all hosts in one
+pass, computes the difference locally and applies it with one mass
+operation per distinct change, so a file that is already in sync costs
+only the reads.
+"""
+
+from __future__ import annotations
+
+import csv
+import ipaddress
+import json
+import re
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import TypeVar
+
+import typer
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+from pydantic import ValidationError
+from pydantic import field_validator
+from strenum import StrEnum
+
+from zabbix_cli.app import Example
+from zabbix_cli.app import app
+from zabbix_cli.exceptions import ZabbixAPIException
+from zabbix_cli.exceptions import ZabbixCLIError
+from zabbix_cli.exceptions import ZabbixCLIFileError
+from zabbix_cli.output.console import exit_err
+from zabbix_cli.output.console import success
+from zabbix_cli.output.render import render_result
+from zabbix_cli.pyzabbix.enums import InterfaceType
+from zabbix_cli.pyzabbix.enums import InventoryMode
+from zabbix_cli.pyzabbix.enums import MonitoringStatus
+from zabbix_cli.pyzabbix.enums import ProxyStrategy
+from zabbix_cli.utils.args import parse_list_arg
+
+if TYPE_CHECKING:
+    from zabbix_cli.commands.results.host import CreateHostFromFileResult
+    from zabbix_cli.commands.results.host import SyncHostsChange
+    from zabbix_cli.pyzabbix.client import ZabbixAPI
+    from zabbix_cli.pyzabbix.types import Host
+    from zabbix_cli.pyzabbix.types import HostGroup
+    from zabbix_cli.pyzabbix.types import ParamsType
+    from zabbix_cli.pyzabbix.types import Proxy
+    from zabbix_cli.pyzabbix.types import Template
+    from zabbix_cli.pyzabbix.types import ZabbixAPIBaseModel
+
+HELP_PANEL = "Host"
+
+CREATE_HOSTS_CHUNK_SIZE = 500
+"""Default number of hosts created per request."""
+
+ObjectT = TypeVar("ObjectT", bound="ZabbixAPIBaseModel")
+
+
+class HostFileFormat(StrEnum):
+    """Format of a host file."""
+
+    CSV = "csv"
+    JSONL = "jsonl"
+
+    @classmethod
+    def from_path(cls, path: Path) -> HostFileFormat:
+        """Determine the format of a host file from its suffix."""
+        if path.suffix.lower() == ".csv":
+            return cls.CSV
+        return cls.JSONL
+
+
+def _parse_json_cell(value: Any) -> Any:
+    """Parse a CSV cell containing JSON. Empty cells are None."""
+    if not isinstance(value, str):
+        return value
+    value = value.strip()
+    if not value:
+        return None
+    if value[0] in "[{":
+        return json.loads(value)
+    return value
+
+
+class HostRowInterface(BaseModel):
+    """An interface of a host in a host file."""
+
+    type: InterfaceType = InterfaceType.AGENT
+    ip: str = ""
+    dns: str = ""
+    port: str | None = None
+    """Defaults to the default port of the interface type."""
+    useip: bool | None = None
+    """Connect to the IP address. Defaults to True if `ip` is set."""
+    main: bool | None = None
+    """Default interface of its type. Defaults to the first interface of each type."""
+    details: dict[str, Any] | None = None
+    """SNMP details. Defaults to SNMPv2 with community `{$SNMP_COMMUNITY}`."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    @field_validator("type", mode="before")
+    @classmethod
+    def _validate_type(cls, value: Any) -> InterfaceType:
+        try:
+            return InterfaceType(value)
+        except ZabbixCLIError as e:
+            raise ValueError(str(e)) from e
+
+    @field_validator("port", mode="before")
+    @classmethod
+    def _validate_port(cls, value: Any) -> Any:
+        return str(value) if isinstance(value, int) else value
+
+    def to_api(self, hostname: str, *, main: bool) -> dict[str, Any]:
+        """Get the API parameters for creating the interface on a host.
+
+        If neither IP nor DNS is set, the host name is used, like `create_host`."""
+        ip, dns = self.ip, self.dns
+        if not ip and not dns:
+            try:
+                ipaddress.ip_address(hostname)
+            except ValueError:
+                dns = hostname
+            else:
+                ip = hostname
+        useip = self.useip if self.useip is not None else bool(ip)
+        params: dict[str, Any] = {
+            "type": self.type.as_api_value(),
+            "main": int(self.main if self.main is not None else main),
+            "useip": int(useip),
+            "ip": ip,
+            "dns": dns,
+            "port": self.port or self.type.get_port(),
+        }
+        if self.type == InterfaceType.SNMP:
+            params["details"] = {
+                "version": 2,
+                "bulk": 1,
+                "community": "{$SNMP_COMMUNITY}",
+                **(self.details or {}),
+            }
+        return params
+
+
+class HostRow(BaseModel):
+    """A host in a host file.
+
+    In CSV files, lists are comma-separated, and interfaces, macros
+    and inventory can be given as JSON. Interfaces can also be given as
+    a comma-separated list of interface types."""
+
+    hostname: str
+    groups: list[str] = Field(default_factory=list)
+    """Host group names or IDs."""
+    proxy: str | None = None
+    """Regex pattern matching the proxy to use. A random matching proxy is selected."""
+    interfaces: list[HostRowInterface] | None = None
+    """Interfaces of the host. Defaults to an agent interface, if enabled in the config."""
+    templates: list[str] = Field(default_factory=list)
+    """Template names or IDs."""
+    macros: dict[str, str] = Field(default_factory=dict)
+    inventory: dict[str, str] = Field(default_factory=dict)
+    status: MonitoringStatus = MonitoringStatus.ON
+    description: str | None = None
+
+    model_config = ConfigDict(extra="forbid")
+
+    @field_validator("hostname", mode="before")
+    @classmethod
+    def _validate_hostname(cls, value: Any) -> Any:
+        return value.strip() if isinstance(value, str) else value
+
+    @field_validator("groups", "templates", mode="before")
+    @classmethod
+    def _validate_list(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return parse_list_arg(value)
+        return [] if value is None else value
+
+    @field_validator("interfaces", mode="before")
+    @classmethod
+    def _validate_interfaces(cls, value: Any) -> Any:
+        value = _parse_json_cell(value)
+        if isinstance(value, str):
+            return [{"type": t} for t in parse_list_arg(value)]
+        return value
+
+    @field_validator("macros", "inventory", mode="before")
+    @classmethod
+    def _validate_mapping(cls, value: Any) -> Any:
+        value = _parse_json_cell(value)
+        return {} if value is None else value
+
+    @field_validator("proxy", "description", mode="before")
+    @classmethod
+    def _validate_optional(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return value.strip() or None
+        return value
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def _validate_status(cls, value: Any) -> Any:
+        if value is None or value == "":
+            return MonitoringStatus.ON
+        try:
+            return MonitoringStatus(value)
+        except ZabbixCLIError as e:
+            raise ValueError(str(e)) from e
+
+    def get_interfaces(self, *, create_interface: bool) -> list[dict[str, Any]]:
+        """Get the API parameters for the interfaces of the host."""
+        if self.interfaces is None:
+            interfaces = [HostRowInterface()] if create_interface else []
+        else:
+            interfaces = self.interfaces
+        seen: set[InterfaceType] = set()
+        params: list[dict[str, Any]] = []
+        for interface in interfaces:
+            params.append(
+                interface.to_api(self.hostname, main=interface.type not in seen)
+            )
+            seen.add(interface.type)
+        return params
+
+
+def read_host_file(
+    path: Path, file_format: HostFileFormat
+) -> Iterator[tuple[int, HostRow | Exception]]:
+    """Read the rows of a host file.
+
+    Yields the line number of each row along with the parsed row,
+    or the error if the row is invalid."""
+    try:
+        f = path.open(newline="" if file_format == HostFileFormat.CSV else None)
+    except OSError as e:
+        raise ZabbixCLIFileError(f"Unable to read host file {path}: {e}") from e
+    with f:
+        if file_format == HostFileFormat.CSV:
+            reader = csv.DictReader(f)
+            for row in reader:
+                # Empty cells are treated as absent fields
+                data = {k.strip(): v for k, v in row.items() if k and v and v.strip()}
+                yield reader.line_num, _parse_row(data)
+        else:
+            for lineno, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except ValueError as e:
+                    yield lineno, ZabbixCLIError(f"Invalid JSON: {e}")
+                else:
+                    yield lineno, _parse_row(data)
+
+
+def _parse_row(data: Any) -> HostRow | Exception:
+    try:
+        return HostRow.model_validate(data)
+    except (ValidationError, ValueError) as e:
+        return e
+
+
+def resolve_objects(
+    fetch: Callable[[list[str]], list[ObjectT]],
+    names_or_ids: Iterable[str],
+    *,
+    name_attr: str,
+    id_attr: str,
+    chunk_size: int = CREATE_HOSTS_CHUNK_SIZE,
+) -> dict[str, ObjectT]:
+    """Fetch objects by name or ID with as few requests as possible.
+
+    Returns:
+        dict[str, ObjectT]: Objects by ID and case-folded name.
+    """
+    names_or_ids = set(names_or_ids)
+    # Names and IDs cannot be mixed in a single request
+    ids = sorted(n for n in names_or_ids if n.isnumeric())
+    names = sorted(n for n in names_or_ids if not n.isnumeric())
+    objects: dict[str, ObjectT] = {}
+    for batch in (ids, names):
+        for i in range(0, len(batch), chunk_size):
+            for obj in fetch(batch[i : i + chunk_size]):
+                objects[str(getattr(obj, id_attr))] = obj
+                objects[str(getattr(obj, name_attr)).casefold()] = obj
+    return objects
+
+
+def lookup_object(objects: dict[str, ObjectT], name_or_id: str) -> ObjectT | None:
+    """Look up an object resolved with `resolve_objects`."""
+    if name_or_id.isnumeric():
+        return objects.get(name_or_id)
+    return objects.get(name_or_id.casefold())
+
+
+class HostCreator:
+    """Creates hosts from the rows of a host file."""
+
+    def __init__(
+        self,
+        client: ZabbixAPI,
+        *,
+        default_hostgroups: list[str],
+        create_interface: bool,
+        chunk_size: int = CREATE_HOSTS_CHUNK_SIZE,
+        proxy_strategy: ProxyStrategy = ProxyStrategy.RANDOM,
+        dryrun: bool = False,
+    ) -> None:
+        self.client = client
+        self.default_hostgroups = default_hostgroups
+        self.create_interface = create_interface
+        self.chunk_size = max(chunk_size, 1)
+        self.proxy_strategy = proxy_strategy
+        self.dryrun = dryrun
+
+    def run(
+        self, rows: list[tuple[int, HostRow | Exception]]
+    ) -> list[CreateHostFromFileResult]:
+        """Create the hosts. Returns the result of each row."""
+        from zabbix_cli.commands.results.host import CreateHostFromFileResult
+
+        results = [
+            CreateHostFromFileResult(
+                row=lineno,
+                hostname=row.hostname if isinstance(row, HostRow) else "",
+            )
+            for lineno, row in rows
+        ]
+        pending: list[tuple[CreateHostFromFileResult, HostRow]] = []
+        seen: dict[str, int] = {}
+        for result, (_, row) in zip(results, rows, strict=True):
+            if isinstance(row, Exception):
+                result.fail(row)
+            elif (first := seen.get(row.hostname.casefold())) is not None:
+                result.fail(f"Duplicate of row {first}")
+            else:
+                seen[row.hostname.casefold()] = result.row
+                pending.append((result, row))
+
+        pending = self._check_existing(pending)
+        to_create = self._resolve(pending)
+        if self.dryrun:
+            for result, _ in to_create:
+                result.status = "dryrun"
+        else:
+            for i in range(0, len(to_create), self.chunk_size):
+                self._create(to_create[i : i + self.chunk_size])
+        return results
+
+    def _check_existing(
+        self, pending: list[tuple[CreateHostFromFileResult, HostRow]]
+    ) -> list[tuple[CreateHostFromFileResult, HostRow]]:
+        """Fail rows for hosts that already exist."""
+        # Host names can be numeric, so they are never looked up as IDs
+        names = sorted({row.hostname for _, row in pending})
+        existing: set[str] = set()
+        for i in range(0, len(names), self.chunk_size):
+            hosts = self.client.get_hosts_by_name(*names[i : i + self.chunk_size])
+            existing.update(host.host.casefold() for host in hosts)
+        remaining: list[tuple[CreateHostFromFileResult, HostRow]] = []
+        for result, row in pending:
+            if row.hostname.casefold() in existing:
+                result.fail(f"Host {row.hostname!r} already exists")
+            else:
+                remaining.append((result, row))
+        return remaining
+
+    def _resolve(
+        self, pending: list[tuple[CreateHostFromFileResult, HostRow]]
+    ) -> list[tuple[CreateHostFromFileResult, ParamsType]]:
+        """Resolve the objects referenced by the rows and get the parameters
+        for creating each host. Fails rows referencing missing objects."""
+        hostgroups: dict[str, HostGroup] = {}
+        templates: dict[str, Template] = {}
+
+        group_names = {g for _, row in pending for g in row.groups}
+        if pending:
+            group_names.update(self.default_hostgroups)
+        if group_names:
+            hostgroups = resolve_objects(
+                lambda names: self.client.get_hostgroups(*names, search=True),
+                group_names,
+                name_attr="name",
+                id_attr="groupid",
+                chunk_size=self.chunk_size,
+            )
+        if template_names := {t for _, row in pending for t in row.templates}:
+            templates = resolve_objects(
+                lambda names: self.client.get_templates(*names),
+                template_names,
+                name_attr="host",
+                id_attr="templateid",
+                chunk_size=self.chunk_size,
+            )
+
+        to_create: list[tuple[CreateHostFromFileResult, ParamsType]] = []
+        for result, row in pending:
+            try:
+                params = self._get_params(row, hostgroups, templates)
+            except ZabbixCLIError as e:
+                result.fail(e)
+            else:
+                to_create.append((result, params))
+        return to_create
+
+    def _get_params(
+        self,
+        row: HostRow,
+        hostgroups: dict[str, HostGroup],
+        templates: dict[str, Template],
+    ) -> ParamsType:
+        groups: list[HostGroup] = []
+        for name in [*row.groups, *self.default_hostgroups]:
+            if not (hg := lookup_object(hostgroups, name)):
+                raise ZabbixCLIError(f"Host group {name!r} not found")
+            groups.append(hg)
+        if not groups:
+            raise ZabbixCLIError("Unable to create a host without a host group")
+
+        host_templates: list[Template] = []
+        for name in row.templates:
+            if not (template := lookup_object(templates, name)):
+                raise ZabbixCLIError(f"Template {name!r} not found")
+            host_templates.append(template)
+
+        proxy: Proxy | None = None
+        if row.proxy:
+            proxy = self.client.proxy_selector.select(
+                row.proxy, strategy=self.proxy_strategy
+            )
+
+        return self.client.get_create_host_params(
+            row.hostname,
+            groups,
+            proxy=proxy,
+            status=row.status,
+            interfaces=row.get_interfaces(create_interface=self.create_interface),
+            inventory_mode=InventoryMode.AUTOMATIC,
+            inventory={"name": row.hostname, **row.inventory},
+            description=row.description,
+            templates=host_templates,
+            macros=row.macros,
+        )
+
+    def _create(self, chunk: list[tuple[CreateHostFromFileResult, ParamsType]]) -> None:
+        """Create a chunk of hosts with a single request.
+
+        `host.create` fails as a whole if any host in the request is invalid,
+        so chunks failing with an API error are split in half until the failing
+        hosts are found. Other errors are not caused by any host, and fail the
+        whole chunk."""
+        from zabbix_cli.pyzabbix.mass import is_api_error
+
+        try:
+            hostids = self.client.create_hosts([params for _, params in chunk])
+        except ZabbixAPIException as e:
+            if len(chunk) == 1 or not is_api_error(e):
+                for result, _ in chunk:
+                    result.fail(e)
+                return
+            middle = len(chunk) // 2
+            self._create(chunk[:middle])
+            self._create(chunk[middle:])
+            return
+        for (result, _), hostid in zip(chunk, hostids, strict=False):
+            result.hostid = hostid
+            result.status = "created"
+
+
+REMOVING_METHODS = ("hostgroup.massremove", "template.massremove")
+"""Operations that are applied after all other operations."""
+
+
+@dataclass
+class SyncOperation:
+    """A mass operation applying changes to multiple hosts."""
+
+    description: str
+    apply: Callable[[list[Any]], object]
+    """Applies the operation to a chunk of items."""
+    items: list[tuple[Any, SyncHostsChange]] = field(default_factory=list)
+    """Items to apply the operation to, and the change each item is part of."""
+
+
+class HostSyncer:
+    """Reconciles hosts with the desired state described by a host file.
+
+    Only the fields set in a row are managed. Host groups and templates
+    are synced exactly, while macros and inventory fields are only added
+    or updated. Interfaces are only used when creating missing hosts,
+    since updating them replaces all interfaces of a host."""
+
+    def __init__(
+        self,
+        client: ZabbixAPI,
+        *,
+        default_hostgroups: list[str],
+        create_interface: bool,
+        create_missing: bool = True,
+        chunk_size: int = CREATE_HOSTS_CHUNK_SIZE,
+        proxy_strategy: ProxyStrategy = ProxyStrategy.RANDOM,
+    ) -> None:
+        self.client = client
+        self.default_hostgroups = default_hostgroups
+        self.create_interface = create_interface
+        self.create_missing = create_missing
+        self.chunk_size = max(chunk_size, 1)
+        self.proxy_strategy = proxy_strategy
+
+        self.changes: list[SyncHostsChange] = []
+        self.operations: dict[tuple[str, str], SyncOperation] = {}
+        """Operations by type and target, i.e. host group ID for `hostgroup.massadd`."""
+        self.missing: list[tuple[int, HostRow]] = []
+        """Rows for hosts that do not exist."""
+        self._create_changes: list[SyncHostsChange] = []
+
+    def plan(self, rows: list[tuple[int, HostRow | Exception]]) -> None:
+        """Fetch the current state of the hosts and plan the changes."""
+        pending: list[tuple[int, HostRow]] = []
+        seen: dict[str, int] = {}
+        for lineno, row in rows:
+            if isinstance(row, Exception):
+                self._error(lineno, "", row)
+            elif (first := seen.get(row.hostname.casefold())) is not None:
+                self._error(lineno, row.hostname, f"Duplicate of row {first}")
+            else:
+                seen[row.hostname.casefold()] = lineno
+                pending.append((lineno, row))
+
+        def managed(field: str) -> bool:
+            return any(field in row.model_fields_set for _, row in pending)
+
+        # Host names can be numeric, so they are never looked up as IDs
+        names = sorted({row.hostname for _, row in pending})
+        hosts: dict[str, Host] = {}
+        for i in range(0, len(names), self.chunk_size):
+            for host in self.client.get_hosts_by_name(
+                *names[i : i + self.chunk_size],
+                select_groups=managed("groups"),
+                select_templates=managed("templates"),
+                select_macros=managed("macros"),
+                select_inventory=managed("inventory"),
+            ):
+                hosts[host.host.casefold()] = host
+        existing: list[tuple[int, HostRow, Host]] = []
+        for lineno, row in pending:
+            if host := hosts.get(row.hostname.casefold()):
+                existing.append((lineno, row, host))
+            elif self.create_missing:
+                self.missing.append((lineno, row))
+                change = self._change(lineno, row.hostname, "create", desired="host")
+                self._create_changes.append(change)
+            else:
+                self._error(lineno, row.hostname, f"Host {row.hostname!r} not found")
+
+        hostgroups = self._resolve_groups(existing)
+        templates = self._resolve_templates(existing)
+        proxies: dict[str, Proxy] = {}
+        if any(row.proxy for _, row, _ in existing):
+            proxies = {p.proxyid: p for p in self.client.proxy_selector.proxies}
+
+        for lineno, row, host in existing:
+            start = len(self.changes)
+            try:
+                self._plan_host(lineno, row, host, hostgroups, templates, proxies)
+            except ZabbixCLIError as e:
+                # Discard the host's other changes, so it is not partially synced
+                self._discard(self.changes[start:])
+                del self.changes[start:]
+                self._error(lineno, row.hostname, e)
+
+    def apply(self) -> None:
+        """Apply the planned changes.
+
+        Host groups are added and templates linked before any are removed,
+        so hosts moved between groups are never left without a group."""
+        operations = sorted(
+            self.operations.items(), key=lambda op: op[0][0] in REMOVING_METHODS
+        )
+        for _, operation in operations:
+            for i in range(0, len(operation.items), self.chunk_size):
+                chunk = operation.items[i : i + self.chunk_size]
+                try:
+                    operation.apply([item for item, _ in chunk])
+                except ZabbixAPIException as e:
+                    for _, change in chunk:
+                        change.fail(e)
+                else:
+                    for _, change in chunk:
+                        change.applied()
+
+        if self.missing:
+            creator = HostCreator(
+                self.client,
+                default_hostgroups=self.default_hostgroups,
+                create_interface=self.create_interface,
+                chunk_size=self.chunk_size,
+                proxy_strategy=self.proxy_strategy,
+            )
+            for change, result in zip(
+                self._create_changes, creator.run(list(self.missing)), strict=True
+            ):
+                if result.status == "failed":
+                    change.fail(result.error or "Unknown error")
+                else:
+                    change.desired = f"host {result.hostid}"
+                    change.applied()
+
+    @property
+    def pending_changes(self) -> list[SyncHostsChange]:
+        """Changes that can be applied."""
+        return [c for c in self.changes if c.status == "planned"]
+
+    def _change(
+        self, row: int, hostname: str, change: str, current: str = "", desired: str = ""
+    ) -> SyncHostsChange:
+        from zabbix_cli.commands.results.host import SyncHostsChange
+
+        result = SyncHostsChange(
+            row=row, hostname=hostname, change=change, current=current, desired=desired
+        )
+        self.changes.append(result)
+        return result
+
+    def _error(self, row: int, hostname: str, error: BaseException | str) -> None:
+        self._change(row, hostname, "error").fail(error)
+
+    def _add(
+        self,
+        key: tuple[str, str],
+        description: str,
+        apply: Callable[[list[Any]], object],
+        item: Any,
+        change: SyncHostsChange,
+    ) -> None:
+        """Add an item to the operation with the given key."""
+        if key not in self.operations:
+            self.operations[key] = SyncOperation(description, apply)
+        self.operations[key].items.append((item, change))
+
+    def _discard(self, changes: list[SyncHostsChange]) -> None:
+        """Remove the items of the given changes from the planned operations."""
+        ids = {id(c) for c in changes}
+        for key, operation in list(self.operations.items()):
+            operation.items = [i for i in operation.items if id(i[1]) not in ids]
+            if not operation.items:
+                del self.operations[key]
+
+    def _resolve_groups(
+        self, existing: list[tuple[int, HostRow, Host]]
+    ) -> dict[str, HostGroup]:
+        """Resolve the host groups referenced by the rows.
+
+        Host groups the hosts are already in are not fetched again."""
+        known: dict[str, HostGroup] = {}
+        for _, _, host in existing:
+            for hg in host.groups:
+                known[hg.groupid] = known[hg.name.casefold()] = hg
+        names = {
+            g
+            for _, row, _ in existing
+            for g in row.groups
+            if lookup_object(known, g) is None
+        }
+        if names:
+            known.update(
+                resolve_objects(
+                    lambda names: self.client.get_hostgroups(*names, search=True),
+                    names,
+                    name_attr="name",
+                    id_attr="groupid",
+                    chunk_size=self.chunk_size,
+                )
+            )
+        return known
+
+    def _resolve_templates(
+        self, existing: list[tuple[int, HostRow, Host]]
+    ) -> dict[str, Template]:
+        """Resolve the templates referenced by the rows.
+
+        Templates already linked to the hosts are not fetched again."""
+        known: dict[str, Template] = {}
+        for _, _, host in existing:
+            for t in host.templates:
+                known[t.templateid] = known[t.host.casefold()] = t
+        names = {
+            t
+            for _, row, _ in existing
+            for t in row.templates
+            if lookup_object(known, t) is None
+        }
+        if names:
+            known.update(
+                resolve_objects(
+                    lambda names: self.client.get_templates(*names),
+                    names,
+                    name_attr="host",
+                    id_attr="templateid",
+                    chunk_size=self.chunk_size,
+                )
+            )
+        return known
+
+    def _plan_host(
+        self,
+        lineno: int,
+        row: HostRow,
+        host: Host,
+        hostgroups: dict[str, HostGroup],
+        templates: dict[str, Template],
+        proxies: dict[str, Proxy],
+    ) -> None:
+        """Plan the changes for a single host."""
+        client = self.client
+        fields = row.model_fields_set
+
+        if "groups" in fields:
+            desired: dict[str, HostGroup] = {}
+            for name in row.groups:
+                if not (hg := lookup_object(hostgroups, name)):
+                    raise ZabbixCLIError(f"Host group {name!r} not found")
+                desired[hg.groupid] = hg
+            current = {hg.groupid: hg for hg in host.groups}
+            if desired.keys() != current.keys():
+                change = self._change(
+                    lineno,
+                    host.host,
+                    "host groups",
+                    ", ".join(sorted(hg.name for hg in current.values())),
+                    ", ".join(sorted(hg.name for hg in desired.values())),
+                )
+                for gid in desired.keys() - current.keys():
+                    hg = desired[gid]
+                    self._add(
+                        ("hostgroup.massadd", gid),
+                        f"Add hosts to host group {hg.name!r}",
+                        lambda hosts, hg=hg: client.add_hosts_to_hostgroups(
+                            hosts, [hg]
+                        ),
+                        host,
+                        change,
+                    )
+                for gid in current.keys() - desired.keys():
+                    hg = current[gid]
+                    self._add(
+                        ("hostgroup.massremove", gid),
+                        f"Remove hosts from host group {hg.name!r}",
+                        lambda hosts, hg=hg: client.remove_hosts_from_hostgroups(
+                            hosts, [hg]
+                        ),
+                        host,
+                        change,
+                    )
+
+        if "templates" in fields:
+            desired_templates: dict[str, Template] = {}
+            for name in row.templates:
+                if not (template := lookup_object(templates, name)):
+                    raise ZabbixCLIError(f"Template {name!r} not found")
+                desired_templates[template.templateid] = template
+            current_templates = {t.templateid: t for t in host.templates}
+            if desired_templates.keys() != current_templates.keys():
+                change = self._change(
+                    lineno,
+                    host.host,
+                    "templates",
+                    ", ".join(sorted(t.host for t in current_templates.values())),
+                    ", ".join(sorted(t.host for t in desired_templates.values())),
+                )
+                for tid in desired_templates.keys() - current_templates.keys():
+                    t = desired_templates[tid]
+                    self._add(
+                        ("template.massadd", tid),
+                        f"Link template {t.host!r}",
+                        lambda hosts, t=t: client.link_templates_to_hosts([t], hosts),
+                        host,
+                        change,
+                    )
+                for tid in current_templates.keys() - desired_templates.keys():
+                    t = current_templates[tid]
+                    # Unlink without clearing, so no data is lost
+                    self._add(
+                        ("template.massremove", tid),
+                        f"Unlink template {t.host!r}",
+                        lambda hosts, t=t: client.unlink_templates_from_hosts(
+                            [t], hosts, clear=False
+                        ),
+                        host,
+                        change,
+                    )
+
+        if "proxy" in fields:
+            current_proxy = proxies.get(str(host.proxyid))
+            if row.proxy is None:
+                if host.proxyid and host.proxyid != "0":
+                    change = self._change(
+                        lineno,
+                        host.host,
+                        "proxy",
+                        current_proxy.name if current_proxy else str(host.proxyid),
+                    )
+                    self._add(
+                        ("host.massupdate", "proxy:"),
+                        "Monitor hosts with the Zabbix server",
+                        client.clear_host_proxies,
+                        host,
+                        change,
+                    )
+            else:
+                try:
+                    pattern = re.compile(row.proxy)
+                except re.error as e:
+                    raise ZabbixCLIError(f"Invalid proxy pattern {row.proxy!r}") from e
+                if not current_proxy or not pattern.match(current_proxy.name):
+                    matches = [p for p in proxies.values() if pattern.match(p.name)]
+                    if not matches:
+                        raise ZabbixCLIError(
+                            f"No proxies matching pattern {row.proxy!r}"
+                        )
+                    proxy = client.proxy_selector.choose(
+                        matches, strategy=self.proxy_strategy, current=current_proxy
+                    )
+                    change = self._change(
+                        lineno,
+                        host.host,
+                        "proxy",
+                        current_proxy.name if current_proxy else "",
+                        proxy.name,
+                    )
+                    self._add(
+                        ("host.massupdate", f"proxy:{proxy.proxyid}"),
+                        f"Move hosts to proxy {proxy.name!r}",
+                        lambda hosts, proxy=proxy: client.update_hosts_proxy(
+                            hosts, proxy
+                        ),
+                        host,
+                        change,
+                    )
+
+        if "status" in fields and host.status is not None:
+            current_status = MonitoringStatus(host.status)
+            if current_status != row.status:
+                status = row.status
+                change = self._change(
+                    lineno, host.host, "status", str(current_status), str(status)
+                )
+                self._add(
+                    ("host.massupdate", f"status:{status}"),
+                    f"Set status {status}",
+                    lambda hosts, status=status: client.update_hosts_status(
+                        hosts, status
+                    ),
+                    host,
+                    change,
+                )
+
+        if "description" in fields:
+            description = row.description or ""
+            if (host.description or "") != description:
+                change = self._change(
+                    lineno,
+                    host.host,
+                    "description",
+                    host.description or "",
+                    description,
+                )
+                self._add(
+                    ("host.massupdate", f"description:{description}"),
+                    f"Set description {description!r}",
+                    lambda hosts, d=description: client.update_hosts(
+                        hosts, description=d
+                    ),
+                    host,
+                    change,
+                )
+
+        if "inventory" in fields:
+            current_inventory = dict(host.inventory.items())
+            for key, value in sorted(row.inventory.items()):
+                current_value = str(current_inventory.get(key) or "")
+                if current_value == value:
+                    continue
+                change = self._change(
+                    lineno, host.host, f"inventory {key}", current_value, value
+                )
+                self._add(
+                    ("host.massupdate", f"inventory:{key}={value}"),
+                    f"Set inventory {key} to {value!r}",
+                    lambda hosts, inventory={key: value}: client.update_hosts(
+                        hosts, inventory=inventory
+                    ),
+                    host,
+                    change,
+                )
+
+        if "macros" in fields:
+            current_macros = {m.macro: m for m in host.macros}
+            for name, value in sorted(row.macros.items()):
+                macro = current_macros.get(name)
+                if macro is None:
+                    change = self._change(lineno, host.host, f"macro {name}", "", value)
+                    self._add(
+                        ("usermacro.create", ""),
+                        "Create host macros",
+                        client.create_host_macros,
+                        (host, name, value),
+                        change,
+                    )
+                # Values of secret macros cannot be compared
+                elif macro.type == 0 and macro.value != value:
+                    change = self._change(
+                        lineno, host.host, f"macro {name}", macro.value or "", value
+                    )
+                    self._add(
+                        ("usermacro.update", ""),
+                        "Update host macros",
+                        client.update_macros,
+                        (macro.hostmacroid, value),
+                        change,
+                    )
+
+
+@app.command(
+    name="create_hosts_from_file",
+    rich_help_panel=HELP_PANEL,
+    examples=[
+        Example(
+            "Create hosts from a CSV file",
+            "create_hosts_from_file hosts.csv",
+        ),
+        Example(
+            "Preview hosts to create from a JSONL file",
+            "create_hosts_from_file hosts.jsonl --dryrun",
+        ),
+    ],
+)
+def create_hosts_from_file(
+    ctx: typer.Context,
+    file: Path = typer.Argument(
+        help="CSV or JSONL file with one host per row.",
+        exists=True,
+        dir_okay=False,
+        show_default=False,
+    ),
+    file_format: HostFileFormat | None = typer.Option(
+        None,
+        "--file-format",
+        help="Format of the file. Determined from the file extension by default.",
+        case_sensitive=False,
+        show_default=False,
+    ),
+    use_default_hostgroups: bool = typer.Option(
+        True,
+        "--default-hostgroups/--no-default-hostgroups",
+        help="Add hosts to default host groups defined in config.",
+    ),
+    chunk_size: int = typer.Option(
+        CREATE_HOSTS_CHUNK_SIZE,
+        "--chunk-size",
+        help="Number of hosts to create per API request.",
+        min=1,
+    ),
+    proxy_strategy: ProxyStrategy | None = typer.Option(
+        None,
+        "--proxy-strategy",
+        help=(
+            "Strategy for selecting among the proxies matching a row's proxy pattern. "
+            "Uses [configopt]app.commands.create_host.proxy_strategy[/] if omitted."
+        ),
+        case_sensitive=False,
+    ),
+    dryrun: bool = typer.Option(
+        False,
+        "--dryrun",
+        help="Preview changes.",
+    ),
+) -> None:
+    """Create hosts from a CSV or JSONL file.
+
+    Each row describes a host with the fields [i]hostname[/], [i]groups[/], [i]proxy[/], [i]interfaces[/], [i]templates[/], [i]macros[/], [i]inventory[/], [i]status[/] and [i]description[/]. Only [i]hostname[/] is required.
+
+    In CSV files, [i]groups[/] and [i]templates[/] are comma-separated, while [i]interfaces[/], [i]macros[/] and [i]inventory[/] are JSON. [i]interfaces[/] can also be a comma-separated list of interface types.
+
+    Unlike [command]create_host[/], no proxy is used unless [i]proxy[/] is set.
+    Referenced objects are resolved up front, and hosts are created in chunks.
+    Results are reported for each row.
+    """
+    from zabbix_cli.models import AggregateResult
+    from zabbix_cli.output.formatting.grammar import pluralize as p
+
+    config = app.state.config.app.commands.create_host
+    rows = list(read_host_file(file, file_format or HostFileFormat.from_path(file)))
+    if not rows:
+        exit_err(f"No hosts found in {file}")
+
+    creator = HostCreator(
+        app.state.client,
+        default_hostgroups=config.hostgroups if use_default_hostgroups else [],
+        create_interface=config.create_interface,
+        chunk_size=chunk_size,
+        proxy_strategy=proxy_strategy or config.proxy_strategy,
+        dryrun=dryrun,
+    )
+    with app.status("Creating hosts..."):
+        results = creator.run(rows)
+
+    render_result(AggregateResult(result=results))
+    failed = sum(1 for r in results if r.status == "failed")
+    if failed:
+        exit_err(f"Failed to create {p('host', failed)} of {len(results)}.")
+    if dryrun:
+        success(f"Would create {p('host', len(results))}.")
+    else:
+        success(f"Created {p('host', len(results))}.")
+
+
+@app.command(
+    name="sync_hosts",
+    rich_help_panel=HELP_PANEL,
+    examples=[
+        Example(
+            "Show the changes needed to sync hosts with a file",
+            "sync_hosts hosts.csv --dryrun",
+        ),
+        Example(
+            "Sync hosts with a file without creating missing hosts",
+            "sync_hosts hosts.jsonl --no-create",
+        ),
+    ],
+)
+def sync_hosts(
+    ctx: typer.Context,
+    file: Path = typer.Argument(
+        help="CSV or JSONL file with the desired state of one host per row.",
+        exists=True,
+        dir_okay=False,
+        show_default=False,
+    ),
+    file_format: HostFileFormat | None = typer.Option(
+        None,
+        "--file-format",
+        help="Format of the file. Determined from the file extension by default.",
+        case_sensitive=False,
+        show_default=False,
+    ),
+    create: bool = typer.Option(
+        True,
+        "--create/--no-create",
+        help="Create hosts that do not exist.",
+    ),
+    use_default_hostgroups: bool = typer.Option(
+        True,
+        "--default-hostgroups/--no-default-hostgroups",
+        help="Add created hosts to default host groups defined in config.",
+    ),
+    chunk_size: int = typer.Option(
+        CREATE_HOSTS_CHUNK_SIZE,
+        "--chunk-size",
+        help="Number of hosts to fetch or update per API request.",
+        min=1,
+    ),
+    proxy_strategy: ProxyStrategy | None = typer.Option(
+        None,
+        "--proxy-strategy",
+        help=(
+            "Strategy for selecting among the proxies matching a row's proxy pattern. "
+            "Uses [configopt]app.commands.create_host.proxy_strategy[/] if omitted."
+        ),
+        case_sensitive=False,
+    ),
+    dryrun: bool = typer.Option(
+        False,
+        "--dryrun",
+        help="Show the plan without applying it.",
+    ),
+) -> None:
+    """Sync hosts with the desired state described by a CSV or JSONL file.
+
+    The file uses the same format as [command]create_hosts_from_file[/].
+    Only the fields present in a row are synced. Host groups and templates are synced exactly, while [i]macros[/] and [i]inventory[/] are only added or updated. A [i]proxy[/] pattern is satisfied by any matching proxy. Interfaces are only used when creating hosts.
+
+    The current state of the hosts is fetched up front, and the changes are applied with one mass operation per distinct change. Templates are unlinked without clearing. Hosts not in the file are left untouched.
+    """
+    from zabbix_cli.models import AggregateResult
+    from zabbix_cli.output.formatting.grammar import pluralize as p
+
+    config = app.state.config.app.commands.create_host
+    rows = list(read_host_file(file, file_format or HostFileFormat.from_path(file)))
+    if not rows:
+        exit_err(f"No hosts found in {file}")
+
+    syncer = HostSyncer(
+        app.state.client,
+        default_hostgroups=config.hostgroups if use_default_hostgroups else [],
+        create_interface=config.create_interface,
+        create_missing=create,
+        chunk_size=chunk_size,
+        proxy_strategy=proxy_strategy or config.proxy_strategy,
+    )
+    with app.status("Fetching hosts..."):
+        syncer.plan(rows)
+
+    n_changes = len(syncer.pending_changes)
+    n_operations = len(syncer.operations) + (1 if syncer.missing else 0)
+    if not dryrun and n_changes:
+        with app.status("Applying changes..."):
+            syncer.apply()
+
+    if syncer.changes:
+        changes = sorted(syncer.changes, key=lambda c: c.row)
+        render_result(AggregateResult(result=changes))
+    failed = sum(1 for c in syncer.changes if c.status == "failed")
+    if failed:
+        exit_err(f"Failed to apply {p('change', failed)} of {len(syncer.changes)}.")
+    if not n_changes:
+        success("Hosts are in sync.")
+    elif dryrun:
+        success(
+            f"Would apply {p('change', n_changes)} with {p('operation', n_operations)}."
+        )
+    else:
+        success(
+            f"Applied {p('change', n_changes)} with {p('operation', n_operations)}."
+        )
@@ -5,6 +5,7 @@ import typer
 from zabbix_cli.app import Example
 from zabbix_cli.app import app
 from zabbix_cli.commands.common.args import OPTION_LIMIT
+from zabbix_cli.commands.common.mass import run_mass_operation
 from zabbix_cli.output.console import error
 from zabbix_cli.output.console import exit_err
 from zabbix_cli.output.console import info
@@ -67,8 +68,12 @@ def add_host_to_hostgroup(
     hosts = parse_hosts_arg(app, hostnames_or_ids)
     hgs = parse_hostgroups_arg(app, hostgroups, select_hosts=True)
     if not dryrun:
-        with app.status("Adding hosts to host groups..."):
-            app.state.client.add_hosts_to_hostgroups(hosts, hgs)
+        res = run_mass_operation(
+            "Adding hosts to host groups...",
+            lambda chunk: app.state.client.add_hosts_to_hostgroups(chunk, hgs),
+            hosts,
+        )
+        res.raise_for_failures("Failed to add hosts to host groups")
 
     result: list[AddHostsToHostGroup] = []
     for hg in hgs:
@@ -212,7 +217,12 @@ def extend_hostgroup(
 
     # TODO: calculate the number of hosts that would be added like the other commands
     if not dryrun:
-        app.state.client.add_hosts_to_hostgroups(src.hosts, dest)
+        res = run_mass_operation(
+            "Adding hosts to host groups...",
+            lambda chunk: app.state.client.add_hosts_to_hostgroups(chunk, dest),
+            src.hosts,
+        )
+        res.raise_for_failures(f"Failed to copy hosts from {src.name!r}")
         success(
             f"Copied {len(src.hosts)} hosts from {src.name!r} to {len(dest)} groups."
         )
@@ -255,19 +265,32 @@ def move_hosts(
     if dryrun:
         info(f"Would move {len(src.hosts)} hosts to {dest.name!r}:")
     else:
-        app.state.client.add_hosts_to_hostgroups(src.hosts, [dest])
+        added = run_mass_operation(
+            f"Adding hosts to {dest.name!r}...",
+            lambda chunk: app.state.client.add_hosts_to_hostgroups(chunk, [dest]),
+            src.hosts,
+        )
+        added.raise_for_failures(f"Failed to add hosts to {dest.name!r}")
         info(f"Added hosts to {dest.name!r}")
-        try:
-            app.state.client.remove_hosts_from_hostgroups(src.hosts, [src])
-        except Exception as e:
-            if rollback:
-                error(
-                    f"Failed to remove hosts from {src.name!r}. Attempting to roll back changes."
-                )
-                app.state.client.remove_hosts_from_hostgroups(src.hosts, [dest])
-            raise e
-        else:
-            info(f"Removed hosts from {src.name!r}.")
+        removed = run_mass_operation(
+            f"Removing hosts from {src.name!r}...",
+            lambda chunk: app.state.client.remove_hosts_from_hostgroups(chunk, [src]),
+            src.hosts,
+        )
+        if removed.failed and rollback:
+            error(
+                f"Failed to remove hosts from {src.name!r}. Attempting to roll back changes."
+            )
+            # Only roll back the hosts that are still in the source group
+            run_mass_operation(
+                f"Removing hosts from {dest.name!r}...",
+                lambda chunk: app.state.client.remove_hosts_from_hostgroups(
+                    chunk, [dest]
+                ),
+                [host for host, _ in removed.failed],
+            ).raise_for_failures(f"Failed to roll back hosts added to {dest.name!r}")
+        removed.raise_for_failures(f"Failed to remove hosts from {src.name!r}")
+        info(f"Removed hosts from {src.name!r}.")
         success(f"Moved {len(src.hosts)} hosts from {src.name!r} to {dest.name!r}.")
 
     render_result(MoveHostsResult.from_result(src, dest))
@@ -317,8 +340,12 @@ def remove_host_from_hostgroup(
     hosts = parse_hosts_arg(app, hostnames_or_ids)
     hgs = parse_hostgroups_arg(app, hostgroups, select_hosts=True)
     if not dryrun:
-        with app.status("Removing hosts from host groups..."):
-            app.state.client.remove_hosts_from_hostgroups(hosts, hgs)
+        res = run_mass_operation(
+            "Removing hosts from host groups...",
+            lambda chunk: app.state.client.remove_hosts_from_hostgroups(chunk, hgs),
+            hosts,
+        )
+        res.raise_for_failures("Failed to remove hosts from host groups")
 
     result: list[RemoveHostsFromHostGroup] = []
     for hg in hgs:
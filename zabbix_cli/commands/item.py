@@ -41,19 +41,17 @@ def show_last_values(
     args: list[str] | None = deprecated_positional_arguments(1),
 ) -> None:
     """Show the last values of given items of monitored hosts."""
+    from zabbix_cli.commands.common.pages import fetch_pages
     from zabbix_cli.commands.results.item import ItemResult
     from zabbix_cli.commands.results.item import group_items
     from zabbix_cli.models import AggregateResult
+    from zabbix_cli.output.render import render_pages
 
     if args:
         group = args[0] == "1"
         # No format arg in V2...
 
     names_or_ids = parse_list_arg(item)
-    with app.status("Fetching items..."):
-        items = app.state.client.get_items(
-            *names_or_ids, select_hosts=True, monitored=True, limit=limit
-        )
 
     # HACK: not super elegant, but this allows us to match V2 output while
     # with and without the --group flag, as well as ALSO rendering the entire
@@ -61,8 +59,22 @@ def show_last_values(
     # Ideally, it would be nice to not have to re-validate when not grouping
     # but I'm not sure how to do that in Pydantic V2?
     if group:
-        res = group_items(items)
-        render_result(AggregateResult(result=res))
-    else:
-        res = [ItemResult.from_item(item) for item in items]
-    render_result(AggregateResult(result=res))
+        # Grouping needs all items, so they cannot be streamed
+        with app.status("Fetching items..."):
+            items = app.state.client.get_items(
+                *names_or_ids, select_hosts=True, monitored=True, limit=limit
+            )
+        render_result(AggregateResult(result=group_items(items)))
+        return
+
+    pages = fetch_pages(
+        lambda page_size: app.state.client.iter_items(
+            *names_or_ids,
+            select_hosts=True,
+            monitored=True,
+            limit=limit,
+            page_size=page_size,
+        ),
+        "Fetching items...",
+    )
+    render_pages([ItemResult.from_item(item) for item in page] for page in pages)
@@ -166,7 +166,8 @@ def show_alarms(
 
     At least one trigger ID, host or host group must be specified.
     """
-    from zabbix_cli.models import AggregateResult
+    from zabbix_cli.commands.common.pages import fetch_pages
+    from zabbix_cli.output.render import render_pages
 
     if args:
         description = args[0]
@@ -180,8 +181,8 @@ def show_alarms(
 
     hostgroups_args = parse_list_arg(hostgroups)
     hgs = [app.state.client.get_hostgroup(hg) for hg in hostgroups_args]
-    with app.status("Fetching triggers..."):
-        triggers = app.state.client.get_triggers(
+    pages = fetch_pages(
+        lambda page_size: app.state.client.iter_triggers(
             hostgroups=hgs,
             description=description,
             priority=priority,
@@ -192,8 +193,11 @@ def show_alarms(
             active=True,
             expand_description=True,
             filter={"value": 1},  # why?
-        )
-    render_result(AggregateResult(result=triggers))
+            page_size=page_size,
+        ),
+        "Fetching triggers...",
+    )
+    render_pages(pages)
 
 
 @app.command(
@@ -243,7 +247,8 @@ def show_trigger_events(
 
     At least one trigger ID, host or host group must be specified.
     """
-    from zabbix_cli.models import AggregateResult
+    from zabbix_cli.commands.common.pages import fetch_pages
+    from zabbix_cli.output.render import render_pages
 
     if args:
         trigger_id = args[0]
@@ -261,13 +266,16 @@ def show_trigger_events(
     hostgroups_list = [app.state.client.get_hostgroup(hg) for hg in hostgroups_args]
     hosts_list = [app.state.client.get_host(host) for host in hosts_args]
 
-    with app.status("Fetching events..."):
-        events = app.state.client.get_events(
+    pages = fetch_pages(
+        lambda page_size: app.state.client.iter_events(
             object_ids=trigger_ids,
             group_ids=[hg.groupid for hg in hostgroups_list],
             host_ids=[host.hostid for host in hosts_list],
             sort_field="clock",
             sort_order="DESC",
             limit=limit,
-        )
-    render_result(AggregateResult(result=events))
+            page_size=page_size,
+        ),
+        "Fetching events...",
+    )
+    render_pages(pages)
@@ -8,13 +8,16 @@ import typer
 
 from zabbix_cli.app import Example
 from zabbix_cli.app import app
+from zabbix_cli.commands.common.mass import run_mass_operation
 from zabbix_cli.exceptions import ZabbixAPICallError
-from zabbix_cli.exceptions import ZabbixCLIError
+from zabbix_cli.exceptions import ZabbixAPIMassOperationError
 from zabbix_cli.output.console import error
 from zabbix_cli.output.console import exit_err
 from zabbix_cli.output.console import info
 from zabbix_cli.output.console import success
 from zabbix_cli.output.render import render_result
+from zabbix_cli.proxy_balance import LoadMetric
+from zabbix_cli.pyzabbix.enums import ProxyStrategy
 from zabbix_cli.utils.args import get_hostgroup_hosts
 from zabbix_cli.utils.args import parse_int_list_arg
 from zabbix_cli.utils.args import parse_list_arg
@@ -103,13 +106,17 @@ def clear_host_proxy(
 
     to_update = [host for host in hosts if host.proxyid]
     if not dryrun:
-        with app.status("Clearing host proxies..."):
-            if not to_update:
-                exit_err("No matching hosts have a proxy assigned.")
-            try:
-                app.state.client.clear_host_proxies(to_update)
-            except Exception as e:
-                error(f"Failed to clear proxies for hosts: {e}")
+        if not to_update:
+            exit_err("No matching hosts have a proxy assigned.")
+        res = run_mass_operation(
+            "Clearing host proxies...",
+            app.state.client.clear_host_proxies,
+            to_update,
+        )
+        try:
+            res.raise_for_failures("Failed to clear proxies for hosts")
+        except ZabbixAPIMassOperationError as e:
+            error(f"{e}")
 
     proxy_map = group_hosts_by_proxy(app, to_update)
 
@@ -153,6 +160,10 @@ def clear_host_proxy(
             "Load balance hosts unevenly between three proxies",
             "load_balance_proxy_hosts proxy1,proxy2,proxy3 1,1,2",
         ),
+        Example(
+            "Show the hosts that would be moved to a new proxy",
+            "load_balance_proxy_hosts proxy1,proxy2,proxy3 --consistent --dryrun",
+        ),
     ],
 )
 def load_balance_proxy_hosts(
@@ -168,6 +179,22 @@ def load_balance_proxy_hosts(
         metavar="[weight1,weight2,...]",
         show_default=False,
     ),
+    balance_by: LoadMetric = typer.Option(
+        LoadMetric.HOSTS,
+        "--balance-by",
+        help="Balance the number of hosts, enabled items or estimated new values per second.",
+        case_sensitive=False,
+    ),
+    consistent: bool = typer.Option(
+        False,
+        "--consistent",
+        help="Use consistent hashing to choose the hosts to move and their destinations.",
+    ),
+    dryrun: bool = typer.Option(
+        False,
+        "--dryrun",
+        help="Show the plan without moving any hosts.",
+    ),
 ) -> None:
     """Spread hosts between multiple proxies.
 
@@ -176,12 +203,17 @@ def load_balance_proxy_hosts(
 
     Weighting for the load balancing is optional, and defaults to equal weights.
     Number of proxies must match number of weights if specified.
-    """
-    import itertools
-    import random
 
+    Only the surplus hosts of proxies above their share are moved.
+    With [option]--balance-by items[/] or [option]--balance-by nvps[/], hosts are weighted by their number of enabled items or the new values per second their items are estimated to require, so hosts with many items count for more.
+    With [option]--consistent[/], hosts are assigned by consistent hashing, so the same hosts are chosen on every run.
+    """
     from zabbix_cli.commands.results.proxy import LBProxy
     from zabbix_cli.commands.results.proxy import LBProxyResult
+    from zabbix_cli.output.formatting.grammar import pluralize as p
+    from zabbix_cli.proxy_balance import ProxyBalance
+    from zabbix_cli.proxy_balance import get_host_loads
+    from zabbix_cli.proxy_balance import plan_rebalance
 
     proxy_names = [p.strip() for p in proxy.split(",")]
     if weight:
@@ -198,50 +230,64 @@ def load_balance_proxy_hosts(
 
     # Fetch proxies one by one to ensure each one exists
     proxies = [app.state.client.get_proxy(p, select_hosts=True) for p in proxy_names]
-
-    # TODO: Make sure list of proxies is in same order we specified them?
-
-    all_hosts = list(itertools.chain.from_iterable(p.hosts for p in proxies))
-    if not all_hosts:
+    if len({p.proxyid for p in proxies}) != len(proxies):
+        exit_err("Proxies must be unique.")
+
+    balances = [
+        ProxyBalance(proxy=p, weight=w, hosts=p.hosts)
+        for p, w in zip(proxies, weights, strict=True)
+    ]
+    total = sum(len(b.hosts) for b in balances)
+    if not total:
         exit_err("Proxies have no hosts to load balance.")
-    logger.debug("Found %d hosts to load balance.", len(all_hosts))
-
-    lb_proxies = {
-        p.proxyid: LBProxy(proxy=p, weight=w)
-        for p, w in zip(proxies, weights, strict=False)
-    }
-
-    for host in all_hosts:
-        p = random.choices(proxies, weights=weights, k=1)[0]
-        lb_proxies[p.proxyid].hosts.append(host)
-
-    # Abort on failure
-    try:
-        for lb_proxy in lb_proxies.values():
-            n_hosts = len(lb_proxy.hosts)
-            logger.debug(
-                "Proxy '%s' has %d hosts after balancing.",
-                lb_proxy.proxy.name,
-                n_hosts,
+    logger.debug("Found %d hosts to load balance.", total)
+
+    loads: dict[str, float] | None = None
+    if balance_by != LoadMetric.HOSTS:
+        with app.status("Computing host load..."):
+            host_loads = get_host_loads(
+                app.state.client,
+                [h for b in balances for h in b.hosts],
+                nvps=balance_by == LoadMetric.NVPS,
             )
-            if not n_hosts:
-                logger.debug(
-                    "Proxy '%s' has no hosts after balancing.", lb_proxy.proxy.name
-                )
-                continue
-            logger.debug("Moving %d hosts to proxy %r", n_hosts, lb_proxy.proxy.name)
+        loads = {hostid: load.get(balance_by) for hostid, load in host_loads.items()}
 
-            app.state.client.move_hosts_to_proxy(
-                hosts=lb_proxy.hosts,
-                proxy=lb_proxy.proxy,
-            )
-            lb_proxy.count = n_hosts
-    except Exception as e:
-        raise ZabbixCLIError(f"Failed to load balance hosts: {e}") from e
+    moves = plan_rebalance(balances, consistent=consistent, loads=loads)
+    render_result(
+        LBProxyResult(
+            proxies=[LBProxy.from_balance(b) for b in balances], metric=balance_by
+        )
+    )
 
-    render_result(LBProxyResult(proxies=list(lb_proxies.values())))
-    # HACK: render_result doesn't print a message for table results
-    success(f"Load balanced {len(all_hosts)} hosts between {len(proxies)} proxies.")
+    if dryrun:
+        info(f"Would move {p('host', len(moves))} of {total}.")
+        return
+    if not moves:
+        success("Proxies are already balanced.")
+        return
+
+    failed: list[str] = []
+    for balance in balances:
+        if not balance.incoming:
+            continue
+        dest = balance.proxy
+        logger.debug("Moving %d hosts to proxy %r", len(balance.incoming), dest.name)
+        res = run_mass_operation(
+            f"Moving hosts to {dest.name!r}...",
+            lambda chunk, dest=dest: app.state.client.update_hosts_proxy(chunk, dest),
+            balance.incoming,
+        )
+        try:
+            res.raise_for_failures(f"Failed to move hosts to {dest.name!r}")
+        except ZabbixAPIMassOperationError as e:
+            error(f"{e}")
+            failed.extend(str(host) for host, _ in res.failed)
+    if failed:
+        exit_err(f"Failed to move {p('host', len(failed))} of {len(moves)}.")
+    success(
+        f"Load balanced {total} hosts between {len(proxies)} proxies, "
+        f"moving {p('host', len(moves))}."
+    )
 
 
 @app.command(
@@ -300,7 +346,12 @@ def move_proxy_hosts(
         if not hosts:
             exit_err(f"No hosts matched filter {hfilter!r}.")
 
-    app.state.client.move_hosts_to_proxy(hosts, destination_proxy)
+    res = run_mass_operation(
+        f"Moving hosts to {destination_proxy.name!r}...",
+        lambda chunk: app.state.client.move_hosts_to_proxy(chunk, destination_proxy),
+        hosts,
+    )
+    res.raise_for_failures(f"Failed to move hosts to {destination_proxy.name!r}")
 
     render_result(
         Result(
@@ -350,6 +401,56 @@ def show_proxies(
     )
 
 
+@app.command(
+    name="show_proxy_load",
+    rich_help_panel=HELP_PANEL,
+    examples=[
+        Example("Show the load of all proxies", "show_proxy_load"),
+        Example("Show the load of some proxies", "show_proxy_load 'proxy-*'"),
+    ],
+)
+def show_proxy_load(
+    ctx: typer.Context,
+    name_or_id: str | None = typer.Argument(
+        None,
+        help="Filter by proxy name or ID. Comma-separated. Supports wildcards.",
+        show_default=False,
+    ),
+) -> None:
+    """Show the load of proxies.
+
+    Shows the number of hosts, enabled items and estimated new values per second (NVPS) of each proxy, along with its share of the total NVPS of the listed proxies.
+    NVPS is estimated from the update intervals of the enabled items of each host.
+    """
+    from zabbix_cli.commands.results.proxy import ProxyLoadResult
+    from zabbix_cli.models import AggregateResult
+    from zabbix_cli.proxy_balance import get_host_loads
+
+    names_or_ids = parse_list_arg(name_or_id)
+    with app.status("Fetching proxies..."):
+        proxies = app.state.client.get_proxies(*names_or_ids, select_hosts=True)
+    with app.status("Computing host load..."):
+        loads = get_host_loads(
+            app.state.client, [h for proxy in proxies for h in proxy.hosts]
+        )
+
+    results: list[ProxyLoadResult] = []
+    for proxy in proxies:
+        proxy_loads = [loads[h.hostid] for h in proxy.hosts]
+        results.append(
+            ProxyLoadResult(
+                proxy=proxy.name,
+                hosts=len(proxy.hosts),
+                items=sum(load.items for load in proxy_loads),
+                nvps=sum(load.nvps for load in proxy_loads),
+            )
+        )
+    total = sum(r.nvps for r in results)
+    for result in results:
+        result.share = result.nvps / total if total else 0.0
+    render_result(AggregateResult(result=results))
+
+
 @app.command(name="show_proxy_hosts", rich_help_panel=HELP_PANEL)
 def show_proxy_hosts(
     ctx: typer.Context,
@@ -378,6 +479,12 @@ def update_host_proxy(
         help="Proxy name. Supports wildcards.",
         show_default=False,
     ),
+    strategy: ProxyStrategy | None = typer.Option(
+        None,
+        "--strategy",
+        help="Distribute the hosts among all matching proxies using this strategy.",
+        case_sensitive=False,
+    ),
     dryrun: bool = typer.Option(
         False,
         help="Preview changes",
@@ -386,7 +493,9 @@ def update_host_proxy(
     """Assign hosts to a proxy.
 
     Supports wildcards for both hosts and proxy names.
-    If multiple proxies match the proxy name, the first match is used.
+    If multiple proxies match the proxy name, the first match is used,
+    unless [option]--strategy[/] is specified, in which case each host is
+    assigned one of the matching proxies using the strategy.
     """
     from zabbix_cli.commands.results.proxy import UpdateHostProxyResult
     from zabbix_cli.models import AggregateResult
@@ -394,39 +503,62 @@ def update_host_proxy(
 
     hostnames = parse_list_arg(hostname)
     hosts = app.state.client.get_hosts(*hostnames, search=True)
-    dest_proxy = app.state.client.get_proxy(proxy)
-
-    to_update: list[Host] = []
-    for host in hosts:
-        if host.proxyid != dest_proxy.proxyid:
-            to_update.append(host)
 
-    if not dryrun:
-        with app.status("Updating host proxies..."):
-            hostids = app.state.client.update_hosts_proxy(to_update, dest_proxy)
+    # Hosts to move to each destination proxy, by proxy ID
+    destinations: dict[str, tuple[Proxy, list[Host]]] = {}
+    if strategy is None:
+        dest_proxy = app.state.client.get_proxy(proxy)
+        destinations[dest_proxy.proxyid] = (
+            dest_proxy,
+            [host for host in hosts if host.proxyid != dest_proxy.proxyid],
+        )
     else:
-        hostids = [host.hostid for host in to_update]
-
-    updated = set(hostids)
-    updated_hosts = [host for host in to_update if host.hostid in updated]
-
-    proxy_hosts = group_hosts_by_proxy(app, updated_hosts)
-
-    render_result(
-        AggregateResult(
-            empty_ok=True,
-            result=[
-                UpdateHostProxyResult.from_result(
-                    hosts=prev.hosts,
-                    source_proxy=prev.proxy,
-                    dest_proxy=dest_proxy,
-                )
-                for _, prev in proxy_hosts.items()
-            ],
+        candidates = app.state.client.get_proxies(proxy)
+        if not candidates:
+            exit_err(f"No proxies matching {proxy!r}")
+        selector = app.state.client.proxy_selector
+        proxies = {p.proxyid: p for p in selector.proxies}
+        for host in hosts:
+            dest_proxy = selector.choose(
+                candidates,
+                strategy=strategy,
+                current=proxies.get(str(host.proxyid)),
+            )
+            if host.proxyid == dest_proxy.proxyid:
+                continue
+            _, to_move = destinations.setdefault(dest_proxy.proxyid, (dest_proxy, []))
+            to_move.append(host)
+
+    results: list[UpdateHostProxyResult] = []
+    total_hosts = 0
+    for dest_proxy, to_update in destinations.values():
+        if not dryrun:
+            res = run_mass_operation(
+                f"Moving hosts to {dest_proxy.name}...",
+                lambda chunk, dest_proxy=dest_proxy: (
+                    app.state.client.update_hosts_proxy(chunk, dest_proxy)
+                ),
+                to_update,
+            )
+            res.raise_for_failures("Failed to update proxy for hosts")
+            updated = {host.hostid for host in res.succeeded}
+        else:
+            updated = {host.hostid for host in to_update}
+        updated_hosts = [host for host in to_update if host.hostid in updated]
+        total_hosts += len(updated_hosts)
+
+        proxy_hosts = group_hosts_by_proxy(app, updated_hosts)
+        results.extend(
+            UpdateHostProxyResult.from_result(
+                hosts=prev.hosts,
+                source_proxy=prev.proxy,
+                dest_proxy=dest_proxy,
+            )
+            for prev in proxy_hosts.values()
         )
-    )
 
-    total_hosts = len(updated)
+    render_result(AggregateResult(empty_ok=True, result=results))
+
     if dryrun:
         info(f"Would update proxy for {total_hosts} hosts.")
     else:
@@ -461,8 +593,13 @@ def update_hostgroup_proxy(
     if not dryrun:
         if not to_update:
             exit_err("All hosts already have the specified proxy.")
-        with app.status("Updating host proxies..."):
-            hostids = app.state.client.update_hosts_proxy(to_update, prx)
+        res = run_mass_operation(
+            "Updating host proxies...",
+            lambda chunk: app.state.client.update_hosts_proxy(chunk, prx),
+            to_update,
+        )
+        res.raise_for_failures("Failed to update proxy for hosts")
+        hostids = [host.hostid for host in res.succeeded]
         if not hostids:
             warning("No hosts were updated.")
     else:
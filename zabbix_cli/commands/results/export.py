@@ -32,10 +32,12 @@ class ImportResult(TableRenderable):
     dryrun: bool = False
     imported: list[Path] = []
     failed: list[Path] = []
+    skipped: list[Path] = []
+    """Files that were skipped because they are unchanged."""
     duration: float | None = None
     """Duration it took to import files in seconds. Is None if import failed."""
 
-    @field_serializer("imported", "failed", when_used="json")
+    @field_serializer("imported", "failed", "skipped", when_used="json")
     def _serialize_files(self, files: list[Path]) -> list[str]:
         """Serializes files as list of normalized, absolute paths with symlinks resolved."""
         return [str(f.resolve()) for f in files]
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+from typing import Literal
+
 from pydantic import BaseModel
 from pydantic import ConfigDict
 
 from zabbix_cli.exceptions import ZabbixCLIError
+from zabbix_cli.models import TableRenderable
 from zabbix_cli.pyzabbix.enums import ActiveInterface
 from zabbix_cli.pyzabbix.enums import MaintenanceStatus
 from zabbix_cli.pyzabbix.enums import MonitoringStatus
 
+if TYPE_CHECKING:
+    from zabbix_cli.models import ColsRowsType
+    from zabbix_cli.models import RowsType
+
 
 # TODO: don't use BaseModel for this
 # Use a normal class with __init__ instead
@@ -55,3 +63,67 @@ class HostFilterArgs(BaseModel):
                     MaintenanceStatus.ON if maintenance else MaintenanceStatus.OFF
                 )
         return args
+
+
+class CreateHostFromFileResult(TableRenderable):
+    """Result of creating the host in a row of a host file."""
+
+    row: int
+    """Line number of the row."""
+    hostname: str
+    hostid: str | None = None
+    status: Literal["pending", "created", "failed", "dryrun"] = "pending"
+    error: str | None = None
+
+    def fail(self, error: BaseException | str) -> None:
+        self.status = "failed"
+        self.error = str(error)
+
+    def __cols_rows__(self) -> ColsRowsType:
+        cols = ["Row", "Host", "ID", "Status", "Error"]
+        rows: RowsType = [
+            [
+                str(self.row),
+                self.hostname,
+                self.hostid or "",
+                self.status,
+                self.error or "",
+            ]
+        ]
+        return cols, rows
+
+
+class SyncHostsChange(TableRenderable):
+    """A change to a host planned by `sync_hosts`."""
+
+    row: int
+    """Line number of the row describing the host."""
+    hostname: str
+    change: str
+    current: str = ""
+    desired: str = ""
+    status: Literal["planned", "applied", "failed"] = "planned"
+    error: str | None = None
+
+    def applied(self) -> None:
+        # A change can require multiple operations, and fails if any of them fail
+        if self.status == "planned":
+            self.status = "applied"
+
+    def fail(self, error: BaseException | str) -> None:
+        self.status = "failed"
+        self.error = str(error)
+
+    def __cols_rows__(self) -> ColsRowsType:
+        cols = ["Row", "Host", "Change", "Current", "Desired", "Status"]
+        rows: RowsType = [
+            [
+                str(self.row),
+                self.hostname,
+                self.change,
+                self.current,
+                self.desired,
+                f"{self.status}: {self.error}" if self.error else self.status,
+            ]
+        ]
+        return cols, rows
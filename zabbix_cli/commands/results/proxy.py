@@ -10,6 +10,7 @@ from typing_extensions import Self
 from zabbix_cli.models import ColsRowsType
 from zabbix_cli.models import MetaKey
 from zabbix_cli.models import TableRenderable
+from zabbix_cli.proxy_balance import LoadMetric
 from zabbix_cli.pyzabbix.types import Host
 from zabbix_cli.pyzabbix.types import HostList
 from zabbix_cli.pyzabbix.types import Proxy
@@ -17,7 +18,9 @@ from zabbix_cli.pyzabbix.types import ProxyGroup
 
 if TYPE_CHECKING:
     from zabbix_cli.models import ColsRowsType
+    from zabbix_cli.models import RowContent
     from zabbix_cli.models import RowsType
+    from zabbix_cli.proxy_balance import ProxyBalance
 
 
 class BaseHostProxyResult(TableRenderable):
@@ -79,8 +82,28 @@ class LBProxy(BaseModel):
 
     proxy: Proxy
     hosts: list[Host] = []
+    """Hosts monitored by the proxy before balancing."""
     weight: int
-    count: int = 0
+    target: float = 0
+    """Load of the proxy after balancing."""
+    load: float = 0
+    """Load of the proxy before balancing."""
+    load_after: float = 0
+    incoming: list[Host] = []
+    outgoing: list[Host] = []
+
+    @classmethod
+    def from_balance(cls, balance: ProxyBalance) -> Self:
+        return cls(
+            proxy=balance.proxy,
+            hosts=balance.hosts,
+            weight=balance.weight,
+            target=balance.target,
+            load=balance.load,
+            load_after=balance.load_after,
+            incoming=balance.incoming,
+            outgoing=balance.outgoing,
+        )
 
     @model_serializer
     def ser_model(self):
@@ -88,8 +111,12 @@ class LBProxy(BaseModel):
             "name": self.proxy.name,
             "proxyid": self.proxy.proxyid,
             "weight": self.weight,
-            "count": self.count,
-            "hosts": [h.host for h in self.hosts],
+            "count": len(self.hosts),
+            "load": self.load,
+            "target": self.target,
+            "load_after": self.load_after,
+            "hosts_in": [h.host for h in self.incoming],
+            "hosts_out": [h.host for h in self.outgoing],
         }
 
 
@@ -97,12 +124,60 @@ class LBProxyResult(TableRenderable):
     """Result type for `load_balance_proxy_hosts` command."""
 
     proxies: list[LBProxy]
+    metric: LoadMetric = LoadMetric.HOSTS
 
     def __cols_rows__(self) -> ColsRowsType:
-        cols = ["Proxy", "Weight", "Hosts"]
+        cols = ["Proxy", "Weight", "Hosts", "In", "Out"]
+        if self.metric == LoadMetric.HOSTS:
+            cols.append("Target")
+        else:
+            label = "Items" if self.metric == LoadMetric.ITEMS else "NVPS"
+            cols.extend([label, f"{label} target", f"{label} after"])
         rows: RowsType = []
         for proxy in self.proxies:
-            rows.append([proxy.proxy.name, str(proxy.weight), str(len(proxy.hosts))])
+            row: RowContent = [
+                proxy.proxy.name,
+                str(proxy.weight),
+                str(len(proxy.hosts)),
+                str(len(proxy.incoming)),
+                str(len(proxy.outgoing)),
+            ]
+            if self.metric == LoadMetric.HOSTS:
+                row.append(str(round(proxy.target)))
+            else:
+                row.extend(
+                    f"{value:.0f}"
+                    if self.metric == LoadMetric.ITEMS
+                    else f"{value:.2f}"
+                    for value in (proxy.load, proxy.target, proxy.load_after)
+                )
+            rows.append(row)
+        return cols, rows
+
+
+class ProxyLoadResult(TableRenderable):
+    """Result type for `show_proxy_load` command."""
+
+    proxy: str
+    hosts: int = 0
+    items: int = 0
+    """Number of enabled items."""
+    nvps: float = 0.0
+    """Estimated new values per second."""
+    share: float = 0.0
+    """Share of the total estimated values per second of all listed proxies."""
+
+    def __cols_rows__(self) -> ColsRowsType:
+        cols = ["Proxy", "Hosts", "Items", "NVPS", "Share"]
+        rows: RowsType = [
+            [
+                self.proxy,
+                str(self.hosts),
+                str(self.items),
+                f"{self.nvps:.2f}",
+                f"{self.share:.1%}",
+            ]
+        ]
         return cols, rows
 
 
@@ -8,6 +8,7 @@ from zabbix_cli.app import Example
 from zabbix_cli.app import app
 from zabbix_cli.commands.common.args import ARG_HOSTNAMES_OR_IDS
 from zabbix_cli.commands.common.args import ARG_TEMPLATE_NAMES_OR_IDS
+from zabbix_cli.commands.common.mass import run_mass_operation
 from zabbix_cli.output.console import info
 from zabbix_cli.output.console import success
 from zabbix_cli.output.formatting.grammar import pluralize as p
@@ -69,8 +70,12 @@ def link_template_to_host(
     )
     hosts = parse_hosts_arg(app, hostnames_or_ids, strict=strict)
     if not dryrun:
-        with app.state.console.status("Linking templates..."):
-            app.state.client.link_templates_to_hosts(templates, hosts)
+        res = run_mass_operation(
+            "Linking templates...",
+            lambda chunk: app.state.client.link_templates_to_hosts(templates, chunk),
+            hosts,
+        )
+        res.raise_for_failures("Failed to link templates")
 
     result: list[LinkTemplateToHostResult] = []
     for host in hosts:
@@ -285,8 +290,14 @@ def unlink_template_from_host(
 
     action = "Unlink and clear" if clear else "Unlink"
     if not dryrun:
-        with app.state.console.status("Unlinking templates..."):
-            app.state.client.unlink_templates_from_hosts(templates, hosts)
+        res = run_mass_operation(
+            "Unlinking templates...",
+            lambda chunk: app.state.client.unlink_templates_from_hosts(
+                templates, chunk
+            ),
+            hosts,
+        )
+        res.raise_for_failures("Failed to unlink templates")
 
     # Only show hosts with matching templates to unlink
     result: list[UnlinkTemplateFromHostResult] = []
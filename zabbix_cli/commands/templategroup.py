@@ -64,7 +64,7 @@ def add_template_to_group(
 
     templates = parse_templates_arg(app, template_names_or_ids, strict=strict)
 
-    with app.state.console.status("Adding templates..."):
+    with app.status("Adding templates..."):
         app.state.client.link_templates_to_groups(templates, groups)
     render_result(TemplateGroupResult.from_result(templates, groups))
     success(f"Added {len(templates)} templates to {len(groups)} groups.")
@@ -391,7 +391,7 @@ def remove_template_from_group(
     templates = parse_templates_arg(app, template_names_or_ids, strict=strict)
 
     if not dryrun:
-        with app.state.console.status("Removing templates from groups..."):
+        with app.status("Removing templates from groups..."):
             # LEGACY: This used to also pass the templateids to templateids_clear,
             # which would unlink and clear all the templates from each other
             # This was a mistake, and has been removed in V3.
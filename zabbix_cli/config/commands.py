@@ -14,6 +14,7 @@ from typing_extensions import Self
 from zabbix_cli.config.base import BaseModel
 from zabbix_cli.dirs import EXPORT_DIR
 from zabbix_cli.pyzabbix.enums import ExportFormat
+from zabbix_cli.pyzabbix.enums import ProxyStrategy
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,12 @@ class CreateHost(BaseModel):
         ),
         description="Default host group to add hosts to.",
     )
+    proxy_strategy: ProxyStrategy = Field(
+        default=ProxyStrategy.RANDOM,
+        description=(
+            "Strategy for selecting a proxy among the proxies matching the proxy pattern."
+        ),
+    )
 
 
 class CreateNotificationUser(BaseModel):
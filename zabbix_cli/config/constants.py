@@ -39,6 +39,12 @@ SESSION_FILE = DATA_DIR / ".zabbix-cli_session.json"
 HISTORY_FILE = DATA_DIR / "history"
 """Path to file containing REPL history."""
 
+IMPORT_LEDGER_FILE = DATA_DIR / ".zabbix-cli_import_ledger.json"
+"""Path to JSON file containing hashes of imported configuration files."""
+
+BULK_CHECKPOINT_DIR = DATA_DIR / "bulk_checkpoints"
+"""Path to directory containing checkpoints of bulk runs."""
+
 LOG_FILE = LOGS_DIR / "zabbix-cli.log"
 
 
@@ -51,13 +57,21 @@ class ConfigEnvVars:
 
 
 class OutputFormat(StrEnum):
-    # CSV = "csv"
+    CSV = "csv"
+    """Comma-separated values with nested values joined on a single line."""
+
     JSON = "json"
     """JSON-serialized output."""
 
     TABLE = "table"
     """Rich terminal table output."""
 
+    NDJSON = "ndjson"
+    """Newline-delimited JSON output with one object per line."""
+
+    PLAIN = "plain"
+    """Plain fixed-width table output. Faster than table output for large results."""
+
 
 class SecretMode(StrEnum):
     """Mode for serializing secrets."""
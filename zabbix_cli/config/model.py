@@ -109,6 +109,21 @@ class APIConfig(BaseModel):
         default=0,
         description="API request timeout in seconds.",
     )
+    mass_chunk_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Initial number of objects per request for mass operations. Adapted to the observed latency.",
+    )
+    mass_jobs: int = Field(
+        default=1,
+        ge=1,
+        description="Number of mass operation requests to run concurrently.",
+    )
+    page_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Number of objects per request when streaming results page by page.",
+    )
 
     @model_validator(mode="after")
     def _validate_model(self) -> Self:
@@ -153,6 +168,31 @@ class OutputConfig(BaseModel):
         default=False,
         description="Use paging in terminal output.",
     )
+    compact_json: bool = Field(
+        default=False,
+        description="Output JSON without indentation.",
+    )
+    csv_list_join: str = Field(
+        default="; ",
+        description="Separator between list items and nested table rows in CSV output.",
+    )
+    csv_cell_join: str = Field(
+        default=" ",
+        description="Separator between the cells of nested table rows in CSV output.",
+    )
+    plain_threshold: int = Field(
+        default=1000,
+        ge=0,
+        description=(
+            "Render tables with more rows than this as plain fixed-width tables. "
+            "0 to always use rich tables."
+        ),
+    )
+    plain_max_width: int = Field(
+        default=50,
+        ge=1,
+        description="Maximum width of columns in plain fixed-width tables.",
+    )
     theme: str = Field(
         default="default",
         description="Color theme to use.",
@@ -234,6 +274,29 @@ class AppConfig(BaseModel):
         description="Path to history file.",
     )
 
+    # REPL result buffer
+    repl_results: int = Field(
+        default=10,
+        ge=0,
+        description="Number of command results kept in memory in the REPL. 0 to disable.",
+    )
+    repl_results_max_size: int = Field(
+        default=200,
+        ge=0,
+        description="Maximum total size of the results kept in memory in the REPL (MB).",
+    )
+
+    # REPL completion
+    repl_completion: bool = Field(
+        default=True,
+        description="Complete names of hosts, host groups, templates, proxies, user groups and macros in the REPL.",
+    )
+    repl_completion_ttl: int = Field(
+        default=300,
+        ge=0,
+        description="Seconds before completed names are refreshed in the background.",
+    )
+
     bulk_mode: BulkRunnerMode = Field(
         default=BulkRunnerMode.STRICT,
         description="Bulk mode error handling.",
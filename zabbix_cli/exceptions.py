@@ -179,6 +179,17 @@ class ZabbixNotFoundError(ZabbixAPICallError):
     """A Zabbix API resource was not found."""
 
 
+class ZabbixAPIMassOperationError(ZabbixAPICallError):
+    """A chunked mass operation failed for some of its objects."""
+
+    def __init__(
+        self, *args: Any, succeeded: list[Any], failed: list[tuple[Any, Exception]]
+    ) -> None:
+        super().__init__(*args)
+        self.succeeded = succeeded
+        self.failed = failed
+
+
 class Exiter(Protocol):
     """Protocol class for exit function that can be passed to an
     exception handler function.
@@ -40,6 +40,8 @@ from zabbix_cli.state import get_state
 if TYPE_CHECKING:
     from typing import Any
 
+    from zabbix_cli.repl.names import ObjectNames
+
 
 def run_repl(ctx: typer.Context) -> None:
     from rich.console import Group
@@ -72,8 +74,17 @@ def run_repl(ctx: typer.Context) -> None:
             state.repl = True
         state.revert_config_overrides()
 
+    names: ObjectNames | None = None
+    if state.config.app.repl_completion:
+        from zabbix_cli.repl.names import ObjectNames
+
+        # Fetch names for completion in the background while the user types
+        names = ObjectNames(state.client, ttl=state.config.app.repl_completion_ttl)
+        state.client.names = names
+        names.warm()
+
     prompt_kwargs: dict[str, Any] = {"pre_run": pre_run, "history": state.history}
-    start_repl(ctx, app, prompt_kwargs=prompt_kwargs)
+    start_repl(ctx, app, prompt_kwargs=prompt_kwargs, names=names)
 
 
 def version_callback(value: bool):
@@ -97,7 +108,7 @@ def main_callback(
         "--file",
         "--input-file",  # DEPRECATED: V2 name for compatibility
         "-f",
-        help="File containing Zabbix-CLI commands to execute in bulk.",
+        help="File containing Zabbix-CLI commands to execute in bulk. Use [value]-[/] to read from stdin.",
         rich_help_panel="Bulk Mode Options",
         show_default=False,
     ),
@@ -110,6 +121,58 @@ def main_callback(
         rich_help_panel="Bulk Mode Options",
         show_default=False,
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of commands to run concurrently in bulk mode.",
+        min=1,
+        rich_help_panel="Bulk Mode Options",
+    ),
+    results_file: Path | None = typer.Option(
+        None,
+        "--results-file",
+        help="Append the result of each command to this file (JSONL) in bulk mode.",
+        rich_help_panel="Bulk Mode Options",
+        show_default=False,
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Resume a previous bulk run of the same file, skipping lines that already succeeded.",
+        rich_help_panel="Bulk Mode Options",
+    ),
+    retry_failed: bool = typer.Option(
+        False,
+        "--retry-failed",
+        help="Only run lines that failed in a previous bulk run of the same file.",
+        rich_help_panel="Bulk Mode Options",
+    ),
+    coalesce: bool = typer.Option(
+        True,
+        "--coalesce/--no-coalesce",
+        help="Merge consecutive commands performing the same operation into mass API calls in bulk mode.",
+        rich_help_panel="Bulk Mode Options",
+    ),
+    prefetch: bool = typer.Option(
+        True,
+        "--prefetch/--no-prefetch",
+        help="Fetch host groups, templates, proxies and user groups referenced in the command file before running it.",
+        rich_help_panel="Bulk Mode Options",
+    ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Show throughput, latency per command and the slowest lines on stderr after a bulk run.",
+        rich_help_panel="Bulk Mode Options",
+    ),
+    timings_file: Path | None = typer.Option(
+        None,
+        "--timings-file",
+        help="Write the timing report of a bulk run to this file (JSON).",
+        rich_help_panel="Bulk Mode Options",
+        show_default=False,
+    ),
     output_format: OutputFormat | None = typer.Option(
         None,
         "--format",
@@ -126,6 +189,37 @@ def main_callback(
         case_sensitive=False,
         show_default=False,
     ),
+    compact_json: bool | None = typer.Option(
+        None,
+        "--compact-json/--no-compact-json",
+        help="Output JSON without indentation.",
+        show_default=False,
+    ),
+    output_file: Path | None = typer.Option(
+        None,
+        "--output-file",
+        help=(
+            "Write results to a file instead of the terminal. "
+            "The format is determined by the file extension: "
+            ".json, .ndjson/.jsonl, .csv or .db/.sqlite/.sqlite3 (SQLite table named after the command). "
+            "Cannot be used in bulk mode."
+        ),
+        dir_okay=False,
+        writable=True,
+        show_default=False,
+    ),
+    fields: str | None = typer.Option(
+        None,
+        "--fields",
+        help="Comma-separated list of fields to show in results.",
+        show_default=False,
+    ),
+    sort: str | None = typer.Option(
+        None,
+        "--sort",
+        help="Sort results by a field. Append [code]:desc[/] for descending order, e.g. [code]host:desc[/].",
+        show_default=False,
+    ),
     version: bool | None = typer.Option(
         None,
         "--version",
@@ -149,6 +243,12 @@ def main_callback(
         return
 
     state = get_state()
+    if output_file is not None and (input_file or state.bulk):
+        from zabbix_cli.output.console import exit_err
+
+        # Every command would overwrite the results of the previous one
+        exit_err("[option]--output-file[/] cannot be used in bulk mode.")
+
     if not should_skip_configuration(ctx) and not state.is_config_loaded:
         state.config = get_config(config_file, init=True)
 
@@ -159,6 +259,18 @@ def main_callback(
         state.config.app.bulk_mode = bulk_mode
     if legacy_json is not None:
         state.config.app.legacy_json_format = legacy_json
+    if compact_json is not None:
+        state.config.app.output.compact_json = compact_json
+    if output_file is not None:
+        state.output_file = output_file
+    if fields is not None:
+        from zabbix_cli.utils.args import parse_list_arg
+
+        state.fields = parse_list_arg(fields) or None
+    if sort is not None:
+        from zabbix_cli.models import SortKey
+
+        state.sort = SortKey.parse(sort)
 
     if state.repl or state.bulk:
         return  # In REPL or bulk mode already; no need to re-configure.
@@ -184,7 +296,19 @@ def main_callback(
     elif input_file:
         from zabbix_cli.bulk import run_bulk
 
-        run_bulk(ctx, input_file, state.config.app.bulk_mode)
+        run_bulk(
+            ctx,
+            input_file,
+            state.config.app.bulk_mode,
+            jobs=jobs,
+            coalesce=coalesce,
+            results_file=results_file,
+            resume=resume,
+            retry_failed=retry_failed,
+            prefetch=prefetch,
+            timings=timings,
+            timings_file=timings_file,
+        )
     elif ctx.invoked_subcommand is not None:
         return  # modern alternative to `-C` option to run a single command
     else:
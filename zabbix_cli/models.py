@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import copy
+import functools
 from collections.abc import MutableSequence
+from collections.abc import Sequence
 from enum import Enum
+from types import UnionType
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
 from typing import Generic
+from typing import Literal
+from typing import NamedTuple
+from typing import Union
 from typing import cast
+from typing import get_args
+from typing import get_origin
 
 import rich.box
 from packaging.version import Version
@@ -14,11 +23,13 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import JsonValue
+from pydantic import create_model
 from pydantic.fields import ComputedFieldInfo
 from pydantic.fields import FieldInfo
 from strenum import StrEnum
 from typing_extensions import TypeVar
 
+from zabbix_cli.exceptions import ZabbixCLIError
 from zabbix_cli.logs import logger
 from zabbix_cli.table import get_table
 from zabbix_cli.utils.rich import get_safe_renderable
@@ -60,6 +71,75 @@ def fmt_field_name(field_name: str) -> str:
     return field_name.capitalize().replace("_", " ")
 
 
+class FieldKind(str, Enum):
+    """How the values of a field are rendered in a table."""
+
+    TEXT = "text"
+    """Values are always rendered as strings."""
+    ANY = "any"
+    """Values are rendered based on their type (table, list, etc.)."""
+
+
+class Column(NamedTuple):
+    """Table rendering metadata for a field."""
+
+    name: str
+    header: str
+    join_char: str
+    kind: FieldKind
+
+
+TEXT_TYPES = (str, int, float, bool, Enum)
+"""Types whose values are rendered as strings."""
+
+
+def get_field_kind(annotation: Any) -> FieldKind:
+    """Get the rendering kind of a field from its type annotation."""
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return FieldKind.TEXT
+    if origin is Union or origin is UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if args and all(get_field_kind(arg) == FieldKind.TEXT for arg in args):
+            return FieldKind.TEXT
+        return FieldKind.ANY
+    if isinstance(annotation, type) and issubclass(annotation, TEXT_TYPES):
+        return FieldKind.TEXT
+    return FieldKind.ANY
+
+
+@functools.cache
+def get_columns(cls: type[TableRenderable]) -> tuple[Column, ...]:
+    """Get the table rendering metadata for the fields of a model.
+
+    Computed once per class, since the fields of a class never change.
+    Includes computed fields, but excludes excluded fields."""
+    all_fields: dict[str, FieldInfo | ComputedFieldInfo] = {
+        **cls.model_fields,
+        **cls.model_computed_fields,
+    }
+    columns: list[Column] = []
+    for field_name, field in all_fields.items():
+        if getattr(field, "exclude", False):
+            continue
+        extra = (
+            field.json_schema_extra if isinstance(field.json_schema_extra, dict) else {}
+        )
+        if isinstance(field, FieldInfo):
+            annotation = field.annotation
+        else:
+            annotation = field.return_type
+        columns.append(
+            Column(
+                name=field_name,
+                header=str(extra.get(MetaKey.HEADER) or fmt_field_name(field_name)),
+                join_char=str(extra.get(MetaKey.JOIN_CHAR, "\n")),
+                kind=get_field_kind(annotation),
+            )
+        )
+    return tuple(columns)
+
+
 # We wrap the results of commands in a Result object,
 # but ONLY if we are rendering it as JSON. This makes the logic in the
 # `render` module a bit of a mess, since the function type annotations
@@ -141,18 +221,7 @@ class TableRenderable(BaseModel):
         >>> User().__cols__()
         ["User ID", "Username"]
         """
-        cols: list[str] = []
-
-        for field_name, field in self.__all_fields__().items():
-            if (
-                field.json_schema_extra
-                and isinstance(field.json_schema_extra, dict)
-                and field.json_schema_extra.get(MetaKey.HEADER, None)
-            ):
-                cols.append(str(field.json_schema_extra[MetaKey.HEADER]))
-            else:
-                cols.append(fmt_field_name(field_name))
-        return cols
+        return [column.header for column in get_columns(self.__class__)]
 
     def __rows__(self) -> RowsType:
         r"""Returns the rows for the table representation of the object.
@@ -176,13 +245,13 @@ class TableRenderable(BaseModel):
         >>> User(userid="1", username="admin", groups=["foo", "bar", "baz"]).__rows__()
         [["1", "admin", "foo\nbar\nbaz"]]
         """  # noqa: D416
-        fields: dict[str, Any | str] = {
-            field_name: getattr(self, field_name, "")
-            for field_name in self.__all_fields__()
-        }
-        for field_name, value in fields.items():
-            if isinstance(value, TableRenderable):
-                fields[field_name] = value.as_table()
+        row: RowContent = []
+        for column in get_columns(self.__class__):
+            value = getattr(self, column.name, "")
+            if column.kind is FieldKind.TEXT:
+                row.append(str(value))
+            elif isinstance(value, TableRenderable):
+                row.append(value.as_table())
             elif isinstance(value, BaseModel):
                 # Fall back to rendering as JSON string
                 logger.warning(
@@ -190,7 +259,7 @@ class TableRenderable(BaseModel):
                     value.__class__.__name__,
                     stack_info=True,  # we want to know how we got here
                 )
-                fields[field_name] = value.model_dump_json(indent=2)
+                row.append(value.model_dump_json(indent=2))
             elif isinstance(value, list):
                 value = cast(list[Any], value)
                 # A list either contains TableRenderable objects or stringable objects
@@ -201,16 +270,15 @@ class TableRenderable(BaseModel):
                     # Rendering an aggregate result with mixed types is not supported
                     # and will probably break.
                     value = cast(list[TableRenderable], value)
-                    fields[field_name] = AggregateResult(result=value).as_table()
+                    row.append(AggregateResult(result=value).as_table())
                 else:
                     # Other lists are rendered as newline delimited strings.
                     # The delimiter can be modified with the `JOIN_CHAR` meta-key in
                     # the field's `json_schema_extra`.
-                    join_char = self._get_extra(field_name, MetaKey.JOIN_CHAR, "\n")
-                    fields[field_name] = join_char.join(str(v) for v in value)
+                    row.append(column.join_char.join(str(v) for v in value))
             else:
-                fields[field_name] = str(value)
-        return [list(fields.values())]  # must be a list of lists
+                row.append(str(value))
+        return [row]  # must be a list of lists
 
     def __cols_rows__(self) -> ColsRowsType:
         """Returns the columns and rows for the table representation of the object.
@@ -243,6 +311,101 @@ class TableRenderable(BaseModel):
     # We should implement the rich renderable protocol...
 
 
+def resolve_field(cls: type[TableRenderable], name: str) -> str:
+    """Get the name of a field of a model from a field name, alias or column header.
+
+    Matching is case-insensitive."""
+    fields: dict[str, FieldInfo | ComputedFieldInfo] = {
+        **cls.model_fields,
+        **cls.model_computed_fields,
+    }
+    if name in fields:
+        return name
+    wanted = name.lower()
+    for column in get_columns(cls):
+        if wanted in (column.name.lower(), column.header.lower()):
+            return column.name
+    for field_name, field in fields.items():
+        if field.alias and wanted == field.alias.lower():
+            return field_name
+    available = ", ".join(column.name for column in get_columns(cls))
+    raise ZabbixCLIError(f"Unknown field {name!r}. Available fields: {available}")
+
+
+@functools.cache
+def get_fields_model(
+    cls: type[TableRenderable], fields: tuple[str, ...]
+) -> type[TableRenderable]:
+    """Get a model with a subset of the fields of a model, in the given order.
+
+    Computed fields become regular fields. The model uses the default
+    columns and rows, even if the original model customizes them."""
+    definitions: dict[str, Any] = {}
+    for name in fields:
+        if name in cls.model_fields:
+            field = cls.model_fields[name]
+            definitions[name] = (field.annotation, copy.copy(field))
+        else:
+            computed = cls.model_computed_fields[name]
+            definitions[name] = (
+                computed.return_type,
+                Field(
+                    default=None,
+                    alias=computed.alias,
+                    json_schema_extra=computed.json_schema_extra,
+                ),
+            )
+    return create_model(  # pyright: ignore[reportCallIssue, reportUnknownVariableType]
+        f"{cls.__name__}Fields",
+        __base__=TableRenderable,
+        **definitions,
+    )
+
+
+def select_fields(obj: TableRenderable, fields: Sequence[str]) -> TableRenderable:
+    """Get a copy of an object with only the given fields."""
+    cls = obj.__class__
+    names = tuple(resolve_field(cls, field) for field in fields)
+    model = get_fields_model(cls, names)
+    return model.model_construct(**{name: getattr(obj, name, None) for name in names})
+
+
+class SortKey(NamedTuple):
+    """Field to sort results by."""
+
+    field: str
+    descending: bool = False
+
+    @classmethod
+    def parse(cls, value: str) -> SortKey:
+        """Parse a sort key on the form `field[:asc|desc]`."""
+        field, _, order = value.partition(":")
+        order = order.strip().lower()
+        if not field.strip() or order not in ("", "asc", "desc"):
+            raise ZabbixCLIError(
+                f"Invalid sort key {value!r}. Expected 'field', 'field:asc' or 'field:desc'."
+            )
+        return cls(field.strip(), order == "desc")
+
+
+def sort_value(value: Any) -> tuple[int, float, str]:
+    """Get a key for sorting field values.
+
+    Numbers (including numeric strings) are sorted numerically before other
+    values, which are sorted case-insensitively. Missing values are last."""
+    if value is None or value == "":
+        return (2, 0.0, "")
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, (int, float)):
+        return (0, float(value), "")
+    text = str(value)
+    try:
+        return (0, float(text), "")
+    except ValueError:
+        return (1, 0.0, text.lower())
+
+
 DataT = TypeVar("DataT", default=TableRenderable)
 
 
@@ -295,3 +458,20 @@ class AggregateResult(BaseResult, Generic[TableRenderableT]):
             if r:
                 rows.append(r[0])  # NOTE: why not add all rows?
         return cols, rows
+
+    def sort_by(self, key: SortKey) -> None:
+        """Sort the results by a field in place."""
+        if not self.result:
+            return
+        field = resolve_field(self.result[0].__class__, key.field)
+        self.result.sort(
+            key=lambda r: sort_value(getattr(r, field, None)),
+            reverse=key.descending,
+        )
+
+    def select(self, fields: Sequence[str]) -> AggregateResult[TableRenderable]:
+        """Get a copy of the result with only the given fields of each result."""
+        return AggregateResult(
+            result=[select_fields(r, fields) for r in self.result],
+            empty_ok=self.empty_ok,
+        )
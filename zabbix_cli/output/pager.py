@@ -0,0 +1,99 @@
+"""Lazy paging of command output.
+
+Output is piped to a pager process while it is rendered. Writes to the pipe
+block once the pager has read ahead of what is shown on screen, so rows that
+are rendered one at a time (and pages of results that are fetched as they are
+rendered) are only produced as the user scrolls. Rendering stops when the
+pager is closed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shlex
+import shutil
+import subprocess
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from zabbix_cli.output.console import console
+from zabbix_cli.state import get_state
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGER = "less"
+
+LESS_OPTIONS = "FRX"
+"""Default options for `less`: quit if the output fits on one screen,
+show colors and don't clear the screen on exit."""
+
+_paging = False
+"""Output is currently being piped to a pager."""
+
+
+def should_page() -> bool:
+    """Check if output should be piped to a pager."""
+    state = get_state()
+    return (
+        state.config.app.output.paging
+        and not state.bulk
+        and not _paging
+        and console.is_terminal
+    )
+
+
+def is_paging() -> bool:
+    """Check if output is currently being piped to a pager."""
+    return _paging
+
+
+def get_pager_command() -> list[str] | None:
+    """Get the command of the pager, if it is installed."""
+    cmd = shlex.split(os.environ.get("PAGER") or DEFAULT_PAGER)
+    if not cmd or not shutil.which(cmd[0]):
+        logger.debug("Pager %r not found, not paging output.", cmd)
+        return None
+    return cmd
+
+
+@contextmanager
+def pager() -> Iterator[None]:
+    """Pipe console output to a pager until the context is exited.
+
+    Does nothing if the pager is not installed. Output that is written after
+    the pager is closed by the user is discarded."""
+    global _paging
+
+    cmd = get_pager_command()
+    if cmd is None:
+        yield
+        return
+
+    env = dict(os.environ)
+    env.setdefault("LESS", LESS_OPTIONS)
+    proc = subprocess.Popen(
+        cmd, stdin=subprocess.PIPE, env=env, encoding="utf-8", errors="replace"
+    )
+    assert proc.stdin is not None
+    # Restore the unset file rather than `console.file`, which would pin the
+    # console to the current `sys.stdout` instead of following it
+    file = console._file  # pyright: ignore[reportPrivateUsage]
+    force_terminal = console._force_terminal  # pyright: ignore[reportPrivateUsage]
+    # Keep the colors and width of the terminal the pager is shown in
+    console._force_terminal = True  # pyright: ignore[reportPrivateUsage]
+    console.file = proc.stdin
+    _paging = True
+    try:
+        yield
+    except BrokenPipeError:
+        logger.debug("Pager closed before all output was rendered.")
+    finally:
+        _paging = False
+        console._file = file  # pyright: ignore[reportPrivateUsage]
+        console._force_terminal = force_terminal  # pyright: ignore[reportPrivateUsage]
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        proc.wait()
@@ -0,0 +1,233 @@
+"""Plain text rendering of table renderables.
+
+Rich tables are built from renderables that are measured and wrapped before
+they are printed, which is slow for results with many rows. The functions in
+this module convert the columns and rows of table renderables to plain strings
+instead, flattening nested tables and lists, so that results can be written
+row by row as they are fetched.
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+from collections.abc import Iterable
+from collections.abc import Iterator
+from itertools import chain
+from itertools import islice
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+from typing import cast
+
+from pydantic import BaseModel
+from rich.cells import cell_len
+from rich.cells import set_cell_size
+from rich.table import Table
+from rich.text import Text
+
+from zabbix_cli.utils.rich import get_text
+
+if TYPE_CHECKING:
+    from typing import IO
+
+    from rich.console import RenderableType
+
+    from zabbix_cli.models import TableRenderable
+
+
+class Joiners(NamedTuple):
+    """Separators used to flatten nested values into a single cell."""
+
+    items: str = "; "
+    """Separator between list items and between rows of nested tables."""
+    cells: str = " "
+    """Separator between the cells of a row in a nested table."""
+
+
+@functools.cache
+def uses_default_rows(cls: type[TableRenderable]) -> bool:
+    """Check if a class renders its fields with the default rows."""
+    from zabbix_cli.models import TableRenderable
+
+    return (
+        cls.__rows__ is TableRenderable.__rows__
+        and cls.__cols_rows__ is TableRenderable.__cols_rows__
+    )
+
+
+def plain_cols(obj: TableRenderable, joiners: Joiners = Joiners()) -> list[str]:
+    """Get the column headers of a table renderable as plain strings."""
+    if uses_default_rows(obj.__class__):
+        cols = obj.__cols__()
+    else:
+        cols = obj.__cols_rows__()[0]
+    return [plain_cell(col, joiners) for col in cols]
+
+
+def plain_rows(obj: TableRenderable, joiners: Joiners = Joiners()) -> list[list[str]]:
+    """Get the rows of a table renderable as plain strings.
+
+    Objects that use the default rows have their field values converted
+    directly. Otherwise, the cells of the custom rows are converted."""
+    from zabbix_cli.models import FieldKind
+    from zabbix_cli.models import get_columns
+
+    if not uses_default_rows(obj.__class__):
+        _, rows = obj.__cols_rows__()
+        return [[plain_cell(cell, joiners) for cell in row] for row in rows]
+    row: list[str] = []
+    for column in get_columns(obj.__class__):
+        value = getattr(obj, column.name, "")
+        if column.kind is FieldKind.TEXT:
+            row.append(str(value))
+        else:
+            row.append(plain_value(value, joiners, column.join_char))
+    return [row]
+
+
+def plain_value(
+    value: Any, joiners: Joiners = Joiners(), join_char: str | None = None
+) -> str:
+    """Convert a field value to a plain string.
+
+    Mirrors the conversions of `TableRenderable.__rows__`, but nested
+    table renderables and lists are joined into a single line. A list is
+    joined with its field's join character, unless it contains line breaks."""
+    from zabbix_cli.models import TableRenderable
+
+    if isinstance(value, str):
+        return value
+    if isinstance(value, TableRenderable):
+        return flatten_rows(plain_rows(value, joiners), joiners)
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    if isinstance(value, list):
+        value = cast(list[Any], value)
+        if value and all(isinstance(v, TableRenderable) for v in value):
+            return joiners.items.join(
+                flatten_rows(plain_rows(v, joiners), joiners)
+                for v in cast(list[TableRenderable], value)
+            )
+        if join_char is None or "\n" in join_char:
+            join_char = joiners.items
+        return join_char.join(str(v) for v in value)
+    return str(value)
+
+
+def plain_cell(cell: RenderableType, joiners: Joiners = Joiners()) -> str:
+    """Convert a table cell to a plain string without markup or line breaks."""
+    if isinstance(cell, str):
+        # Styles added by the models are always closed with a closing tag.
+        # Other text that looks like markup, such as item keys, is kept as-is.
+        if "[/" in cell:
+            cell = get_text(cell, log=False).plain
+    elif isinstance(cell, Text):
+        cell = cell.plain
+    elif isinstance(cell, Table):
+        return flatten_table(cell, joiners)
+    else:
+        cell = str(cell)
+    if "\n" in cell:
+        cell = joiners.items.join(cell.splitlines())
+    return cell
+
+
+def flatten_rows(rows: Iterable[Iterable[str]], joiners: Joiners = Joiners()) -> str:
+    """Join the rows of a nested table into a single line.
+    Empty cells are skipped."""
+    return joiners.items.join(
+        joiners.cells.join(cell for cell in row if cell) for row in rows
+    )
+
+
+def flatten_table(table: Table, joiners: Joiners = Joiners()) -> str:
+    """Join the cells of a Rich table into a single line."""
+    columns = [
+        [plain_cell(cell, joiners) for cell in column.cells] for column in table.columns
+    ]
+    return flatten_rows(zip(*columns, strict=True), joiners)
+
+
+def iter_renderables(objects: Iterable[TableRenderable]) -> Iterator[TableRenderable]:
+    """Iterate over objects, unwrapping the items of aggregate results."""
+    from zabbix_cli.models import AggregateResult
+
+    for obj in objects:
+        if isinstance(obj, AggregateResult):
+            yield from iter_renderables(obj.result)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+        else:
+            yield obj
+
+
+def format_plain_table(
+    objects: Iterable[TableRenderable],
+    *,
+    max_width: int,
+    joiners: Joiners = Joiners(),
+    sample: int | None = None,
+) -> Iterator[str]:
+    """Format objects as a fixed-width plain text table, one line at a time.
+
+    Column widths are the width of the widest cell, up to `max_width`.
+    Cells that are wider than their column are truncated.
+
+    If `sample` is given, column widths are computed from the first
+    `sample` rows only, and the remaining objects are converted lazily
+    as lines are consumed."""
+    objs = iter_renderables(objects)
+    first = next(objs, None)
+    if first is None:
+        return
+    cols = plain_cols(first, joiners)
+    rows = (row for obj in chain([first], objs) for row in plain_rows(obj, joiners))
+    head = list(rows if sample is None else islice(rows, sample))
+    if not head:
+        return
+
+    widths = [cell_len(col) for col in cols]
+    for row in head:
+        for i, cell in enumerate(row):
+            if i < len(widths) and (length := cell_len(cell)) > widths[i]:
+                widths[i] = length
+    widths = [max(min(width, max_width), 1) for width in widths]
+
+    yield _format_plain_row(cols, widths)
+    yield _format_plain_row(["-" * width for width in widths], widths)
+    for row in chain(head, rows):
+        yield _format_plain_row(row, widths)
+
+
+def _format_plain_row(row: list[str], widths: list[int]) -> str:
+    cells: list[str] = []
+    for i, width in enumerate(widths):
+        cell = row[i] if i < len(row) else ""
+        length = cell_len(cell)
+        if length > width:
+            cell = set_cell_size(cell, width - 1) + "…"
+        elif length < width:
+            cell += " " * (width - length)
+        cells.append(cell)
+    return "  ".join(cells).rstrip()
+
+
+class CsvWriter:
+    """Writes table renderables as CSV rows.
+
+    The header is written before the first row, so a writer can be
+    used to write the pages of a result one after another."""
+
+    def __init__(self, file: IO[str], joiners: Joiners = Joiners()) -> None:
+        self.file = file
+        self.joiners = joiners
+        self.writer = csv.writer(file, lineterminator="\n")
+        self.header_written = False
+
+    def write(self, objects: Iterable[TableRenderable]) -> None:
+        """Write the rows of the given objects."""
+        for obj in iter_renderables(objects):
+            if not self.header_written:
+                self.writer.writerow(plain_cols(obj, self.joiners))
+                self.header_written = True
+            self.writer.writerows(plain_rows(obj, self.joiners))
+        self.file.flush()
@@ -0,0 +1,47 @@
+"""Progress bars for long-running operations."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from rich.progress import BarColumn
+from rich.progress import MofNCompleteColumn
+from rich.progress import Progress
+from rich.progress import ProgressColumn
+from rich.progress import SpinnerColumn
+from rich.progress import TextColumn
+from rich.progress import TimeElapsedColumn
+from rich.text import Text
+
+from zabbix_cli.output.console import err_console
+
+if TYPE_CHECKING:
+    from rich.progress import Task
+
+
+class RateColumn(ProgressColumn):
+    """Renders the number of completed steps per second."""
+
+    def __init__(self, unit: str = "it") -> None:
+        self.unit = unit
+        super().__init__()
+
+    def render(self, task: Task) -> Text:
+        speed = task.finished_speed or task.speed
+        if speed is None:
+            return Text(f"- {self.unit}/s", style="progress.data.speed")
+        return Text(f"{speed:.1f} {self.unit}/s", style="progress.data.speed")
+
+
+def get_progress(unit: str = "it", *, transient: bool = True) -> Progress:
+    """Get a progress bar that renders to stderr and shows throughput."""
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        RateColumn(unit),
+        TimeElapsedColumn(),
+        transient=transient,
+        console=err_console,
+    )
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
 from contextlib import nullcontext
+from itertools import chain
+from itertools import islice
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -10,13 +15,24 @@ import typer
 from zabbix_cli.output.console import console
 from zabbix_cli.output.console import error
 from zabbix_cli.output.console import success
+from zabbix_cli.output.pager import is_paging
+from zabbix_cli.output.pager import pager
+from zabbix_cli.output.pager import should_page
 from zabbix_cli.state import get_state
 
 if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import IO
+
     from pydantic import BaseModel
 
     from zabbix_cli.models import BaseResult
     from zabbix_cli.models import TableRenderable
+    from zabbix_cli.output.plain import CsvWriter
+
+
+JSON_WRITE_CHUNK_SIZE = 1024 * 1024
+"""Number of bytes written to stdout at a time when writing JSON directly."""
 
 
 def wrap_result(result: BaseModel) -> BaseResult:
@@ -52,14 +68,23 @@ def render_result(
         Additional keyword arguments to pass to the render function.
     """
     from zabbix_cli.config.constants import OutputFormat
+    from zabbix_cli.models import Result
 
     # Short form aliases
     state = get_state()
     fmt = state.config.app.output.format
-    # paging = state.config.output.paging
-    paging = False  # TODO: implement
 
-    ctx_manager = console.pager() if paging else nullcontext()
+    if state.repl:
+        state.result_buffer.record(result)
+    if state.fields or state.sort:
+        result = apply_result_options(result)
+
+    # Messages are always shown in the terminal
+    if state.output_file and not (isinstance(result, Result) and result.message):
+        render_file(state.output_file, [[result]], empty_ok=result.empty_ok)
+        return
+
+    ctx_manager = pager() if should_page() else nullcontext()
     with ctx_manager:
         if fmt == OutputFormat.JSON:
             if state.config.app.legacy_json_format:
@@ -68,23 +93,181 @@ def render_result(
                 render_json(result, ctx, **kwargs)
         elif fmt == OutputFormat.TABLE:
             render_table(result, ctx, **kwargs)
-        # TODO: implement CSV
+        elif fmt == OutputFormat.NDJSON:
+            render_ndjson(result, ctx, **kwargs)
+        elif fmt == OutputFormat.CSV:
+            render_csv(result, ctx, **kwargs)
+        elif fmt == OutputFormat.PLAIN:
+            render_plain(result, ctx, **kwargs)
         else:
             raise ValueError(f"Unknown output format {fmt!r}.")
 
 
+def render_pages(
+    pages: Iterable[Sequence[TableRenderable]],
+    ctx: typer.Context | None = None,
+    *,
+    empty_ok: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Render results fetched page by page.
+
+    With NDJSON and CSV output, and when writing to an output file, each page
+    is written as soon as it is fetched. When paging table or JSON output,
+    pages are fetched as the user scrolls. Otherwise, the pages are
+    collected first.
+    """
+    from zabbix_cli.config.constants import OutputFormat
+    from zabbix_cli.models import AggregateResult
+
+    state = get_state()
+    if state.sort:
+        # Sorting needs all the results
+        render_result(
+            AggregateResult(
+                result=[obj for page in pages for obj in page], empty_ok=empty_ok
+            ),
+            ctx,
+            **kwargs,
+        )
+        return
+    if state.repl:
+        pages = state.result_buffer.record_pages(pages, empty_ok=empty_ok)
+    if state.fields:
+        pages = select_pages(pages, state.fields)
+    if state.output_file:
+        render_file(state.output_file, pages, empty_ok=empty_ok)
+        return
+    fmt = state.config.app.output.format
+    if fmt in (OutputFormat.NDJSON, OutputFormat.CSV):
+        write = get_csv_writer().write if fmt == OutputFormat.CSV else write_ndjson
+        with pager() if should_page() else nullcontext():
+            for page in pages:
+                write(page)
+        return
+
+    objects = (obj for page in pages for obj in page)
+    if should_page() and supports_lazy_paging():
+        with pager():
+            render_lazily(objects, empty_ok=empty_ok)
+        return
+    result = AggregateResult(result=list(objects), empty_ok=empty_ok)
+    # The pages have already been recorded
+    with state.result_buffer.pause() if state.repl else nullcontext():
+        render_result(result, ctx, **kwargs)
+
+
+def apply_result_options(result: TableRenderable) -> TableRenderable:
+    """Sort results and select their fields according to the global
+    `--sort` and `--fields` options.
+
+    Results wrapped in a `Result`, such as messages, are returned as-is."""
+    from zabbix_cli.models import AggregateResult
+    from zabbix_cli.models import Result
+    from zabbix_cli.models import select_fields
+
+    state = get_state()
+    if isinstance(result, AggregateResult):
+        if state.sort:
+            result.sort_by(state.sort)
+        if state.fields:
+            return result.select(state.fields)
+    elif state.fields and not isinstance(result, Result):
+        return select_fields(result, state.fields)
+    return result
+
+
+def select_pages(
+    pages: Iterable[Sequence[TableRenderable]], fields: Sequence[str]
+) -> Iterator[list[TableRenderable]]:
+    """Select the given fields of each object of each page."""
+    from zabbix_cli.models import select_fields
+
+    for page in pages:
+        yield [select_fields(obj, fields) for obj in page]
+
+
+def render_file(
+    path: Path, pages: Iterable[Iterable[TableRenderable]], *, empty_ok: bool
+) -> None:
+    """Write results to a file instead of rendering them."""
+    from zabbix_cli.output.formatting.grammar import pluralize as p
+    from zabbix_cli.output.formatting.path import path_link
+    from zabbix_cli.output.sinks import write_file
+
+    count = write_file(path, pages, empty_ok=empty_ok)
+    success(f"Wrote {p('result', count)} to {path_link(path)}")
+
+
+def render_lazily(objects: Iterator[TableRenderable], *, empty_ok: bool) -> None:
+    """Render objects as they are consumed from an iterator.
+
+    Tables with fewer rows than the plain table threshold are rendered
+    as rich tables once all the objects are consumed."""
+    from zabbix_cli.config.constants import OutputFormat
+    from zabbix_cli.models import AggregateResult
+
+    output = get_state().config.app.output
+    if output.format == OutputFormat.JSON:
+        write_json_lazily(AggregateResult(empty_ok=empty_ok), objects)
+    elif output.format == OutputFormat.PLAIN:
+        write_plain_table(objects, empty_ok=empty_ok)
+    else:
+        threshold = output.plain_threshold
+        head = list(islice(objects, threshold + 1) if threshold else objects)
+        if not threshold or len(head) <= threshold:
+            render_table(AggregateResult(result=head, empty_ok=empty_ok))
+        else:
+            write_plain_table(chain(head, objects), empty_ok=empty_ok)
+
+
+def is_streaming() -> bool:
+    """Check if results are rendered as they are fetched."""
+    from zabbix_cli.config.constants import OutputFormat
+
+    state = get_state()
+    if state.output_file or state.config.app.output.format in (
+        OutputFormat.NDJSON,
+        OutputFormat.CSV,
+    ):
+        return True
+    return should_page() and supports_lazy_paging()
+
+
+def supports_lazy_paging() -> bool:
+    """Check if the output format can be rendered lazily in a pager."""
+    from zabbix_cli.config.constants import OutputFormat
+
+    state = get_state()
+    fmt = state.config.app.output.format
+    if fmt == OutputFormat.JSON:
+        return not state.config.app.legacy_json_format
+    return fmt in (OutputFormat.TABLE, OutputFormat.PLAIN)
+
+
 def render_table(
     result: TableRenderable, ctx: typer.Context | None = None, **kwargs: Any
 ) -> None:
     """Render the result of a command as a table if possible.
     If result contains a message, print success message instead.
+
+    Aggregate results with more rows than the configured threshold
+    are rendered as plain tables.
     """
     # TODO: be able to print message _AND_ table
     # The Result/TableRenderable dichotomy is a bit of a mess
+    from zabbix_cli.models import AggregateResult
     from zabbix_cli.models import Result
     from zabbix_cli.models import ReturnCode
 
-    if isinstance(result, Result) and result.message:
+    threshold = get_state().config.app.output.plain_threshold
+    if (
+        threshold
+        and isinstance(result, AggregateResult)
+        and len(result.result) > threshold  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+    ):
+        render_plain(result, ctx, **kwargs)
+    elif isinstance(result, Result) and result.message:
         if result.return_code == ReturnCode.ERROR:
             error(result.message)
         else:
@@ -98,17 +281,73 @@ def render_table(
             console.print(tbl)
 
 
+def render_plain(
+    result: TableRenderable, ctx: typer.Context | None = None, **kwargs: Any
+) -> None:
+    """Render the result of a command as a plain fixed-width table.
+    If result contains a message, print the message instead.
+    """
+    from zabbix_cli.models import Result
+    from zabbix_cli.models import ReturnCode
+
+    if isinstance(result, Result) and result.message:
+        if result.return_code == ReturnCode.ERROR:
+            error(result.message)
+        else:
+            success(result.message)
+        return
+
+    write_plain_table([result], empty_ok=result.empty_ok)
+
+
+def write_plain_table(objects: Iterable[TableRenderable], *, empty_ok: bool) -> None:
+    """Write objects as a plain table to stdout.
+
+    When paging, column widths are computed from the rows that fit on the
+    first screen, and the remaining rows are formatted as they are written."""
+    from zabbix_cli.output.plain import format_plain_table
+
+    lines = format_plain_table(
+        objects,
+        max_width=get_state().config.app.output.plain_max_width,
+        sample=console.height if is_paging() else None,
+    )
+    header = next(lines, None)
+    if header is None:
+        if not empty_ok:
+            console.print("No results found.")
+        return
+    # Bypass the console, which would measure and wrap every line
+    file = console.file
+    file.write(header + "\n")
+    file.writelines(line + "\n" for line in lines)
+    file.flush()
+
+
 def render_json(
     result: TableRenderable,
     ctx: typer.Context | None = None,
     **kwargs: Any,
 ) -> None:
     """Render the result of a command as JSON."""
+    from zabbix_cli.models import AggregateResult
     from zabbix_cli.models import ReturnCode
 
     result = wrap_result(result)
-    o_json = result.model_dump_json(indent=2, by_alias=True)
-    console.print_json(o_json, indent=2, sort_keys=False)
+    indent = get_json_indent()
+    if is_paging() and isinstance(result, AggregateResult):
+        # Serialize the items as the user scrolls
+        items: list[TableRenderable] = result.result  # pyright: ignore[reportUnknownMemberType]
+        write_json_lazily(result.model_copy(update={"result": []}), items)
+    elif should_write_json():
+        # Write the serialized bytes as-is instead of letting Rich
+        # parse, highlight and re-serialize them
+        write_json(
+            result.__pydantic_serializer__.to_json(result, indent=indent, by_alias=True)
+        )
+    else:
+        o_json = result.model_dump_json(indent=indent, by_alias=True)
+        console.print_json(o_json, indent=indent, sort_keys=False)
     if result.message:
         if result.return_code == ReturnCode.ERROR:
             error(result.message)
@@ -134,10 +373,11 @@ def render_json_legacy(
     """
     from zabbix_cli.models import Result
 
+    indent = get_json_indent()
     # If we have a message, it should not be indexed
     # NOTE: do we have a more accurate heuristic for this?
     if isinstance(result, Result) and result.message:
-        j = result.model_dump_json(indent=2)
+        j = result.model_dump_json(indent=indent)
     else:
         from zabbix_cli.models import AggregateResult
 
@@ -150,5 +390,154 @@ def render_json_legacy(
 
         for idx, item in enumerate(py_result):
             jdict[str(idx)] = item
-        j = json.dumps(jdict, indent=2)
-    console.print_json(j, indent=2, sort_keys=False)
+        j = json.dumps(jdict, indent=indent, ensure_ascii=False)
+    if should_write_json():
+        write_json(j.encode())
+    else:
+        console.print_json(j, indent=indent, sort_keys=False)
+
+
+def render_ndjson(
+    result: TableRenderable,
+    ctx: typer.Context | None = None,
+    **kwargs: Any,
+) -> None:
+    """Render the result of a command as newline-delimited JSON.
+
+    Aggregate results are written with one object per line."""
+    from zabbix_cli.models import AggregateResult
+    from zabbix_cli.models import BaseResult
+    from zabbix_cli.models import ReturnCode
+
+    if isinstance(result, AggregateResult):
+        write_ndjson(result.result)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+    else:
+        write_ndjson([result])
+    if isinstance(result, BaseResult) and result.message:
+        if result.return_code == ReturnCode.ERROR:
+            error(result.message)
+        else:
+            success(result.message)
+
+
+def render_csv(
+    result: TableRenderable,
+    ctx: typer.Context | None = None,
+    **kwargs: Any,
+) -> None:
+    """Render the result of a command as CSV.
+
+    If result contains a message, print the message instead."""
+    from zabbix_cli.models import Result
+    from zabbix_cli.models import ReturnCode
+
+    if isinstance(result, Result) and result.message:
+        if result.return_code == ReturnCode.ERROR:
+            error(result.message)
+        else:
+            success(result.message)
+    else:
+        get_csv_writer().write([result])
+
+
+def get_csv_writer(file: IO[str] | None = None) -> CsvWriter:
+    """Get a CSV writer for stdout, or a file, using the configured separators."""
+    from zabbix_cli.output.plain import CsvWriter
+    from zabbix_cli.output.plain import Joiners
+
+    output = get_state().config.app.output
+    return CsvWriter(
+        file or console.file,
+        Joiners(items=output.csv_list_join, cells=output.csv_cell_join),
+    )
+
+
+def write_ndjson(objects: Iterable[BaseModel], file: IO[str] | None = None) -> None:
+    """Write objects as JSON to stdout, one object per line."""
+    file = file or console.file
+    buffer: IO[bytes] | None = getattr(file, "buffer", None)
+    file.flush()
+    for obj in objects:
+        line = obj.__pydantic_serializer__.to_json(obj, by_alias=True)
+        if buffer is None:
+            file.write(line.decode())
+            file.write("\n")
+        else:
+            buffer.write(line)
+            buffer.write(b"\n")
+    (buffer or file).flush()
+
+
+def write_json_lazily(
+    envelope: BaseResult, items: Iterable[BaseModel], file: IO[str] | None = None
+) -> None:
+    """Write an aggregate result as JSON to stdout, serializing one item at a time.
+
+    The `result` field of the envelope is replaced with the items."""
+    file = file or console.file
+    for chunk in iter_json_chunks(envelope, items, get_json_indent()):
+        file.write(chunk)
+    file.write("\n")
+    file.flush()
+
+
+def iter_json_chunks(
+    envelope: BaseResult, items: Iterable[BaseModel], indent: int | None
+) -> Iterator[str]:
+    """Serialize an aggregate result as JSON one item at a time.
+
+    The concatenated chunks are identical to the serialized result with
+    the items as its `result` field. The envelope must have an empty result."""
+    empty = envelope.__pydantic_serializer__.to_json(
+        envelope, indent=indent, by_alias=True
+    ).decode()
+    marker = '"result": []' if indent else '"result":[]'
+    head, _, tail = empty.rpartition(marker)
+    yield head + marker[:-1]
+    # Items are nested two levels deep
+    newline = "\n" + " " * (2 * indent) if indent else ""
+    first = True
+    for item in items:
+        data = item.__pydantic_serializer__.to_json(
+            item, indent=indent, by_alias=True
+        ).decode()
+        if indent:
+            data = data.replace("\n", newline)
+        yield ("" if first else ",") + newline + data
+        first = False
+    if indent and not first:
+        yield "\n" + " " * indent
+    yield "]" + tail
+
+
+def get_json_indent() -> int | None:
+    """Get the indentation of JSON output. None for compact output."""
+    return None if get_state().config.app.output.compact_json else 2
+
+
+def should_write_json() -> bool:
+    """Check if JSON output can be written directly to stdout.
+
+    Highlighting is only useful in a terminal with colors, and re-parsing
+    the JSON to highlight it is expensive for large results."""
+    return not console.is_terminal or console.color_system is None
+
+
+def write_json(data: bytes, file: IO[str] | None = None) -> None:
+    """Write serialized JSON followed by a newline to stdout in chunks,
+    bypassing the Rich console."""
+    file = file or console.file
+    buffer: IO[bytes] | None = getattr(file, "buffer", None)
+    if buffer is None:
+        # Text-only stream, such as a StringIO
+        file.write(data.decode())
+        file.write("\n")
+        file.flush()
+        return
+    # Text written to the stream so far must come before the JSON
+    file.flush()
+    view = memoryview(data)
+    for i in range(0, len(view), JSON_WRITE_CHUNK_SIZE):
+        buffer.write(view[i : i + JSON_WRITE_CHUNK_SIZE])
+    buffer.write(b"\n")
+    buffer.flush()
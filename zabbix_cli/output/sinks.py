@@ -0,0 +1,211 @@
+"""Writing of command results directly to files.
+
+Results are written to a file in JSON, NDJSON or CSV format, or to a table in
+a SQLite database, without being rendered in the terminal. Results that are
+fetched page by page are written as each page is fetched.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from collections.abc import Iterator
+from pathlib import Path
+from types import UnionType
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Union
+from typing import get_args
+from typing import get_origin
+
+import click
+from strenum import StrEnum
+
+from zabbix_cli.exceptions import ZabbixCLIFileError
+from zabbix_cli.output.plain import CsvWriter
+from zabbix_cli.output.plain import iter_renderables
+
+if TYPE_CHECKING:
+    from typing import IO
+
+    from zabbix_cli.models import TableRenderable
+
+SQLITE_BATCH_SIZE = 1000
+"""Number of rows inserted into a SQLite table at a time."""
+
+
+class SinkFormat(StrEnum):
+    """Format of a file results are written to."""
+
+    JSON = "json"
+    NDJSON = "ndjson"
+    CSV = "csv"
+    SQLITE = "sqlite"
+
+
+FILE_EXTENSIONS = {
+    ".json": SinkFormat.JSON,
+    ".ndjson": SinkFormat.NDJSON,
+    ".jsonl": SinkFormat.NDJSON,
+    ".csv": SinkFormat.CSV,
+    ".db": SinkFormat.SQLITE,
+    ".sqlite": SinkFormat.SQLITE,
+    ".sqlite3": SinkFormat.SQLITE,
+}
+
+
+def get_sink_format(path: Path) -> SinkFormat:
+    """Get the format of a file from its extension.
+
+    Files without a known extension use the configured output format if
+    it can be written to a file, otherwise JSON."""
+    from zabbix_cli.state import get_state
+
+    if fmt := FILE_EXTENSIONS.get(path.suffix.lower()):
+        return fmt
+    output_format = get_state().config.app.output.format
+    if output_format in (SinkFormat.JSON, SinkFormat.NDJSON, SinkFormat.CSV):
+        return SinkFormat(output_format)
+    return SinkFormat.JSON
+
+
+def get_table_name() -> str:
+    """Get the name of the SQLite table to write results to.
+
+    Tables are named after the command that produced the results."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and ctx.command.name:
+        return ctx.command.name.replace("-", "_")
+    return "results"
+
+
+def write_file(
+    path: Path, pages: Iterable[Iterable[TableRenderable]], *, empty_ok: bool = False
+) -> int:
+    """Write results to a file, one page at a time.
+
+    Results are written as rows, with one row per item of aggregate results.
+    Returns the number of rows written."""
+    fmt = get_sink_format(path)
+    count = 0
+
+    def iter_objects() -> Iterator[TableRenderable]:
+        nonlocal count
+        for obj in iter_renderables(obj for page in pages for obj in page):
+            count += 1
+            yield obj
+
+    try:
+        if fmt == SinkFormat.SQLITE:
+            write_sqlite(path, get_table_name(), iter_objects())
+        else:
+            with path.open("w", encoding="utf-8") as f:
+                write_text(f, fmt, iter_objects(), empty_ok=empty_ok)
+    except (OSError, sqlite3.Error) as e:
+        raise ZabbixCLIFileError(f"Failed to write results to {path}: {e}") from e
+    return count
+
+
+def write_text(
+    file: IO[str],
+    fmt: SinkFormat,
+    objects: Iterable[TableRenderable],
+    *,
+    empty_ok: bool = False,
+) -> None:
+    """Write objects to a text file in JSON, NDJSON or CSV format.
+
+    JSON is written as an aggregate result with the objects as its result."""
+    from zabbix_cli.models import AggregateResult
+    from zabbix_cli.output.render import write_json_lazily
+    from zabbix_cli.output.render import write_ndjson
+
+    if fmt == SinkFormat.JSON:
+        write_json_lazily(AggregateResult(empty_ok=empty_ok), objects, file)
+    elif fmt == SinkFormat.NDJSON:
+        write_ndjson(objects, file)
+    elif fmt == SinkFormat.CSV:
+        CsvWriter(file).write(objects)
+    else:
+        raise ValueError(f"Cannot write {fmt} to a text file.")
+
+
+def write_sqlite(path: Path, table: str, objects: Iterable[TableRenderable]) -> None:
+    """Write objects to a SQLite table, replacing the table if it exists.
+
+    The columns of the table are created from the fields of the first object.
+    The table is dropped even if there are no objects, so no stale rows are
+    left behind. Nested values are stored as JSON strings."""
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            # Single transaction, so the table is only replaced once all
+            # objects have been written
+            conn.execute("BEGIN")
+            conn.execute(f"DROP TABLE IF EXISTS {quote(table)}")
+            columns: list[str] = []
+            batch: list[list[Any]] = []
+            insert = ""
+            for obj in objects:
+                data = obj.__pydantic_serializer__.to_python(
+                    obj, mode="json", by_alias=True
+                )
+                if not columns:
+                    columns = list(data)
+                    conn.execute(create_table_sql(table, obj, columns))
+                    insert = (
+                        f"INSERT INTO {quote(table)} ({', '.join(map(quote, columns))}) "
+                        f"VALUES ({', '.join('?' * len(columns))})"
+                    )
+                batch.append([sqlite_value(data.get(col)) for col in columns])
+                if len(batch) >= SQLITE_BATCH_SIZE:
+                    conn.executemany(insert, batch)
+                    batch.clear()
+            if batch:
+                conn.executemany(insert, batch)
+    finally:
+        conn.close()
+
+
+def create_table_sql(table: str, obj: TableRenderable, columns: list[str]) -> str:
+    """Get the statement that creates a table for the fields of an object."""
+    types: dict[str, str] = {}
+    fields = {**type(obj).model_fields, **type(obj).model_computed_fields}
+    for name, field in fields.items():
+        alias = getattr(field, "serialization_alias", None) or getattr(
+            field, "alias", None
+        )
+        annotation = getattr(field, "annotation", None) or getattr(
+            field, "return_type", None
+        )
+        types[alias or name] = sqlite_type(annotation)
+    defs = ", ".join(f"{quote(col)} {types.get(col, 'TEXT')}" for col in columns)
+    return f"CREATE TABLE {quote(table)} ({defs})"
+
+
+def sqlite_type(annotation: Any) -> str:
+    """Get the SQLite column type for a field type annotation."""
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return sqlite_type(args[0])
+        return "TEXT"
+    if isinstance(annotation, type):
+        if issubclass(annotation, (bool, int)):
+            return "INTEGER"
+        if issubclass(annotation, float):
+            return "REAL"
+    return "TEXT"
+
+
+def sqlite_value(value: Any) -> Any:
+    """Convert a JSON-serialized value to a value that can be stored in SQLite."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def quote(identifier: str) -> str:
+    """Quote a SQLite identifier."""
+    return '"' + identifier.replace('"', '""') + '"'
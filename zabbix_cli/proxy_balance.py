@@ -0,0 +1,275 @@
+"""Rebalancing of hosts between proxies.
+
+Every host that changes proxy causes a configuration resync and a gap in
+monitoring, so rebalancing computes a target number of hosts per proxy from
+the weights and only moves the surplus hosts of proxies above their target
+to the proxies below it. Proxies that are already balanced are untouched.
+
+With consistent hashing, each host ranks the proxies by a weighted
+rendezvous hash of the host and proxy IDs. Hosts with the weakest affinity
+to their current proxy are moved first, and moved hosts go to the proxy
+they rank highest, so assignments stay stable between runs and when
+proxies are added or removed.
+
+Hosts can be weighted by their load instead of counted, since a switch
+with thousands of items costs a proxy far more than a VM with a hundred.
+The load of a host is either its number of enabled items, or the values
+per second its enabled items are estimated to require. Item counts are
+fetched per host with a single counting `item.get` request per chunk of
+hosts. Estimating values per second requires fetching the items themselves,
+so hosts are chunked by their number of items instead, keeping the size of
+each response bounded regardless of how many items a host has.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import re
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+
+from strenum import StrEnum
+
+if TYPE_CHECKING:
+    from zabbix_cli.pyzabbix.client import ZabbixAPI
+    from zabbix_cli.pyzabbix.types import Host
+    from zabbix_cli.pyzabbix.types import Proxy
+
+logger = logging.getLogger(__name__)
+
+HOST_LOAD_CHUNK_SIZE = 500
+"""Number of hosts whose items are counted per request."""
+
+ITEM_CHUNK_SIZE = 10_000
+"""Maximum number of items fetched per request when estimating values per second.
+Hosts with more items are fetched on their own."""
+
+DEFAULT_ITEM_DELAY = 60.0
+"""Update interval in seconds assumed for items with an interval that cannot
+be parsed, such as one defined by a user macro."""
+
+DELAY_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+DELAY_PATTERN = re.compile(r"^(\d+)([smhdw]?)$")
+
+
+class LoadMetric(StrEnum):
+    """Metric hosts are weighted by when balancing."""
+
+    HOSTS = "hosts"
+    ITEMS = "items"
+    NVPS = "nvps"
+    """Estimated new values per second."""
+
+
+@dataclass
+class HostLoad:
+    """Load a host puts on its proxy."""
+
+    items: int = 0
+    """Number of enabled items."""
+    nvps: float = 0.0
+    """Estimated new values per second of the enabled items."""
+
+    def get(self, metric: LoadMetric) -> float:
+        if metric == LoadMetric.ITEMS:
+            return self.items
+        elif metric == LoadMetric.NVPS:
+            return self.nvps
+        return 1
+
+
+def parse_delay(delay: str | None) -> float:
+    """Get the update interval in seconds from an item's delay.
+
+    Only the default interval before any flexible or scheduling intervals
+    is used. Items without an interval of their own, such as trapper and
+    dependent items, have a delay of 0."""
+    base = (delay or "0").split(";", 1)[0].strip()
+    if match := DELAY_PATTERN.match(base):
+        return int(match.group(1)) * DELAY_UNITS[match.group(2)]
+    return DEFAULT_ITEM_DELAY
+
+
+def chunk_by_items(
+    hostids: Sequence[str], loads: Mapping[str, HostLoad], max_items: int
+) -> Iterator[list[str]]:
+    """Split hosts into chunks with at most `max_items` items in total.
+
+    Hosts without items are omitted."""
+    chunk: list[str] = []
+    size = 0
+    for hostid in hostids:
+        items = loads[hostid].items
+        if not items:
+            continue
+        if chunk and size + items > max_items:
+            yield chunk
+            chunk = []
+            size = 0
+        chunk.append(hostid)
+        size += items
+    if chunk:
+        yield chunk
+
+
+def get_host_loads(
+    client: ZabbixAPI,
+    hosts: Sequence[Host],
+    *,
+    nvps: bool = True,
+    chunk_size: int = HOST_LOAD_CHUNK_SIZE,
+    item_chunk_size: int = ITEM_CHUNK_SIZE,
+) -> dict[str, HostLoad]:
+    """Compute the load of hosts from their enabled items, by host ID.
+
+    Values per second are only estimated if `nvps` is True."""
+    loads = {host.hostid: HostLoad() for host in hosts}
+    hostids = list(loads)
+    for i in range(0, len(hostids), chunk_size):
+        counts = client.get_item_counts(hostids[i : i + chunk_size])
+        for hostid, count in counts.items():
+            if load := loads.get(hostid):
+                load.items = count
+    if nvps:
+        for chunk in chunk_by_items(hostids, loads, item_chunk_size):
+            for hostid, delay in client.get_item_delays(chunk):
+                load = loads.get(hostid)
+                if load is not None and (seconds := parse_delay(delay)):
+                    load.nvps += 1 / seconds
+    logger.debug("Computed load of %d hosts", len(loads))
+    return loads
+
+
+@dataclass
+class ProxyBalance:
+    """Current hosts and planned moves for a proxy."""
+
+    proxy: Proxy
+    weight: int
+    hosts: list[Host]
+    """Hosts currently monitored by the proxy."""
+    target: float = 0
+    """Load the proxy should have after rebalancing."""
+    load: float = 0
+    """Load of the hosts currently monitored by the proxy."""
+    load_after: float = 0
+    """Load of the proxy after rebalancing."""
+    incoming: list[Host] = field(default_factory=list)
+    outgoing: list[Host] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        """Number of hosts after rebalancing."""
+        return len(self.hosts) - len(self.outgoing) + len(self.incoming)
+
+
+@dataclass
+class HostMove:
+    """A host moved from one proxy to another."""
+
+    host: Host
+    source: ProxyBalance
+    destination: ProxyBalance
+
+
+def get_targets(total: int, weights: Sequence[int]) -> list[int]:
+    """Divide a number of hosts between proxies by weight.
+
+    Uses the largest remainder method, so the targets add up to the total."""
+    weight_sum = sum(weights)
+    if not weight_sum:
+        raise ValueError("At least one weight must be non-zero")
+    quotas = [total * w / weight_sum for w in weights]
+    targets = [math.floor(q) for q in quotas]
+    remaining = total - sum(targets)
+    by_remainder = sorted(
+        range(len(weights)), key=lambda i: quotas[i] - targets[i], reverse=True
+    )
+    for i in by_remainder[:remaining]:
+        targets[i] += 1
+    return targets
+
+
+def rendezvous_score(host: Host, proxy: Proxy, weight: int) -> float:
+    """Weighted rendezvous hash score of a host on a proxy. Higher is preferred."""
+    digest = hashlib.sha256(f"{host.hostid}:{proxy.proxyid}".encode()).digest()
+    # Uniform in (0, 1), never 0 or 1
+    u = (int.from_bytes(digest[:8], "big") + 0.5) / 2**64
+    return -weight / math.log(u)
+
+
+def plan_rebalance(
+    balances: Sequence[ProxyBalance],
+    *,
+    consistent: bool = False,
+    loads: Mapping[str, float] | None = None,
+) -> list[HostMove]:
+    """Plan the moves needed to bring each proxy to its share of the load.
+
+    Hosts are counted unless the load of each host is given by host ID. Sets the target, load, incoming and outgoing hosts of each proxy,
+    and returns the moves. Only surplus hosts are moved, and a host is only
+    moved if doing so brings both proxies closer to their targets."""
+
+    def get_load(host: Host) -> float:
+        return loads[host.hostid] if loads is not None else 1
+
+    def affinity(host: Host, balance: ProxyBalance) -> float:
+        return rendezvous_score(host, balance.proxy, balance.weight)
+
+    weights = [b.weight for b in balances]
+    for balance in balances:
+        balance.load = balance.load_after = sum(get_load(h) for h in balance.hosts)
+        balance.incoming = []
+        balance.outgoing = []
+    total = sum(b.load for b in balances)
+    if loads is not None:
+        weight_sum = sum(weights)
+        targets: list[float] = [total * w / weight_sum for w in weights]
+    else:
+        targets = list(get_targets(sum(len(b.hosts) for b in balances), weights))
+    for balance, target in zip(balances, targets, strict=True):
+        balance.target = target
+
+    leaving: list[tuple[Host, ProxyBalance]] = []
+    for balance in balances:
+        surplus = balance.load - balance.target
+        if surplus <= 0:
+            continue
+        if consistent:
+            candidates = sorted(balance.hosts, key=lambda h: affinity(h, balance))
+        else:
+            # Move the heaviest, then the most recently created hosts
+            candidates = sorted(
+                balance.hosts, key=lambda h: (get_load(h), int(h.hostid)), reverse=True
+            )
+        for host in candidates:
+            if surplus <= 0:
+                break
+            host_load = get_load(host)
+            if host_load < 2 * surplus:
+                leaving.append((host, balance))
+                surplus -= host_load
+
+    moves: list[HostMove] = []
+    receiving = [b for b in balances if b.target > b.load]
+    for host, source in leaving:
+        host_load = get_load(host)
+        open_ = [b for b in receiving if host_load < 2 * (b.target - b.load_after)]
+        if not open_:
+            continue
+        if consistent:
+            destination = max(open_, key=lambda b: affinity(host, b))
+        else:
+            destination = max(open_, key=lambda b: b.target - b.load_after)
+        source.outgoing.append(host)
+        source.load_after -= host_load
+        destination.incoming.append(host)
+        destination.load_after += host_load
+        moves.append(HostMove(host, source, destination))
+    return moves
@@ -16,13 +16,17 @@ from __future__ import annotations
 
 import logging
 import ssl
+import threading
+from collections.abc import Iterator
 from collections.abc import MutableMapping
+from collections.abc import Sequence
 from datetime import datetime
 from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Literal
+from typing import TypeVar
 from typing import cast
 
 import httpx
@@ -54,6 +58,9 @@ from zabbix_cli.pyzabbix.enums import MonitoringStatus
 from zabbix_cli.pyzabbix.enums import TriggerPriority
 from zabbix_cli.pyzabbix.enums import UsergroupPermission
 from zabbix_cli.pyzabbix.enums import UserRole
+from zabbix_cli.pyzabbix.mass import DEFAULT_CHUNK_SIZE
+from zabbix_cli.pyzabbix.mass import MassOperation
+from zabbix_cli.pyzabbix.mass import MassOperationResult
 from zabbix_cli.pyzabbix.types import CreateHostInterfaceDetails
 from zabbix_cli.pyzabbix.types import Event
 from zabbix_cli.pyzabbix.types import GlobalMacro
@@ -85,14 +92,19 @@ from zabbix_cli.pyzabbix.types import ZabbixRight
 from zabbix_cli.utils.utils import get_acknowledge_action_value
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from httpx._types import TimeoutTypes
     from typing_extensions import TypedDict
 
     from zabbix_cli.config.model import Config
+    from zabbix_cli.pyzabbix.lookup import LookupTable
+    from zabbix_cli.pyzabbix.proxy_selector import ProxySelector
     from zabbix_cli.pyzabbix.types import ModifyGroupParams
     from zabbix_cli.pyzabbix.types import ModifyHostParams
     from zabbix_cli.pyzabbix.types import ModifyTemplateParams
     from zabbix_cli.pyzabbix.types import SortOrder
+    from zabbix_cli.repl.names import ObjectNames
 
     class HTTPXClientKwargs(TypedDict, total=False):
         timeout: TimeoutTypes
@@ -102,6 +114,11 @@ logger = logging.getLogger(__name__)
 
 RPC_ENDPOINT = "/api_jsonrpc.php"
 
+DEFAULT_PAGE_SIZE = 1000
+"""Number of objects per request when fetching objects page by page."""
+
+T = TypeVar("T")
+
 
 def strip_none(data: dict[str, Any]) -> dict[str, Any]:
     """Recursively strip None values from a dictionary."""
@@ -235,6 +252,15 @@ def get_returned_list(returned: Any, key: str, endpoint: str) -> list[str]:
     return cast(list[str], response_list)
 
 
+class RequestStats(threading.local):
+    """Number of API requests made and bytes transferred by the current thread."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.bytes = 0
+        """Bytes sent and received."""
+
+
 class ZabbixAPI:
     def __init__(
         self,
@@ -242,11 +268,17 @@ class ZabbixAPI:
         *,
         timeout: int | None = None,
         verify_ssl: bool | Path = True,
+        mass_chunk_size: int = DEFAULT_CHUNK_SIZE,
+        mass_jobs: int = 1,
+        page_size: int = DEFAULT_PAGE_SIZE,
     ) -> None:
         """Parameters:
         server: Base URI for zabbix web interface (omitting /api_jsonrpc.php)
         timeout: Read and connect timeout for HTTP requests in seconds.
         verify_ssl: Verify SSL certificates. Can be a boolean or a path to a CA bundle.
+        mass_chunk_size: Initial number of objects per request for mass operations.
+        mass_jobs: Number of mass operation requests to run concurrently.
+        page_size: Number of objects per request when fetching objects page by page.
         """
         self.timeout = timeout if timeout else None
         self.session = self._get_client(verify_ssl=verify_ssl, timeout=timeout)
@@ -254,10 +286,28 @@ class ZabbixAPI:
         self.auth = ""
         self.use_api_token = False
         self.id = 0
+        self._id_lock = threading.Lock()
+        """Lock for request IDs. The client can be shared between threads."""
+        self.lookup: LookupTable | None = None
+        """Lookup table of prefetched objects used instead of the API when set."""
+        self.names: ObjectNames | None = None
+        """Names of objects completed in the REPL, marked as stale when modified."""
+        self.stats = RequestStats()
+        """Requests made by the current thread."""
+        self.mass_chunk_size = mass_chunk_size
+        self.mass_jobs = mass_jobs
+        self.page_size = page_size
 
         self.url = self._get_url(server)
         logger.info("JSON-RPC Server Endpoint: %s", self.url)
 
+    @cached_property
+    def proxy_selector(self) -> ProxySelector:
+        """Proxy selector shared by all commands in the session."""
+        from zabbix_cli.pyzabbix.proxy_selector import ProxySelector
+
+        return ProxySelector(self)
+
     def _get_url(self, server: str) -> str:
         """Format a URL for the Zabbix API."""
         server, _, _ = server.partition(RPC_ENDPOINT)
@@ -275,6 +325,9 @@ class ZabbixAPI:
             server=config.api.url,
             timeout=config.api.timeout,
             verify_ssl=config.api.verify_ssl,
+            mass_chunk_size=config.api.mass_chunk_size,
+            mass_jobs=config.api.mass_jobs,
+            page_size=config.api.page_size,
         )
         return client
 
@@ -431,6 +484,19 @@ class ZabbixAPI:
             },
         ).result
 
+    def confimportcompare(
+        self, format: ExportFormat, source: str, rules: ImportRules
+    ) -> Any:
+        """Alias for configuration.importcompare, analogous to `confimport`."""
+        return self.do_request(
+            method="configuration.importcompare",
+            params={
+                "format": format,
+                "source": source,
+                "rules": rules.model_dump_api(),
+            },
+        ).result
+
     @cached_property
     def version(self) -> Version:
         """`api_version()` exposed as a cached property."""
@@ -445,16 +511,47 @@ class ZabbixAPI:
         except InvalidVersion as e:
             raise ZabbixAPIException("Got invalid Zabbix version from API") from e
 
+    def _lookup(
+        self, object_type: str, names_or_ids: tuple[str, ...], *, search: bool
+    ) -> Any:
+        """Look up objects in the lookup table, if any.
+
+        Like `parse_name_or_id_arg`, multiple names are always searched for,
+        and IDs are never searched for.
+
+        Returns None if the objects cannot be served from the table."""
+        if self.lookup is None or any("*" in n for n in names_or_ids):
+            return None
+        if not names_or_ids:
+            return self.lookup.get_all(object_type)
+        ids = [n for n in names_or_ids if n.strip().isnumeric()]
+        if len(ids) == len(names_or_ids):
+            return self.lookup.get(object_type, names_or_ids)
+        if ids:
+            # IDs and names cannot be mixed
+            return None
+        if search or len(names_or_ids) > 1:
+            return self.lookup.search(object_type, names_or_ids)
+        return self.lookup.get(object_type, names_or_ids)
+
     def do_request(
         self, method: str, params: ParamsType | Json | None = None
     ) -> ZabbixAPIResponse:
         params = params or {}
+        if self.lookup is not None:
+            self.lookup.invalidate(method)
+        if self.names is not None:
+            self.names.invalidate(method)
+
+        with self._id_lock:
+            request_id = self.id
+            self.id += 1
 
         request_json = {
             "jsonrpc": "2.0",
             "method": method,
             "params": params,
-            "id": self.id,
+            "id": request_id,
         }
         request_headers: dict[str, str] = {}
 
@@ -472,6 +569,7 @@ class ZabbixAPI:
 
         logger.debug("Sending %s to %s", method, self.url)
 
+        self.stats.calls += 1
         try:
             response = self.session.post(
                 self.url, json=request_json, headers=request_headers
@@ -481,6 +579,7 @@ class ZabbixAPI:
                 f"Failed to send request to {self.url} ({method}) with params {params}",
                 params=params,
             ) from e
+        self.stats.bytes += len(response.request.content) + len(response.content)
 
         logger.debug("Response Code: %s", str(response.status_code))
 
@@ -492,8 +591,6 @@ class ZabbixAPI:
         if not len(response.text):
             raise ZabbixAPIRequestError("Received empty response", response=response)
 
-        self.id += 1
-
         try:
             resp = ZabbixAPIResponse.model_validate_json(response.text)
         except ValidationError as e:
@@ -509,6 +606,70 @@ class ZabbixAPI:
 
         return resp
 
+    def run_chunked(
+        self,
+        func: Callable[[list[T]], object],
+        items: Sequence[T],
+        *,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> MassOperationResult[T]:
+        """Apply a mass operation to a list of objects in adaptively sized chunks.
+
+        Args:
+            func: Function performing the mass API call for a chunk of objects.
+            items: Objects to apply the operation to.
+            on_progress: Called with the number of objects completed after each chunk.
+        """
+        operation = MassOperation(
+            func,
+            chunk_size=self.mass_chunk_size,
+            jobs=self.mass_jobs,
+            on_progress=on_progress,
+        )
+        return operation.run(items)
+
+    def get_pages(
+        self,
+        object_type: str,
+        params: ParamsType,
+        *,
+        id_field: str,
+        page_size: int | None = None,
+    ) -> Iterator[list[Any]]:
+        """Fetch objects of a given type page by page.
+
+        The API has no offset-based pagination, so the IDs of all matching
+        objects are fetched first, in the requested order, and the objects
+        themselves are then fetched by ID one page at a time. Only one page
+        of objects is held in memory, and the first page is available as soon
+        as it is fetched.
+
+        Args:
+            object_type: API object type, i.e. `host`.
+            params: Parameters for the `get` method.
+            id_field: Name of the ID property of the objects, i.e. `hostid`.
+            page_size: Number of objects per page. Fetches all objects in a
+                single request if None.
+        """
+        api = getattr(self, object_type)
+        if not page_size:
+            yield api.get(**params) or []
+            return
+
+        # Only the IDs are needed, not any of the related objects
+        id_params = {k: v for k, v in params.items() if not k.startswith("select")}
+        id_params["output"] = [id_field]
+        ids = [obj[id_field] for obj in api.get(**id_params) or []]
+        logger.debug(
+            "Fetching %d %s objects in pages of %d", len(ids), object_type, page_size
+        )
+
+        # The limit is already applied to the IDs
+        page_params = {k: v for k, v in params.items() if k != "limit"}
+        for i in range(0, len(ids), page_size):
+            page_params[f"{id_field}s"] = ids[i : i + page_size]
+            yield api.get(**page_params) or []
+
     def _check_response_errors(
         self,
         resp: ZabbixAPIResponse,
@@ -628,6 +789,16 @@ class ZabbixAPI:
         Returns:
             List[HostGroup]: List of host groups.
         """
+        if (
+            names_or_ids
+            and search_union
+            and not any((select_hosts, select_templates, sort_order, sort_field, limit))
+        ):
+            if (
+                cached := self._lookup("hostgroup", names_or_ids, search=search)
+            ) is not None:
+                return cached
+
         params: ParamsType = {"output": "extend"}
         params = parse_name_or_id_arg(
             params,
@@ -866,6 +1037,87 @@ class ZabbixAPI:
     ) -> list[Host]:
         """Fetches all hosts matching the given criteria(s).
 
+        See `iter_hosts` for a description of the arguments.
+        """
+        return [
+            host
+            for page in self.iter_hosts(
+                *names_or_ids,
+                select_groups=select_groups,
+                select_templates=select_templates,
+                select_inventory=select_inventory,
+                select_macros=select_macros,
+                select_interfaces=select_interfaces,
+                proxy=proxy,
+                proxy_group=proxy_group,
+                hostgroups=hostgroups,
+                maintenance=maintenance,
+                monitored=monitored,
+                active_interface=active_interface,
+                sort_field=sort_field,
+                sort_order=sort_order,
+                search=search,
+                limit=limit,
+            )
+            for host in page
+        ]
+
+    def get_hosts_by_name(
+        self,
+        *names: str,
+        select_groups: bool = False,
+        select_templates: bool = False,
+        select_inventory: bool = False,
+        select_macros: bool = False,
+    ) -> list[Host]:
+        """Fetches the hosts with the given names.
+
+        Unlike `get_hosts`, names are matched exactly, even when
+        multiple names are given, and are never treated as IDs.
+        See `iter_hosts` for a description of the `select_*` arguments.
+        """
+        if not names:
+            return []
+        params: ParamsType = {"output": "extend", "filter": {"host": list(names)}}
+        if select_groups:
+            params[compat.param_host_get_groups(self.version)] = "extend"
+        if select_templates:
+            params["selectParentTemplates"] = "extend"
+        if select_inventory:
+            params["selectInventory"] = "extend"
+        if select_macros:
+            params["selectMacros"] = "extend"
+        try:
+            resp = self.host.get(**params)
+        except ZabbixAPIException as e:
+            raise ZabbixAPICallError("Failed to fetch hosts") from e
+        return [Host(**r) for r in resp]
+
+    def iter_hosts(
+        self,
+        *names_or_ids: str,
+        select_groups: bool = False,
+        select_templates: bool = False,
+        select_inventory: bool = False,
+        select_macros: bool = False,
+        select_interfaces: bool = False,
+        proxy: Proxy | None = None,
+        proxy_group: ProxyGroup | None = None,
+        hostgroups: list[HostGroup] | None = None,
+        # These params take special API values we don't want to evaluate
+        # inside this method, so we delegate it to the enums.
+        maintenance: MaintenanceStatus | None = None,
+        monitored: MonitoringStatus | None = None,
+        active_interface: ActiveInterface | None = None,
+        sort_field: str | None = None,
+        sort_order: Literal["ASC", "DESC"] | None = None,
+        search: bool = True,  # we generally always want to search when multiple hosts are requested
+        limit: int | None = None,
+        page_size: int | None = None,
+        output: list[str] | None = None,
+    ) -> Iterator[list[Host]]:
+        """Fetches all hosts matching the given criteria(s) page by page.
+
         Hosts can be filtered by name or ID. Names and IDs cannot be mixed.
         If no criteria are given, all hosts are returned.
 
@@ -890,14 +1142,17 @@ class ZabbixAPI:
             sort_field (Optional[str], optional): Sort hosts by the given field. Defaults to None.
             sort_order (Optional[Literal[ASC, DESC]], optional): Sort order. Defaults to None.
             search (Optional[bool], optional): Force positional arguments to be treated as a search pattern. Defaults to True.
+            limit (Optional[int], optional): Maximum number of hosts. Defaults to None.
+            page_size (Optional[int], optional): Number of hosts per page. Fetches all hosts in one page if None. Defaults to None.
+            output (Optional[List[str]], optional): Host properties to fetch. Fetches all properties if None. Defaults to None.
 
         Raises:
             ZabbixAPIException: _description_
 
         Returns:
-            List[Host]: _description_
+            Iterator[List[Host]]: Pages of hosts.
         """
-        params: ParamsType = {"output": "extend"}
+        params: ParamsType = {"output": output or "extend"}
 
         params = parse_name_or_id_arg(
             params,
@@ -946,9 +1201,11 @@ class ZabbixAPI:
             params, sort_field=sort_field, sort_order=sort_order, limit=limit
         )
 
-        resp: list[Any] = self.host.get(**params) or []
         # TODO add result to cache
-        return [Host(**r) for r in resp]
+        for page in self.get_pages(
+            "host", params, id_field="hostid", page_size=page_size
+        ):
+            yield [Host(**r) for r in page]
 
     def get_host_count(self, params: ParamsType | None = None) -> int:
         """Fetches the total number of hosts in the Zabbix server."""
@@ -975,6 +1232,43 @@ class ZabbixAPI:
         inventory: dict[str, Any] | None = None,
         description: str | None = None,
     ) -> str:
+        params = self.get_create_host_params(
+            host,
+            groups,
+            proxy=proxy,
+            status=status,
+            interfaces=interfaces,
+            inventory_mode=inventory_mode,
+            inventory=inventory,
+            description=description,
+        )
+        try:
+            resp = self.host.create(**params)
+        except ZabbixAPIException as e:
+            raise ZabbixAPICallError(f"Failed to create host {host!r}") from e
+        if not resp or not resp.get("hostids"):
+            raise ZabbixAPICallError(
+                "Host creation returned no data. Unable to determine if host was created."
+            )
+        return str(resp["hostids"][0])
+
+    def get_create_host_params(
+        self,
+        host: str,
+        groups: list[HostGroup],
+        proxy: Proxy | None = None,
+        status: MonitoringStatus = MonitoringStatus.ON,
+        interfaces: Sequence[HostInterface | dict[str, Any]] | None = None,
+        inventory_mode: InventoryMode = InventoryMode.AUTOMATIC,
+        inventory: dict[str, Any] | None = None,
+        description: str | None = None,
+        templates: list[Template] | None = None,
+        macros: dict[str, str] | None = None,
+    ) -> ParamsType:
+        """Get the parameters for creating a host with `host.create`.
+
+        Interfaces can be given as API parameters, i.e. for SNMP
+        interfaces with details."""
         params: ParamsType = {
             "host": host,
             "status": status.as_api_value(),
@@ -991,7 +1285,10 @@ class ZabbixAPI:
                 params["monitored_by"] = MonitoredBy.PROXY.as_api_value()
 
         if interfaces:
-            params["interfaces"] = [iface.model_dump_api() for iface in interfaces]
+            params["interfaces"] = [
+                iface.model_dump_api() if isinstance(iface, HostInterface) else iface
+                for iface in interfaces
+            ]
 
         if inventory:
             params["inventory"] = inventory
@@ -999,15 +1296,33 @@ class ZabbixAPI:
         if description:
             params["description"] = description
 
+        if templates:
+            templateids = list({template.templateid for template in templates})
+            params["templates"] = [{"templateid": tid} for tid in templateids]
+
+        if macros:
+            params["macros"] = [
+                {"macro": macro, "value": value} for macro, value in macros.items()
+            ]
+        return params
+
+    def create_hosts(self, hosts: list[ParamsType]) -> list[str]:
+        """Creates multiple hosts in a single request.
+
+        The request fails as a whole if any of the hosts cannot be created.
+
+        Args:
+            hosts (list[ParamsType]): Parameters for each host.
+                See `get_create_host_params`.
+
+        Returns:
+            list[str]: IDs of the created hosts, in the same order as `hosts`.
+        """
         try:
-            resp = self.host.create(**params)
+            resp = self.host.create(*hosts)
         except ZabbixAPIException as e:
-            raise ZabbixAPICallError(f"Failed to create host {host!r}") from e
-        if not resp or not resp.get("hostids"):
-            raise ZabbixAPICallError(
-                "Host creation returned no data. Unable to determine if host was created."
-            )
-        return str(resp["hostids"][0])
+            raise ZabbixAPICallError(f"Failed to create {len(hosts)} hosts") from e
+        return get_returned_list(resp, "hostids", "host.create")
 
     def update_host(
         self,
@@ -1217,6 +1532,12 @@ class ZabbixAPI:
         limit: int | None = None,
     ) -> list[Usergroup]:
         """Fetches all user groups. Optionally includes users and rights."""
+        if names_or_ids and not (select_users or select_rights or limit):
+            if (
+                cached := self._lookup("usergroup", names_or_ids, search=search)
+            ) is not None:
+                return cached
+
         params: ParamsType = {
             "output": "extend",
         }
@@ -1404,6 +1725,12 @@ class ZabbixAPI:
 
         NOTE: IDs and names cannot be mixed
         """
+        if not select_hosts and not kwargs:
+            if (
+                cached := self._lookup("proxy", names_or_ids, search=search)
+            ) is not None:
+                return cached
+
         params: ParamsType = {"output": "extend"}
         params = parse_name_or_id_arg(
             params,
@@ -1424,6 +1751,28 @@ class ZabbixAPI:
         else:
             return [Proxy(**proxy) for proxy in res]
 
+    def get_proxy_host_counts(self) -> dict[str, int]:
+        """Fetch the number of hosts monitored by each proxy, by proxy ID."""
+        try:
+            res = self.proxy.get(output=["proxyid"], selectHosts=["hostid"])
+        except ZabbixAPIException as e:
+            raise ZabbixAPICallError("Unable to fetch proxy host counts") from e
+        return {str(proxy["proxyid"]): len(proxy.get("hosts") or []) for proxy in res}
+
+    def get_proxy_item_count(self, proxy: Proxy) -> int:
+        """Fetch the number of enabled items monitored by a proxy."""
+        try:
+            res = self.item.get(
+                proxyids=[proxy.proxyid],
+                filter={"status": 0},
+                countOutput=True,
+            )
+        except ZabbixAPIException as e:
+            raise ZabbixAPICallError(
+                f"Unable to fetch item count for proxy {proxy.name!r}"
+            ) from e
+        return int(res or 0)
+
     def get_proxy_group(
         self,
         name_or_id: str,
@@ -1574,11 +1923,14 @@ class ZabbixAPI:
         sort_field: str | None = "macro",
         sort_order: SortOrder | None = None,
         limit: int | None = None,
+        hosts: list[Host] | None = None,
     ) -> list[Macro]:
         params: ParamsType = {"output": "extend"}
 
         if host:
             params["hostids"] = host.hostid
+        elif hosts:
+            params["hostids"] = [h.hostid for h in hosts]
 
         # NOTE: Fetching macros for a template uses the param `hostids` as well!
         # https://www.zabbix.com/documentation/current/en/manual/api/reference/usermacro/get#retrieving-host-macros-for-a-template
@@ -1667,6 +2019,24 @@ class ZabbixAPI:
             )
         return resp["hostmacroids"][0]
 
+    def create_host_macros(self, macros: list[tuple[Host, str, str]]) -> list[str]:
+        """Creates user macros for multiple hosts in a single request.
+
+        Args:
+            macros (list[tuple[Host, str, str]]): Host, macro name and value for each macro.
+        """
+        params = [
+            {"hostid": host.hostid, "macro": macro, "value": value}
+            for host, macro, value in macros
+        ]
+        try:
+            resp = self.usermacro.create(*params)
+        except ZabbixAPIException as e:
+            raise ZabbixAPICallError(
+                f"Failed to create {len(params)} host macros"
+            ) from e
+        return get_returned_list(resp, "hostmacroids", "usermacro.create")
+
     def create_template_macro(self, template: Template, macro: str, value: str) -> str:
         """Creates a user macro for a template."""
         try:
@@ -1698,6 +2068,15 @@ class ZabbixAPI:
             )
         return resp["globalmacroids"][0]
 
+    def update_macros(self, macros: list[tuple[str, str]]) -> list[str]:
+        """Updates multiple macros given their macro IDs and values."""
+        params = [{"hostmacroid": macroid, "value": value} for macroid, value in macros]
+        try:
+            resp = self.usermacro.update(*params)
+        except ZabbixAPIException as e:
+            raise ZabbixAPICallError(f"Failed to update {len(params)} macros") from e
+        return get_returned_list(resp, "hostmacroids", "usermacro.update")
+
     def update_macro(self, macroid: str, value: str) -> str:
         """Updates a macro given a macro ID and value."""
         try:
@@ -1774,6 +2153,42 @@ class ZabbixAPI:
             )
         return resp["hostids"][0]
 
+    def update_hosts_status(
+        self, hosts: list[Host], status: MonitoringStatus
+    ) -> list[str]:
+        """Updates the status of a list of hosts."""
+        try:
+            resp = self.host.massupdate(
+                hosts=[{"hostid": host.hostid} for host in hosts],
+                status=status.as_api_value(),
+            )
+        except ZabbixAPIException as e:
+            raise ZabbixAPICallError(
+                f"Failed to update host status for {len(hosts)} hosts"
+            ) from e
+        return get_returned_list(resp, "hostids", "host.massupdate")
+
+    def update_hosts(
+        self,
+        hosts: list[Host],
+        *,
+        description: str | None = None,
+        inventory: dict[str, str] | None = None,
+    ) -> list[str]:
+        """Sets the same description and/or inventory fields on a list of hosts.
+
+        Inventory fields that are not given are left unchanged."""
+        params: ParamsType = {"hosts": [{"hostid": host.hostid} for host in hosts]}
+        if description is not None:
+            params["description"] = description
+        if inventory:
+            params["inventory"] = dict(inventory)
+        try:
+            resp = self.host.massupdate(**params)
+        except ZabbixAPIException as e:
+            raise ZabbixAPICallError(f"Failed to update {len(hosts)} hosts") from e
+        return get_returned_list(resp, "hostids", "host.massupdate")
+
     # NOTE: maybe passing in a list of hosts to this is overkill?
     # Just pass in a list of host IDs instead?
     def move_hosts_to_proxy(self, hosts: list[Host], proxy: Proxy) -> None:
@@ -1821,6 +2236,15 @@ class ZabbixAPI:
         select_parent_templates: bool = False,
     ) -> list[Template]:
         """Fetches one or more templates given a name or ID."""
+        if template_names_or_ids and not any(
+            (select_hosts, select_macros, select_templates, select_parent_templates)
+        ):
+            # Template names are always searched for
+            if (
+                cached := self._lookup("template", template_names_or_ids, search=True)
+            ) is not None:
+                return cached
+
         params: ParamsType = {"output": "extend"}
         params = parse_name_or_id_arg(
             params,
@@ -2037,10 +2461,39 @@ class ZabbixAPI:
         monitored: bool = False,
         select_hosts: bool = False,
         limit: int | None = None,
+    ) -> list[Item]:
+        return [
+            item
+            for page in self.iter_items(
+                *names,
+                templates=templates,
+                hosts=hosts,
+                proxies=proxies,
+                search=search,
+                monitored=monitored,
+                select_hosts=select_hosts,
+                limit=limit,
+            )
+            for item in page
+        ]
+
+    def iter_items(
+        self,
+        *names: str,
+        templates: list[Template] | None = None,
+        hosts: list[Template] | None = None,  # NYI
+        proxies: list[Proxy] | None = None,  # NYI
+        search: bool = True,
+        monitored: bool = False,
+        select_hosts: bool = False,
+        limit: int | None = None,
+        page_size: int | None = None,
         # TODO: implement interfaces
         # TODO: implement graphs
         # TODO: implement triggers
-    ) -> list[Item]:
+    ) -> Iterator[list[Item]]:
+        """Fetches items page by page. Fetches all items in one page if
+        `page_size` is None."""
         params: ParamsType = {"output": "extend"}
         params = parse_name_or_id_arg(
             params,
@@ -2057,10 +2510,46 @@ class ZabbixAPI:
             params["selectHosts"] = "extend"
         add_common_params(params, limit=limit)
         try:
-            items = self.item.get(**params)
+            for page in self.get_pages(
+                "item", params, id_field="itemid", page_size=page_size
+            ):
+                yield [Item(**item) for item in page]
         except ZabbixAPIException as e:
             raise ZabbixAPICallError("Unable to fetch items") from e
-        return [Item(**item) for item in items]
+
+    def get_item_counts(self, hostids: list[str]) -> dict[str, int]:
+        """Fetch the number of enabled items of hosts, by host ID.
+
+        Hosts without enabled items are omitted."""
+        try:
+            counts = self.item.get(
+                output=["hostid"],
+                hostids=hostids,
+                filter={"status": 0},
+                webitems=True,
+                countOutput=True,
+                groupCount=True,
+            )
+            return {str(c["hostid"]): int(c["rowscount"]) for c in counts}
+        except (ZabbixAPIException, KeyError, TypeError, ValueError) as e:
+            raise ZabbixAPICallError(
+                f"Unable to fetch item counts for {len(hostids)} hosts"
+            ) from e
+
+    def get_item_delays(self, hostids: list[str]) -> list[tuple[str, str]]:
+        """Fetch the host ID and update interval of the enabled items of hosts."""
+        try:
+            items = self.item.get(
+                output=["hostid", "delay"],
+                hostids=hostids,
+                filter={"status": 0},
+                webitems=True,
+            )
+        except ZabbixAPIException as e:
+            raise ZabbixAPICallError(
+                f"Unable to fetch items for {len(hostids)} hosts"
+            ) from e
+        return [(str(item["hostid"]), str(item.get("delay") or "0")) for item in items]
 
     def create_user(
         self,
@@ -2426,6 +2915,34 @@ class ZabbixAPI:
         sort_order: SortOrder | None = None,
         limit: int | None = None,
     ) -> list[Event]:
+        return [
+            event
+            for page in self.iter_events(
+                event_ids=event_ids,
+                group_ids=group_ids,
+                host_ids=host_ids,
+                object_ids=object_ids,
+                sort_field=sort_field,
+                sort_order=sort_order,
+                limit=limit,
+            )
+            for event in page
+        ]
+
+    def iter_events(
+        self,
+        *,
+        event_ids: str | list[str] | None = None,
+        group_ids: str | list[str] | None = None,
+        host_ids: str | list[str] | None = None,
+        object_ids: str | list[str] | None = None,
+        sort_field: str | list[str] | None = None,
+        sort_order: SortOrder | None = None,
+        limit: int | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[list[Event]]:
+        """Fetches events page by page. Fetches all events in one page if
+        `page_size` is None."""
         params: ParamsType = {"output": "extend"}
         if event_ids:
             params["eventids"] = event_ids
@@ -2435,13 +2952,17 @@ class ZabbixAPI:
             params["hostids"] = host_ids
         if object_ids:
             params["objectids"] = object_ids
-        add_common_params(params, sort_field=sort_field, sort_order=sort_order)
+        add_common_params(
+            params, sort_field=sort_field, sort_order=sort_order, limit=limit
+        )
 
         try:
-            resp = self.event.get(**params)
+            for page in self.get_pages(
+                "event", params, id_field="eventid", page_size=page_size
+            ):
+                yield [Event(**event) for event in page]
         except ZabbixAPIException as e:
             raise ZabbixAPICallError("Failed to fetch events") from e
-        return [Event(**event) for event in resp]
 
     def get_triggers(
         self,
@@ -2461,6 +2982,48 @@ class ZabbixAPI:
         sort_field: str | None = "lastchange",
         sort_order: SortOrder = "DESC",
     ) -> list[Trigger]:
+        return [
+            trigger
+            for page in self.iter_triggers(
+                trigger_ids=trigger_ids,
+                hostgroups=hostgroups,
+                templates=templates,
+                description=description,
+                priority=priority,
+                unacknowledged=unacknowledged,
+                skip_dependent=skip_dependent,
+                monitored=monitored,
+                active=active,
+                expand_description=expand_description,
+                filter=filter,
+                select_hosts=select_hosts,
+                sort_field=sort_field,
+                sort_order=sort_order,
+            )
+            for trigger in page
+        ]
+
+    def iter_triggers(
+        self,
+        *,
+        trigger_ids: str | list[str] | None = None,
+        hostgroups: list[HostGroup] | None = None,
+        templates: list[Template] | None = None,
+        description: str | None = None,
+        priority: TriggerPriority | None = None,
+        unacknowledged: bool = False,
+        skip_dependent: bool | None = None,
+        monitored: bool | None = None,
+        active: bool | None = None,
+        expand_description: bool | None = None,
+        filter: dict[str, Any] | None = None,
+        select_hosts: bool = False,
+        sort_field: str | None = "lastchange",
+        sort_order: SortOrder = "DESC",
+        page_size: int | None = None,
+    ) -> Iterator[list[Trigger]]:
+        """Fetches triggers page by page. Fetches all triggers in one page if
+        `page_size` is None."""
         params: ParamsType = {"output": "extend"}
         if description:
             params["search"] = {"description": description}
@@ -2496,10 +3059,12 @@ class ZabbixAPI:
         add_common_params(params, sort_field, sort_order)
 
         try:
-            resp = self.trigger.get(**params)
+            for page in self.get_pages(
+                "trigger", params, id_field="triggerid", page_size=page_size
+            ):
+                yield [Trigger(**trigger) for trigger in page]
         except ZabbixAPIException as e:
             raise ZabbixAPICallError("Failed to fetch triggers") from e
-        return [Trigger(**trigger) for trigger in resp]
 
     def get_images(self, *image_names: str, select_image: bool = True) -> list[Image]:
         """Fetches images, optionally filtered by name(s)."""
@@ -2620,6 +3185,32 @@ class ZabbixAPI:
         except ZabbixAPIException as e:
             raise ZabbixAPICallError("Failed to import configuration") from e
 
+    def compare_configuration(
+        self,
+        to_import: Path,
+        *,
+        create_missing: bool = True,
+        update_existing: bool = True,
+        delete_missing: bool = False,
+    ) -> bool:
+        """Compares a configuration file with the current configuration.
+
+        Returns True if importing the file would change the configuration.
+        Requires Zabbix >= 6.0.
+        """
+        try:
+            conf = to_import.read_text()
+            fmt = ExportFormat(to_import.suffix.strip("."))
+            rules = ImportRules.get(
+                create_missing=create_missing,
+                update_existing=update_existing,
+                delete_missing=delete_missing,
+            )
+            changes = self.confimportcompare(format=fmt, source=conf, rules=rules)
+        except ZabbixAPIException as e:
+            raise ZabbixAPICallError("Failed to compare configuration") from e
+        return bool(changes)
+
     def __getattr__(self, attr: str) -> ZabbixAPIObjectClass:
         """Dynamically create an object class (ie: host)"""
         return ZabbixAPIObjectClass(attr, self)
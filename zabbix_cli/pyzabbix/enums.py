@@ -273,6 +273,15 @@ class ExportFormat(StrEnum):
         return [cls.JSON, cls.YAML, cls.XML]
 
 
+class ProxyStrategy(StrEnum):
+    """Strategy for selecting a proxy among the proxies matching a pattern."""
+
+    RANDOM = "random"
+    LEAST_HOSTS = "least-hosts"
+    LEAST_ITEMS = "least-items"
+    ROUND_ROBIN = "round-robin"
+
+
 class GUIAccess(APIStrEnum):
     """GUI Access for a user group."""
 
@@ -0,0 +1,145 @@
+"""Run-scoped lookup table of prefetched Zabbix objects.
+
+When a lookup table is attached to a client, plain lookups of objects by
+name or ID are served from the table instead of the API. Lookups that
+request additional properties (selects, sorting, limits) always go to the
+API, as do lookups of objects not in the table.
+
+Searching the API for a name matches every object containing it, so a
+search can only be served if the table holds the result of searching for
+the same name, or all objects of the type.
+
+The table for an object type is cleared whenever an object of that type
+is created, updated or deleted through the client.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+if TYPE_CHECKING:
+    from zabbix_cli.pyzabbix.types import ZabbixAPIBaseModel
+
+
+class ObjectKeys(NamedTuple):
+    """Attributes used to look up an object type."""
+
+    name: str
+    id: str
+
+
+LOOKUP_KEYS: dict[str, ObjectKeys] = {
+    "hostgroup": ObjectKeys("name", "groupid"),
+    "template": ObjectKeys("host", "templateid"),
+    "proxy": ObjectKeys("name", "proxyid"),
+    "usergroup": ObjectKeys("name", "usrgrpid"),
+}
+"""Object types that can be stored in a lookup table, keyed by API object name."""
+
+INVALIDATING_ACTIONS = ("create", "update", "delete")
+"""API methods that invalidate the table for an object type."""
+
+
+class LookupTable:
+    """Prefetched objects by type, name and ID."""
+
+    def __init__(self) -> None:
+        self._objects: dict[str, dict[str, ZabbixAPIBaseModel]] = {}
+        self._all: dict[str, list[ZabbixAPIBaseModel]] = {}
+        self._searched: dict[str, set[str]] = {}
+        """Casefolded names searched for by type, whose results were added."""
+        self._lock = threading.Lock()
+        self.hits = 0
+        """Number of lookups served from the table."""
+
+    def add(
+        self,
+        object_type: str,
+        objects: Sequence[ZabbixAPIBaseModel],
+        *,
+        searched: Iterable[str] = (),
+    ) -> None:
+        """Add objects of a type to the table.
+
+        `searched` are the names that were searched for to get the objects,
+        so that later searches for the same names can be served."""
+        keys = LOOKUP_KEYS[object_type]
+        with self._lock:
+            table = self._objects.setdefault(object_type, {})
+            for obj in objects:
+                table[str(getattr(obj, keys.name))] = obj
+                table[str(getattr(obj, keys.id))] = obj
+            self._searched.setdefault(object_type, set()).update(
+                name.strip().casefold() for name in searched
+            )
+
+    def set_all(self, object_type: str, objects: Sequence[ZabbixAPIBaseModel]) -> None:
+        """Add all objects of a type, so requests for all objects can be served."""
+        self.add(object_type, objects)
+        with self._lock:
+            self._all[object_type] = list(objects)
+
+    def get(
+        self, object_type: str, names_or_ids: Sequence[str]
+    ) -> list[ZabbixAPIBaseModel] | None:
+        """Get objects by name or ID. Returns None unless all of them are found."""
+        if not names_or_ids:
+            return None
+        with self._lock:
+            table = self._objects.get(object_type)
+            if not table:
+                return None
+            objects: dict[int, ZabbixAPIBaseModel] = {}
+            for name_or_id in names_or_ids:
+                obj = table.get(name_or_id.strip())
+                if obj is None:
+                    return None
+                objects[id(obj)] = obj  # deduplicate
+            self.hits += 1
+        return [obj.model_copy() for obj in objects.values()]
+
+    def search(
+        self, object_type: str, names: Sequence[str]
+    ) -> list[ZabbixAPIBaseModel] | None:
+        """Get objects whose name contains any of the names, ignoring case,
+        like searching the API. Returns None unless the table holds the
+        results of searching for all of the names."""
+        keys = LOOKUP_KEYS[object_type]
+        patterns = {name.strip().casefold() for name in names}
+        if not patterns:
+            return None
+        with self._lock:
+            if object_type not in self._all and not patterns.issubset(
+                self._searched.get(object_type, ())
+            ):
+                return None
+            objects: dict[int, ZabbixAPIBaseModel] = {}
+            for obj in self._objects.get(object_type, {}).values():
+                name = str(getattr(obj, keys.name)).casefold()
+                if any(pattern in name for pattern in patterns):
+                    objects[id(obj)] = obj  # deduplicate
+            self.hits += 1
+        return [obj.model_copy() for obj in objects.values()]
+
+    def get_all(self, object_type: str) -> list[ZabbixAPIBaseModel] | None:
+        """Get all objects of a type. Returns None if not all objects are known."""
+        with self._lock:
+            objects = self._all.get(object_type)
+            if objects is None:
+                return None
+            self.hits += 1
+        return [obj.model_copy() for obj in objects]
+
+    def invalidate(self, method: str) -> None:
+        """Clear the table for the object type modified by an API method."""
+        object_type, _, action = method.partition(".")
+        if object_type not in LOOKUP_KEYS or action not in INVALIDATING_ACTIONS:
+            return
+        with self._lock:
+            self._objects.pop(object_type, None)
+            self._all.pop(object_type, None)
+            self._searched.pop(object_type, None)
@@ -0,0 +1,329 @@
+"""Chunked mass operations.
+
+Mass API methods (`hostgroup.massadd`, `host.massupdate`, ...) accept any
+number of objects, but sending tens of thousands of IDs in one request runs
+into the `post_max_size` and `max_execution_time` limits of the PHP frontend.
+
+A mass operation splits the objects into chunks and sends one request per
+chunk, optionally running several chunks concurrently. The chunk size adapts
+to the observed latency: it grows while requests are fast and shrinks when
+they approach the target latency or fail. A failed chunk is split in half
+and retried until the objects that cannot be updated are isolated, so the
+result reports exactly which objects succeeded and which failed.
+
+Errors that are not caused by individual objects (an invalid template ID,
+no permissions on a host group) make every chunk fail. If both halves of a
+failed chunk fail with the same API error as the chunk, the operation is
+aborted instead of splitting further. The number of retries is also capped,
+after which failed chunks are reported as failed as a whole.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Generic
+from typing import TypeVar
+
+import httpx
+
+from zabbix_cli.exceptions import AuthError
+from zabbix_cli.exceptions import ZabbixAPIException
+from zabbix_cli.exceptions import ZabbixAPIMassOperationError
+from zabbix_cli.exceptions import ZabbixAPINotAuthorizedError
+from zabbix_cli.exceptions import ZabbixAPIRequestError
+from zabbix_cli.exceptions import ZabbixAPISessionExpired
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 1000
+"""Initial number of objects per request."""
+
+MAX_CHUNK_SIZE = 10000
+"""Largest number of objects per request the chunk size can grow to."""
+
+TARGET_LATENCY = 5.0
+"""Request latency in seconds the chunk size is adapted to stay below."""
+
+MAX_RETRIES = 100
+"""Number of requests made for halves of failed chunks before giving up on splitting."""
+
+MAX_REPORTED_FAILURES = 10
+"""Number of failed objects listed in error messages."""
+
+FATAL_ERRORS: tuple[type[Exception], ...] = (
+    AuthError,
+    ZabbixAPINotAuthorizedError,
+    ZabbixAPISessionExpired,
+)
+"""Errors that affect every chunk and abort the operation instead of being retried."""
+
+
+def is_fatal(error: BaseException) -> bool:
+    """Check if an error, or any error that caused it, is fatal."""
+    e: BaseException | None = error
+    while e is not None:
+        if isinstance(e, FATAL_ERRORS):
+            return True
+        e = e.__cause__
+    return False
+
+
+def is_api_error(error: BaseException) -> bool:
+    """Check if an error, or any error that caused it, is an error returned
+    by the API for the request. Unlike request, network and authentication
+    errors, these can be caused by the objects in the request."""
+    e: BaseException | None = error
+    while e is not None:
+        if (
+            isinstance(e, ZabbixAPIRequestError)
+            and e.api_response is not None
+            and e.api_response.error is not None
+        ):
+            return not is_fatal(error)
+        e = e.__cause__
+    return False
+
+
+class ChunkSizer:
+    """Adapts the chunk size to the observed latency and errors."""
+
+    def __init__(
+        self,
+        size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        max_size: int = MAX_CHUNK_SIZE,
+        target_latency: float = TARGET_LATENCY,
+    ) -> None:
+        self.max_size = max(max_size, 1)
+        self.size = min(max(size, 1), self.max_size)
+        self.target_latency = target_latency
+
+    def record(self, n: int, seconds: float) -> None:
+        """Record a successful request with `n` objects."""
+        if seconds > self.target_latency:
+            self.size = max(self.size // 2, 1)
+        # Only grow when a full chunk was fast, not just a small remainder
+        elif seconds < self.target_latency / 4 and n >= self.size:
+            self.size = min(self.size * 2, self.max_size)
+        else:
+            return
+        logger.debug("Chunk size adjusted to %d (%.2fs)", self.size, seconds)
+
+    def shrink(self, n: int) -> None:
+        """Record a failed request with `n` objects."""
+        # Never grow back to a size that has failed
+        self.max_size = max(min(self.max_size, n - 1), 1)
+        self.size = max(min(self.size, n) // 2, 1)
+
+
+@dataclass
+class MassOperationResult(Generic[T]):
+    """Objects a mass operation succeeded and failed for."""
+
+    succeeded: list[T] = field(default_factory=list)
+    failed: list[tuple[T, Exception]] = field(default_factory=list)
+    """Objects that failed on their own, with the error."""
+    requests: int = 0
+    """Number of requests made, including retries."""
+
+    @property
+    def total(self) -> int:
+        return len(self.succeeded) + len(self.failed)
+
+    def raise_for_failures(self, message: str) -> None:
+        """Raise an error describing the failed objects, if any."""
+        if not self.failed:
+            return
+        failures = ", ".join(
+            f"{item} ({error})" for item, error in self.failed[:MAX_REPORTED_FAILURES]
+        )
+        if len(self.failed) > MAX_REPORTED_FAILURES:
+            failures += f" and {len(self.failed) - MAX_REPORTED_FAILURES} more"
+        raise ZabbixAPIMassOperationError(
+            f"{message}: failed for {len(self.failed)} of {self.total}: {failures}",
+            succeeded=self.succeeded,
+            failed=self.failed,
+        )
+
+
+def is_same_error(error: Exception, other: Exception) -> bool:
+    """Check if two errors are the same API error.
+
+    HTTP errors such as timeouts depend on the size of the request,
+    and are never considered the same."""
+    return (
+        isinstance(error, ZabbixAPIException)
+        and type(error) is type(other)
+        and str(error) == str(other)
+    )
+
+
+@dataclass
+class _Split(Generic[T]):
+    """A failed chunk whose halves are being retried."""
+
+    error: Exception
+    remaining: int = 2
+    """Number of halves that have not been handled."""
+    held: tuple[list[T], Exception] | None = None
+    """Half that failed with the same error, waiting for the other half."""
+
+
+class MassOperation(Generic[T]):
+    """Applies a mass API call to a list of objects in chunks."""
+
+    def __init__(
+        self,
+        func: Callable[[list[T]], object],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_chunk_size: int = MAX_CHUNK_SIZE,
+        target_latency: float = TARGET_LATENCY,
+        jobs: int = 1,
+        max_retries: int = MAX_RETRIES,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> None:
+        self.func = func
+        self.max_retries = max_retries
+        self.sizer = ChunkSizer(
+            chunk_size, max_size=max_chunk_size, target_latency=target_latency
+        )
+        self.jobs = max(jobs, 1)
+        self.on_progress = on_progress
+        # State of the current run
+        self._items: Sequence[T] = ()
+        self._pos = 0
+        self._retry: deque[list[T]] = deque()
+        """Halves of failed chunks, retried before new chunks."""
+        self._splits: dict[int, _Split[T]] = {}
+        """Failed chunks by the ID of their halves."""
+        self._retries_left = max_retries
+
+    def run(self, items: Sequence[T]) -> MassOperationResult[T]:
+        """Apply the operation to the objects."""
+        result: MassOperationResult[T] = MassOperationResult()
+        self._items = items
+        self._pos = 0
+        self._retry.clear()
+        self._splits.clear()
+        self._retries_left = self.max_retries
+        if self.jobs == 1:
+            while chunk := self._next_chunk():
+                self._handle(result, chunk, *self._call(chunk))
+        else:
+            self._run_concurrent(result)
+        return result
+
+    def _next_chunk(self) -> list[T]:
+        if self._retry:
+            return self._retry.popleft()
+        chunk = list(self._items[self._pos : self._pos + self.sizer.size])
+        self._pos += len(chunk)
+        return chunk
+
+    def _run_concurrent(self, result: MassOperationResult[T]) -> None:
+        from concurrent.futures import FIRST_COMPLETED
+        from concurrent.futures import Future
+        from concurrent.futures import ThreadPoolExecutor
+        from concurrent.futures import wait
+
+        executor = ThreadPoolExecutor(max_workers=self.jobs)
+        pending: dict[Future[tuple[float, Exception | None]], list[T]] = {}
+        try:
+            while True:
+                while len(pending) < self.jobs and (chunk := self._next_chunk()):
+                    pending[executor.submit(self._call, chunk)] = chunk
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._handle(result, pending.pop(future), *future.result())
+        finally:
+            # Don't start new chunks after a fatal error
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _call(self, chunk: list[T]) -> tuple[float, Exception | None]:
+        """Send a chunk. Returns the latency and the error, if any."""
+        start = time.perf_counter()
+        try:
+            self.func(chunk)
+        except (ZabbixAPIException, httpx.HTTPError) as e:
+            if is_fatal(e):
+                raise
+            return time.perf_counter() - start, e
+        return time.perf_counter() - start, None
+
+    def _handle(
+        self,
+        result: MassOperationResult[T],
+        chunk: list[T],
+        seconds: float,
+        error: Exception | None,
+    ) -> None:
+        result.requests += 1
+        split = self._splits.pop(id(chunk), None)
+        if split is not None:
+            split.remaining -= 1
+        if error is None:
+            self.sizer.record(len(chunk), seconds)
+            result.succeeded.extend(chunk)
+            self._progress(len(chunk))
+        elif split is not None and is_same_error(error, split.error):
+            if split.held is not None:
+                # Both halves failed like the whole chunk: not caused by any object
+                raise ZabbixAPIMassOperationError(
+                    f"Mass operation failed: {error}",
+                    succeeded=result.succeeded,
+                    failed=result.failed,
+                ) from error
+            if split.remaining:
+                # Wait for the other half before splitting further
+                split.held = (chunk, error)
+                return
+            self._fail(result, chunk, error)
+        else:
+            self._fail(result, chunk, error)
+        if split is not None and split.held is not None and not split.remaining:
+            held, held_error = split.held
+            split.held = None
+            self._fail(result, held, held_error)
+
+    def _fail(
+        self, result: MassOperationResult[T], chunk: list[T], error: Exception
+    ) -> None:
+        """Split a failed chunk to retry its halves, or record its objects as failed."""
+        if len(chunk) > 1 and self._retries_left >= 2:
+            logger.info("Chunk of %d failed, splitting it: %s", len(chunk), error)
+            self._retries_left -= 2
+            self.sizer.shrink(len(chunk))
+            mid = len(chunk) // 2
+            halves = [chunk[:mid], chunk[mid:]]
+            split = _Split[T](error)
+            for half in halves:
+                self._splits[id(half)] = split
+            self._retry.extendleft(reversed(halves))
+            return
+        if len(chunk) == 1:
+            logger.error("Mass operation failed for %s: %s", chunk[0], error)
+        else:
+            logger.error(
+                "Mass operation failed for %d objects, not retrying: %s",
+                len(chunk),
+                error,
+            )
+        result.failed.extend((item, error) for item in chunk)
+        self._progress(len(chunk))
+
+    def _progress(self, n: int) -> None:
+        if self.on_progress:
+            self.on_progress(n)
@@ -0,0 +1,172 @@
+"""Selection of proxies for new and moved hosts.
+
+Commands that accept a proxy pattern pick one of the matching proxies for
+each host. Picking at random leaves the proxies unevenly loaded, and fetching
+the proxies for every host is slow when provisioning hosts in bulk.
+
+A selector fetches the proxies once per session, and the number of hosts
+(and, for the least-items strategy, enabled items) monitored by each proxy
+the first time a strategy needs them. The counts are then updated locally as
+hosts are assigned, so consecutive selections spread the hosts across the
+proxies without any further requests.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import threading
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from zabbix_cli.exceptions import ZabbixAPICallError
+from zabbix_cli.exceptions import ZabbixNotFoundError
+from zabbix_cli.pyzabbix.enums import ProxyStrategy
+
+if TYPE_CHECKING:
+    from zabbix_cli.pyzabbix.client import ZabbixAPI
+    from zabbix_cli.pyzabbix.types import Proxy
+
+logger = logging.getLogger(__name__)
+
+
+class ProxySelector:
+    """Selects proxies for hosts using a strategy, tracking proxy load locally."""
+
+    def __init__(
+        self, client: ZabbixAPI, strategy: ProxyStrategy = ProxyStrategy.RANDOM
+    ) -> None:
+        self.client = client
+        self.strategy = strategy
+        self._proxies: list[Proxy] | None = None
+        self._host_counts: dict[str, int] | None = None
+        """Number of hosts per proxy ID."""
+        self._item_counts: dict[str, float] = {}
+        """Number of enabled items per proxy ID, fetched per proxy when needed."""
+        self._rr_counters: dict[tuple[str, ...], int] = {}
+        """Next position for each set of candidates selected from round-robin."""
+        self._lock = threading.RLock()
+        """Commands may select proxies from several threads."""
+
+    @property
+    def proxies(self) -> list[Proxy]:
+        """All proxies, fetched once."""
+        with self._lock:
+            if self._proxies is None:
+                self._proxies = self.client.get_proxies()
+            return self._proxies
+
+    def match(self, pattern: str | None = None) -> list[Proxy]:
+        """Get the proxies whose names match a regex pattern."""
+        proxies = self.proxies
+        if not proxies:
+            raise ZabbixNotFoundError("No proxies found")
+        if not pattern:
+            return list(proxies)
+        try:
+            re_pattern = re.compile(pattern)
+        except re.error as e:
+            raise ZabbixAPICallError(f"Invalid proxy regex pattern: {pattern!r}") from e
+        matches = [proxy for proxy in proxies if re_pattern.match(proxy.name)]
+        if not matches:
+            raise ZabbixNotFoundError(f"No proxies matching pattern {pattern!r}")
+        return matches
+
+    def select(
+        self,
+        pattern: str | None = None,
+        *,
+        strategy: ProxyStrategy | None = None,
+        current: Proxy | None = None,
+    ) -> Proxy:
+        """Select a proxy matching a pattern for a host.
+
+        The host is counted as assigned to the selected proxy, and removed
+        from its current proxy, if any."""
+        return self.choose(self.match(pattern), strategy=strategy, current=current)
+
+    def choose(
+        self,
+        candidates: Sequence[Proxy],
+        *,
+        strategy: ProxyStrategy | None = None,
+        current: Proxy | None = None,
+    ) -> Proxy:
+        """Choose one of the given proxies for a host."""
+        if not candidates:
+            raise ZabbixNotFoundError("No proxies to choose from")
+        strategy = strategy or self.strategy
+        with self._lock:
+            if strategy == ProxyStrategy.RANDOM:
+                proxy = random.choice(candidates)
+            elif strategy == ProxyStrategy.ROUND_ROBIN:
+                proxy = self._next_round_robin(candidates)
+            elif strategy == ProxyStrategy.LEAST_ITEMS:
+                # Ties are broken by host count, then name
+                proxy = min(
+                    candidates,
+                    key=lambda p: (self.item_count(p), self.host_count(p), p.name),
+                )
+            else:
+                proxy = min(candidates, key=lambda p: (self.host_count(p), p.name))
+            if current is None or current.proxyid != proxy.proxyid:
+                self.assign(proxy, current=current)
+        logger.debug("Selected proxy %r using strategy %s", proxy.name, strategy)
+        return proxy
+
+    def _next_round_robin(self, candidates: Sequence[Proxy]) -> Proxy:
+        ordered = sorted(candidates, key=lambda p: p.name)
+        key = tuple(p.proxyid for p in ordered)
+        pos = self._rr_counters.get(key, 0)
+        self._rr_counters[key] = pos + 1
+        return ordered[pos % len(ordered)]
+
+    def host_count(self, proxy: Proxy) -> int:
+        """Number of hosts monitored by a proxy, including local assignments."""
+        with self._lock:
+            if self._host_counts is None:
+                self._host_counts = self.client.get_proxy_host_counts()
+            return self._host_counts.get(proxy.proxyid, 0)
+
+    def item_count(self, proxy: Proxy) -> float:
+        """Number of enabled items monitored by a proxy, including local assignments.
+
+        Hosts assigned locally are counted with the average number of items
+        per host on the proxy, since new hosts get their items from templates."""
+        with self._lock:
+            if proxy.proxyid not in self._item_counts:
+                self._item_counts[proxy.proxyid] = self.client.get_proxy_item_count(
+                    proxy
+                )
+            return self._item_counts[proxy.proxyid]
+
+    def _items_per_host(self, proxy: Proxy) -> float:
+        """Average number of items per host on a proxy, or on all the proxies
+        whose items have been counted if the proxy has no hosts."""
+        if hosts := self.host_count(proxy):
+            return self._item_counts[proxy.proxyid] / hosts
+        counts = self._host_counts or {}
+        total_hosts = sum(counts.get(proxyid, 0) for proxyid in self._item_counts)
+        if not total_hosts:
+            return 0.0
+        return sum(self._item_counts.values()) / total_hosts
+
+    def assign(self, proxy: Proxy, *, current: Proxy | None = None) -> None:
+        """Count a host as moved to a proxy from its current proxy, if any.
+
+        Only the counts that have already been fetched are updated."""
+        with self._lock:
+            if current is not None:
+                self._adjust(current, -1)
+            self._adjust(proxy, 1)
+
+    def _adjust(self, proxy: Proxy, n: int) -> None:
+        if self._host_counts is None:
+            return
+        if proxy.proxyid in self._item_counts:
+            items = self._items_per_host(proxy)
+            self._item_counts[proxy.proxyid] = max(
+                self._item_counts[proxy.proxyid] + n * items, 0.0
+            )
+        self._host_counts[proxy.proxyid] = max(self.host_count(proxy) + n, 0)
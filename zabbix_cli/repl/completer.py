@@ -6,6 +6,7 @@ import os
 import shlex
 from collections.abc import Generator
 from glob import iglob
+from typing import TYPE_CHECKING
 from typing import Any
 
 import click
@@ -15,6 +16,11 @@ from prompt_toolkit.completion import Completion
 from prompt_toolkit.document import Document
 
 from zabbix_cli.commands.common.args import CommandParam
+from zabbix_cli.repl.names import get_param_kind
+
+if TYPE_CHECKING:
+    from zabbix_cli.repl.names import NameKind
+    from zabbix_cli.repl.names import ObjectNames
 
 __all__ = ["ClickCompleter"]
 
@@ -112,7 +118,7 @@ def _resolve_context(args: list[Any], ctx: click.Context) -> click.Context:
 class ClickCompleter(Completer):
     """Completer for Click commands."""
 
-    __slots__ = ("cli", "ctx", "parsed_args", "parsed_ctx", "ctx_command")
+    __slots__ = ("cli", "ctx", "parsed_args", "parsed_ctx", "ctx_command", "names")
 
     def __init__(
         self,
@@ -121,6 +127,7 @@ class ClickCompleter(Completer):
         *,
         show_only_unused: bool = False,
         shortest_only: bool = False,
+        names: ObjectNames | None = None,
     ) -> None:
         self.cli = cli
         self.ctx = ctx
@@ -129,6 +136,7 @@ class ClickCompleter(Completer):
         self.ctx_command = ctx.command
         self.show_only_unused = show_only_unused
         self.shortest_only = shortest_only
+        self.names = names
 
     def _get_completion_from_autocompletion_functions(
         self,
@@ -200,6 +208,24 @@ class ClickCompleter(Completer):
             if command.startswith(incomplete)
         ]
 
+    def _get_completion_for_names(
+        self, kind: NameKind, incomplete: str
+    ) -> list[Completion]:
+        if self.names is None:
+            return []
+        # Complete the last value of comma-separated values, inside quotes if any
+        quote = incomplete[0] if incomplete[:1] in ("'", '"') else ""
+        head, sep, prefix = incomplete[len(quote) :].rpartition(",")
+        choices: list[Completion] = []
+        for name in self.names.search(kind, prefix):
+            value = f"{head}{sep}{name}"
+            if quote:
+                value = f"{quote}{value}{quote}"
+            elif any(c.isspace() for c in value):
+                value = shlex.quote(value)
+            choices.append(Completion(value, -len(incomplete), display=name))
+        return choices
+
     def _get_completion_from_params(
         self,
         autocomplete_ctx: click.Context,
@@ -216,6 +242,8 @@ class ClickCompleter(Completer):
             choices.extend(self._get_completion_for_Path_types(param, args, incomplete))
         elif isinstance(param.type, CommandParam):
             choices.extend(self._get_completion_from_command_param(param, incomplete))
+        elif kind := get_param_kind(self.ctx_command, param):
+            choices.extend(self._get_completion_for_names(kind, incomplete))
         elif getattr(param, AUTO_COMPLETION_PARAM, None) is not None:
             choices.extend(
                 self._get_completion_from_autocompletion_functions(
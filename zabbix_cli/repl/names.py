@@ -0,0 +1,230 @@
+"""Names of Zabbix objects for completion in the REPL.
+
+The names of hosts, host groups, templates, proxies, user groups and macros
+are fetched in a background thread when the REPL starts, and kept in sorted
+prefix indexes so that completions are found with a binary search. Completions
+never wait for the API: names that are older than the TTL, or whose object
+type has been modified through the client, are refreshed in the background
+while the previous names are used.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+import click
+from strenum import StrEnum
+
+from zabbix_cli.pyzabbix.compat import proxy_name
+
+if TYPE_CHECKING:
+    from zabbix_cli.pyzabbix.client import ZabbixAPI
+
+logger = logging.getLogger(__name__)
+
+MAX_COMPLETIONS = 100
+"""Maximum number of names completed at a time."""
+
+
+class NameKind(StrEnum):
+    """Type of object whose names are completed."""
+
+    HOST = "host"
+    HOSTGROUP = "hostgroup"
+    TEMPLATE = "template"
+    PROXY = "proxy"
+    USERGROUP = "usergroup"
+    MACRO = "macro"
+
+
+PARAM_KINDS: dict[str, NameKind] = {
+    "hostname": NameKind.HOST,
+    "hostname_or_id": NameKind.HOST,
+    "hostnames_or_ids": NameKind.HOST,
+    "hosts": NameKind.HOST,
+    "host": NameKind.HOST,
+    "hostgroup": NameKind.HOSTGROUP,
+    "hostgroups": NameKind.HOSTGROUP,
+    "src_group": NameKind.HOSTGROUP,
+    "dest_group": NameKind.HOSTGROUP,
+    "template": NameKind.TEMPLATE,
+    "templates": NameKind.TEMPLATE,
+    "template_name": NameKind.TEMPLATE,
+    "template_name_or_id": NameKind.TEMPLATE,
+    "proxy": NameKind.PROXY,
+    "proxies": NameKind.PROXY,
+    "proxy_src": NameKind.PROXY,
+    "proxy_dst": NameKind.PROXY,
+    "usergroup": NameKind.USERGROUP,
+    "usergroups": NameKind.USERGROUP,
+    "ro_groups": NameKind.USERGROUP,
+    "rw_groups": NameKind.USERGROUP,
+    "macro_name": NameKind.MACRO,
+    "usermacro": NameKind.MACRO,
+}
+"""Kinds of names completed for command parameters, by parameter name."""
+
+COMMAND_PARAM_KINDS: dict[tuple[str, str], NameKind | None] = {
+    # Template group commands use the same parameter names as host group commands
+    ("extend_templategroup", "src_group"): None,
+    ("extend_templategroup", "dest_group"): None,
+    ("move_templates", "src_group"): None,
+    ("move_templates", "dest_group"): None,
+}
+"""Kinds of names for parameters of specific commands, overriding `PARAM_KINDS`."""
+
+API_OBJECT_KINDS: dict[str, NameKind] = {
+    "host": NameKind.HOST,
+    "hostgroup": NameKind.HOSTGROUP,
+    "template": NameKind.TEMPLATE,
+    "proxy": NameKind.PROXY,
+    "usergroup": NameKind.USERGROUP,
+    "usermacro": NameKind.MACRO,
+}
+"""Kinds of names by the API object type that modifies them."""
+
+MODIFYING_ACTIONS = (
+    "create",
+    "update",
+    "delete",
+    "createglobal",
+    "updateglobal",
+    "deleteglobal",
+)
+"""API methods that modify the names of an object type."""
+
+
+def get_param_kind(command: click.Command, param: click.Parameter) -> NameKind | None:
+    """Get the kind of names to complete for a command parameter, if any."""
+    if param.name is None or isinstance(param.type, click.types.BoolParamType):
+        return None
+    key = (command.name or "", param.name)
+    if key in COMMAND_PARAM_KINDS:
+        return COMMAND_PARAM_KINDS[key]
+    return PARAM_KINDS.get(param.name)
+
+
+class PrefixIndex:
+    """Case-insensitive index of names by prefix.
+
+    Names are sorted by their lowercase form, so the names starting
+    with a prefix are a contiguous range found with a binary search."""
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self.names = sorted({name for name in names if name}, key=str.lower)
+        self.keys = [name.lower() for name in self.names]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search(self, prefix: str, limit: int = MAX_COMPLETIONS) -> list[str]:
+        """Get names starting with a prefix."""
+        prefix = prefix.lower()
+        matches: list[str] = []
+        for i in range(bisect_left(self.keys, prefix), len(self.keys)):
+            if len(matches) >= limit or not self.keys[i].startswith(prefix):
+                break
+            matches.append(self.names[i])
+        return matches
+
+
+class IndexEntry(NamedTuple):
+    names: PrefixIndex
+    updated: float
+    """Monotonic time of the last refresh. -inf if the names are stale."""
+
+
+class ObjectNames:
+    """Names of Zabbix objects, refreshed in the background."""
+
+    def __init__(self, client: ZabbixAPI, ttl: float = 300) -> None:
+        self.client = client
+        self.ttl = ttl
+        self._entries: dict[NameKind, IndexEntry] = {}
+        self._refreshing: set[NameKind] = set()
+        self._lock = threading.Lock()
+        self.fetchers: dict[NameKind, Callable[[], Iterable[str]]] = {
+            NameKind.HOST: lambda: self._fetch("host", "host"),
+            NameKind.HOSTGROUP: lambda: self._fetch("hostgroup", "name"),
+            NameKind.TEMPLATE: lambda: self._fetch("template", "host"),
+            NameKind.PROXY: lambda: self._fetch(
+                "proxy", proxy_name(self.client.version)
+            ),
+            NameKind.USERGROUP: lambda: self._fetch("usergroup", "name"),
+            NameKind.MACRO: self._fetch_macros,
+        }
+
+    def _fetch(self, object_type: str, field: str, **params: Any) -> list[str]:
+        objects: list[dict[str, Any]] = getattr(self.client, object_type).get(
+            output=[field], **params
+        )
+        return [obj[field] for obj in objects]
+
+    def _fetch_macros(self) -> list[str]:
+        return [
+            *self._fetch("usermacro", "macro", globalmacro=True),
+            *self._fetch("usermacro", "macro"),
+        ]
+
+    def warm(self) -> threading.Thread | None:
+        """Fetch the names of all object types in the background."""
+        return self.refresh(NameKind)
+
+    def refresh(self, kinds: Iterable[NameKind]) -> threading.Thread | None:
+        """Fetch the names of object types in a background thread.
+
+        Object types that are already being refreshed are skipped."""
+        with self._lock:
+            kinds = [kind for kind in kinds if kind not in self._refreshing]
+            self._refreshing.update(kinds)
+        if not kinds:
+            return None
+        thread = threading.Thread(
+            target=self._refresh, args=(kinds,), name="repl-names", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _refresh(self, kinds: list[NameKind]) -> None:
+        for kind in kinds:
+            try:
+                index = PrefixIndex(self.fetchers[kind]())
+                logger.debug("Fetched %d %s names for completion.", len(index), kind)
+            except Exception as e:
+                # Completion is best-effort; retry after the TTL
+                logger.debug("Failed to fetch %s names for completion: %s", kind, e)
+                entry = self._entries.get(kind)
+                index = entry.names if entry else PrefixIndex()
+            with self._lock:
+                self._entries[kind] = IndexEntry(index, time.monotonic())
+                self._refreshing.discard(kind)
+
+    def search(self, kind: NameKind, prefix: str) -> list[str]:
+        """Get names of an object type starting with a prefix.
+
+        Never waits for the API. Starts a refresh in the background if the
+        names are missing or stale, and returns the current names meanwhile."""
+        entry = self._entries.get(kind)
+        if entry is None or time.monotonic() - entry.updated > self.ttl:
+            self.refresh([kind])
+        if entry is None:
+            return []
+        return entry.names.search(prefix)
+
+    def invalidate(self, method: str) -> None:
+        """Mark the names of the object type modified by an API method as stale."""
+        object_type, _, action = method.partition(".")
+        kind = API_OBJECT_KINDS.get(object_type)
+        if kind is None or action not in MODIFYING_ACTIONS:
+            return
+        with self._lock:
+            if entry := self._entries.get(kind):
+                self._entries[kind] = entry._replace(updated=float("-inf"))
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
     from click.core import Context
 
     from zabbix_cli.app import StatefulApp
+    from zabbix_cli.repl.names import ObjectNames
 
 
 class InternalCommandException(Exception):
@@ -67,11 +68,11 @@ def _get_registered_target(
     return default
 
 
-def _exit_internal() -> NoReturn:
+def _exit_internal(*args: str) -> NoReturn:
     raise ExitReplException()
 
 
-def _help_internal() -> str:
+def _help_internal(*args: str) -> str:
     formatter = click.HelpFormatter()
     formatter.write_heading("REPL help")
     formatter.indent()
@@ -100,6 +101,29 @@ _register_internal_command(
 )
 
 
+def _last_internal(*args: str) -> None:
+    from zabbix_cli.repl.results import last_command
+    from zabbix_cli.repl.results import parse_redirect
+
+    last_command.main(parse_redirect(args), prog_name=":last", standalone_mode=False)
+
+
+def _results_internal(*args: str) -> str:
+    from zabbix_cli.repl.results import list_results
+
+    return list_results()
+
+
+_register_internal_command(
+    ["last"],
+    _last_internal,
+    "re-renders a previous result (see :last --help)",
+)
+_register_internal_command(
+    ["results"], _results_internal, "lists the results that can be re-rendered"
+)
+
+
 def bootstrap_prompt(
     prompt_kwargs: dict[str, Any] | None,
     group: click.Group,
@@ -107,17 +131,23 @@ def bootstrap_prompt(
     *,
     show_only_unused: bool = False,
     shortest_only: bool = False,
+    names: ObjectNames | None = None,
 ) -> dict[str, Any]:
     """Bootstrap prompt_toolkit kwargs or use user defined values.
 
     :param prompt_kwargs: The user specified prompt kwargs.
+    :param names: Names of objects to complete in command arguments.
     """
     prompt_kwargs = prompt_kwargs or {}
 
     defaults = {
         "history": InMemoryHistory(),
         "completer": ClickCompleter(
-            group, ctx, show_only_unused=show_only_unused, shortest_only=shortest_only
+            group,
+            ctx,
+            show_only_unused=show_only_unused,
+            shortest_only=shortest_only,
+            names=names,
         ),
         "message": "> ",
     }
@@ -157,12 +187,14 @@ def handle_internal_commands(command: str) -> Any:
     """Run repl-internal commands.
 
     Repl-internal commands are all commands starting with ":".
+    Arguments following the command name are passed to the command.
 
     """
     if command.startswith(":"):
-        target = _get_registered_target(command[1:], default=None)
+        name, *args = shlex.split(command[1:]) or [""]
+        target = _get_registered_target(name, default=None)
         if target:
-            return target()
+            return target(*args)
 
 
 def repl(  # noqa: C901
@@ -172,12 +204,14 @@ def repl(  # noqa: C901
     *,
     allow_system_commands: bool = True,
     allow_internal_commands: bool = True,
+    names: ObjectNames | None = None,
 ) -> None:
     """Start an interactive shell. All subcommands are available in it.
 
     :param old_ctx: The current Click context.
     :param prompt_kwargs: Parameters passed to
         :py:func:`prompt_toolkit.shortcuts.prompt`.
+    :param names: Names of objects to complete in command arguments.
 
     If stdin is not a TTY, no prompt will be printed, but only commands read
     from stdin.
@@ -204,7 +238,7 @@ def repl(  # noqa: C901
     }
 
     group.commands = available_commands
-    prompt_kwargs = bootstrap_prompt(prompt_kwargs, group, group_ctx)
+    prompt_kwargs = bootstrap_prompt(prompt_kwargs, group, group_ctx, names=names)
 
     if isatty:
 
@@ -239,6 +273,15 @@ def repl(  # noqa: C901
                     continue
             except ExitReplException:
                 break
+            except click.ClickException as e:
+                e.show()
+                continue
+            except Exception as e:
+                try:
+                    handle_exception(e)
+                except SystemExit:
+                    pass
+                continue
 
         try:
             args = shlex.split(command)
@@ -273,3 +316,7 @@ def repl(  # noqa: C901
             # TODO: determine if last char in terminal was newline somehow! Can we?
             err_console.print("\n[red]Aborted.[/]")
             pass
+        finally:
+            if app:
+                # Keep the results of the command for the `:last` command
+                app.state.result_buffer.commit(command.strip())
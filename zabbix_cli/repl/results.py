@@ -0,0 +1,285 @@
+"""Buffer of command results in the REPL.
+
+The results of the last commands run in the REPL are kept in memory, so they
+can be sorted, filtered, rendered in another format or written to a file with
+the `:last` command without fetching them from the API again.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import deque
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+import click
+
+from zabbix_cli.config.constants import OutputFormat
+from zabbix_cli.exceptions import ZabbixCLIError
+
+if TYPE_CHECKING:
+    from zabbix_cli.models import TableRenderable
+
+logger = logging.getLogger(__name__)
+
+SIZE_SAMPLE = 100
+"""Number of items serialized to estimate the size of a result."""
+
+
+class BufferedResult(NamedTuple):
+    """A result kept in the result buffer."""
+
+    command: str
+    """The command that produced the result."""
+    result: TableRenderable
+    n_items: int
+    """Number of items in the result."""
+    size: int
+    """Estimated size of the result in bytes."""
+
+
+def get_items(result: TableRenderable) -> Sequence[TableRenderable]:
+    """Get the items of a result. Other results than aggregate results
+    are a single item."""
+    from zabbix_cli.models import AggregateResult
+
+    if isinstance(result, AggregateResult):
+        return result.result  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    return [result]
+
+
+def estimate_size(items: Sequence[TableRenderable]) -> int:
+    """Estimate the size of a list of objects from the size of their JSON
+    serialization.
+
+    Only a sample of evenly spaced objects is serialized."""
+    if not items:
+        return 0
+    step = max(len(items) // SIZE_SAMPLE, 1)
+    sample = items[::step][:SIZE_SAMPLE]
+    size = sum(
+        len(obj.__pydantic_serializer__.to_json(obj, by_alias=True)) for obj in sample
+    )
+    return size * len(items) // len(sample)
+
+
+class ResultBuffer:
+    """The last results of commands run in the REPL.
+
+    Results rendered while a command runs are recorded, and added to
+    the buffer when the command finishes. The oldest results are evicted
+    when there are more than `max_results` results, or their total
+    estimated size exceeds `max_size` bytes."""
+
+    def __init__(self, max_results: int, max_size: int) -> None:
+        self.max_results = max_results
+        self.max_size = max_size
+        self.results: deque[BufferedResult] = deque()
+        self.size = 0
+        self.pending: list[TableRenderable] = []
+        self.paused = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_results > 0 and self.max_size > 0 and not self.paused
+
+    def record(self, result: TableRenderable) -> None:
+        """Record a result rendered by the running command.
+
+        Messages are not recorded."""
+        from zabbix_cli.models import Result
+
+        if not self.enabled or (isinstance(result, Result) and result.message):
+            return
+        self.pending.append(result)
+
+    def record_pages(
+        self, pages: Iterable[Sequence[TableRenderable]], *, empty_ok: bool = False
+    ) -> Iterator[Sequence[TableRenderable]]:
+        """Record the objects of pages as they are rendered.
+
+        The objects are recorded as one result once all pages have been
+        rendered. Recording stops if the size of the objects, estimated
+        from the first page, exceeds the maximum size of the buffer."""
+        from zabbix_cli.models import AggregateResult
+
+        if not self.enabled:
+            yield from pages
+            return
+        objects: list[TableRenderable] | None = []
+        size_per_object = 0
+        for page in pages:
+            if objects is not None:
+                if not objects and page:
+                    size_per_object = estimate_size(page) // len(page)
+                objects.extend(page)
+                if len(objects) * size_per_object > self.max_size:
+                    logger.debug("Result is too large for the REPL result buffer.")
+                    objects = None
+            yield page
+        if objects is not None:
+            self.record(AggregateResult(result=objects, empty_ok=empty_ok))
+
+    def commit(self, command: str) -> None:
+        """Add the results recorded while running a command to the buffer."""
+        pending, self.pending = self.pending, []
+        for result in pending:
+            self.add(command, result)
+
+    def add(self, command: str, result: TableRenderable) -> None:
+        """Add a result to the buffer, evicting the oldest results if the
+        buffer is full."""
+        items = get_items(result)
+        size = estimate_size(items)
+        if size > self.max_size:
+            logger.debug(
+                "Result of %r (%d bytes) is too large for the REPL result buffer.",
+                command,
+                size,
+            )
+            return
+        self.results.append(BufferedResult(command, result, len(items), size))
+        self.size += size
+        while len(self.results) > self.max_results or self.size > self.max_size:
+            evicted = self.results.popleft()
+            self.size -= evicted.size
+
+    def get(self, index: int = 1) -> BufferedResult:
+        """Get a result by its position in the buffer, counting from the
+        most recent result (1)."""
+        if not self.results:
+            raise ZabbixCLIError("No results in the REPL result buffer.")
+        if not 1 <= index <= len(self.results):
+            raise ZabbixCLIError(
+                f"Invalid result number {index}. "
+                f"The REPL result buffer has {len(self.results)} results."
+            )
+        return self.results[-index]
+
+    @contextmanager
+    def pause(self) -> Iterator[None]:
+        """Stop recording results until the context is exited."""
+        paused = self.paused
+        self.paused = True
+        try:
+            yield
+        finally:
+            self.paused = paused
+
+
+def grep_items(items: Sequence[TableRenderable], pattern: str) -> list[TableRenderable]:
+    """Get the items with a cell matching a regular expression (case-insensitive).
+
+    Cells are matched as they are shown in plain tables."""
+    from zabbix_cli.output.plain import plain_rows
+
+    try:
+        regex = re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        raise ZabbixCLIError(f"Invalid pattern {pattern!r}: {e}") from e
+    return [
+        item
+        for item in items
+        if any(regex.search(cell) for row in plain_rows(item) for cell in row)
+    ]
+
+
+def parse_redirect(args: Sequence[str]) -> list[str]:
+    """Convert a shell-style redirection (`> file` or `>file`) at the end of
+    the arguments of a REPL command to an `--output-file` option."""
+    args = list(args)
+    if len(args) >= 2 and args[-2] == ">":
+        return [*args[:-2], "--output-file", args[-1]]
+    if args and args[-1].startswith(">") and len(args[-1]) > 1:
+        return [*args[:-1], "--output-file", args[-1][1:]]
+    return args
+
+
+@click.command(name=":last", context_settings={"help_option_names": ["-h", "--help"]})
+@click.argument("index", type=click.IntRange(min=1), default=1)
+@click.option(
+    "--sort", help="Sort results by a field. Append :desc for descending order."
+)
+@click.option(
+    "--grep", "pattern", help="Only show results matching a regular expression."
+)
+@click.option("--fields", help="Comma-separated list of fields to show.")
+@click.option(
+    "--format",
+    "-o",
+    "output_format",
+    type=click.Choice([fmt.value for fmt in OutputFormat], case_sensitive=False),
+    help="Output format.",
+)
+@click.option(
+    "--output-file",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    help="Write results to a file. Also accepts `> FILE`.",
+)
+def last_command(
+    index: int,
+    sort: str | None,
+    pattern: str | None,
+    fields: str | None,
+    output_format: str | None,
+    output_file: Path | None,
+) -> None:
+    """Render a previous result without fetching it again.
+
+    INDEX is the position of the result in the REPL result buffer,
+    counting from the most recent result (1)."""
+    from zabbix_cli.models import AggregateResult
+    from zabbix_cli.models import SortKey
+    from zabbix_cli.output.render import render_result
+    from zabbix_cli.state import get_state
+    from zabbix_cli.utils.args import parse_list_arg
+
+    state = get_state()
+    buffered = state.result_buffer.get(index)
+    result = buffered.result
+    if pattern is not None or sort is not None:
+        items = get_items(result)
+        if pattern is not None:
+            items = grep_items(items, pattern)
+        # Sorting a copy keeps the order of the buffered result
+        result = AggregateResult(result=list(items), empty_ok=True)
+
+    original = (state.fields, state.sort, state.output_file)
+    config = state.config.app.output.model_copy()
+    try:
+        if fields is not None:
+            state.fields = parse_list_arg(fields) or None
+        if sort is not None:
+            state.sort = SortKey.parse(sort)
+        if output_file is not None:
+            state.output_file = output_file
+        if output_format is not None:
+            state.config.app.output.format = OutputFormat(output_format.lower())
+        with state.result_buffer.pause():
+            render_result(result)
+    finally:
+        state.fields, state.sort, state.output_file = original
+        state.config.app.output = config
+
+
+def list_results() -> str:
+    """List the results in the REPL result buffer, most recent first."""
+    from zabbix_cli.output.formatting.bytes import bytesize_str
+    from zabbix_cli.output.formatting.grammar import pluralize as p
+    from zabbix_cli.state import get_state
+
+    buffer = get_state().result_buffer
+    if not buffer.results:
+        return "No results in the REPL result buffer."
+    width = len(str(len(buffer.results)))
+    lines = [
+        f"{i:>{width}}  {r.command}  ({p('result', r.n_items)}, {bytesize_str(r.size)})"
+        for i, r in enumerate(reversed(buffer.results), start=1)
+    ]
+    return "\n".join(lines)
@@ -27,6 +27,7 @@ and other stateful objects.
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -37,11 +38,15 @@ from typing_extensions import Self
 # Runtime imports from other modules should be done inside functions,
 # while annotations imports should done in `if TYPE_CHECKING:` blocks.
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from prompt_toolkit.history import History
     from rich.console import Console
 
     from zabbix_cli.config.model import Config
+    from zabbix_cli.models import SortKey
     from zabbix_cli.pyzabbix.client import ZabbixAPI
+    from zabbix_cli.repl.results import ResultBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -54,12 +59,15 @@ class State:
     """
 
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls, *args: Any, **kwargs: Any) -> Self:
         """Instantiate the singleton object or return the existing instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls, *args, **kwargs)
-        return cls._instance
+        # State is shared between worker threads when running commands concurrently
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls, *args, **kwargs)
+            return cls._instance
 
     repl: bool = False
     """REPL is active."""
@@ -67,6 +75,15 @@ class State:
     bulk: bool = False
     """Running in bulk mode."""
 
+    output_file: Path | None = None
+    """Write results to this file instead of rendering them."""
+
+    fields: list[str] | None = None
+    """Only show these fields of results."""
+
+    sort: SortKey | None = None
+    """Sort results by this field."""
+
     _client: ZabbixAPI | None = None
     """Zabbix API client object."""
 
@@ -90,6 +107,13 @@ class State:
 
     _history: History | None = None
 
+    _result_buffer: ResultBuffer | None = None
+
+    _repl_output_options: (
+        tuple[Path | None, list[str] | None, SortKey | None] | None
+    ) = None
+    """Output options when the REPL was first launched."""
+
     @property
     def client(self) -> ZabbixAPI:
         """Zabbix API client object.
@@ -192,6 +216,21 @@ class State:
                 self._history = InMemoryHistory()
         return self._history
 
+    @property
+    def result_buffer(self) -> ResultBuffer:
+        """Results of the last commands run in the REPL.
+
+        Lazily instantiates the buffer if it doesn't exist.
+        """
+        from zabbix_cli.repl.results import ResultBuffer
+
+        if not self._result_buffer:
+            self._result_buffer = ResultBuffer(
+                max_results=self.config.app.repl_results,
+                max_size=self.config.app.repl_results_max_size * 1024 * 1024,
+            )
+        return self._result_buffer
+
     @property
     def ready(self) -> bool:
         """State is configured and ready to use."""
@@ -211,14 +250,18 @@ class State:
         > show_trigger_events 123 # renders table (override reverted)
         ```
 
-        The override is reset after the command is executed.
+        The override is reset after the command is executed. The same applies
+        to the `--output-file`, `--fields` and `--sort` options.
         """
         if not self.repl or not self.is_config_loaded:
             return
         if not self._config_repl_original:
             self._config_repl_original = self.config.model_copy(deep=True)
+            self._repl_output_options = (self.output_file, self.fields, self.sort)
         else:
             self.config = self._config_repl_original.model_copy(deep=True)
+            if self._repl_output_options:
+                self.output_file, self.fields, self.sort = self._repl_output_options
 
     def login(self) -> None:
         """Log in to the Zabbix API.
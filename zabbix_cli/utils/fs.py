@@ -32,6 +32,20 @@ def read_file(file: Path) -> str:
         raise ZabbixCLIFileError(f"Unable to read file {file}") from e
 
 
+def get_file_hash(file: Path) -> str:
+    """Get the SHA-256 hash of a file's contents."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    try:
+        with open(file, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError as e:
+        raise ZabbixCLIFileError(f"Unable to read file {file}: {e}") from e
+    return digest.hexdigest()
+
+
 def open_directory(
     directory: Path, command: str | None = None, *, force: bool = False
 ) -> None: